@@ -0,0 +1,82 @@
+"""Pytest configuration and shared fixtures.
+
+JobManager はワーカーを spawn で起動するため、子プロセスは run_job を
+teto_api.jobs から import し直す。テストモジュールのトップレベルでは
+ジョブを投入せず、すべてフィクスチャとテスト関数の中で行う。
+"""
+
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from teto_api import main
+
+
+@pytest.fixture
+def jobs_dir(tmp_path, monkeypatch):
+    """Point the API at a temporary jobs directory."""
+    path = tmp_path / "jobs"
+    monkeypatch.setattr(main, "JOBS_DIR", str(path))
+    monkeypatch.setattr(main, "MAX_CONCURRENT_JOBS", 1)
+    return path
+
+
+@pytest.fixture
+def client(jobs_dir):
+    """Run the app, including its job manager, for one test."""
+    with TestClient(main.app) as client:
+        yield client
+
+
+@pytest.fixture
+def image_path(tmp_path):
+    """Create a small image to render."""
+    from PIL import Image
+
+    path = tmp_path / "image.png"
+    Image.new("RGB", (32, 24), color=(200, 40, 40)).save(path)
+    return path
+
+
+@pytest.fixture
+def project_payload(image_path):
+    """Build a project request body; keyword arguments adjust the output."""
+
+    def make(duration=0.5, path="out.mp4", **output):
+        return {
+            "project": {
+                "output": {
+                    "path": path,
+                    "width": 32,
+                    "height": 24,
+                    "fps": 10,
+                    "preset": "ultrafast",
+                    "encoder": "ffmpeg_pipe",
+                    **output,
+                },
+                "timeline": {
+                    "video_layers": [
+                        {"type": "image", "path": str(image_path), "duration": duration}
+                    ]
+                },
+            }
+        }
+
+    return make
+
+
+@pytest.fixture
+def wait_for():
+    """Poll a job until it reaches one of the given statuses."""
+
+    def wait(client, job_id, *statuses, timeout=60.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            job = client.get(f"/jobs/{job_id}").json()
+            if job["status"] in statuses:
+                return job
+            time.sleep(0.1)
+        raise AssertionError(f"job {job_id} did not reach {statuses}: {job}")
+
+    return wait
@@ -0,0 +1,168 @@
+"""Tests for the render job endpoints."""
+
+import json
+
+import pytest
+
+from teto_api.jobs import JobManager
+
+# キャンセルするまで終わらない長さのジョブ
+LONG_DURATION = 3600.0
+
+
+@pytest.mark.integration
+class TestJobLifecycle:
+    """Test suite for submitting, following and downloading jobs."""
+
+    def test_submit_and_download(self, client, project_payload, wait_for):
+        """Test that a submitted project renders and can be downloaded."""
+        response = client.post("/jobs", json=project_payload())
+
+        assert response.status_code == 202
+        job = response.json()
+        assert job["status"] in ("queued", "running")
+
+        done = wait_for(client, job["id"], "completed", "failed")
+        assert done["status"] == "completed", done["error"]
+        assert done["progress"] == 1.0
+
+        output = client.get(f"/jobs/{job['id']}/output")
+        assert output.status_code == 200
+        assert output.headers["content-type"] == "video/mp4"
+        assert f'filename="{job["id"]}.mp4"' in output.headers["content-disposition"]
+        assert len(output.content) > 0
+
+    def test_output_format_follows_project_path(
+        self, client, project_payload, wait_for, jobs_dir
+    ):
+        """Test that the download keeps the container of the requested path."""
+        body = project_payload(
+            path="clip.webm", codec="libvpx", audio_codec="libvorbis"
+        )
+        job = client.post("/jobs", json=body).json()
+
+        done = wait_for(client, job["id"], "completed", "failed")
+        assert done["status"] == "completed", done["error"]
+        assert (jobs_dir / job["id"] / "output.webm").exists()
+
+        output = client.get(f"/jobs/{job['id']}/output")
+        assert output.headers["content-type"] == "video/webm"
+        assert f'filename="{job["id"]}.webm"' in output.headers["content-disposition"]
+
+    def test_events_stream_until_finished(self, client, project_payload):
+        """Test that the SSE stream reports status changes and then closes."""
+        job = client.post("/jobs", json=project_payload()).json()
+
+        with client.stream("GET", f"/jobs/{job['id']}/events") as response:
+            assert response.headers["content-type"].startswith("text/event-stream")
+            events = [
+                json.loads(line.removeprefix("data: "))
+                for line in response.iter_lines()
+                if line.startswith("data: ")
+            ]
+
+        assert events[0]["id"] == job["id"]
+        assert events[-1]["status"] == "completed"
+
+    def test_output_is_unavailable_before_completion(
+        self, client, project_payload, wait_for
+    ):
+        """Test that downloading an unfinished job is a conflict."""
+        job = client.post("/jobs", json=project_payload(LONG_DURATION)).json()
+
+        assert client.get(f"/jobs/{job['id']}/output").status_code == 409
+        client.delete(f"/jobs/{job['id']}")
+        wait_for(client, job["id"], "cancelled")
+
+
+@pytest.mark.integration
+class TestJobCancellation:
+    """Test suite for cancelling jobs."""
+
+    def test_cancel_queued_job(self, client, project_payload, wait_for):
+        """Test that a queued job is cancelled without starting."""
+        running = client.post("/jobs", json=project_payload(LONG_DURATION)).json()
+        queued = client.post("/jobs", json=project_payload()).json()
+        assert queued["status"] == "queued"
+
+        response = client.delete(f"/jobs/{queued['id']}")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "cancelled"
+        assert response.json()["started_at"] is None
+        client.delete(f"/jobs/{running['id']}")
+        wait_for(client, running["id"], "cancelled")
+
+    def test_cancel_running_job(self, client, project_payload, wait_for, jobs_dir):
+        """Test that a running job's worker is terminated and cleaned up."""
+        job = client.post("/jobs", json=project_payload(LONG_DURATION)).json()
+        wait_for(client, job["id"], "running")
+
+        client.delete(f"/jobs/{job['id']}")
+
+        cancelled = wait_for(client, job["id"], "cancelled", timeout=10.0)
+        assert cancelled["finished_at"] is not None
+        assert not (jobs_dir / job["id"]).exists()
+
+    def test_cancel_unknown_job(self, client):
+        """Test that cancelling a missing job is not found."""
+        assert client.delete("/jobs/missing").status_code == 404
+
+
+@pytest.mark.integration
+class TestJobRetention:
+    """Test suite for removing finished jobs."""
+
+    def test_delete_output(self, client, project_payload, wait_for, jobs_dir):
+        """Test that a finished job and its output can be deleted."""
+        job = client.post("/jobs", json=project_payload()).json()
+        wait_for(client, job["id"], "completed")
+
+        response = client.delete(f"/jobs/{job['id']}/output")
+
+        assert response.status_code == 200
+        assert not (jobs_dir / job["id"]).exists()
+        assert client.get(f"/jobs/{job['id']}").status_code == 404
+
+    def test_delete_output_of_unfinished_job(self, client, project_payload, wait_for):
+        """Test that a job must finish before its output is deleted."""
+        job = client.post("/jobs", json=project_payload(LONG_DURATION)).json()
+
+        assert client.delete(f"/jobs/{job['id']}/output").status_code == 409
+        client.delete(f"/jobs/{job['id']}")
+        wait_for(client, job["id"], "cancelled")
+
+    def test_oldest_finished_jobs_are_pruned(self, tmp_path):
+        """Test that only max_finished_jobs finished jobs are kept."""
+        manager = JobManager(tmp_path, max_finished_jobs=2)
+        manager.max_concurrency = 0
+        jobs = [manager.submit("project", {}) for _ in range(3)]
+
+        for job in jobs:
+            (tmp_path / job.id).mkdir()
+            manager.cancel(job.id)
+
+        assert [job.id for job in manager.list_jobs()] == [j.id for j in jobs[1:]]
+        assert not (tmp_path / jobs[0].id).exists()
+
+
+@pytest.mark.unit
+class TestJobValidation:
+    """Test suite for request validation."""
+
+    def test_requires_exactly_one_input(self, client, project_payload):
+        """Test that a request with neither or both inputs is rejected."""
+        assert client.post("/jobs", json={}).status_code == 422
+
+        body = {**project_payload(), "script": {"title": "x", "scenes": []}}
+        assert client.post("/jobs", json=body).status_code == 422
+
+    def test_invalid_project_is_rejected(self, client, project_payload):
+        """Test that project validation errors are reported as 422."""
+        body = project_payload()
+        body["project"]["output"]["fps"] = 0
+
+        response = client.post("/jobs", json=body)
+
+        assert response.status_code == 422
+        assert client.get("/jobs").json() == []
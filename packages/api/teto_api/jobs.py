@@ -0,0 +1,468 @@
+"""レンダリングジョブのキューと実行"""
+
+import multiprocessing
+import queue
+import shutil
+import threading
+import time
+import traceback
+import uuid
+from collections import deque
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import proglog
+
+from .models import JobInfo, JobStatus
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+class _Job:
+    """ジョブの内部状態"""
+
+    def __init__(
+        self,
+        kind: str,
+        payload: dict[str, Any],
+        jobs_dir: Path,
+        output_suffix: str = ".mp4",
+    ):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.payload = payload
+        self.work_dir = jobs_dir / self.id
+        self.output_suffix = output_suffix
+        self.status = JobStatus.QUEUED
+        self.message: str | None = None
+        self.progress = 0.0
+        self.eta_seconds: float | None = None
+        self.error: str | None = None
+        self.created_at = datetime.now(timezone.utc)
+        self.started_at: datetime | None = None
+        self.finished_at: datetime | None = None
+        self.process: multiprocessing.Process | None = None
+        self.cancel_requested = False
+        # フレーム出力の開始時刻（残り時間の推定に使う）
+        self._frames_started: float | None = None
+        # 状態が変わるたびに増える（SSE の変更検知に使う）
+        self.version = 0
+
+    @property
+    def output_path(self) -> Path:
+        """出力ファイルのパス（拡張子は出力設定のパスに合わせる）"""
+        return self.work_dir / f"output{self.output_suffix}"
+
+    def update_progress(self, done: int, total: int) -> None:
+        """フレーム出力の進捗を更新し、残り時間を推定する
+
+        Args:
+            done: 出力済みのフレーム数
+            total: 全フレーム数
+        """
+        now = time.monotonic()
+        if self._frames_started is None or done <= 1:
+            self._frames_started = now
+        self.progress = min(done / total, 1.0) if total else 0.0
+        elapsed = now - self._frames_started
+        if 0.0 < self.progress < 1.0 and elapsed > 0.0:
+            self.eta_seconds = elapsed * (1.0 - self.progress) / self.progress
+        else:
+            self.eta_seconds = None
+
+    def info(self) -> JobInfo:
+        """API のレスポンスに変換"""
+        return JobInfo(
+            id=self.id,
+            kind=self.kind,
+            status=self.status,
+            message=self.message,
+            progress=self.progress,
+            eta_seconds=self.eta_seconds,
+            error=self.error,
+            created_at=self.created_at,
+            started_at=self.started_at,
+            finished_at=self.finished_at,
+        )
+
+
+class JobManager:
+    """レンダリングジョブを有限個のワーカープロセスで実行するキュー
+
+    ジョブは投入順に待ち行列へ入り、同時に実行するのは max_concurrency 個
+    までに制限する。各ジョブは専用のプロセスで実行するため、実行中の
+    ジョブもプロセスを終了させてキャンセルできる。memory_limit_mb を
+    指定すると、ワーカープロセス（と ffmpeg などの子プロセス）の
+    仮想メモリに上限を設け、1つのジョブがホストのメモリを使い切らない
+    ようにする。
+
+    ワーカーは進捗メッセージとフレーム出力の進捗をキュー経由で送り、
+    マネージャーはそれをもとに進捗率と推定残り時間を更新する。
+
+    終了したジョブは max_finished_jobs 個まで保持し、超えた分は古い順に
+    記録と出力ファイルを削除する。remove で個別に削除することもできる。
+    """
+
+    def __init__(
+        self,
+        jobs_dir: Path | str,
+        max_concurrency: int = 1,
+        memory_limit_mb: int | None = None,
+        max_finished_jobs: int | None = 100,
+    ):
+        """初期化
+
+        Args:
+            jobs_dir: ジョブごとの作業ディレクトリ・出力を置くディレクトリ
+            max_concurrency: 同時に実行するジョブの最大数
+            memory_limit_mb: ジョブ1つあたりの仮想メモリの上限（MB）。
+                None の場合は制限しない
+            max_finished_jobs: 保持する終了済みジョブの最大数。
+                None の場合は削除しない
+        """
+        self.jobs_dir = Path(jobs_dir)
+        self.jobs_dir.mkdir(parents=True, exist_ok=True)
+        self.max_concurrency = max(max_concurrency, 1)
+        self.memory_limit_mb = memory_limit_mb
+        self.max_finished_jobs = max_finished_jobs
+        self._lock = threading.Lock()
+        self._jobs: dict[str, _Job] = {}
+        self._queue: deque[_Job] = deque()
+        self._running: set[str] = set()
+        self._mp = multiprocessing.get_context("spawn")
+
+    def submit(
+        self, kind: str, payload: dict[str, Any], output_suffix: str = ".mp4"
+    ) -> JobInfo:
+        """ジョブを投入する
+
+        Args:
+            kind: 入力の種類（"project" または "script"）
+            payload: run_job に渡す入力（Project / Script の dict とオプション）
+            output_suffix: 出力ファイルの拡張子（出力するコンテナの形式を決める）
+
+        Returns:
+            投入したジョブの状態
+        """
+        if kind not in ("project", "script"):
+            raise ValueError(f"Unknown job kind: {kind}")
+
+        job = _Job(kind, payload, self.jobs_dir, output_suffix)
+        with self._lock:
+            self._jobs[job.id] = job
+            self._queue.append(job)
+        self._dispatch()
+        return job.info()
+
+    def get(self, job_id: str) -> JobInfo | None:
+        """ジョブの状態を取得
+
+        Args:
+            job_id: ジョブID
+
+        Returns:
+            ジョブの状態。存在しない場合は None
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return job.info() if job else None
+
+    def list_jobs(self) -> list[JobInfo]:
+        """すべてのジョブの状態を投入順に取得"""
+        with self._lock:
+            return [job.info() for job in self._jobs.values()]
+
+    def version(self, job_id: str) -> int:
+        """ジョブの状態の更新回数を取得（変更の検知用）
+
+        Args:
+            job_id: ジョブID
+
+        Returns:
+            更新回数。存在しない場合は -1
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return job.version if job else -1
+
+    def output_path(self, job_id: str) -> Path | None:
+        """完了したジョブの出力ファイルのパスを取得
+
+        Args:
+            job_id: ジョブID
+
+        Returns:
+            出力ファイルのパス。未完了・存在しない場合は None
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status != JobStatus.COMPLETED:
+                return None
+            return job.output_path
+
+    def cancel(self, job_id: str) -> JobInfo | None:
+        """ジョブをキャンセルする
+
+        待機中のジョブは待ち行列から外し、実行中のジョブはワーカー
+        プロセスを終了させる。終了済みのジョブは何もしない。
+
+        Args:
+            job_id: ジョブID
+
+        Returns:
+            ジョブの状態。存在しない場合は None
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            if job.status == JobStatus.QUEUED:
+                self._queue.remove(job)
+                self._finish(job, JobStatus.CANCELLED)
+            elif job.status == JobStatus.RUNNING:
+                job.cancel_requested = True
+                if job.process is not None:
+                    job.process.terminate()
+            return job.info()
+
+    def remove(self, job_id: str) -> JobInfo | None:
+        """終了したジョブの記録と出力ファイルを削除する
+
+        Args:
+            job_id: ジョブID
+
+        Returns:
+            削除したジョブの状態。存在しない場合は None
+
+        Raises:
+            ValueError: ジョブがまだ終了していない場合
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            if not job.status.is_finished:
+                raise ValueError(f"Job is not finished ({job.status.value})")
+            del self._jobs[job_id]
+        shutil.rmtree(job.work_dir, ignore_errors=True)
+        return job.info()
+
+    def shutdown(self) -> None:
+        """待機中のジョブを取り消し、実行中のジョブを終了させる"""
+        with self._lock:
+            for job in list(self._queue):
+                self._finish(job, JobStatus.CANCELLED)
+            self._queue.clear()
+            running = [self._jobs[job_id] for job_id in self._running]
+        for job in running:
+            self.cancel(job.id)
+        for job in running:
+            if job.process is not None:
+                job.process.join(timeout=5.0)
+
+    def _dispatch(self) -> None:
+        """空きがあれば待機中のジョブを開始する"""
+        with self._lock:
+            while self._queue and len(self._running) < self.max_concurrency:
+                job = self._queue.popleft()
+                events = self._mp.Queue()
+                job.work_dir.mkdir(parents=True, exist_ok=True)
+                job.process = self._mp.Process(
+                    target=run_job,
+                    args=(
+                        job.kind,
+                        job.payload,
+                        str(job.work_dir),
+                        str(job.output_path),
+                        self.memory_limit_mb,
+                        events,
+                    ),
+                    name=f"teto-job-{job.id[:8]}",
+                    daemon=True,
+                )
+                job.process.start()
+                job.status = JobStatus.RUNNING
+                job.started_at = datetime.now(timezone.utc)
+                job.version += 1
+                self._running.add(job.id)
+                threading.Thread(
+                    target=self._monitor,
+                    args=(job, events),
+                    name=f"teto-job-monitor-{job.id[:8]}",
+                    daemon=True,
+                ).start()
+
+    def _monitor(self, job: _Job, events) -> None:
+        """ワーカーの進捗を受け取り、終了したら状態を確定する"""
+        finished = False
+        exited = False
+        while True:
+            try:
+                event = events.get(timeout=0.2)
+            except queue.Empty:
+                if job.process.is_alive():
+                    continue
+                # 終了直前に送られたイベントを受け取ってから抜ける
+                if exited:
+                    break
+                exited = True
+                continue
+            except (EOFError, OSError):
+                break
+            with self._lock:
+                kind = event[0]
+                if kind == "message":
+                    job.message = event[1]
+                elif kind == "progress":
+                    job.update_progress(event[1], event[2])
+                elif kind == "done":
+                    finished = True
+                elif kind == "error":
+                    job.error = event[1]
+                job.version += 1
+
+        job.process.join()
+        with self._lock:
+            self._running.discard(job.id)
+            if job.cancel_requested:
+                self._finish(job, JobStatus.CANCELLED)
+            elif finished and job.process.exitcode == 0:
+                job.progress = 1.0
+                self._finish(job, JobStatus.COMPLETED)
+            else:
+                job.error = job.error or (
+                    f"Worker exited with code {job.process.exitcode}"
+                )
+                self._finish(job, JobStatus.FAILED)
+        self._dispatch()
+
+    def _finish(self, job: _Job, status: JobStatus) -> None:
+        """ジョブを終了状態にする（ロックを保持して呼ぶ）"""
+        job.status = status
+        job.eta_seconds = None
+        job.finished_at = datetime.now(timezone.utc)
+        job.version += 1
+        if status != JobStatus.COMPLETED:
+            shutil.rmtree(job.work_dir, ignore_errors=True)
+        self._prune()
+
+    def _prune(self) -> None:
+        """保持数を超えた終了済みジョブを古い順に削除する（ロックを保持して呼ぶ）"""
+        if self.max_finished_jobs is None:
+            return
+        finished = [job for job in self._jobs.values() if job.status.is_finished]
+        for job in finished[: max(len(finished) - self.max_finished_jobs, 0)]:
+            del self._jobs[job.id]
+            shutil.rmtree(job.work_dir, ignore_errors=True)
+
+
+class _QueueProgressLogger(proglog.ProgressBarLogger):
+    """フレーム出力の進捗をキューへ送るロガー"""
+
+    def __init__(self, events):
+        super().__init__()
+        self.events = events
+        self._last_percent = -1
+
+    def bars_callback(self, bar, attr, value, old_value=None):
+        if bar != "frame_index" or attr != "index":
+            return
+        total = self.bars[bar].get("total")
+        if not total:
+            return
+        done = value + 1
+        # 1% 刻みでだけ送る
+        percent = done * 100 // total
+        if percent != self._last_percent:
+            self._last_percent = percent
+            self.events.put(("progress", done, total))
+
+
+def _limit_memory(memory_limit_mb: int | None) -> None:
+    """このプロセス（と子プロセス）の仮想メモリに上限を設ける"""
+    if memory_limit_mb is None or resource is None:
+        return
+    limit = memory_limit_mb * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def run_job(
+    kind: str,
+    payload: dict[str, Any],
+    work_dir: str,
+    output_path: str,
+    memory_limit_mb: int | None,
+    events,
+) -> None:
+    """ワーカープロセスでジョブを実行する
+
+    Args:
+        kind: 入力の種類（"project" または "script"）
+        payload: 入力（"project" / "script" の dict と "dry_run"）
+        work_dir: ジョブの作業ディレクトリ
+        output_path: 出力ファイルのパス
+        memory_limit_mb: 仮想メモリの上限（MB）
+        events: 進捗を送るキュー
+    """
+    try:
+        _limit_memory(memory_limit_mb)
+
+        from teto_core import Project, VideoGenerator
+
+        def progress_callback(message: str) -> None:
+            events.put(("message", message))
+
+        if kind == "script":
+            project = _compile_script(payload, work_dir, output_path, progress_callback)
+        else:
+            project = Project(**payload["project"])
+            project.output.path = output_path
+
+        VideoGenerator(project).generate(
+            progress_callback=progress_callback,
+            verbose=False,
+            progress_logger=_QueueProgressLogger(events),
+        )
+        events.put(("done",))
+    except BaseException as e:
+        traceback.print_exc()
+        events.put(("error", f"{type(e).__name__}: {e}"))
+        raise SystemExit(1)
+
+
+def _compile_script(
+    payload: dict[str, Any], work_dir: str, output_path: str, progress_callback
+):
+    """Script を Project に変換する"""
+    from teto_core.script import Script, ScriptCompiler
+    from teto_core.script.providers import (
+        GoogleTTSProvider,
+        ElevenLabsTTSProvider,
+        GeminiTTSProvider,
+        MockTTSProvider,
+        CompositeAssetResolver,
+    )
+
+    script = Script(**payload["script"])
+    if payload.get("dry_run"):
+        tts_provider = MockTTSProvider()
+    elif script.voice.provider == "elevenlabs":
+        tts_provider = ElevenLabsTTSProvider()
+    elif script.voice.provider == "gemini":
+        tts_provider = GeminiTTSProvider()
+    else:
+        tts_provider = GoogleTTSProvider()
+
+    progress_callback("Script → Project 変換中...")
+    compiler = ScriptCompiler(
+        tts_provider=tts_provider,
+        asset_resolver=CompositeAssetResolver(
+            default_config=script.image_generation,
+        ),
+        output_dir=str(Path(work_dir) / "assets"),
+    )
+    return compiler.compile(script, output_path=output_path).project
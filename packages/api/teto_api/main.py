@@ -1,10 +1,49 @@
-from fastapi import FastAPI
+import asyncio
+import mimetypes
+import os
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse, StreamingResponse
+
+from .jobs import JobManager
+from .models import JobInfo, JobRequest
+
+# ジョブの出力を置くディレクトリ
+JOBS_DIR = os.environ.get("TETO_API_JOBS_DIR", "./output/jobs")
+# 同時に実行するレンダリングジョブの最大数
+MAX_CONCURRENT_JOBS = int(os.environ.get("TETO_API_MAX_JOBS", "1"))
+# ジョブ1つあたりのメモリ上限（MB、未指定時は制限なし）
+JOB_MEMORY_LIMIT_MB = (
+    int(os.environ["TETO_API_JOB_MEMORY_MB"])
+    if os.environ.get("TETO_API_JOB_MEMORY_MB")
+    else None
+)
+# 保持する終了済みジョブの最大数（超えた分は古い順に出力ごと削除）
+MAX_FINISHED_JOBS = int(os.environ.get("TETO_API_MAX_FINISHED_JOBS", "100"))
+# SSE で状態の変化を確認する間隔（秒）
+EVENT_POLL_INTERVAL = 0.5
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.jobs = JobManager(
+        JOBS_DIR,
+        max_concurrency=MAX_CONCURRENT_JOBS,
+        memory_limit_mb=JOB_MEMORY_LIMIT_MB,
+        max_finished_jobs=MAX_FINISHED_JOBS,
+    )
+    yield
+    app.state.jobs.shutdown()
+
 
 app = FastAPI(
     title="Teto API",
     description="API for video generation system",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # CORS設定（開発時はデスクトップアプリからのアクセスを許可）
@@ -17,6 +56,17 @@ app.add_middleware(
 )
 
 
+def _jobs(request: Request) -> JobManager:
+    return request.app.state.jobs
+
+
+def _get_job(request: Request, job_id: str) -> JobInfo:
+    job = _jobs(request).get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return job
+
+
 @app.get("/")
 async def root():
     return {"message": "Teto API is running"}
@@ -25,3 +75,90 @@ async def root():
 @app.get("/health")
 async def health():
     return {"status": "healthy"}
+
+
+@app.post("/jobs", status_code=202, response_model=JobInfo)
+async def submit_job(body: JobRequest, request: Request):
+    """レンダリングジョブを投入"""
+    output_suffix = ".mp4"
+    if body.project is not None:
+        payload = {"project": body.project.model_dump(mode="json")}
+        kind = "project"
+        output_suffix = Path(body.project.output.path).suffix or output_suffix
+    else:
+        payload = {
+            "script": body.script.model_dump(mode="json"),
+            "dry_run": body.dry_run,
+        }
+        kind = "script"
+    return _jobs(request).submit(kind, payload, output_suffix=output_suffix)
+
+
+@app.get("/jobs", response_model=list[JobInfo])
+async def list_jobs(request: Request):
+    """ジョブの一覧を取得"""
+    return _jobs(request).list_jobs()
+
+
+@app.get("/jobs/{job_id}", response_model=JobInfo)
+async def get_job(job_id: str, request: Request):
+    """ジョブの状態を取得"""
+    return _get_job(request, job_id)
+
+
+@app.delete("/jobs/{job_id}", response_model=JobInfo)
+async def cancel_job(job_id: str, request: Request):
+    """ジョブをキャンセル"""
+    job = _jobs(request).cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return job
+
+
+@app.get("/jobs/{job_id}/output")
+async def download_output(job_id: str, request: Request):
+    """完了したジョブの動画をダウンロード"""
+    job = _get_job(request, job_id)
+    path = _jobs(request).output_path(job_id)
+    if path is None or not path.exists():
+        raise HTTPException(
+            status_code=409, detail=f"Job output is not available ({job.status})"
+        )
+    media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+    return FileResponse(path, media_type=media_type, filename=f"{job_id}{path.suffix}")
+
+
+@app.delete("/jobs/{job_id}/output", response_model=JobInfo)
+async def delete_output(job_id: str, request: Request):
+    """終了したジョブの記録と出力ファイルを削除"""
+    try:
+        job = _jobs(request).remove(job_id)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return job
+
+
+@app.get("/jobs/{job_id}/events")
+async def stream_events(job_id: str, request: Request):
+    """ジョブの状態・進捗・推定残り時間を Server-Sent Events で配信
+
+    状態が変わるたびに status イベントを送り、ジョブが終了したら閉じる。
+    """
+    _get_job(request, job_id)
+    jobs = _jobs(request)
+
+    async def events():
+        last_version = None
+        while not await request.is_disconnected():
+            version = jobs.version(job_id)
+            if version != last_version:
+                last_version = version
+                job = jobs.get(job_id)
+                yield f"event: status\ndata: {job.model_dump_json()}\n\n"
+                if job.status.is_finished:
+                    return
+            await asyncio.sleep(EVENT_POLL_INTERVAL)
+
+    return StreamingResponse(events(), media_type="text/event-stream")
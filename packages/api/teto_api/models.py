@@ -0,0 +1,62 @@
+"""API のリクエスト・レスポンスのモデル"""
+
+from datetime import datetime
+from enum import Enum
+
+from pydantic import BaseModel, Field, model_validator
+from teto_core import Project
+from teto_core.script import Script
+
+
+class JobRequest(BaseModel):
+    """レンダリングジョブの投入リクエスト
+
+    project と script のどちらか一方を指定する。
+    """
+
+    project: Project | None = Field(None, description="レンダリングする Project")
+    script: Script | None = Field(
+        None, description="Project に変換してレンダリングする Script"
+    )
+    dry_run: bool = Field(
+        False, description="Script の変換で TTS を呼ばずにモック音声を使う"
+    )
+
+    @model_validator(mode="after")
+    def require_one_input(self) -> "JobRequest":
+        """project と script のどちらか一方だけを受け付ける"""
+        if (self.project is None) == (self.script is None):
+            raise ValueError("Specify exactly one of 'project' or 'script'")
+        if self.script is not None and isinstance(self.script.output, list):
+            raise ValueError("Scripts with multiple outputs are not supported")
+        return self
+
+
+class JobStatus(str, Enum):
+    """ジョブの状態"""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    @property
+    def is_finished(self) -> bool:
+        """終了状態（完了・失敗・キャンセル）か"""
+        return self in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+class JobInfo(BaseModel):
+    """ジョブの状態（API のレスポンス）"""
+
+    id: str = Field(..., description="ジョブID")
+    kind: str = Field(..., description="入力の種類（project / script）")
+    status: JobStatus = Field(..., description="ジョブの状態")
+    message: str | None = Field(None, description="最新の進捗メッセージ")
+    progress: float = Field(0.0, description="フレーム出力の進捗（0.0〜1.0）")
+    eta_seconds: float | None = Field(None, description="推定残り時間（秒）")
+    error: str | None = Field(None, description="失敗時のエラーメッセージ")
+    created_at: datetime = Field(..., description="投入時刻")
+    started_at: datetime | None = Field(None, description="開始時刻")
+    finished_at: datetime | None = Field(None, description="終了時刻")
@@ -85,6 +85,45 @@ def info():
     is_flag=True,
     help="Projectへの変換のみ（Script用: 動画生成はスキップ）",
 )
+@click.option(
+    "--chunks",
+    type=click.IntRange(min=1),
+    default=None,
+    help="タイムラインを時間分割して並列レンダリングする際のチャンク数",
+)
+@click.option(
+    "--segment-cache",
+    is_flag=True,
+    help="シーン単位のセグメントキャッシュを使い、変更のあったシーンだけ再レンダリング",
+)
+@click.option(
+    "--audio-cache",
+    is_flag=True,
+    help="合成済みの音声トラックをキャッシュし、音声に変更がなければ再利用",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    help="セグメントごとにチェックポイントを残して出力し、前回中断した位置から再開",
+)
+@click.option(
+    "--checkpoint-interval",
+    type=click.FloatRange(min=1.0),
+    default=60.0,
+    show_default=True,
+    help="--resume 時に1セグメントとして確定させる長さ（秒）",
+)
+@click.option(
+    "--draft",
+    is_flag=True,
+    help="確認用に縮小解像度・低フレームレートで高速に出力",
+)
+@click.option(
+    "--profile",
+    "profile_path",
+    default=None,
+    help="ステップ・レイヤー・エフェクトごとの処理時間を計測し、JSONレポートを出力",
+)
 def generate(
     input_file,
     output,
@@ -94,6 +133,13 @@ def generate(
     preset,
     dry_run,
     no_generate,
+    chunks,
+    segment_cache,
+    audio_cache,
+    resume,
+    checkpoint_interval,
+    draft,
+    profile_path,
 ):
     """
     Script/Projectファイルから動画を生成
@@ -109,6 +155,12 @@ def generate(
       teto generate file.json --type script     # 明示的にScript
       teto generate my_script.json --dry-run    # TTSなしでテスト
       teto generate my_script.json --preset bold_subtitle
+      teto generate my_script.json --chunks 16  # 16チャンクに分けて並列レンダリング
+      teto generate my_script.json --segment-cache  # 変更したシーンだけ再レンダリング
+      teto generate my_script.json --audio-cache    # 音声の合成・エンコードを再利用
+      teto generate my_script.json --resume     # 中断したレンダリングを続きから再開
+      teto generate my_script.json --draft      # タイミング・レイアウト確認用の高速出力
+      teto generate my_script.json --profile profile.json  # 処理時間の内訳を計測
     """
     try:
         input_path = Path(input_file)
@@ -138,11 +190,25 @@ def generate(
                 validate_only=validate_only,
                 dry_run=dry_run,
                 no_generate=no_generate,
+                chunks=chunks,
+                segment_cache=segment_cache,
+                audio_cache=audio_cache,
+                resume=resume,
+                checkpoint_interval=checkpoint_interval,
+                draft=draft,
+                profile_path=profile_path,
             )
         else:
             _generate_from_project(
                 project_file=input_file,
                 validate_only=validate_only,
+                chunks=chunks,
+                segment_cache=segment_cache,
+                audio_cache=audio_cache,
+                resume=resume,
+                checkpoint_interval=checkpoint_interval,
+                draft=draft,
+                profile_path=profile_path,
             )
 
     except ImportError as e:
@@ -153,7 +219,51 @@ def generate(
         sys.exit(1)
 
 
-def _generate_from_project(project_file: str, validate_only: bool) -> None:
+def _print_draft_notice(output_config) -> None:
+    """ドラフト出力の設定を表示"""
+    draft_config = output_config.draft()
+    width, height = draft_config.render_size
+    console.print(
+        f"[yellow]ドラフト出力: {width}x{height} / {draft_config.fps}fps "
+        f"(本番: {output_config.width}x{output_config.height} / {output_config.fps}fps)[/yellow]"
+    )
+
+
+def _print_profile(profiler, profile_path: str) -> None:
+    """プロファイル結果を書き出して要約を表示"""
+    report_path = profiler.write_report(profile_path)
+    console.print("\n[bold]プロファイル:[/bold]")
+    console.print(profiler.summary(), highlight=False)
+    console.print(f"[green]プロファイル結果: {report_path}[/green]")
+
+
+def _print_resume_overrides() -> None:
+    """--resume と併用できないオプションが指定された場合に警告を表示"""
+    console.print(
+        "[yellow]--resume ではセグメントを順に確定させるため、"
+        "--chunks / --segment-cache は無視されます[/yellow]"
+    )
+
+
+def _print_profile_unsupported() -> None:
+    """プロファイルを使えない生成方法の場合に警告を表示"""
+    console.print(
+        "[yellow]--profile は単一出力の通常レンダリングでのみ有効です"
+        "（--chunks / --segment-cache / --resume / マルチ出力では無視されます）[/yellow]"
+    )
+
+
+def _generate_from_project(
+    project_file: str,
+    validate_only: bool,
+    chunks: int | None = None,
+    segment_cache: bool = False,
+    audio_cache: bool = False,
+    resume: bool = False,
+    checkpoint_interval: float = 60.0,
+    draft: bool = False,
+    profile_path: str | None = None,
+) -> None:
     """Projectファイルから動画を生成"""
     from teto_core import VideoGenerator, Project
 
@@ -180,6 +290,8 @@ def _generate_from_project(project_file: str, validate_only: bool) -> None:
 
     # 動画生成
     console.print("\n[bold yellow]動画生成を開始します...[/bold yellow]\n")
+    if draft:
+        _print_draft_notice(project.output)
 
     generator = VideoGenerator(project)
 
@@ -187,9 +299,46 @@ def _generate_from_project(project_file: str, validate_only: bool) -> None:
         console.print(f"[cyan]{message}[/cyan]")
 
     try:
-        output_path = generator.generate(progress_callback=progress_callback)
+        profiler = None
+        if resume:
+            if profile_path:
+                _print_profile_unsupported()
+            if chunks or segment_cache:
+                _print_resume_overrides()
+            if draft:
+                generator.project.output = generator.project.output.draft()
+            output_path = generator.generate_resumable(
+                segment_seconds=checkpoint_interval,
+                resume=True,
+                progress_callback=progress_callback,
+                use_audio_cache=audio_cache,
+            )
+        elif chunks or segment_cache:
+            if profile_path:
+                _print_profile_unsupported()
+            if draft:
+                generator.project.output = generator.project.output.draft()
+            output_path = generator.generate_chunked(
+                num_chunks=chunks,
+                progress_callback=progress_callback,
+                use_segment_cache=segment_cache,
+                use_audio_cache=audio_cache,
+            )
+        else:
+            if profile_path:
+                from teto_core.render import RenderProfiler
+
+                profiler = RenderProfiler()
+            output_path = generator.generate(
+                progress_callback=progress_callback,
+                draft=draft,
+                profiler=profiler,
+                use_audio_cache=audio_cache,
+            )
         console.print("\n[bold green]✓ 動画生成が完了しました！[/bold green]")
         console.print(f"[green]出力ファイル: {output_path}[/green]")
+        if profiler is not None:
+            _print_profile(profiler, profile_path)
 
     except Exception as e:
         console.print("\n[red]エラー: 動画生成に失敗しました[/red]")
@@ -208,6 +357,13 @@ def _generate_from_script(
     validate_only: bool,
     dry_run: bool,
     no_generate: bool,
+    chunks: int | None = None,
+    segment_cache: bool = False,
+    audio_cache: bool = False,
+    resume: bool = False,
+    checkpoint_interval: float = 60.0,
+    draft: bool = False,
+    profile_path: str | None = None,
 ) -> None:
     """Scriptファイルから動画を生成"""
     from teto_core.script import Script, ScriptCompiler
@@ -347,6 +503,9 @@ def _generate_from_script(
     # 動画生成
     console.print("\n[bold yellow]動画生成を開始します...[/bold yellow]\n")
 
+    if draft and not isinstance(script_data.output, list):
+        _print_draft_notice(result.project.output)
+
     generator = VideoGenerator(result.project)
 
     def progress_callback(message: str):
@@ -372,6 +531,8 @@ def _generate_from_script(
             console.print(
                 f"[cyan]複数フォーマットで並列出力します: {len(script_data.output)}個[/cyan]"
             )
+            if profile_path:
+                _print_profile_unsupported()
 
             # 出力設定を作成
             output_configs = []
@@ -395,6 +556,8 @@ def _generate_from_script(
                     subtitle_mode=output_settings.subtitle_mode,
                     object_fit=output_settings.object_fit,
                 )
+                if draft:
+                    config = config.draft()
                 output_configs.append(config)
                 config_names.append(name)
 
@@ -436,8 +599,11 @@ def _generate_from_script(
                 )
 
                 # 並列生成（verbose=False で MoviePy のログを抑制）
+                # 音声トラックは全フォーマットで共有し、一度だけ合成する
                 output_paths = generator.generate_multi_parallel(
                     output_configs,
+                    share_audio=True,
+                    use_audio_cache=audio_cache,
                     progress_callback=lambda msg: (
                         parallel_progress_callback(msg),
                         progress.update(task, completed=len(completed_names)),
@@ -460,9 +626,48 @@ def _generate_from_script(
 
         else:
             # 単一フォーマット出力
-            output_path = generator.generate(progress_callback=progress_callback)
+            profiler = None
+            if resume:
+                if profile_path:
+                    _print_profile_unsupported()
+                if chunks or segment_cache:
+                    _print_resume_overrides()
+                if draft:
+                    generator.project.output = generator.project.output.draft()
+                output_path = generator.generate_resumable(
+                    segment_seconds=checkpoint_interval,
+                    resume=True,
+                    progress_callback=progress_callback,
+                    use_audio_cache=audio_cache,
+                )
+            elif chunks or segment_cache:
+                if profile_path:
+                    _print_profile_unsupported()
+                # シーン境界でチャンクを分割して並列レンダリング
+                if draft:
+                    generator.project.output = generator.project.output.draft()
+                output_path = generator.generate_chunked(
+                    num_chunks=chunks,
+                    scene_boundaries=result.metadata.scene_boundaries(),
+                    progress_callback=progress_callback,
+                    use_segment_cache=segment_cache,
+                    use_audio_cache=audio_cache,
+                )
+            else:
+                if profile_path:
+                    from teto_core.render import RenderProfiler
+
+                    profiler = RenderProfiler()
+                output_path = generator.generate(
+                    progress_callback=progress_callback,
+                    draft=draft,
+                    profiler=profiler,
+                    use_audio_cache=audio_cache,
+                )
             console.print("\n[bold green]✓ 動画生成が完了しました！[/bold green]")
             console.print(f"[green]出力ファイル: {output_path}[/green]")
+            if profiler is not None:
+                _print_profile(profiler, profile_path)
 
     except Exception as e:
         console.print("\n[red]エラー: 動画生成に失敗しました[/red]")
@@ -863,7 +1068,7 @@ def script_init(output_file):
 
 @main.group()
 def cache():
-    """アセットキャッシュを管理（TTS、画像、動画）"""
+    """アセットキャッシュを管理（TTS、画像、動画、セグメント、音声トラック）"""
     pass
 
 
@@ -871,7 +1076,7 @@ def cache():
 @click.option(
     "--type",
     "cache_type",
-    type=click.Choice(["all", "tts", "image", "video"]),
+    type=click.Choice(["all", "tts", "image", "video", "segment", "audio_track"]),
     default="all",
     help="表示するキャッシュタイプ",
 )
@@ -915,6 +1120,18 @@ def cache_info(cache_type):
                 f"{all_info.video.total_size_mb:.2f} MB",
                 str(all_info.video.cache_dir),
             )
+            table.add_row(
+                "セグメント",
+                str(all_info.segment.total_files),
+                f"{all_info.segment.total_size_mb:.2f} MB",
+                str(all_info.segment.cache_dir),
+            )
+            table.add_row(
+                "音声トラック",
+                str(all_info.audio_track.total_files),
+                f"{all_info.audio_track.total_size_mb:.2f} MB",
+                str(all_info.audio_track.cache_dir),
+            )
             table.add_row(
                 "[bold]合計[/bold]",
                 f"[bold]{all_info.total_files}[/bold]",
@@ -930,6 +1147,12 @@ def cache_info(cache_type):
             elif cache_type == "image":
                 info = all_info.image
                 type_name = "画像"
+            elif cache_type == "segment":
+                info = all_info.segment
+                type_name = "セグメント"
+            elif cache_type == "audio_track":
+                info = all_info.audio_track
+                type_name = "音声トラック"
             else:
                 info = all_info.video
                 type_name = "動画"
@@ -950,7 +1173,7 @@ def cache_info(cache_type):
 @click.option(
     "--type",
     "cache_type",
-    type=click.Choice(["all", "tts", "image", "video"]),
+    type=click.Choice(["all", "tts", "image", "video", "segment", "audio_track"]),
     default="all",
     help="クリアするキャッシュタイプ",
 )
@@ -979,6 +1202,14 @@ def cache_clear(yes, cache_type):
             total_files = all_info.image.total_files
             total_size = all_info.image.total_size_mb
             type_name = "画像"
+        elif cache_type == "segment":
+            total_files = all_info.segment.total_files
+            total_size = all_info.segment.total_size_mb
+            type_name = "セグメント"
+        elif cache_type == "audio_track":
+            total_files = all_info.audio_track.total_files
+            total_size = all_info.audio_track.total_size_mb
+            type_name = "音声トラック"
         else:
             total_files = all_info.video.total_files
             total_size = all_info.video.total_size_mb
@@ -1005,6 +1236,8 @@ def cache_clear(yes, cache_type):
             console.print(f"  TTS: {results['tts']} ファイル")
             console.print(f"  画像: {results['image']} ファイル")
             console.print(f"  動画: {results['video']} ファイル")
+            console.print(f"  セグメント: {results['segment']} ファイル")
+            console.print(f"  音声トラック: {results['audio_track']} ファイル")
         elif cache_type == "tts":
             deleted = manager.clear_tts()
             console.print(
@@ -1015,6 +1248,16 @@ def cache_clear(yes, cache_type):
             console.print(
                 f"\n[green]✓ 画像キャッシュ {deleted} ファイルを削除しました[/green]"
             )
+        elif cache_type == "segment":
+            deleted = manager.clear_segment()
+            console.print(
+                f"\n[green]✓ セグメントキャッシュ {deleted} ファイルを削除しました[/green]"
+            )
+        elif cache_type == "audio_track":
+            deleted = manager.clear_audio_track()
+            console.print(
+                f"\n[green]✓ 音声トラックキャッシュ {deleted} ファイルを削除しました[/green]"
+            )
         else:
             deleted = manager.clear_video()
             console.print(
@@ -1027,5 +1270,231 @@ def cache_clear(yes, cache_type):
         sys.exit(1)
 
 
+@main.group()
+def bench():
+    """レンダリング性能のベンチマーク"""
+    pass
+
+
+@bench.command("render")
+@click.option(
+    "--case",
+    "case_names",
+    multiple=True,
+    help="実行するケース名（複数指定可。省略時は標準ケースすべて）",
+)
+@click.option(
+    "--cases-file",
+    default=None,
+    help="ケース定義のJSONファイル（BenchmarkCase のリスト）",
+)
+@click.option(
+    "--encoder",
+    type=click.Choice(["null", "ffmpeg_pipe", "moviepy"]),
+    default="null",
+    help="出力バックエンド（null: エンコードせずフレーム生成のみ計測）",
+)
+@click.option("--scenes", type=click.IntRange(min=1), default=None, help="シーン数")
+@click.option("--scene-duration", type=float, default=None, help="1シーンの長さ（秒）")
+@click.option("--resolution", default=None, help="出力解像度（例: 1920x1080）")
+@click.option("--fps", type=click.IntRange(min=1), default=None, help="フレームレート")
+@click.option(
+    "--frame-workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="フレーム生成の並列スレッド数",
+)
+@click.option("-o", "--output", default="benchmark.json", help="結果のJSONファイルパス")
+@click.option("--baseline", default=None, help="比較するベースラインのJSONファイル")
+@click.option(
+    "--tolerance",
+    type=float,
+    default=0.1,
+    help="ベースラインに対して許容する fps の低下率（超えると終了コード1）",
+)
+@click.option(
+    "--work-dir",
+    default=None,
+    help="アセットと出力の作業ディレクトリ（省略時は一時ディレクトリ）",
+)
+@click.option(
+    "--no-isolate",
+    is_flag=True,
+    help="ケースを同じプロセスで実行（ピーク RSS はケースごとに分離されない）",
+)
+def bench_render(
+    case_names,
+    cases_file,
+    encoder,
+    scenes,
+    scene_duration,
+    resolution,
+    fps,
+    frame_workers,
+    output,
+    baseline,
+    tolerance,
+    work_dir,
+    no_isolate,
+):
+    """
+    合成プロジェクトをレンダリングして性能を計測
+
+    シーン数・レイヤーの種類・エフェクト・字幕の密度・キャラクター数を
+    変えた合成プロジェクトを VideoGenerator で生成し、fps、出力1分あたりの
+    生成時間、ピーク RSS を計測して JSON に保存します。
+
+    \b
+    例:
+      teto bench render                               # 標準ケースを計測
+      teto bench render --resolution 640x360 --scenes 2  # 小さい構成で素早く計測
+      teto bench render --case image_effects --encoder ffmpeg_pipe
+      teto bench render -o after.json --baseline before.json  # ベースラインと比較
+    """
+    import json
+    import shutil
+    import tempfile
+
+    from rich.table import Table
+    from teto_core.benchmark import (
+        DEFAULT_CASES,
+        BenchmarkCase,
+        BenchmarkReport,
+        compare_reports,
+        run_benchmark,
+    )
+
+    # ケースを決定
+    if cases_file:
+        with open(cases_file, encoding="utf-8") as f:
+            cases = [BenchmarkCase.model_validate(data) for data in json.load(f)]
+    else:
+        cases = list(DEFAULT_CASES)
+    if case_names:
+        unknown = set(case_names) - {case.name for case in cases}
+        if unknown:
+            console.print(
+                f"[red]エラー: 不明なケース: {', '.join(sorted(unknown))}[/red]"
+            )
+            console.print(f"利用可能なケース: {', '.join(c.name for c in cases)}")
+            sys.exit(1)
+        cases = [case for case in cases if case.name in case_names]
+
+    # 全ケースに共通の上書き
+    overrides = {}
+    if scenes is not None:
+        overrides["scenes"] = scenes
+    if scene_duration is not None:
+        overrides["scene_duration"] = scene_duration
+    if fps is not None:
+        overrides["fps"] = fps
+    if frame_workers is not None:
+        overrides["frame_workers"] = frame_workers
+    if resolution:
+        try:
+            width, height = (int(v) for v in resolution.lower().split("x"))
+        except ValueError:
+            console.print(f"[red]エラー: 解像度の形式が不正です: {resolution}[/red]")
+            sys.exit(1)
+        overrides["width"] = width
+        overrides["height"] = height
+    if overrides:
+        cases = [
+            BenchmarkCase.model_validate({**case.model_dump(), **overrides})
+            for case in cases
+        ]
+
+    baseline_report = None
+    if baseline:
+        baseline_report = BenchmarkReport.from_json_file(baseline)
+
+    temp_dir = None
+    if work_dir is None:
+        temp_dir = tempfile.mkdtemp(prefix="teto_bench_")
+        work_dir = temp_dir
+
+    console.print(
+        f"[cyan]{len(cases)}ケースを計測します（encoder: {encoder}）[/cyan]\n"
+    )
+
+    def on_result(result):
+        console.print(
+            f"  {result.case.name}: {result.fps:.1f} fps / "
+            f"出力1分あたり {result.seconds_per_output_minute:.1f}秒"
+        )
+
+    try:
+        report = run_benchmark(
+            cases,
+            work_dir,
+            encoder=encoder,
+            isolate=not no_isolate,
+            progress_callback=on_result,
+        )
+    finally:
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    report_path = report.write_json(output)
+
+    table = Table()
+    table.add_column("ケース", style="cyan")
+    table.add_column("フレーム", justify="right")
+    table.add_column("fps", justify="right")
+    table.add_column("秒/出力1分", justify="right")
+    table.add_column("ピーク RSS", justify="right")
+    for result in report.results:
+        rss = (
+            f"{result.peak_rss_bytes / 1024 / 1024:.0f} MB"
+            if result.peak_rss_bytes is not None
+            else "-"
+        )
+        table.add_row(
+            result.case.name,
+            str(result.frames),
+            f"{result.fps:.1f}",
+            f"{result.seconds_per_output_minute:.1f}",
+            rss,
+        )
+    console.print()
+    console.print(table)
+    console.print(f"[green]結果を保存しました: {report_path}[/green]")
+
+    if baseline_report is None:
+        return
+
+    comparisons = compare_reports(report, baseline_report)
+    if not comparisons:
+        console.print("[yellow]ベースラインに同じケースがありません[/yellow]")
+        return
+
+    table = Table(title="ベースラインとの比較")
+    table.add_column("ケース", style="cyan")
+    table.add_column("fps（前）", justify="right")
+    table.add_column("fps（後）", justify="right")
+    table.add_column("変化", justify="right")
+    regressions = []
+    for comparison in comparisons:
+        change = comparison.fps_change
+        if change < -tolerance:
+            regressions.append(comparison.name)
+            style = "red"
+        elif change > tolerance:
+            style = "green"
+        else:
+            style = "white"
+        table.add_row(
+            comparison.name,
+            f"{comparison.baseline_fps:.1f}",
+            f"{comparison.current_fps:.1f}",
+            f"[{style}]{change:+.1%}[/{style}]",
+        )
+    console.print(table)
+
+    if regressions:
+        console.print(f"[red]性能が低下したケース: {', '.join(regressions)}[/red]")
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     main()
@@ -29,3 +29,50 @@ def sample_image_path(temp_dir):
 def sample_output_path(temp_dir):
     """Provide a path for test output."""
     return temp_dir / "output.mp4"
+
+
+@pytest.fixture
+def counter_clip():
+    """Provide a factory for clips whose red channel encodes the frame time.
+
+    The factory takes ``duration``, ``size`` and an optional ``delay(t)``
+    returning seconds to sleep before each frame.
+    """
+    import time
+
+    import numpy as np
+    from moviepy import VideoClip
+
+    def make(duration=1.0, size=(16, 8), delay=None):
+        def frame_function(t):
+            if delay is not None:
+                time.sleep(delay(t))
+            frame = np.zeros((size[1], size[0], 3), dtype=np.uint8)
+            frame[:, :, 0] = int(round(t * 100))
+            return frame
+
+        return VideoClip(frame_function, duration=duration).with_fps(10)
+
+    return make
+
+
+class ChainClip:
+    """A clip stand-in whose transforms compose like moviepy's.
+
+    ``passes`` counts how many transforms have been stacked on the source.
+    """
+
+    def __init__(self, get_frame, duration: float = 2.0, passes: int = 0):
+        self.get_frame = get_frame
+        self.duration = duration
+        self.passes = passes
+
+    def transform(self, fn):
+        parent = self.get_frame
+        return ChainClip(lambda t: fn(parent, t), self.duration, self.passes + 1)
+
+
+@pytest.fixture
+def chain_clip():
+    """Provide the ChainClip stand-in for effect tests without moviepy clips."""
+    return ChainClip
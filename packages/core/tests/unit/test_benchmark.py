@@ -0,0 +1,134 @@
+"""Tests for the synthetic render benchmark."""
+
+import pytest
+from pydantic import ValidationError
+
+from teto_core.benchmark import (
+    BenchmarkCase,
+    BenchmarkReport,
+    BenchmarkResult,
+    build_project,
+    compare_reports,
+    prepare_assets,
+    run_benchmark,
+    run_case,
+)
+from teto_core.layer.models import ImageLayer, VideoLayer
+
+
+def _small_case(**kwargs):
+    """Create a tiny benchmark case."""
+    defaults = dict(name="tiny", scenes=2, scene_duration=0.5, width=32, height=24)
+    return BenchmarkCase(**{**defaults, "fps": 10, **kwargs})
+
+
+@pytest.mark.unit
+class TestBenchmarkCase:
+    """Test suite for BenchmarkCase."""
+
+    def test_duration(self):
+        """Test that the duration covers all scenes."""
+        assert _small_case(scenes=4).duration == 2.0
+
+    def test_unknown_effect_is_rejected(self):
+        """Test that effect names are validated."""
+        with pytest.raises(ValidationError, match="unknown effect type"):
+            _small_case(effects=["warp"])
+
+
+@pytest.mark.unit
+class TestBuildProject:
+    """Test suite for synthetic project building."""
+
+    def test_mixed_layers_alternate(self, temp_dir):
+        """Test that mixed cases alternate image and video layers."""
+        case = _small_case(scenes=3, layer_type="mixed", effects=["zoom"])
+        project = build_project(case, prepare_assets(case, temp_dir), "out.mp4")
+
+        layers = project.timeline.video_layers
+        assert [type(layer) for layer in layers] == [
+            ImageLayer,
+            VideoLayer,
+            ImageLayer,
+        ]
+        assert all(layer.effects[0].type == "zoom" for layer in layers)
+
+    def test_subtitles_and_characters(self, temp_dir):
+        """Test subtitle density and character count."""
+        case = _small_case(subtitles_per_scene=3, characters=2)
+        project = build_project(case, prepare_assets(case, temp_dir), "out.mp4")
+
+        items = project.timeline.subtitle_layers[0].items
+        assert len(items) == 6
+        assert items[-1].end_time == pytest.approx(case.duration)
+        assert len(project.timeline.character_layers) == 2
+
+    def test_assets_are_reused(self, temp_dir):
+        """Test that existing assets are not regenerated."""
+        case = _small_case(layer_type="video")
+        first = prepare_assets(case, temp_dir)
+        mtime = (temp_dir / "assets").stat().st_mtime_ns
+
+        second = prepare_assets(case, temp_dir)
+
+        assert first == second
+        assert (temp_dir / "assets").stat().st_mtime_ns == mtime
+
+
+@pytest.mark.unit
+class TestRunBenchmark:
+    """Test suite for running benchmarks."""
+
+    def test_run_case_with_null_encoder(self, temp_dir):
+        """Test that the null encoder renders frames without writing a file."""
+        case = _small_case(characters=1)
+
+        result = run_case(case, temp_dir, encoder="null")
+
+        assert result.frames == 10
+        assert result.seconds > 0
+        assert result.fps > 0
+        assert not (temp_dir / "output" / "tiny.mp4").exists()
+
+    def test_run_case_with_pipe_encoder(self, temp_dir):
+        """Test that a real encoder writes the output file."""
+        result = run_case(_small_case(), temp_dir, encoder="ffmpeg_pipe")
+
+        assert result.encoder == "ffmpeg_pipe"
+        assert (temp_dir / "output" / "tiny.mp4").exists()
+
+    def test_report_round_trip_and_compare(self, temp_dir):
+        """Test that a saved report can be used as a baseline."""
+        report = run_benchmark([_small_case()], temp_dir, isolate=False)
+        path = report.write_json(temp_dir / "baseline.json")
+
+        baseline = BenchmarkReport.from_json_file(path)
+        faster = BenchmarkReport(
+            results=[
+                BenchmarkResult(
+                    case=_small_case(),
+                    encoder="null",
+                    frames=10,
+                    seconds=baseline.results[0].seconds / 2,
+                )
+            ]
+        )
+        comparisons = compare_reports(faster, baseline)
+
+        assert "python" in baseline.environment
+        assert len(comparisons) == 1
+        assert comparisons[0].fps_change == pytest.approx(1.0)
+
+    def test_compare_skips_other_encoders(self):
+        """Test that results are only compared for the same encoder."""
+        result = BenchmarkResult(
+            case=_small_case(), encoder="null", frames=10, seconds=1.0
+        )
+        other = result.model_copy(update={"encoder": "ffmpeg_pipe"})
+
+        assert (
+            compare_reports(
+                BenchmarkReport(results=[result]), BenchmarkReport(results=[other])
+            )
+            == []
+        )
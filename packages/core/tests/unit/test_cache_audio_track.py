@@ -0,0 +1,177 @@
+"""Tests for audio track cache module."""
+
+import numpy as np
+import pytest
+
+from teto_core.cache.audio_track import AudioTrackCacheManager, audio_track_material
+from teto_core.effect.models import AnimationEffect
+from teto_core.layer.models import AudioLayer, ImageLayer
+from teto_core.output_config.models import OutputConfig
+from teto_core.project.models import Project, Timeline
+from teto_core.render import MixedAudioClip, decode_audio
+from teto_core.video_generator import VideoGenerator
+
+
+@pytest.fixture
+def sample_audio_path(temp_dir):
+    """Create a short stereo WAV file."""
+    path = temp_dir / "narration.wav"
+    samples = np.full((22050, 2), 0.25, dtype=np.float32)
+    MixedAudioClip(samples).write_audiofile(
+        str(path), fps=44100, codec="pcm_s16le", logger=None
+    )
+    return path
+
+
+def _project(image_path, audio_path, temp_dir, **output):
+    """Create an image project with one narration layer."""
+    return Project(
+        output=OutputConfig(
+            **{
+                "path": str(temp_dir / "out.mp4"),
+                "width": 32,
+                "height": 24,
+                "fps": 10,
+                "preset": "ultrafast",
+                "encoder": "ffmpeg_pipe",
+                **output,
+            }
+        ),
+        timeline=Timeline(
+            video_layers=[ImageLayer(path=str(image_path), duration=1.0)],
+            audio_layers=[AudioLayer(path=str(audio_path), start_time=0.2)],
+        ),
+    )
+
+
+@pytest.mark.unit
+class TestAudioTrackMaterial:
+    """Test suite for audio_track_material."""
+
+    def test_video_only_edits_are_ignored(
+        self, temp_dir, sample_image_path, sample_audio_path
+    ):
+        """Test that effects and output size do not affect the material."""
+        before = _project(sample_image_path, sample_audio_path, temp_dir)
+        after = _project(
+            sample_image_path, sample_audio_path, temp_dir, width=64, height=48
+        )
+        after.timeline.video_layers[0].effects = [AnimationEffect(type="zoom")]
+
+        assert audio_track_material(before) == audio_track_material(after)
+
+    def test_audio_changes_material(
+        self, temp_dir, sample_image_path, sample_audio_path
+    ):
+        """Test that audio settings, codec and length change the material."""
+        base = _project(sample_image_path, sample_audio_path, temp_dir)
+        louder = _project(sample_image_path, sample_audio_path, temp_dir)
+        louder.timeline.audio_layers[0].volume = 0.5
+        mp3 = _project(
+            sample_image_path, sample_audio_path, temp_dir, audio_codec="mp3"
+        )
+        longer = _project(sample_image_path, sample_audio_path, temp_dir)
+        longer.timeline.video_layers[0].duration = 2.0
+
+        material = audio_track_material(base)
+        assert audio_track_material(louder) != material
+        assert audio_track_material(mp3) != material
+        assert audio_track_material(longer) != material
+
+    def test_source_content_changes_material(
+        self, temp_dir, sample_image_path, sample_audio_path
+    ):
+        """Test that rewriting an audio source changes the material."""
+        project = _project(sample_image_path, sample_audio_path, temp_dir)
+        before = audio_track_material(project)
+        MixedAudioClip(np.zeros((100, 2), dtype=np.float32)).write_audiofile(
+            str(sample_audio_path), fps=44100, codec="pcm_s16le", logger=None
+        )
+
+        assert audio_track_material(project) != before
+
+
+@pytest.mark.unit
+class TestCachedAudioTrack:
+    """Test suite for cached audio track rendering."""
+
+    def test_track_is_rendered_once(
+        self, temp_dir, sample_image_path, sample_audio_path, monkeypatch
+    ):
+        """Test that a second render reuses the cached track."""
+        cache = AudioTrackCacheManager(cache_dir=temp_dir / "cache")
+        project = _project(sample_image_path, sample_audio_path, temp_dir)
+        first = VideoGenerator(project).cached_audio_track(cache)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("audio track was rendered again")
+
+        generator = VideoGenerator(project)
+        monkeypatch.setattr(generator, "render_audio_track", fail)
+
+        assert generator.cached_audio_track(cache) == first
+        assert cache.get_info().total_files == 1
+
+    def test_silent_timeline_is_not_cached(self, temp_dir, sample_image_path):
+        """Test that a timeline without audio returns None."""
+        cache = AudioTrackCacheManager(cache_dir=temp_dir / "cache")
+        project = _project(sample_image_path, sample_image_path, temp_dir)
+        project.timeline.audio_layers = []
+
+        assert VideoGenerator(project).cached_audio_track(cache) is None
+        assert cache.get_info().total_files == 0
+
+    def test_generate_muxes_cached_track(
+        self, temp_dir, sample_image_path, sample_audio_path
+    ):
+        """Test that generate muxes the cached track into the output."""
+        cache = AudioTrackCacheManager(cache_dir=temp_dir / "cache")
+        project = _project(sample_image_path, sample_audio_path, temp_dir)
+
+        output_path = VideoGenerator(project).generate(
+            verbose=False, use_audio_cache=True, audio_cache=cache
+        )
+
+        audio = decode_audio(output_path)
+        assert cache.get_info().total_files == 1
+        assert len(audio) == pytest.approx(44100, abs=2048)
+        assert np.abs(audio[:4000]).max() < 0.01
+        assert audio[20000:25000].mean() == pytest.approx(0.25, abs=0.02)
+
+    def test_chunked_render_uses_cached_track(
+        self, temp_dir, sample_image_path, sample_audio_path
+    ):
+        """Test that chunked rendering muxes the cached track."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        cache = AudioTrackCacheManager(cache_dir=temp_dir / "cache")
+        project = _project(sample_image_path, sample_audio_path, temp_dir)
+
+        output_path = VideoGenerator(project).generate_chunked(
+            num_chunks=2,
+            max_workers=1,
+            use_audio_cache=True,
+            audio_cache=cache,
+            _executor_class=ThreadPoolExecutor,
+        )
+
+        assert cache.get_info().total_files == 1
+        assert decode_audio(output_path)[20000:25000].mean() == pytest.approx(
+            0.25, abs=0.02
+        )
+
+    def test_resumable_render_uses_cached_track(
+        self, temp_dir, sample_image_path, sample_audio_path
+    ):
+        """Test that checkpointed rendering muxes the cached track."""
+        cache = AudioTrackCacheManager(cache_dir=temp_dir / "cache")
+        project = _project(sample_image_path, sample_audio_path, temp_dir)
+
+        output_path = VideoGenerator(project).generate_resumable(
+            segment_seconds=0.5, use_audio_cache=True, audio_cache=cache
+        )
+
+        assert cache.get_info().total_files == 1
+        assert decode_audio(output_path)[20000:25000].mean() == pytest.approx(
+            0.25, abs=0.02
+        )
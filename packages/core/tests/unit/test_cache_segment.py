@@ -0,0 +1,140 @@
+"""Tests for segment cache module."""
+
+import pytest
+
+from teto_core.cache.segment import (
+    SegmentCacheManager,
+    file_fingerprint,
+    segment_material,
+    video_layer_spans,
+)
+from teto_core.effect.models import AnimationEffect, TransitionConfig
+from teto_core.layer.models import ImageLayer, StampLayer
+from teto_core.output_config.models import OutputConfig
+from teto_core.project.models import Project, Timeline
+
+
+def _project(image_path, durations, stamps=None, **output):
+    """Create an image-only project with one layer per scene."""
+    return Project(
+        output=OutputConfig(path="out.mp4", fps=10, **output),
+        timeline=Timeline(
+            video_layers=[
+                ImageLayer(path=str(image_path), duration=d) for d in durations
+            ],
+            stamp_layers=stamps or [],
+        ),
+    )
+
+
+@pytest.mark.unit
+class TestSegmentMaterial:
+    """Test suite for segment_material."""
+
+    def test_unchanged_scene_survives_earlier_change(self, sample_image_path):
+        """Test that a later scene keeps its key when an earlier scene grows."""
+        before = _project(sample_image_path, [1.0, 2.0])
+        after = _project(sample_image_path, [1.5, 2.0])
+
+        assert segment_material(before, 10, 30) == segment_material(after, 15, 35)
+
+    def test_changed_layer_changes_material(self, sample_image_path):
+        """Test that editing a layer in the range changes the material."""
+        before = _project(sample_image_path, [1.0, 2.0])
+        after = _project(sample_image_path, [1.0, 2.0])
+        after.timeline.video_layers[1].effects = [AnimationEffect(type="zoom")]
+
+        assert segment_material(before, 10, 30) != segment_material(after, 10, 30)
+        assert segment_material(before, 0, 10) == segment_material(after, 0, 10)
+
+    def test_overlay_outside_range_is_ignored(self, sample_image_path):
+        """Test that overlays outside the range do not affect the material."""
+        stamp = StampLayer(path=str(sample_image_path), start_time=0.2, duration=0.5)
+        plain = _project(sample_image_path, [1.0, 2.0])
+        stamped = _project(sample_image_path, [1.0, 2.0], stamps=[stamp])
+
+        assert segment_material(plain, 10, 30) == segment_material(stamped, 10, 30)
+        assert segment_material(plain, 0, 10) != segment_material(stamped, 0, 10)
+
+    def test_output_destination_is_ignored(self, sample_image_path):
+        """Test that the output path and audio codec do not affect the material."""
+        a = _project(sample_image_path, [1.0])
+        b = _project(sample_image_path, [1.0])
+        b.output.path = "other.mp4"
+        b.output.audio_codec = "mp3"
+        c = _project(sample_image_path, [1.0], width=1280, height=720)
+
+        assert segment_material(a, 0, 10) == segment_material(b, 0, 10)
+        assert segment_material(a, 0, 10) != segment_material(c, 0, 10)
+
+    def test_scheduling_settings_are_ignored(self, sample_image_path):
+        """Test that worker, window and thread counts do not affect the material."""
+        a = _project(sample_image_path, [1.0])
+        b = _project(
+            sample_image_path, [1.0], frame_workers=4, frame_window=16, threads=8
+        )
+
+        assert segment_material(a, 0, 10) == segment_material(b, 0, 10)
+
+    def test_asset_content_changes_material(self, sample_image_path):
+        """Test that rewriting an asset file changes the material."""
+        from PIL import Image
+
+        project = _project(sample_image_path, [1.0])
+        before = segment_material(project, 0, 10)
+        Image.new("RGB", (100, 100), color="blue").save(sample_image_path)
+
+        assert segment_material(project, 0, 10) != before
+
+
+@pytest.mark.unit
+class TestVideoLayerSpans:
+    """Test suite for video_layer_spans."""
+
+    def test_sequential_layers(self, sample_image_path):
+        """Test that layers are placed back to back."""
+        layers = [
+            ImageLayer(path=str(sample_image_path), duration=1.0),
+            ImageLayer(path=str(sample_image_path), duration=2.0),
+        ]
+
+        assert video_layer_spans(layers) == [(0.0, 1.0), (1.0, 3.0)]
+
+    def test_transition_overlaps_next_layer(self, sample_image_path):
+        """Test that a transition overlaps the next layer."""
+        layers = [
+            ImageLayer(
+                path=str(sample_image_path),
+                duration=1.0,
+                transition=TransitionConfig(duration=0.5),
+            ),
+            ImageLayer(path=str(sample_image_path), duration=2.0),
+        ]
+
+        assert video_layer_spans(layers) == [(0.0, 1.0), (0.5, 2.5)]
+
+
+@pytest.mark.unit
+class TestSegmentCacheManager:
+    """Test suite for SegmentCacheManager."""
+
+    def test_put_and_get_path(self, temp_dir, sample_image_path):
+        """Test that a stored segment can be found by its key."""
+        manager = SegmentCacheManager(cache_dir=temp_dir / "cache")
+        key = manager.compute_key(_project(sample_image_path, [1.0]), 0, 10)
+        source = temp_dir / "chunk.mp4"
+        source.write_bytes(b"segment")
+
+        assert manager.get_path(key) is None
+
+        cached = manager.put_file(key, source)
+
+        assert manager.get_path(key) == cached
+        assert cached.read_bytes() == b"segment"
+        assert manager.get_info().total_files == 1
+
+    def test_file_fingerprint_missing_file(self, temp_dir):
+        """Test that missing files get a path-based fingerprint."""
+        path = str(temp_dir / "missing.png")
+
+        assert file_fingerprint(path) == f"missing:{path}"
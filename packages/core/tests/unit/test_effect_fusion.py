@@ -0,0 +1,138 @@
+"""Tests for fusing consecutive effects into single passes."""
+
+import numpy as np
+import pytest
+from scipy.ndimage import gaussian_filter
+
+from teto_core.effect.fusion import compose_affine
+from teto_core.effect.models import AnimationEffect
+from teto_core.effect.processors import EffectProcessor
+from teto_core.effect.strategies.base import EffectStrategy
+
+
+@pytest.fixture
+def frame():
+    """Create a smooth RGB frame."""
+    rng = np.random.default_rng(1)
+    noise = gaussian_filter(rng.random((48, 64, 3)), (3, 3, 0))
+    return (255 * (noise - noise.min()) / np.ptp(noise)).astype(np.uint8)
+
+
+def chained(chain_clip, frame, effects, t):
+    """Apply each effect with its own transform, as before fusion."""
+    clip = chain_clip(lambda _: frame)
+    for effect in effects:
+        strategy = EffectProcessor._effect_strategies[effect.type]
+        clip = strategy.apply(clip, effect, (64, 48))
+    return clip.get_frame(t)
+
+
+@pytest.mark.unit
+class TestEffectFusion:
+    """Test suite for fused effect application."""
+
+    def test_pixel_effects_fuse_into_one_pass(self, chain_clip, frame):
+        """Test that colour and fade effects run as one transform."""
+        effects = [
+            AnimationEffect(type="colorGrade", contrast=1.2, saturation=0.7),
+            AnimationEffect(type="vignette", vignette_amount=0.4),
+            AnimationEffect(type="fadein", duration=1.0),
+            AnimationEffect(type="fadeout", duration=1.0),
+        ]
+
+        clip = EffectProcessor.apply_effects(
+            chain_clip(lambda _: frame), effects, (64, 48)
+        )
+
+        assert clip.passes == 1
+        for t in (0.5, 1.5, 1.9):
+            diff = clip.get_frame(t).astype(int) - chained(
+                chain_clip, frame, effects, t
+            )
+            assert np.abs(diff).max() <= 2
+
+    def test_affine_effects_fuse_into_one_resample(self, chain_clip, frame):
+        """Test that consecutive zooms resample once and match the chain."""
+        effects = [
+            AnimationEffect(type="zoom", start_scale=1.1, end_scale=1.3),
+            AnimationEffect(
+                type="kenBurns", start_scale=1.0, end_scale=1.2, pan_end=(0.2, 0.1)
+            ),
+        ]
+
+        clip = EffectProcessor.apply_effects(
+            chain_clip(lambda _: frame), effects, (64, 48)
+        )
+
+        assert clip.passes == 1
+        diff = clip.get_frame(1.0).astype(int) - chained(
+            chain_clip, frame, effects, 1.0
+        )
+        assert np.abs(diff).mean() < 2
+
+    def test_zoom_out_is_not_fused(self, chain_clip, frame):
+        """Test that zooming out keeps its own pass for the transparent border."""
+        effects = [
+            AnimationEffect(type="zoom", start_scale=0.8, end_scale=0.8),
+            AnimationEffect(type="kenBurns"),
+        ]
+
+        clip = EffectProcessor.apply_effects(
+            chain_clip(lambda _: frame), effects, (64, 48)
+        )
+
+        assert clip.passes == 2
+
+    def test_unfusable_effect_breaks_the_run(self, chain_clip, frame):
+        """Test that an effect without a stage is applied on its own."""
+        effects = [
+            AnimationEffect(type="colorGrade", brightness=0.9),
+            AnimationEffect(type="blur", blur_amount=1.0),
+            AnimationEffect(type="colorGrade", brightness=0.9),
+        ]
+
+        clip = EffectProcessor.apply_effects(
+            chain_clip(lambda _: frame), effects, (64, 48)
+        )
+
+        assert clip.passes == 3
+        np.testing.assert_array_equal(
+            clip.get_frame(0.0), chained(chain_clip, frame, effects, 0.0)
+        )
+
+    def test_stages_default_to_none(self, chain_clip):
+        """Test that custom strategies are not fused unless they opt in."""
+
+        class Custom(EffectStrategy):
+            def apply(self, clip, effect, video_size):
+                return clip
+
+        effect = AnimationEffect(type="glitch")
+        assert Custom().pixel_stage(chain_clip(None), effect) is None
+        assert Custom().affine_stage(chain_clip(None), effect) is None
+
+
+@pytest.mark.unit
+class TestComposeAffine:
+    """Test suite for compose_affine."""
+
+    def test_composes_scale_and_offset(self):
+        """Test that the composed map equals applying both maps in turn."""
+
+        def first(t, w, h):
+            return 1.5, 1.25, 4.0, 2.0
+
+        def second(t, w, h):
+            return 2.0, 1.5, 1.0, 3.0
+
+        scale_x, scale_y, offset_x, offset_y = compose_affine(
+            [first, second], 0.0, 10, 10
+        )
+
+        assert (scale_x, scale_y) == (3.0, 1.875)
+        assert offset_x == 1.0 + 4.0 * 2.0
+        assert offset_y == 3.0 + 2.0 * 1.5
+
+    def test_empty_is_identity(self):
+        """Test that no stages give the identity map."""
+        assert compose_affine([], 0.0, 10, 10) == (1.0, 1.0, 0.0, 0.0)
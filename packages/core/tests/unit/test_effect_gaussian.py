@@ -0,0 +1,124 @@
+"""Tests for the tiered Gaussian blur engine."""
+
+import numpy as np
+import pytest
+from scipy.ndimage import gaussian_filter
+
+from teto_core.effect.gaussian import (
+    BOX_MEAN_ERROR,
+    PYRAMID_MEAN_ERROR,
+    _box_radii,
+    box_blur,
+    choose_blur_quality,
+    gaussian_blur,
+    pyramid_blur,
+)
+from teto_core.effect.models import AnimationEffect
+from teto_core.effect.strategies.blur import BlurEffect
+
+
+@pytest.fixture
+def stripes():
+    """Create an RGBA frame with hard edges, the worst case for approximations."""
+    columns = np.indices((120, 600))[1]
+    frame = np.where(columns % 60 < 30, 255, 0).astype(np.uint8)
+    return np.stack([frame, 255 - frame, frame, np.full_like(frame, 200)], axis=2)
+
+
+def per_channel_reference(frame, sigma):
+    """Blur each channel separately, as BlurEffect originally did."""
+    result = np.zeros_like(frame)
+    for i in range(frame.shape[2]):
+        result[:, :, i] = gaussian_filter(frame[:, :, i], sigma=sigma)
+    return result
+
+
+@pytest.mark.unit
+class TestGaussianBlur:
+    """Test suite for gaussian_blur and its tiers."""
+
+    def test_exact_matches_per_channel_filter(self, stripes):
+        """Test that the exact tier reproduces the original output bit for bit."""
+        result = gaussian_blur(stripes, 3.0, "exact")
+
+        np.testing.assert_array_equal(result, per_channel_reference(stripes, 3.0))
+
+    def test_box_radii_match_variance(self):
+        """Test that the three boxes add up to the Gaussian variance."""
+        sigma = 7.0
+        radii = _box_radii(sigma)
+        variance = sum(((2 * r + 1) ** 2 - 1) / 12 for r in radii)
+
+        assert len(radii) == 3
+        assert abs(variance - sigma**2) < 2 * sigma
+
+    @pytest.mark.parametrize("sigma", [6.0, 7.5])
+    def test_box_within_error_bound(self, stripes, sigma):
+        """Test that the box approximation stays within its documented error."""
+        result = box_blur(stripes, sigma)
+        expected = per_channel_reference(stripes, sigma)
+
+        assert result.shape == stripes.shape
+        assert result.dtype == np.uint8
+        assert np.abs(result.astype(int) - expected).mean() <= BOX_MEAN_ERROR
+
+    @pytest.mark.parametrize("sigma", [8.0, 20.0, 30.0])
+    def test_pyramid_within_error_bound(self, stripes, sigma):
+        """Test that downsample-blur-upsample stays within its documented error."""
+        result = pyramid_blur(stripes, sigma)
+        expected = per_channel_reference(stripes, sigma)
+
+        assert result.shape == stripes.shape
+        assert np.abs(result.astype(int) - expected).mean() <= PYRAMID_MEAN_ERROR
+
+    def test_grayscale_frames(self):
+        """Test that two-dimensional frames are supported by every tier."""
+        frame = np.random.default_rng(0).integers(0, 256, (61, 83), dtype=np.uint8)
+
+        for quality in ("exact", "box", "pyramid"):
+            assert gaussian_blur(frame, 9.0, quality).shape == frame.shape
+
+    def test_zero_sigma_returns_input(self, stripes):
+        """Test that no blur leaves the frame untouched."""
+        assert gaussian_blur(stripes, 0.0) is stripes
+
+
+@pytest.mark.unit
+class TestChooseBlurQuality:
+    """Test suite for automatic tier selection."""
+
+    def test_small_frames_and_radii_stay_exact(self):
+        """Test that cheap cases use the exact filter."""
+        assert choose_blur_quality((360, 640, 3), 30.0, 2.0) == "exact"
+        assert choose_blur_quality((2160, 3840, 3), 2.0, 2.0) == "exact"
+
+    def test_faster_tiers_for_larger_radii(self):
+        """Test that the box and pyramid tiers take over as sigma grows."""
+        assert choose_blur_quality((2160, 3840, 3), 6.0, 4.0) == "box"
+        assert choose_blur_quality((2160, 3840, 3), 30.0, 4.0) == "pyramid"
+
+    def test_tolerance_rules_out_tiers(self):
+        """Test that a tier is only chosen when its error bound fits the tolerance."""
+        assert choose_blur_quality((2160, 3840, 3), 6.0, 1.5) == "exact"
+        assert choose_blur_quality((2160, 3840, 3), 30.0, 1.5) == "pyramid"
+        assert choose_blur_quality((2160, 3840, 3), 30.0, 0.5) == "exact"
+
+
+@pytest.mark.unit
+class TestBlurEffectQuality:
+    """Test suite for BlurEffect quality settings."""
+
+    def test_effect_uses_requested_tier(self, stripes):
+        """Test that blur_quality selects the engine tier."""
+
+        class Clip:
+            def transform(self, fn):
+                self.fn = fn
+                return self
+
+        effect = AnimationEffect(type="blur", blur_amount=6.0, blur_quality="box")
+        clip = BlurEffect().apply(Clip(), effect, (250, 90))
+
+        np.testing.assert_array_equal(
+            clip.fn(lambda t: stripes, 0.0), box_blur(stripes, 6.0)
+        )
@@ -0,0 +1,133 @@
+"""Tests for memoizing time-invariant effects on static sources."""
+
+import numpy as np
+import pytest
+
+from teto_core.effect.memo import freeze_clip
+from teto_core.effect.models import AnimationEffect
+from teto_core.effect.processors import EffectProcessor
+from teto_core.render.static_spans import is_static_overlay, mark_static_overlay
+
+
+@pytest.fixture
+def source(chain_clip):
+    """Create a static source that records every read."""
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 256, (24, 32, 3), dtype=np.uint8)
+    reads = []
+
+    def get_frame(t):
+        reads.append(t)
+        return frame
+
+    return chain_clip(get_frame), reads
+
+
+@pytest.mark.unit
+class TestStaticEffectMemo:
+    """Test suite for static-source effect memoization."""
+
+    def test_invariant_prefix_is_computed_once(self, source):
+        """Test that blur runs once and the fade reads the cached result."""
+        clip, reads = source
+        effects = [
+            AnimationEffect(type="blur", blur_amount=2.0),
+            AnimationEffect(type="fadein", duration=1.0),
+        ]
+
+        result = EffectProcessor.apply_effects(
+            clip, effects, (32, 24), static_source=True
+        )
+        frames = [result.get_frame(t) for t in (0.0, 0.5, 1.5)]
+
+        assert len(reads) == 1
+        assert frames[0].max() == 0
+        assert not is_static_overlay(result)
+
+    def test_matches_unmemoized_result(self, source):
+        """Test that memoization does not change the rendered frames."""
+        clip, _ = source
+        effects = [
+            AnimationEffect(type="colorGrade", contrast=1.2),
+            AnimationEffect(type="vignette"),
+            AnimationEffect(type="fadeout", duration=1.0),
+        ]
+
+        memoized = EffectProcessor.apply_effects(
+            clip, effects, (32, 24), static_source=True
+        )
+        plain = EffectProcessor.apply_effects(clip, effects, (32, 24))
+
+        for t in (0.2, 1.5):
+            np.testing.assert_array_equal(memoized.get_frame(t), plain.get_frame(t))
+
+    def test_all_invariant_result_is_marked_static(self, source):
+        """Test that a fully time-invariant stack stays a static overlay."""
+        clip, reads = source
+
+        result = EffectProcessor.apply_effects(
+            clip,
+            [AnimationEffect(type="blur"), AnimationEffect(type="colorGrade")],
+            (32, 24),
+            static_source=True,
+        )
+        result.get_frame(0.0)
+        result.get_frame(1.0)
+
+        assert is_static_overlay(result)
+        assert len(reads) == 1
+
+    def test_marked_source_is_treated_as_static(self, source):
+        """Test that a clip marked as a static overlay is memoized."""
+        clip, reads = source
+        mark_static_overlay(clip)
+
+        result = EffectProcessor.apply_effects(
+            clip, [AnimationEffect(type="blur")], (32, 24)
+        )
+        result.get_frame(0.0)
+        result.get_frame(1.0)
+
+        assert len(reads) == 1
+
+    def test_dynamic_source_is_not_memoized(self, source):
+        """Test that effects on a changing source run every frame."""
+        clip, reads = source
+
+        result = EffectProcessor.apply_effects(
+            clip, [AnimationEffect(type="blur")], (32, 24)
+        )
+        result.get_frame(0.0)
+        result.get_frame(1.0)
+
+        assert len(reads) == 2
+        assert not is_static_overlay(result)
+
+    def test_variant_effect_first_disables_memo(self, source):
+        """Test that only the leading time-invariant effects are cached."""
+        clip, reads = source
+
+        result = EffectProcessor.apply_effects(
+            clip,
+            [AnimationEffect(type="fadein"), AnimationEffect(type="blur")],
+            (32, 24),
+            static_source=True,
+        )
+        result.get_frame(0.0)
+        result.get_frame(1.0)
+
+        assert len(reads) == 2
+
+
+@pytest.mark.unit
+class TestFreezeClip:
+    """Test suite for freeze_clip."""
+
+    def test_returns_first_frame_for_all_times(self, source):
+        """Test that the first generated frame is reused."""
+        clip, reads = source
+
+        frozen = freeze_clip(clip)
+
+        assert frozen.get_frame(0.3) is frozen.get_frame(1.7)
+        assert reads == [0.3]
@@ -0,0 +1,206 @@
+"""Tests for the output-sized affine resampler."""
+
+import numpy as np
+import pytest
+from scipy.ndimage import gaussian_filter, shift as scipy_shift, zoom as scipy_zoom
+
+from teto_core.effect.models import AnimationEffect
+from teto_core.effect.resample import (
+    affine_resample,
+    corner_aligned_axis,
+    corner_aligned_offset,
+)
+from teto_core.effect.strategies.zoom import KenBurnsEffect, ZoomEffect
+
+# 旧実装（scipy の zoom と切り出し）との差の許容値。丸め方の違いだけを許す
+ZOOM_TOLERANCE = 1
+
+
+@pytest.fixture
+def smooth_frame():
+    """Create a smooth RGB frame so interpolation differences stay small."""
+    rng = np.random.default_rng(0)
+    noise = gaussian_filter(rng.random((60, 80, 3)), (4, 4, 0))
+    return (255 * (noise - noise.min()) / np.ptp(noise)).astype(np.uint8)
+
+
+@pytest.fixture
+def noise_frame():
+    """Create a frame of independent pixels, where any geometry shift shows."""
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 256, (61, 83, 3), dtype=np.uint8)
+
+
+class Clip:
+    """A clip stand-in that keeps the frame transform."""
+
+    duration = 1.0
+
+    def transform(self, fn):
+        self.fn = fn
+        return self
+
+
+def zoom_then_crop(frame, scale, start):
+    """Zoom with scipy and crop at an integer start, as ZoomEffect used to."""
+    h, w = frame.shape[:2]
+    zoomed = scipy_zoom(frame, (scale, scale, 1), order=1)
+    if start is None:
+        start = ((zoomed.shape[1] - w) // 2, (zoomed.shape[0] - h) // 2)
+    x, y = start
+    return zoomed[y : y + h, x : x + w]
+
+
+@pytest.mark.unit
+class TestAffineResample:
+    """Test suite for affine_resample."""
+
+    def test_identity(self, smooth_frame):
+        """Test that scale 1 without offset returns the source."""
+        result, inside = affine_resample(smooth_frame, 1.0)
+
+        np.testing.assert_array_equal(result, smooth_frame)
+        assert inside is None
+
+    def test_corner_aligned_matches_zoom_then_crop(self, noise_frame):
+        """Test that corner-aligned offsets reproduce scipy zoom plus a crop."""
+        scale_x, zw = corner_aligned_axis(83, 1.3)
+        scale_y, zh = corner_aligned_axis(61, 1.3)
+        zoomed = scipy_zoom(noise_frame, (1.3, 1.3, 1), order=1)
+        assert zoomed.shape[:2] == (zh, zw)
+
+        result, _ = affine_resample(
+            noise_frame,
+            (scale_x, scale_y),
+            (corner_aligned_offset(7, scale_x), corner_aligned_offset(4, scale_y)),
+        )
+
+        expected = zoomed[4 : 4 + 61, 7 : 7 + 83]
+        assert np.abs(result.astype(int) - expected).max() <= ZOOM_TOLERANCE
+
+    def test_per_axis_scale(self, smooth_frame):
+        """Test that separate scales stretch each axis independently."""
+        result, _ = affine_resample(
+            smooth_frame, (1.0, 2.0), (0, 0), out_size=(80, 60), quality="nearest"
+        )
+
+        np.testing.assert_array_equal(result[::2], smooth_frame[:30])
+
+    def test_integer_offset_is_exact_crop(self, smooth_frame):
+        """Test that scale 1 with an integer pan is a plain crop."""
+        result, inside = affine_resample(smooth_frame, 1.0, (5, 3), out_size=(20, 10))
+
+        np.testing.assert_array_equal(result, smooth_frame[3:13, 5:25])
+        assert inside is None
+
+    def test_subpixel_offset_blends_neighbours(self):
+        """Test that a half pixel pan averages adjacent pixels."""
+        frame = np.array([[0, 100, 200, 200]], dtype=np.uint8)
+
+        result, _ = affine_resample(frame, 1.0, (0.5, 0.0), out_size=(3, 1))
+
+        np.testing.assert_array_equal(result, [[50, 150, 200]])
+
+    def test_nearest_picks_source_pixels(self, smooth_frame):
+        """Test that nearest mode only copies existing pixel values."""
+        result, _ = affine_resample(smooth_frame, 2.0, (20, 15), quality="nearest")
+
+        np.testing.assert_array_equal(result[::2, ::2], smooth_frame[7:37, 10:50])
+
+    def test_zoom_out_reports_uncovered_pixels(self, smooth_frame):
+        """Test that pixels outside the shrunken source are flagged."""
+        result, inside = affine_resample(smooth_frame, 0.5, (-20, -15))
+
+        assert result.shape == smooth_frame.shape
+        assert inside[30, 40]
+        assert not inside[0, 0]
+        assert inside.sum() == 30 * 40
+
+
+@pytest.mark.unit
+class TestScipyZoomGeometry:
+    """Regression tests against the previous scipy zoom-and-crop output."""
+
+    @pytest.mark.parametrize("scale", [1.0, 1.05, 1.17, 1.3, 2.0, 2.37])
+    def test_zoom_matches_scipy(self, noise_frame, scale):
+        """Test that ZoomEffect samples the same positions as zoom plus crop."""
+        effect = AnimationEffect(type="zoom", start_scale=scale, end_scale=scale)
+        clip = ZoomEffect().apply(Clip(), effect, (83, 61))
+
+        result = clip.fn(lambda t: noise_frame, 0.0)
+
+        expected = zoom_then_crop(noise_frame, scale, None)
+        assert np.abs(result.astype(int) - expected).max() <= ZOOM_TOLERANCE
+
+    def test_zoom_out_matches_scipy(self, noise_frame):
+        """Test that a zoomed-out frame lands where the old code placed it."""
+        effect = AnimationEffect(type="zoom", start_scale=0.7, end_scale=0.7)
+        clip = ZoomEffect().apply(Clip(), effect, (83, 61))
+
+        result = clip.fn(lambda t: noise_frame, 0.0)
+
+        zoomed = scipy_zoom(noise_frame, (0.7, 0.7, 1), order=1)
+        zh, zw = zoomed.shape[:2]
+        y, x = (61 - zh) // 2, (83 - zw) // 2
+        assert (result[:, :, 3] == 255).sum() == zh * zw
+        inner = result[y : y + zh, x : x + zw, :3].astype(int)
+        assert np.abs(inner - zoomed).max() <= ZOOM_TOLERANCE
+
+    def test_ken_burns_matches_scipy_at_whole_pixels(self, noise_frame):
+        """Test that a pan landing on whole pixels equals zoom plus crop."""
+        # 拡大後 108x79。余白 25x18 の 0.6 と 0.5 の位置で 15, 9 画素目から切り出す
+        effect = AnimationEffect(
+            type="kenBurns",
+            start_scale=1.3,
+            end_scale=1.3,
+            pan_start=(0.1, 0.0),
+            pan_end=(0.1, 0.0),
+        )
+        clip = KenBurnsEffect().apply(Clip(), effect, (83, 61))
+
+        result = clip.fn(lambda t: noise_frame, 0.0)
+
+        expected = zoom_then_crop(noise_frame, 1.3, (15, 9))
+        assert np.abs(result.astype(int) - expected).max() <= ZOOM_TOLERANCE
+
+    def test_ken_burns_subpixel_pan_is_close(self, smooth_frame):
+        """Test that sub-pixel pans stay close to zoom, crop and shift."""
+        effect = AnimationEffect(
+            type="kenBurns",
+            start_scale=1.5,
+            end_scale=1.5,
+            pan_start=(-0.3, 0.25),
+            pan_end=(-0.3, 0.25),
+        )
+        clip = KenBurnsEffect().apply(Clip(), effect, (80, 60))
+
+        result = clip.fn(lambda t: smooth_frame, 0.0)
+
+        # 旧実装は拡大後の画像をもう一度線形補間していたため完全には一致しない
+        zoomed = scipy_zoom(smooth_frame, (1.5, 1.5, 1), order=1)
+        x, y = (zoomed.shape[1] - 80) * 0.2, (zoomed.shape[0] - 60) * 0.75
+        shifted = scipy_shift(
+            zoomed[int(y) : int(y) + 61, int(x) : int(x) + 81],
+            (int(y) - y, int(x) - x, 0),
+            order=1,
+            mode="nearest",
+        )
+        assert np.abs(result.astype(int) - shifted[:60, :80]).max() <= 2
+
+
+@pytest.mark.unit
+class TestZoomOutTransparency:
+    """Test suite for zooming out with a transparent border."""
+
+    def test_rgb_gains_transparent_border(self, smooth_frame):
+        """Test that zooming out an RGB frame adds a transparent margin."""
+        effect = AnimationEffect(
+            type="zoom", start_scale=0.5, end_scale=0.5, resample="nearest"
+        )
+        clip = ZoomEffect().apply(Clip(), effect, (80, 60))
+
+        result = clip.fn(lambda t: smooth_frame, 0.0)
+
+        assert result.shape == (60, 80, 4)
+        assert result[0, 0, 3] == 0
+        assert result[30, 40, 3] == 255
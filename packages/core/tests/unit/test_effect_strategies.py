@@ -4,9 +4,15 @@ import pytest
 import numpy as np
 
 from teto_core.effect.models import AnimationEffect
+from teto_core.effect.processors import EffectProcessor
 from teto_core.effect.strategies.fade import FadeInEffect, FadeOutEffect
 from teto_core.effect.strategies.zoom import ZoomEffect, KenBurnsEffect
 from teto_core.effect.strategies.blur import BlurEffect
+from teto_core.effect.strategies.color import (
+    ColorGradeEffect,
+    VignetteEffect,
+    _vignette_mask,
+)
 from teto_core.effect.strategies.slide import SlideInEffect, SlideOutEffect
 
 
@@ -198,6 +204,27 @@ class TestBlurEffect:
         result = transform_fn(lambda t: simple_frame.copy(), 0.0)
         assert result.shape == simple_frame.shape
 
+    def test_scale_params_scales_blur_amount(self):
+        """Test that the blur radius follows the render scale."""
+        blur = BlurEffect()
+
+        scaled = blur.scale_params(AnimationEffect(type="blur", blur_amount=4.0), 0.5)
+        default = blur.scale_params(AnimationEffect(type="blur"), 0.5)
+
+        assert scaled.blur_amount == 2.0
+        assert default.blur_amount == 1.5
+
+    def test_scale_effects_keeps_resolution_independent_effects(self):
+        """Test that effects without pixel parameters are left unchanged."""
+        zoom = AnimationEffect(type="zoom")
+        blur = AnimationEffect(type="blur", blur_amount=2.0)
+
+        scaled = EffectProcessor.scale_effects([zoom, blur], 0.5)
+
+        assert scaled[0] is zoom
+        assert scaled[1].blur_amount == 1.0
+        assert blur.blur_amount == 2.0
+
 
 @pytest.mark.unit
 class TestZoomEffect:
@@ -293,6 +320,81 @@ class TestKenBurnsEffect:
             assert result.shape[:2] == simple_frame.shape[:2]
 
 
+@pytest.mark.unit
+class TestColorGradeEffect:
+    """Test suite for ColorGradeEffect."""
+
+    @staticmethod
+    def reference(frame, contrast, brightness, color_temp, saturation):
+        """Grade a frame with the original float pipeline."""
+        frame = frame.astype(float) / 255.0
+        frame = ((frame - 0.5) * contrast + 0.5) * brightness
+        frame[:, :, 0] *= 1 + color_temp * 0.3
+        frame[:, :, 2] *= 1 - color_temp * 0.3
+        if saturation != 1.0:
+            gray = np.dot(frame[..., :3], [0.299, 0.587, 0.114])
+            frame[:, :, :3] = (
+                gray[..., np.newaxis] * (1 - saturation) + frame[:, :, :3] * saturation
+            )
+        return np.clip(frame * 255, 0, 255).astype(np.uint8)
+
+    @pytest.fixture
+    def noise_frame(self):
+        """Create a frame that covers every 8-bit value."""
+        rng = np.random.default_rng(0)
+        return rng.integers(0, 256, (64, 64, 4), dtype=np.uint8)
+
+    def test_lut_matches_float_pipeline(self, noise_frame, mock_clip):
+        """Test that the per-channel tables reproduce the float result exactly."""
+        effect = AnimationEffect(
+            type="colorGrade", contrast=1.3, brightness=0.9, color_temp=-0.4
+        )
+
+        result_clip = ColorGradeEffect().apply(mock_clip, effect, (64, 64))
+        result = result_clip._transform_fn(lambda t: noise_frame, 0.0)
+
+        np.testing.assert_array_equal(
+            result, self.reference(noise_frame, 1.3, 0.9, -0.4, 1.0)
+        )
+
+    def test_saturation_matrix_matches_float_pipeline(self, noise_frame, mock_clip):
+        """Test that the colour matrix path stays within one level."""
+        effect = AnimationEffect(
+            type="colorGrade", contrast=1.1, color_temp=0.2, saturation=0.5
+        )
+
+        result_clip = ColorGradeEffect().apply(mock_clip, effect, (64, 64))
+        result = result_clip._transform_fn(lambda t: noise_frame, 0.0)
+
+        expected = self.reference(noise_frame, 1.1, 1.0, 0.2, 0.5)
+        assert result.dtype == np.uint8
+        assert np.abs(result.astype(int) - expected).max() <= 1
+
+
+@pytest.mark.unit
+class TestVignetteEffect:
+    """Test suite for VignetteEffect."""
+
+    def test_mask_is_cached_per_size(self):
+        """Test that the mask is computed once per frame size."""
+        mask = _vignette_mask(90, 160, 0.5)
+
+        assert _vignette_mask(90, 160, 0.5) is mask
+        assert _vignette_mask(45, 80, 0.5) is not mask
+        assert not mask.flags.writeable
+
+    def test_darkens_corners(self, simple_frame, mock_clip):
+        """Test that corners are darker than the centre."""
+        effect = AnimationEffect(type="vignette", vignette_amount=0.5)
+
+        result_clip = VignetteEffect().apply(mock_clip, effect, (100, 100))
+        result = result_clip._transform_fn(lambda t: simple_frame, 0.0)
+
+        assert result.dtype == np.uint8
+        assert result[50, 50, 0] == 128
+        assert result[0, 0, 0] == 64
+
+
 @pytest.mark.unit
 class TestSlideInEffect:
     """Test suite for SlideInEffect."""
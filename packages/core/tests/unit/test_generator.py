@@ -90,3 +90,101 @@ class TestVideoGenerator:
 
         assert len(generator._pre_hooks) == 2
         assert len(generator._post_hooks) == 2
+
+
+@pytest.mark.unit
+class TestDraftGenerate:
+    """Test suite for draft rendering."""
+
+    def test_draft_renders_smaller_and_restores_output(
+        self, sample_image_path, temp_dir
+    ):
+        """Test that a draft render is downscaled and leaves the project intact."""
+        from moviepy import VideoFileClip
+        from teto_core.layer.models import ImageLayer
+        from teto_core.output_config.models import OutputConfig
+        from teto_core.project.models import Timeline
+
+        output = OutputConfig(
+            path=str(temp_dir / "draft.mp4"), width=64, height=48, fps=24
+        )
+        project = Project(
+            output=output,
+            timeline=Timeline(
+                video_layers=[ImageLayer(path=str(sample_image_path), duration=1.0)]
+            ),
+        )
+
+        VideoGenerator(project).generate(verbose=False, draft=True)
+
+        assert project.output is output
+        with VideoFileClip(output.path) as result:
+            assert tuple(result.size) == (32, 24)
+            assert result.fps == 12
+            assert len(list(result.iter_frames())) == 12
+
+
+@pytest.mark.unit
+class TestOutputStepOverride:
+    """Test suite for replacing the output step of the default pipeline."""
+
+    def test_output_step_replaces_encoding(self, sample_image_path, temp_dir):
+        """Test that a custom output step runs instead of writing a file."""
+        from teto_core.generator.steps import NullOutputStep
+        from teto_core.layer.models import ImageLayer
+        from teto_core.output_config.models import OutputConfig
+        from teto_core.project.models import Timeline
+
+        output = OutputConfig(
+            path=str(temp_dir / "null.mp4"), width=32, height=24, fps=10
+        )
+        project = Project(
+            output=output,
+            timeline=Timeline(
+                video_layers=[ImageLayer(path=str(sample_image_path), duration=0.5)]
+            ),
+        )
+        generator = VideoGenerator(project)
+
+        result = generator.generate(verbose=False, output_step=NullOutputStep())
+
+        assert result == output.path
+        assert not (temp_dir / "null.mp4").exists()
+        assert not generator._has_custom_pipeline
+
+    def test_decoders_are_closed_when_rendering_fails(
+        self, counter_clip, temp_dir, monkeypatch
+    ):
+        """Test that a failed render still releases the decoder pool."""
+        from teto_core.generator.pipeline import ProcessingStep
+        from teto_core.layer.models import VideoLayer
+        from teto_core.output_config.models import OutputConfig
+        from teto_core.project.models import Timeline
+        from teto_core.render.decoder_pool import DecoderPool
+        from teto_core.render.ffmpeg_pipe import write_video_pipe
+
+        video_path = str(temp_dir / "source.mp4")
+        write_video_pipe(counter_clip(), video_path, fps=10, logger=None)
+
+        class FailingOutputStep(ProcessingStep):
+            def process(self, context):
+                context.video_clip.get_frame(0.1)
+                raise RuntimeError("encoder failed")
+
+        closed = []
+        close = DecoderPool.close
+        monkeypatch.setattr(
+            DecoderPool, "close", lambda pool: (closed.append(pool), close(pool))
+        )
+        project = Project(
+            output=OutputConfig(path=str(temp_dir / "out.mp4"), width=32, height=24),
+            timeline=Timeline(video_layers=[VideoLayer(path=video_path, duration=0.5)]),
+        )
+
+        with pytest.raises(RuntimeError):
+            VideoGenerator(project).generate(
+                verbose=False, output_step=FailingOutputStep()
+            )
+
+        assert len(closed) == 1
+        assert closed[0].open_count == 0
@@ -105,3 +105,18 @@ class TestProcessingContext:
         assert context.audio_clip is mock_audio
         assert context.output_size == (1280, 720)
         assert context.progress_callback is callback
+
+    def test_logger_follows_verbose(self, mock_project):
+        """Test that the output logger is a bar only when verbose."""
+        assert ProcessingContext(project=mock_project).logger == "bar"
+        assert ProcessingContext(project=mock_project, verbose=False).logger is None
+
+    def test_progress_logger_overrides_verbose(self, mock_project):
+        """Test that a custom progress logger is passed to output steps."""
+        progress_logger = Mock()
+
+        context = ProcessingContext(
+            project=mock_project, verbose=False, progress_logger=progress_logger
+        )
+
+        assert context.logger is progress_logger
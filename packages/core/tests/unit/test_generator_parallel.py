@@ -322,3 +322,239 @@ class TestGenerateSingleOutput:
 
             assert "Failed to generate" in str(exc_info.value)
             assert "/tmp/output.mp4" in str(exc_info.value)
+
+
+@pytest.mark.unit
+class TestGenerateChunked:
+    """Test suite for generate_chunked method."""
+
+    @pytest.fixture
+    def project(self, sample_image_path, temp_dir):
+        """Create a small image-only project."""
+        from teto_core.layer.models import ImageLayer
+        from teto_core.project.models import Timeline
+
+        return Project(
+            output=OutputConfig(
+                path=str(temp_dir / "out" / "chunked.mp4"),
+                width=32,
+                height=24,
+                fps=10,
+                preset="ultrafast",
+            ),
+            timeline=Timeline(
+                video_layers=[
+                    ImageLayer(path=str(sample_image_path), duration=1.0),
+                    ImageLayer(path=str(sample_image_path), duration=1.5),
+                ]
+            ),
+        )
+
+    def test_generate_chunked_writes_all_frames(self, project):
+        """Test that joined chunks contain every frame of the timeline."""
+        from moviepy import VideoFileClip
+
+        generator = VideoGenerator(project)
+
+        output_path = generator.generate_chunked(
+            num_chunks=3,
+            max_workers=2,
+            scene_boundaries=[1.0],
+            _executor_class=ThreadPoolExecutor,
+        )
+
+        assert output_path == project.output.path
+        with VideoFileClip(output_path) as result:
+            assert len(list(result.iter_frames())) == 25
+
+    def test_generate_chunked_removes_work_dir(self, project):
+        """Test that chunk files are cleaned up after joining."""
+        from pathlib import Path
+
+        generator = VideoGenerator(project)
+
+        generator.generate_chunked(num_chunks=2, _executor_class=ThreadPoolExecutor)
+
+        assert [p.name for p in Path(project.output.path).parent.iterdir()] == [
+            "chunked.mp4"
+        ]
+
+    def test_generate_chunked_executes_hooks(self, project):
+        """Test that pre and post hooks run once."""
+        generator = VideoGenerator(project)
+        pre_hook = Mock()
+        post_hook = Mock()
+        generator.register_pre_hook(pre_hook)
+        generator.register_post_hook(post_hook)
+
+        generator.generate_chunked(num_chunks=2, _executor_class=ThreadPoolExecutor)
+
+        pre_hook.assert_called_once_with(project)
+        post_hook.assert_called_once_with(project.output.path, project)
+
+    def test_generate_chunked_raises_on_chunk_failure(self, project):
+        """Test that a failing chunk aborts the render."""
+        generator = VideoGenerator(project)
+
+        with patch(
+            "teto_core.generator.parallel.render_chunk",
+            side_effect=ValueError("boom"),
+        ):
+            with pytest.raises(RuntimeError, match="Failed to render chunk"):
+                generator.generate_chunked(
+                    num_chunks=2, _executor_class=ThreadPoolExecutor
+                )
+
+    def test_overlays_are_not_rendered_before_chunks(self, project):
+        """Test that planning chunks and the audio track skip the overlay steps."""
+        from teto_core.generator.steps import OverlayCompositingStep
+
+        generator = VideoGenerator(project)
+
+        with patch.object(OverlayCompositingStep, "process") as overlay, patch(
+            "teto_core.generator.parallel.render_chunk",
+            side_effect=ValueError("boom"),
+        ):
+            with pytest.raises(RuntimeError):
+                generator.generate_chunked(
+                    num_chunks=2, _executor_class=ThreadPoolExecutor
+                )
+
+        overlay.assert_not_called()
+
+    def test_segment_cache_reuses_unchanged_scenes(self, project, temp_dir):
+        """Test that a second render only encodes the changed scene."""
+        from moviepy import VideoFileClip
+        from teto_core.cache.segment import SegmentCacheManager
+        from teto_core.generator import parallel
+
+        segment_cache = SegmentCacheManager(cache_dir=temp_dir / "segments")
+        generator = VideoGenerator(project)
+        generator.generate_chunked(
+            use_segment_cache=True,
+            segment_cache=segment_cache,
+            _executor_class=ThreadPoolExecutor,
+        )
+        assert segment_cache.get_info().total_files == 2
+
+        project.timeline.video_layers[0].duration = 0.5
+        messages = []
+        with patch.object(
+            parallel, "render_chunk", wraps=parallel.render_chunk
+        ) as render_chunk:
+            VideoGenerator(project).generate_chunked(
+                use_segment_cache=True,
+                segment_cache=segment_cache,
+                progress_callback=messages.append,
+                _executor_class=ThreadPoolExecutor,
+            )
+
+        assert render_chunk.call_count == 1
+        assert "セグメントキャッシュ: 1/2シーンを再利用" in messages
+        with VideoFileClip(project.output.path) as result:
+            assert len(list(result.iter_frames())) == 20
+
+
+@pytest.mark.unit
+class TestGenerateMultiParallelSharedAudio:
+    """Test suite for generate_multi_parallel with a shared audio track."""
+
+    @pytest.fixture
+    def project(self, sample_image_path, temp_dir):
+        """Create a small image project with one audio layer."""
+        import numpy as np
+        from moviepy import AudioClip
+        from teto_core.layer.models import AudioLayer, ImageLayer
+        from teto_core.project.models import Timeline
+
+        audio_path = str(temp_dir / "tone.wav")
+        AudioClip(
+            lambda t: np.sin(440 * 2 * np.pi * t), duration=1.0, fps=44100
+        ).write_audiofile(audio_path, fps=44100, logger=None)
+
+        return Project(
+            output=OutputConfig(path=str(temp_dir / "out" / "base.mp4")),
+            timeline=Timeline(
+                video_layers=[ImageLayer(path=str(sample_image_path), duration=1.0)],
+                audio_layers=[AudioLayer(path=audio_path)],
+            ),
+        )
+
+    @pytest.fixture
+    def output_configs(self, temp_dir):
+        """Create two small outputs with different sizes."""
+        return [
+            OutputConfig(
+                path=str(temp_dir / "out" / f"{name}.mp4"),
+                width=width,
+                height=height,
+                fps=10,
+                preset="ultrafast",
+                encoder=encoder,
+            )
+            for name, width, height, encoder in [
+                ("wide", 32, 18, "moviepy"),
+                ("square", 24, 24, "ffmpeg_pipe"),
+            ]
+        ]
+
+    def test_audio_track_is_rendered_once(self, project, output_configs):
+        """Test that every output gets audio mixed only once."""
+        from moviepy import VideoFileClip
+
+        generator = VideoGenerator(project)
+
+        with patch.object(
+            VideoGenerator,
+            "render_audio_track",
+            autospec=True,
+            side_effect=VideoGenerator.render_audio_track,
+        ) as render_audio_track:
+            output_paths = generator.generate_multi_parallel(
+                output_configs,
+                share_audio=True,
+                _executor_class=ThreadPoolExecutor,
+            )
+
+        assert render_audio_track.call_count == 1
+        for path, (width, height) in zip(output_paths, [(32, 18), (24, 24)]):
+            with VideoFileClip(path) as result:
+                assert tuple(result.size) == (width, height)
+                assert result.audio is not None
+
+    def test_one_track_per_audio_codec(self, project, output_configs):
+        """Test that outputs with different audio codecs get separate tracks."""
+        output_configs[1].audio_codec = "libmp3lame"
+        generator = VideoGenerator(project)
+
+        with patch(
+            "teto_core.generator.parallel.generate_output_with_audio"
+        ) as mock_worker:
+            mock_worker.side_effect = lambda p, c, a, v: c["path"]
+
+            generator.generate_multi_parallel(
+                output_configs,
+                share_audio=True,
+                _executor_class=ThreadPoolExecutor,
+            )
+
+        audio_paths = [call.args[2] for call in mock_worker.call_args_list]
+        assert len(set(audio_paths)) == 2
+        assert sorted(p.rsplit(".", 1)[1] for p in audio_paths) == ["mp3", "mp4"]
+
+    def test_work_dir_is_removed(self, project, output_configs):
+        """Test that the shared audio files are cleaned up."""
+        from pathlib import Path
+
+        generator = VideoGenerator(project)
+
+        generator.generate_multi_parallel(
+            output_configs, share_audio=True, _executor_class=ThreadPoolExecutor
+        )
+
+        assert sorted(
+            p.name for p in Path(output_configs[0].path).parent.iterdir()
+        ) == [
+            "square.mp4",
+            "wide.mp4",
+        ]
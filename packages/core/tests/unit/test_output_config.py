@@ -168,3 +168,45 @@ class TestOutputConfig:
         settings = OutputSettings(object_fit="cover")
         config = OutputConfig.from_settings(settings, "test.mp4")
         assert config.object_fit == "cover"
+
+    def test_encoder_defaults_to_moviepy(self):
+        """encoder のデフォルト値が moviepy であること"""
+        settings = OutputSettings()
+        assert settings.encoder == "moviepy"
+        assert settings.threads is None
+
+    def test_from_settings_preserves_encoder_options(self):
+        """from_settings が encoder と threads を保持すること"""
+        settings = OutputSettings(encoder="ffmpeg_pipe", threads=4)
+        config = OutputConfig.from_settings(settings, "test.mp4")
+        assert config.encoder == "ffmpeg_pipe"
+        assert config.threads == 4
+
+    def test_from_settings_preserves_frame_scheduling(self):
+        """from_settings が frame_workers と frame_window を保持すること"""
+        settings = OutputSettings(frame_workers=4, frame_window=12)
+        config = OutputConfig.from_settings(settings, "test.mp4")
+        assert config.frame_workers == 4
+        assert config.frame_window == 12
+        assert OutputSettings().frame_workers == 1
+
+    def test_render_size_defaults_to_output_size(self):
+        """render_scale が 1 の場合は width/height で描画すること"""
+        config = OutputConfig(path="test.mp4", width=1280, height=720)
+        assert config.render_size == (1280, 720)
+
+    def test_draft_reduces_resolution_and_fps(self):
+        """draft() が解像度・フレームレート・プリセットを下げること"""
+        config = OutputConfig(path="test.mp4", width=1920, height=1080, fps=30)
+        draft = config.draft()
+        assert draft.render_size == (960, 540)
+        assert (draft.width, draft.height) == (1920, 1080)
+        assert draft.fps == 12
+        assert draft.preset == "ultrafast"
+        assert draft.path == "test.mp4"
+        assert config.render_scale == 1.0
+
+    def test_draft_render_size_is_even(self):
+        """ドラフトの描画解像度が偶数に丸められること"""
+        config = OutputConfig(path="test.mp4", width=1080, height=1350)
+        assert config.draft(scale=0.3).render_size == (324, 404)
@@ -0,0 +1,189 @@
+"""Tests for the offline PCM audio mixer."""
+
+import numpy as np
+import pytest
+from moviepy import AudioClip, ColorClip
+
+from teto_core.generator.context import ProcessingContext
+from teto_core.generator.steps import AudioMergingStep
+from teto_core.layer.models import AudioLayer
+from teto_core.layer.processors import AudioProcessor
+from teto_core.render import (
+    AudioMixer,
+    MixedAudioClip,
+    decode_audio,
+    write_audio_track,
+)
+
+FPS = 8000
+
+
+def _write_tone(path, duration=0.5, value=0.25, fps=FPS):
+    """Write a constant-value stereo WAV file."""
+    samples = np.full((int(duration * fps), 2), value, dtype=np.float32)
+    MixedAudioClip(samples, fps).write_audiofile(
+        str(path), fps=fps, codec="pcm_s16le", logger=None
+    )
+    return str(path)
+
+
+@pytest.mark.unit
+class TestAudioMixer:
+    """Test suite for AudioMixer."""
+
+    def test_offset_gain_and_duration(self):
+        """Test that tracks are placed with offset, gain and duration."""
+        mixer = AudioMixer(fps=10)
+        mixer.add(np.ones((10, 2)), start=0.5, gain=0.5, duration=0.3)
+
+        buffer = mixer.mix()
+
+        assert buffer.dtype == np.float32
+        assert buffer.shape == (8, 2)
+        assert np.all(buffer[:5] == 0)
+        assert np.all(buffer[5:] == 0.5)
+
+    def test_overlapping_tracks_are_summed(self):
+        """Test that overlapping tracks are added together."""
+        mixer = AudioMixer(fps=10)
+        mixer.add(np.full((10, 2), 0.25))
+        mixer.add(np.full((10, 2), 0.5), start=0.5)
+
+        buffer = mixer.mix(duration=1.0)
+
+        assert buffer.shape == (10, 2)
+        assert np.allclose(buffer[:5], 0.25)
+        assert np.allclose(buffer[5:], 0.75)
+
+    def test_mono_is_spread_to_all_channels(self):
+        """Test that mono input is duplicated across channels."""
+        mixer = AudioMixer(fps=10)
+        mixer.add(np.arange(4, dtype=np.float32))
+
+        buffer = mixer.mix()
+
+        assert np.array_equal(buffer[:, 0], buffer[:, 1])
+        assert np.array_equal(buffer[:, 0], [0, 1, 2, 3])
+
+    def test_files_are_decoded_once(self, temp_dir, monkeypatch):
+        """Test that the same source is decoded only once."""
+        path = _write_tone(temp_dir / "tone.wav")
+        calls = []
+
+        import teto_core.render.audio_mixer as audio_mixer
+
+        original = audio_mixer.decode_audio
+
+        def counting_decode(*args, **kwargs):
+            calls.append(args[0])
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(audio_mixer, "decode_audio", counting_decode)
+
+        mixer = AudioMixer(fps=FPS)
+        mixer.add_file(path, start=0.0)
+        mixer.add_file(path, start=1.0, gain=0.5)
+
+        assert calls == [path]
+        assert mixer.duration == pytest.approx(1.5)
+
+    def test_decode_failure_raises(self, temp_dir):
+        """Test that an undecodable file raises OSError."""
+        broken = temp_dir / "broken.wav"
+        broken.write_bytes(b"not audio")
+
+        with pytest.raises(OSError):
+            decode_audio(str(broken))
+
+
+@pytest.mark.unit
+class TestMixedAudioClip:
+    """Test suite for MixedAudioClip."""
+
+    def test_frames_index_the_buffer(self):
+        """Test scalar and vector frame lookups, including out of range."""
+        samples = np.arange(20, dtype=np.float32).reshape(10, 2)
+        clip = MixedAudioClip(samples, fps=10)
+
+        assert clip.duration == 1.0
+        assert np.array_equal(clip.get_frame(0.3), [6, 7])
+        frames = clip.get_frame(np.array([0.0, 0.9, 1.5]))
+        assert np.array_equal(frames, [[0, 1], [18, 19], [0, 0]])
+
+    def test_transform_marks_clip_modified(self):
+        """Test that transformed copies are no longer written directly."""
+        clip = MixedAudioClip(np.ones((10, 2), dtype=np.float32), fps=10)
+
+        assert clip.is_unmodified
+        assert clip.with_duration(2.0).is_unmodified
+        assert not clip.with_volume_scaled(0.5).is_unmodified
+
+
+@pytest.mark.unit
+class TestWriteAudioTrack:
+    """Test suite for write_audio_track."""
+
+    def test_buffer_is_written_with_clip_duration(self, temp_dir):
+        """Test that the buffer is padded to the clip duration and clipped."""
+        clip = MixedAudioClip(np.full((FPS, 2), 2.0, dtype=np.float32), FPS)
+        path = str(temp_dir / "out.wav")
+
+        write_audio_track(clip.with_duration(1.5), path, codec="pcm_s16le", fps=FPS)
+
+        decoded = decode_audio(path, fps=FPS)
+        assert len(decoded) == int(1.5 * FPS)
+        assert np.allclose(decoded[:FPS], 1.0, atol=1e-3)
+        assert np.all(decoded[FPS:] == 0)
+
+    def test_other_clips_fall_back_to_moviepy(self, temp_dir):
+        """Test that non-buffer clips are written through MoviePy."""
+        clip = AudioClip(lambda t: np.zeros((np.size(t), 2)), duration=0.5, fps=FPS)
+        path = str(temp_dir / "fallback.wav")
+
+        write_audio_track(clip, path, codec="pcm_s16le", fps=FPS, logger=None)
+
+        assert len(decode_audio(path, fps=FPS)) >= int(0.5 * FPS)
+
+
+@pytest.mark.unit
+class TestAudioPipeline:
+    """Test suite for the mixer-backed audio processing."""
+
+    def test_audio_processor_returns_mixed_clip(self, temp_dir):
+        """Test that all audio layers end up in one buffer."""
+        path = _write_tone(temp_dir / "tone.wav")
+        layers = [
+            AudioLayer(path=path, start_time=0.0),
+            AudioLayer(path=path, start_time=0.25, volume=0.5, duration=0.5),
+        ]
+
+        clip = AudioProcessor().execute(layers)
+
+        assert isinstance(clip, MixedAudioClip)
+        assert clip.duration == pytest.approx(0.75)
+        assert clip.get_frame(0.1)[0] == pytest.approx(0.25, abs=1e-3)
+        assert clip.get_frame(0.4)[0] == pytest.approx(0.375, abs=1e-3)
+
+    def test_missing_layer_fails_validation(self, temp_dir):
+        """Test that a missing audio file still fails validation."""
+        layers = [AudioLayer(path=str(temp_dir / "missing.wav"))]
+
+        with pytest.raises(ValueError):
+            AudioProcessor().execute(layers)
+
+    def test_merging_with_video_audio(self):
+        """Test that existing video audio is mixed into the buffer."""
+        video_audio = AudioClip(
+            lambda t: np.full((np.size(t), 2), 0.25), duration=1.0, fps=44100
+        )
+        video = ColorClip((8, 8), color=(0, 0, 0), duration=1.0).with_audio(video_audio)
+        extra = MixedAudioClip(np.full((22050, 2), 0.5, dtype=np.float32))
+        context = ProcessingContext(project=None, video_clip=video, audio_clip=extra)
+
+        context = AudioMergingStep().execute(context)
+
+        merged = context.video_clip.audio
+        assert isinstance(merged, MixedAudioClip)
+        assert merged.duration == pytest.approx(1.0)
+        assert merged.get_frame(0.25)[0] == pytest.approx(0.75)
+        assert merged.get_frame(0.75)[0] == pytest.approx(0.25)
@@ -0,0 +1,148 @@
+"""Tests for render checkpoints and resumable generation."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from moviepy import VideoFileClip
+
+from teto_core.generator.steps import output as output_steps
+from teto_core.layer.models import ImageLayer
+from teto_core.output_config.models import OutputConfig
+from teto_core.project.models import Project, Timeline
+from teto_core.render import RenderCheckpoint
+from teto_core.video_generator import VideoGenerator
+
+SEGMENTS = [(0, 10), (10, 20), (20, 25)]
+
+
+@pytest.mark.unit
+class TestRenderCheckpoint:
+    """Test suite for RenderCheckpoint."""
+
+    def test_resume_restores_completed_segments(self, temp_dir):
+        """Test that finished segments survive a restart."""
+        checkpoint = RenderCheckpoint(temp_dir, "abc", SEGMENTS)
+        Path(checkpoint.segment_paths[0]).write_bytes(b"done")
+        checkpoint.mark_done(0)
+
+        restored = RenderCheckpoint(temp_dir, "abc", SEGMENTS)
+
+        assert restored.resume() == 1
+        assert restored.pending == [1, 2]
+        assert not restored.is_complete
+
+    def test_changed_project_starts_over(self, temp_dir):
+        """Test that a different project hash discards the manifest."""
+        checkpoint = RenderCheckpoint(temp_dir, "abc", SEGMENTS)
+        Path(checkpoint.segment_paths[0]).write_bytes(b"done")
+        checkpoint.mark_done(0)
+
+        assert RenderCheckpoint(temp_dir, "def", SEGMENTS).resume() == 0
+        assert RenderCheckpoint(temp_dir, "abc", SEGMENTS[:2]).resume() == 0
+
+    def test_missing_segment_file_is_pending(self, temp_dir):
+        """Test that a recorded segment without its file is rendered again."""
+        checkpoint = RenderCheckpoint(temp_dir, "abc", SEGMENTS)
+        checkpoint.mark_done(1)
+
+        restored = RenderCheckpoint(temp_dir, "abc", SEGMENTS)
+
+        assert restored.resume() == 0
+        assert restored.pending == [0, 1, 2]
+
+    def test_manifest_is_plain_json(self, temp_dir):
+        """Test that the manifest records the hash and completed ranges."""
+        checkpoint = RenderCheckpoint(temp_dir, "abc", SEGMENTS)
+        checkpoint.mark_done(2)
+
+        manifest = json.loads(checkpoint.manifest_path.read_text())
+
+        assert manifest["project_hash"] == "abc"
+        assert manifest["segments"] == [list(s) for s in SEGMENTS]
+        assert manifest["completed"] == [2]
+        assert not checkpoint.manifest_path.with_suffix(".tmp").exists()
+
+
+@pytest.mark.unit
+class TestGenerateResumable:
+    """Test suite for VideoGenerator.generate_resumable."""
+
+    @pytest.fixture
+    def project(self, sample_image_path, temp_dir):
+        """Create a small image-only project."""
+        return Project(
+            output=OutputConfig(
+                path=str(temp_dir / "out" / "resumable.mp4"),
+                width=32,
+                height=24,
+                fps=10,
+                preset="ultrafast",
+            ),
+            timeline=Timeline(
+                video_layers=[
+                    ImageLayer(path=str(sample_image_path), duration=1.0),
+                    ImageLayer(path=str(sample_image_path), duration=1.5),
+                ]
+            ),
+        )
+
+    def test_writes_all_frames_and_cleans_up(self, project):
+        """Test that joined segments contain every frame of the timeline."""
+        output_path = VideoGenerator(project).generate_resumable(segment_seconds=1.0)
+
+        with VideoFileClip(output_path) as result:
+            assert len(list(result.iter_frames())) == 25
+        assert [p.name for p in Path(output_path).parent.iterdir()] == ["resumable.mp4"]
+
+    def test_resume_skips_completed_segments(self, project):
+        """Test that a crashed render continues from the last segment."""
+        real_write = output_steps.write_video_pipe
+        calls = []
+
+        def crash_on_second(clip, path, **kwargs):
+            calls.append(kwargs["start_frame"])
+            if len(calls) == 2:
+                raise RuntimeError("worker preempted")
+            return real_write(clip, path, **kwargs)
+
+        with patch.object(output_steps, "write_video_pipe", crash_on_second):
+            with pytest.raises(RuntimeError):
+                VideoGenerator(project).generate_resumable(segment_seconds=1.0)
+
+        def record(clip, path, **kwargs):
+            calls.append(kwargs["start_frame"])
+            return real_write(clip, path, **kwargs)
+
+        calls.clear()
+        with patch.object(output_steps, "write_video_pipe", record):
+            output_path = VideoGenerator(project).generate_resumable(
+                segment_seconds=1.0, resume=True
+            )
+
+        # 3 segments: the first survived the crash, only the rest are rendered
+        assert calls == [8, 17]
+        with VideoFileClip(output_path) as result:
+            assert len(list(result.iter_frames())) == 25
+
+    def test_without_resume_starts_over(self, project):
+        """Test that a fresh render ignores an existing checkpoint."""
+        generator = VideoGenerator(project)
+        real_write = output_steps.write_video_pipe
+        calls = []
+
+        def crash_on_last(clip, path, **kwargs):
+            calls.append(kwargs["start_frame"])
+            if len(calls) == 3:
+                raise RuntimeError("worker preempted")
+            return real_write(clip, path, **kwargs)
+
+        with patch.object(output_steps, "write_video_pipe", crash_on_last):
+            with pytest.raises(RuntimeError):
+                generator.generate_resumable(segment_seconds=1.0)
+
+        with patch.object(output_steps, "write_video_pipe", wraps=real_write) as spy:
+            generator.generate_resumable(segment_seconds=1.0)
+
+        assert spy.call_count == 3
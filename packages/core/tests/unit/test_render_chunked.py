@@ -0,0 +1,103 @@
+"""Tests for time-chunked rendering helpers."""
+
+import pytest
+from moviepy import ColorClip, VideoFileClip
+
+from teto_core.render import (
+    concat_segments,
+    plan_chunks,
+    scene_chunks,
+    write_video_pipe,
+)
+
+
+@pytest.mark.unit
+class TestPlanChunks:
+    """Test suite for plan_chunks."""
+
+    def test_even_split(self):
+        """Test that chunks split the frames evenly without gaps."""
+        chunks = plan_chunks(10.0, 30, 4)
+
+        assert chunks == [(0, 75), (75, 150), (150, 225), (225, 300)]
+
+    def test_cuts_snap_to_scene_boundaries(self):
+        """Test that cuts move to nearby scene boundaries."""
+        chunks = plan_chunks(10.0, 10, 2, scene_boundaries=[4.2, 9.5])
+
+        assert chunks == [(0, 42), (42, 100)]
+
+    def test_distant_scene_boundaries_are_ignored(self):
+        """Test that far-away scene boundaries do not skew the split."""
+        chunks = plan_chunks(10.0, 10, 4, scene_boundaries=[5.1])
+
+        assert chunks == [(0, 25), (25, 51), (51, 75), (75, 100)]
+
+    def test_chunks_cover_all_frames(self):
+        """Test that chunk ranges are contiguous and complete."""
+        chunks = plan_chunks(7.3, 24, 5, scene_boundaries=[1.0, 2.5, 6.9])
+
+        assert chunks[0][0] == 0
+        assert chunks[-1][1] == int(7.3 * 24)
+        for (_, end), (start, _) in zip(chunks, chunks[1:]):
+            assert end == start
+
+    def test_more_chunks_than_frames(self):
+        """Test that the chunk count is capped by the frame count."""
+        chunks = plan_chunks(0.3, 10, 8)
+
+        assert chunks == [(0, 1), (1, 2), (2, 3)]
+
+    def test_empty_timeline(self):
+        """Test that an empty timeline produces no chunks."""
+        assert plan_chunks(0.0, 30, 4) == []
+
+
+@pytest.mark.unit
+class TestConcatSegments:
+    """Test suite for concat_segments."""
+
+    def test_concatenates_without_reencoding(self, temp_dir):
+        """Test that segments are joined into one video."""
+        clip = ColorClip(size=(32, 24), color=(0, 200, 0), duration=1.0)
+        segments = []
+        for i, (start, end) in enumerate([(0, 4), (4, 10)]):
+            path = str(temp_dir / f"chunk_{i}.mp4")
+            write_video_pipe(
+                clip,
+                path,
+                fps=10,
+                preset="ultrafast",
+                logger=None,
+                start_frame=start,
+                end_frame=end,
+            )
+            segments.append(path)
+        output_path = str(temp_dir / "joined.mp4")
+
+        concat_segments(segments, output_path)
+
+        with VideoFileClip(output_path) as result:
+            assert len(list(result.iter_frames())) == 10
+        assert not (temp_dir / "joined_concat.txt").exists()
+
+    def test_missing_segment_raises(self, temp_dir):
+        """Test that ffmpeg failures are reported as OSError."""
+        with pytest.raises(OSError, match="missing.mp4"):
+            concat_segments([str(temp_dir / "missing.mp4")], str(temp_dir / "x.mp4"))
+
+
+@pytest.mark.unit
+class TestSceneChunks:
+    """Test suite for scene_chunks."""
+
+    def test_cuts_exactly_at_scene_boundaries(self):
+        """Test that every scene boundary becomes a cut."""
+        chunks = scene_chunks(10.0, 10, [1.0, 1.5, 7.0])
+
+        assert chunks == [(0, 10), (10, 15), (15, 70), (70, 100)]
+
+    def test_without_boundaries(self):
+        """Test that the whole timeline is one chunk without boundaries."""
+        assert scene_chunks(2.0, 10) == [(0, 20)]
+        assert scene_chunks(0.0, 10, [1.0]) == []
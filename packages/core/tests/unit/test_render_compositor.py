@@ -0,0 +1,395 @@
+"""Tests for the flattened overlay compositor."""
+
+import numpy as np
+import pytest
+from unittest.mock import MagicMock
+from moviepy import ColorClip, CompositeVideoClip, ImageClip
+
+from teto_core.generator.context import ProcessingContext
+from teto_core.generator.steps import OverlayCompositingStep
+from teto_core.render import (
+    FlattenedCompositeClip,
+    is_static_overlay,
+    mark_static_overlay,
+    scale_overlay,
+)
+
+
+def _rgba_image(width, height, color, alpha):
+    """Create an RGBA numpy image with a uniform color and alpha."""
+    image = np.zeros((height, width, 4), dtype=np.uint8)
+    image[:, :, :3] = color
+    image[:, :, 3] = alpha
+    return image
+
+
+@pytest.fixture
+def base_clip():
+    """Create an opaque base clip."""
+    return ColorClip(size=(64, 48), color=(10, 20, 30), duration=2.0)
+
+
+@pytest.mark.unit
+class TestFlattenedCompositeClip:
+    """Test suite for FlattenedCompositeClip."""
+
+    def test_size_and_duration(self, base_clip):
+        """Test that size and duration follow the base clip."""
+        clip = FlattenedCompositeClip(base_clip, [], size=(64, 48))
+
+        assert clip.size == (64, 48)
+        assert clip.duration == 2.0
+
+    def test_duration_extends_to_last_overlay(self, base_clip):
+        """Test that an overlay ending after the base extends the duration."""
+        overlay = ColorClip(size=(8, 8), color=(255, 0, 0), duration=2.0)
+        overlay = overlay.with_start(1.0)
+
+        clip = FlattenedCompositeClip(base_clip, [overlay])
+
+        assert clip.duration == 3.0
+
+    def test_base_only_frame(self, base_clip):
+        """Test that a clip without overlays returns the base frame."""
+        clip = FlattenedCompositeClip(base_clip, [])
+
+        frame = clip.get_frame(0.5)
+
+        assert frame.shape == (48, 64, 3)
+        assert frame.dtype == np.uint8
+        assert np.all(frame == (10, 20, 30))
+
+    def test_opaque_overlay_is_copied(self, base_clip):
+        """Test that an opaque overlay replaces its region only."""
+        overlay = ColorClip(size=(10, 10), color=(255, 0, 0), duration=2.0)
+        overlay = overlay.with_position((5, 6))
+
+        frame = FlattenedCompositeClip(base_clip, [overlay]).get_frame(0.0)
+
+        assert np.all(frame[6:16, 5:15] == (255, 0, 0))
+        assert np.all(frame[0:6, :] == (10, 20, 30))
+        assert np.all(frame[16:, :] == (10, 20, 30))
+
+    def test_overlay_respects_time_window(self, base_clip):
+        """Test that overlays are only drawn while playing."""
+        overlay = ColorClip(size=(10, 10), color=(255, 0, 0), duration=0.5)
+        overlay = overlay.with_start(1.0)
+        clip = FlattenedCompositeClip(base_clip, [overlay])
+
+        assert np.all(clip.get_frame(0.5) == (10, 20, 30))
+        assert np.all(clip.get_frame(1.2)[0:10, 0:10] == (255, 0, 0))
+        assert np.all(clip.get_frame(1.6) == (10, 20, 30))
+
+    def test_overlay_clipped_to_frame_bounds(self, base_clip):
+        """Test that overlays partially outside the frame are cropped."""
+        overlay = ColorClip(size=(20, 20), color=(0, 255, 0), duration=2.0)
+        overlay = overlay.with_position((-10, 40))
+
+        frame = FlattenedCompositeClip(base_clip, [overlay]).get_frame(0.0)
+
+        assert np.all(frame[40:48, 0:10] == (0, 255, 0))
+        assert np.all(frame[40:48, 10:] == (10, 20, 30))
+
+    def test_overlay_outside_frame_is_ignored(self, base_clip):
+        """Test that overlays fully outside the frame are skipped."""
+        overlay = ColorClip(size=(10, 10), color=(0, 255, 0), duration=2.0)
+        overlay = overlay.with_position((100, 100))
+
+        frame = FlattenedCompositeClip(base_clip, [overlay]).get_frame(0.0)
+
+        assert np.all(frame == (10, 20, 30))
+
+    def test_later_overlay_is_on_top(self, base_clip):
+        """Test that list order defines z-order."""
+        red = ColorClip(size=(10, 10), color=(255, 0, 0), duration=2.0)
+        blue = ColorClip(size=(10, 10), color=(0, 0, 255), duration=2.0)
+
+        frame = FlattenedCompositeClip(base_clip, [red, blue]).get_frame(0.0)
+
+        assert np.all(frame[0:10, 0:10] == (0, 0, 255))
+
+    def test_layer_index_overrides_list_order(self, base_clip):
+        """Test that layer_index is honoured like CompositeVideoClip."""
+        red = ColorClip(size=(10, 10), color=(255, 0, 0), duration=2.0)
+        red = red.with_layer_index(1)
+        blue = ColorClip(size=(10, 10), color=(0, 0, 255), duration=2.0)
+
+        frame = FlattenedCompositeClip(base_clip, [red, blue]).get_frame(0.0)
+
+        assert np.all(frame[0:10, 0:10] == (255, 0, 0))
+
+    def test_matches_nested_composite(self, base_clip):
+        """Test that the output matches nested CompositeVideoClip chains."""
+        stamp = ImageClip(_rgba_image(16, 12, (200, 50, 50), 128), duration=2.0)
+        stamp = stamp.with_position((4, 4)).with_opacity(0.8)
+        character = ImageClip(_rgba_image(20, 20, (50, 200, 50), 255), duration=2.0)
+        character = character.with_position(("center", "bottom"))
+        subtitle = ImageClip(_rgba_image(40, 10, (255, 255, 255), 64), duration=1.0)
+        subtitle = subtitle.with_position((12, 30)).with_start(0.5)
+
+        nested = CompositeVideoClip([base_clip, stamp], size=(64, 48))
+        nested = CompositeVideoClip([nested, character], size=(64, 48))
+        nested = CompositeVideoClip([nested, subtitle], size=(64, 48))
+        flattened = FlattenedCompositeClip(
+            base_clip, [stamp, character, subtitle], size=(64, 48)
+        )
+
+        for t in (0.0, 0.75, 1.8):
+            expected = nested.get_frame(t).astype(int)
+            actual = flattened.get_frame(t).astype(int)
+            assert np.abs(expected - actual).max() <= 1
+
+    def test_rgba_frames_use_alpha_channel(self, base_clip):
+        """Test that 4-channel frames are blended with their alpha."""
+        rgba = _rgba_image(10, 10, (255, 255, 255), 0)
+        rgba[0:5, :, 3] = 255
+        overlay = ImageClip(rgba, duration=2.0, transparent=False)
+
+        frame = FlattenedCompositeClip(base_clip, [overlay]).get_frame(0.0)
+
+        assert np.all(frame[0:5, 0:10] == (255, 255, 255))
+        assert np.all(frame[5:10, 0:10] == (10, 20, 30))
+
+    def test_has_no_mask(self, base_clip):
+        """Test that the flattened clip is a final opaque frame source."""
+        overlay = ImageClip(_rgba_image(10, 10, (1, 2, 3), 100), duration=2.0)
+
+        clip = FlattenedCompositeClip(base_clip, [overlay])
+
+        assert clip.mask is None
+
+
+@pytest.mark.unit
+class TestStaticOverlayPlates:
+    """Test suite for pre-blended static overlay plates."""
+
+    @staticmethod
+    def _overlays():
+        """Create a mix of overlays with different alphas and windows."""
+        stamp = ImageClip(_rgba_image(16, 12, (200, 50, 50), 128), duration=2.0)
+        stamp = stamp.with_position((4, 4)).with_opacity(0.8)
+        subtitle = ImageClip(_rgba_image(40, 10, (255, 255, 255), 64), duration=1.0)
+        subtitle = subtitle.with_position((10, 8)).with_start(0.5)
+        moving = ColorClip(size=(6, 6), color=(0, 0, 255), duration=2.0)
+        moving = moving.with_position(lambda t: (int(t * 20), 20))
+        top = ImageClip(_rgba_image(30, 30, (0, 200, 0), 200), duration=2.0)
+        top = top.with_position((20, 10))
+        return [stamp, subtitle, moving, top]
+
+    def test_mark_static_overlay(self):
+        """Test marking clips as static overlays."""
+        clip = ColorClip(size=(4, 4), color=(0, 0, 0), duration=1.0)
+
+        assert is_static_overlay(clip) is False
+        assert mark_static_overlay(clip) is clip
+        assert is_static_overlay(clip) is True
+
+    def test_plates_match_per_overlay_blending(self, base_clip):
+        """Test that static plates render like individual blends."""
+        dynamic = FlattenedCompositeClip(base_clip, self._overlays())
+        overlays = self._overlays()
+        for index in (0, 1, 3):
+            mark_static_overlay(overlays[index])
+        static = FlattenedCompositeClip(base_clip, overlays)
+
+        for t in (0.0, 0.6, 1.2, 1.9):
+            expected = dynamic.get_frame(t).astype(int)
+            actual = static.get_frame(t).astype(int)
+            assert np.abs(expected - actual).max() <= 1
+
+    def test_plate_is_built_once_per_span(self, base_clip):
+        """Test that a static overlay is rasterized once for its span."""
+        overlay = ColorClip(size=(10, 10), color=(255, 0, 0), duration=2.0)
+        overlay = mark_static_overlay(overlay.with_opacity(0.5))
+        calls = []
+        original = overlay.get_frame
+        overlay.get_frame = lambda t: calls.append(t) or original(t)
+        clip = FlattenedCompositeClip(base_clip, [overlay])
+
+        for t in np.linspace(0, 1.9, 20):
+            clip.get_frame(t)
+
+        assert len(calls) == 1
+
+    def test_plate_cache_is_bounded(self, base_clip):
+        """Test that old plates are evicted."""
+        overlays = [
+            mark_static_overlay(
+                ColorClip(size=(4, 4), color=(255, 0, 0), duration=0.1).with_start(
+                    i * 0.1
+                )
+            )
+            for i in range(10)
+        ]
+        clip = FlattenedCompositeClip(base_clip, overlays, max_cached_plates=3)
+
+        for i in range(10):
+            clip.get_frame(i * 0.1 + 0.05)
+
+        assert len(clip._plates) == 3
+
+
+@pytest.mark.unit
+class TestDirtyRectangles:
+    """Test suite for re-blending only the changed rectangles."""
+
+    @staticmethod
+    def _overlays():
+        """Create a static subtitle and a small overlay bouncing over it."""
+        subtitle = ImageClip(_rgba_image(40, 10, (255, 255, 255), 128), duration=2.0)
+        subtitle = mark_static_overlay(subtitle.with_position((10, 30)))
+        bouncing = ImageClip(_rgba_image(8, 8, (0, 200, 0), 180), duration=1.5)
+        bouncing = bouncing.with_position(lambda t: (int(t * 30), 25 + int(t * 4)))
+        return [subtitle, bouncing.with_start(0.3)]
+
+    def test_matches_full_redraw(self):
+        """Test that sequential frames equal frames rendered from scratch."""
+        base = mark_static_overlay(
+            ImageClip(_rgba_image(64, 48, (10, 20, 30), 255)[:, :, :3], duration=2.0)
+        )
+        clip = FlattenedCompositeClip(base, self._overlays())
+
+        for t in np.linspace(0, 1.95, 40):
+            fresh = FlattenedCompositeClip(base, self._overlays())
+            np.testing.assert_array_equal(clip.get_frame(t), fresh.get_frame(t))
+
+    def test_only_dirty_region_changes(self):
+        """Test that pixels outside the overlay boxes are copied."""
+        base = mark_static_overlay(
+            ImageClip(_rgba_image(64, 48, (10, 20, 30), 255)[:, :, :3], duration=2.0)
+        )
+        clip = FlattenedCompositeClip(base, self._overlays())
+        clip.get_frame(0.5)
+        draws = []
+        original = clip._draw
+        clip._draw = lambda *args: draws.append(args[-1]) or original(*args)
+
+        clip.get_frame(0.6)
+
+        assert draws
+        assert all((x1 - x0) * (y1 - y0) <= 64 for x0, y0, x1, y1 in draws)
+
+    def test_base_is_rasterized_once_per_span(self):
+        """Test that a static base is reused while overlays animate."""
+        base = mark_static_overlay(
+            ColorClip(size=(64, 48), color=(1, 2, 3), duration=2.0)
+        )
+        calls = []
+        original = base.get_frame
+        base.get_frame = lambda t: calls.append(t) or original(t)
+        clip = FlattenedCompositeClip(base, self._overlays())
+
+        for t in np.linspace(0, 1.9, 20):
+            clip.get_frame(t)
+
+        assert len(calls) == 1
+
+    def test_animated_base_redraws_full_frame(self, base_clip):
+        """Test that an unmarked base is never treated as static."""
+        clip = FlattenedCompositeClip(base_clip, self._overlays())
+        clip.get_frame(0.5)
+        draws = []
+        original = clip._draw
+        clip._draw = lambda *args: draws.append(args[-1]) or original(*args)
+
+        clip.get_frame(0.6)
+
+        assert draws == [(0, 0, 64, 48)]
+
+
+@pytest.mark.unit
+class TestScaleOverlay:
+    """Test suite for scale_overlay."""
+
+    def test_scales_size_and_position(self):
+        """Test that the image and its position shrink together."""
+        clip = ColorClip(size=(40, 20), color=(255, 0, 0), duration=1.0)
+        clip = clip.with_position((30, 10))
+
+        scaled = scale_overlay(clip, 0.5)
+
+        assert scaled.size == (20, 10)
+        assert scaled.pos(0) == (15, 5)
+
+    def test_keeps_named_and_relative_positions(self):
+        """Test that named and relative positions are not scaled."""
+        named = ColorClip(size=(40, 20), color=(0, 0, 0), duration=1.0)
+        named = named.with_position(("center", 8))
+        relative = ColorClip(size=(40, 20), color=(0, 0, 0), duration=1.0)
+        relative = relative.with_position((0.25, 0.5), relative=True)
+
+        assert scale_overlay(named, 0.5).pos(0) == ("center", 4)
+        assert scale_overlay(relative, 0.5).pos(0) == (0.25, 0.5)
+
+    def test_keeps_static_mark(self):
+        """Test that static overlays stay eligible for plate caching."""
+        clip = mark_static_overlay(
+            ColorClip(size=(8, 8), color=(0, 0, 0), duration=1.0)
+        )
+
+        assert is_static_overlay(scale_overlay(clip, 0.5)) is True
+
+    def test_full_scale_is_noop(self):
+        """Test that a scale of 1 returns the clip itself."""
+        clip = ColorClip(size=(8, 8), color=(0, 0, 0), duration=1.0)
+
+        assert scale_overlay(clip, 1.0) is clip
+
+
+@pytest.mark.unit
+class TestOverlayCompositingStep:
+    """Test suite for OverlayCompositingStep."""
+
+    @pytest.fixture
+    def context(self, base_clip):
+        """Create a processing context with a base clip."""
+        context = ProcessingContext(project=MagicMock())
+        context.project.output.render_scale = 1.0
+        context.project.output.render_size = (64, 48)
+        context.video_clip = base_clip
+        context.output_size = (64, 48)
+        return context
+
+    def test_no_overlays_keeps_video_clip(self, context, base_clip):
+        """Test that the step is a no-op without overlays."""
+        result = OverlayCompositingStep().process(context)
+
+        assert result.video_clip is base_clip
+
+    def test_overlays_are_flattened(self, context, base_clip):
+        """Test that queued overlays are composited in one clip."""
+        overlay = ColorClip(size=(10, 10), color=(255, 0, 0), duration=2.0)
+        context.overlay_clips.append(overlay)
+
+        result = OverlayCompositingStep().process(context)
+
+        assert isinstance(result.video_clip, FlattenedCompositeClip)
+        assert result.video_clip.base is base_clip
+        assert result.video_clip.overlays == [overlay]
+        assert result.overlay_clips == []
+
+    def test_draft_scale_shrinks_overlays(self, context):
+        """Test that overlays are scaled to the render size in draft mode."""
+        context.project.output.render_scale = 0.5
+        context.project.output.render_size = (32, 24)
+        context.video_clip = ColorClip(size=(32, 24), color=(0, 0, 0), duration=2.0)
+        overlay = ColorClip(size=(20, 10), color=(255, 0, 0), duration=2.0)
+        context.overlay_clips.append(overlay.with_position((40, 20)))
+
+        result = OverlayCompositingStep().process(context)
+
+        assert result.video_clip.size == (32, 24)
+        assert result.video_clip.overlays[0].size == (10, 5)
+        assert result.video_clip.overlays[0].pos(0) == (20, 10)
+
+    def test_reports_progress(self, context):
+        """Test that progress is reported when compositing."""
+        callback = MagicMock()
+        context.progress_callback = callback
+        context.overlay_clips.append(
+            ColorClip(size=(10, 10), color=(255, 0, 0), duration=2.0)
+        )
+
+        OverlayCompositingStep().process(context)
+
+        callback.assert_called_once()
@@ -0,0 +1,200 @@
+"""Tests for the shared video decoder pool."""
+
+import numpy as np
+import pytest
+from moviepy import VideoClip
+
+from teto_core.generator.context import ProcessingContext
+from teto_core.generator.steps import CleanupStep
+from teto_core.layer.models import VideoLayer
+from teto_core.layer.processors import VideoProcessor
+from teto_core.render.audio_mixer import (
+    DecodedAudioFileClip,
+    MixedAudioClip,
+    write_audio_track,
+)
+from teto_core.render.decoder_pool import DecoderPool
+from teto_core.render.ffmpeg_pipe import write_video_pipe
+
+
+def _make_video(path, level_offset=0):
+    """Write a 1 second clip whose brightness encodes the frame time."""
+
+    def frame(t):
+        level = min(level_offset + int(t * 200), 255)
+        return np.full((24, 32, 3), level, dtype=np.uint8)
+
+    clip = VideoClip(frame, duration=1.0)
+    write_video_pipe(clip, str(path), fps=10, preset="ultrafast", logger=None)
+    return str(path)
+
+
+@pytest.fixture
+def videos(temp_dir):
+    """Three short videos with distinct content."""
+    return [_make_video(temp_dir / f"v{i}.mp4", level_offset=i * 10) for i in range(3)]
+
+
+@pytest.mark.unit
+class TestDecoderPool:
+    """Test suite for DecoderPool."""
+
+    def test_clips_start_closed_and_share_reader(self, videos):
+        """Test that clips for the same path share one lazily opened reader."""
+        pool = DecoderPool()
+        first = pool.open_clip(videos[0])
+        second = pool.open_clip(videos[0])
+
+        assert first is not second
+        assert first.reader is second.reader
+        assert pool.open_count == 0
+
+        first.get_frame(0.5)
+        assert pool.open_count == 1
+        pool.close()
+        assert pool.open_count == 0
+
+    def test_cap_evicts_least_recently_used(self, videos):
+        """Test that the pool never keeps more than max_open decoders."""
+        pool = DecoderPool(max_open=2)
+        clips = [pool.open_clip(path) for path in videos]
+        expected = [clip.get_frame(0.3) for clip in clips]
+
+        assert pool.open_count == 2
+        assert not clips[0].reader.is_open
+
+        # 閉じられたデコーダーは次の要求で開き直し、同じフレームを返す
+        for clip, frame in zip(clips, expected):
+            np.testing.assert_array_equal(clip.get_frame(0.3), frame)
+            assert pool.open_count <= 2
+        pool.close()
+
+    def test_reader_evicted_before_locking_is_reregistered(self, videos):
+        """Test that a reader closed between acquire and read stays within the cap."""
+        pool = DecoderPool(max_open=1)
+        first, second = (pool.open_clip(path) for path in videos[:2])
+        acquire = pool._acquire
+        calls = []
+
+        def acquire_then_evict(reader):
+            acquire(reader)
+            if not calls:
+                # 別のスレッドが割り込んで first のリーダーを閉じた状況を再現する
+                calls.append(reader)
+                acquire(second.reader)
+
+        pool._acquire = acquire_then_evict
+        first.get_frame(0.3)
+
+        assert first.reader.is_open
+        assert pool._is_registered(first.reader)
+        second.get_frame(0.3)
+        assert pool.open_count == 1
+        pool.close()
+
+    def test_prefetch_open_failure_is_deferred(self, videos, monkeypatch):
+        """Test that an ffmpeg start failure is left to the frame request."""
+        pool = DecoderPool()
+        clip = pool.open_clip(videos[0])
+        pool._open[clip.reader] = None
+        pool._prefetching.add(videos[0])
+
+        def fail(t):
+            raise OSError("ffmpeg not found")
+
+        monkeypatch.setattr(clip.reader._reader, "initialize", fail)
+        pool._prefetch(videos[0], clip.reader)
+
+        assert videos[0] not in pool._prefetching
+        with pytest.raises(OSError):
+            clip.get_frame(0.3)
+
+    def test_prefetch_does_not_hide_other_errors(self, videos, monkeypatch):
+        """Test that errors other than failing to start ffmpeg propagate."""
+        pool = DecoderPool()
+        clip = pool.open_clip(videos[0])
+        pool._open[clip.reader] = None
+        pool._prefetching.add(videos[0])
+
+        def broken(t):
+            raise TypeError("bug")
+
+        monkeypatch.setattr(clip.reader._reader, "initialize", broken)
+
+        with pytest.raises(TypeError):
+            pool._prefetch(videos[0], clip.reader)
+        assert videos[0] not in pool._prefetching
+
+    def test_prefetch_skips_evicted_reader(self, videos):
+        """Test that a prefetch does not open a reader evicted before it ran."""
+        pool = DecoderPool(max_open=1)
+        first, second = (pool.open_clip(path) for path in videos[:2])
+        pool._open[first.reader] = None
+        second.get_frame(0.3)
+
+        pool._prefetch(videos[0], first.reader)
+
+        assert not first.reader.is_open
+        assert pool.open_count == 1
+        pool.close()
+
+    def test_cleanup_step_closes_pool(self, videos):
+        """Test that the cleanup step releases every decoder."""
+        pool = DecoderPool()
+        pool.open_clip(videos[0]).get_frame(0.3)
+        context = ProcessingContext(project=None, decoder_pool=pool)
+
+        CleanupStep().process(context)
+
+        assert pool.open_count == 0
+
+    def test_advance_closes_decoders_outside_window(self, videos):
+        """Test that decoders are released once the timeline leaves their span."""
+        pool = DecoderPool(lookahead=0.2)
+        clip = pool.open_clip(videos[0])
+        pool.add_window(videos[0], 0.0, 1.0)
+
+        clip.get_frame(0.5)
+        pool.advance(0.5)
+        assert clip.reader.is_open
+
+        pool.advance(2.0)
+        assert not clip.reader.is_open
+
+    def test_processor_output_matches_direct_decode(self, videos):
+        """Test that pooled timeline frames match the source frames."""
+        layers = [VideoLayer(path=path, duration=1.0) for path in videos]
+        processor = VideoProcessor()
+
+        clip = processor.execute(layers, output_size=(32, 24), max_decoders=1)
+
+        for t in (0.25, 1.25, 2.25, 0.5):
+            source = VideoProcessor().video_processor.execute(
+                layers[int(t)], output_size=(32, 24)
+            )
+            np.testing.assert_array_equal(
+                clip.get_frame(t), source.get_frame(t - int(t))
+            )
+            source.close()
+
+
+@pytest.mark.unit
+class TestDecodedAudioFileClip:
+    """Test suite for DecodedAudioFileClip."""
+
+    def test_decodes_on_first_use(self, temp_dir):
+        """Test that audio is decoded lazily and sampled by time."""
+        fps = 8000
+        samples = np.zeros((fps, 2), dtype=np.float32)
+        samples[fps // 2 :] = 0.5
+        path = str(temp_dir / "tone.wav")
+        write_audio_track(
+            MixedAudioClip(samples, fps), path, codec="pcm_s16le", fps=fps
+        )
+
+        clip = DecodedAudioFileClip(path, duration=1.0, fps=fps)
+        assert clip._samples is None
+
+        assert clip.get_frame(0.25) == pytest.approx([0.0, 0.0])
+        assert clip.get_frame(0.75) == pytest.approx([0.5, 0.5], abs=1e-3)
+        assert clip.get_frame(2.0) == pytest.approx([0.0, 0.0])
@@ -0,0 +1,255 @@
+"""Tests for the direct ffmpeg pipe encoder."""
+
+import threading
+
+import numpy as np
+import pytest
+from moviepy import AudioClip, ColorClip, VideoClip, VideoFileClip
+
+from teto_core.render import FFmpegPipeWriter, FrameProducer, write_video_pipe
+from teto_core.render.ffmpeg_pipe import EncodeStats, frame_count, to_rgb24
+
+
+@pytest.mark.unit
+class TestFFmpegPipeWriter:
+    """Test suite for FFmpegPipeWriter."""
+
+    def test_build_command_defaults(self):
+        """Test the command for a silent libx264 output."""
+        writer = FFmpegPipeWriter("out.mp4", (64, 48), 30, ffmpeg_binary="ffmpeg")
+
+        cmd = writer.build_command()
+
+        assert cmd[0] == "ffmpeg"
+        assert cmd[cmd.index("-s") + 1] == "64x48"
+        assert cmd[cmd.index("-pix_fmt") + 1] == "rgb24"
+        assert "-an" in cmd
+        assert cmd[cmd.index("-preset") + 1] == "fast"
+        assert cmd[-3:] == ["-pix_fmt", "yuv420p", "out.mp4"]
+        assert "-b:v" not in cmd
+        assert "-threads" not in cmd
+
+    def test_build_command_with_options(self):
+        """Test that bitrate, threads and audio are passed through."""
+        writer = FFmpegPipeWriter(
+            "out.mp4",
+            (64, 48),
+            24,
+            preset="ultrafast",
+            bitrate="2M",
+            threads=4,
+            audio_path="audio.mp4",
+        )
+
+        cmd = writer.build_command()
+
+        assert cmd[cmd.index("-b:v") + 1] == "2M"
+        assert cmd[cmd.index("-threads") + 1] == "4"
+        assert cmd[cmd.index("-acodec") + 1] == "copy"
+        assert "audio.mp4" in cmd
+        assert "-an" not in cmd
+
+    def test_odd_size_keeps_pixel_format(self):
+        """Test that yuv420p is not forced for odd frame sizes."""
+        writer = FFmpegPipeWriter("out.mp4", (63, 48), 30)
+
+        assert "yuv420p" not in writer.build_command()
+
+    def test_verbose_ffmpeg_log_does_not_block_writes(self, tmp_path):
+        """Test that ffmpeg's log output cannot stall frame writes."""
+
+        class VerboseWriter(FFmpegPipeWriter):
+            def build_command(self):
+                cmd = super().build_command()
+                cmd[cmd.index("-loglevel") + 1] = "trace"
+                return cmd[:-1] + ["-debug_ts", cmd[-1]]
+
+        writer = VerboseWriter(
+            str(tmp_path / "out.mp4"), (32, 24), 10, preset="ultrafast"
+        )
+        frame = np.zeros((24, 32, 3), dtype=np.uint8)
+
+        def encode():
+            with writer:
+                for _ in range(2000):
+                    writer.write_frame(frame)
+
+        thread = threading.Thread(target=encode, daemon=True)
+        thread.start()
+        thread.join(timeout=30)
+        if thread.is_alive():
+            writer.abort()
+            pytest.fail("writing frames blocked on ffmpeg's log output")
+        assert (tmp_path / "out.mp4").stat().st_size > 0
+
+    def test_failure_message_includes_ffmpeg_log(self, tmp_path):
+        """Test that a failed encode reports the tail of ffmpeg's log."""
+        writer = FFmpegPipeWriter(
+            str(tmp_path / "out.mp4"), (32, 24), 10, codec="no-such-codec"
+        )
+        frame = np.zeros((24, 32, 3), dtype=np.uint8)
+
+        with pytest.raises(OSError, match="no-such-codec"):
+            with writer:
+                for _ in range(100):
+                    writer.write_frame(frame)
+        assert writer._stderr is None
+
+
+@pytest.mark.unit
+class TestFrameProducer:
+    """Test suite for FrameProducer."""
+
+    def test_frames_are_in_order(self, counter_clip):
+        """Test that frames are yielded in timeline order."""
+        producer = FrameProducer(counter_clip(), fps=10, queue_size=2)
+
+        values = [int(frame[0, 0, 0]) for frame in producer]
+
+        assert len(producer) == 10
+        assert values == [i * 10 for i in range(10)]
+
+    def test_worker_error_is_raised(self):
+        """Test that errors in the worker thread reach the consumer."""
+
+        def frame_function(t):
+            if t > 0.25:
+                raise ValueError("broken frame")
+            return np.zeros((4, 4, 3), dtype=np.uint8)
+
+        clip = VideoClip(frame_function, duration=1.0)
+        producer = FrameProducer(clip, fps=10)
+
+        with pytest.raises(ValueError, match="broken frame"):
+            list(producer)
+
+    def test_early_exit_stops_worker(self, counter_clip):
+        """Test that abandoning iteration stops the worker thread."""
+        producer = FrameProducer(counter_clip(duration=10.0), fps=10, queue_size=1)
+
+        for _ in producer:
+            break
+
+        assert not producer._thread.is_alive()
+
+
+@pytest.mark.unit
+class TestFrameHelpers:
+    """Test suite for frame helper functions."""
+
+    def test_frame_count_matches_moviepy(self, counter_clip):
+        """Test that the frame count follows iter_frames."""
+        clip = counter_clip(duration=1.05)
+
+        assert frame_count(1.05, 10) == len(list(clip.iter_frames(fps=10)))
+
+    def test_to_rgb24_converts_formats(self):
+        """Test conversion of grayscale, RGBA and float frames."""
+        gray = np.full((2, 3), 7, dtype=np.uint8)
+        rgba = np.full((2, 3, 4), 9, dtype=np.uint8)
+        floats = np.full((2, 3, 3), 12.7)
+
+        assert to_rgb24(gray).shape == (2, 3, 3)
+        assert to_rgb24(rgba).shape == (2, 3, 3)
+        assert to_rgb24(floats).dtype == np.uint8
+        assert to_rgb24(rgba).flags["C_CONTIGUOUS"]
+
+    def test_encode_stats_fps(self):
+        """Test that the throughput is frames per second."""
+        assert EncodeStats(frames=60, elapsed=2.0).fps == 30.0
+        assert EncodeStats(frames=60, elapsed=0.0).fps == 0.0
+
+
+@pytest.mark.unit
+class TestWriteVideoPipe:
+    """Test suite for write_video_pipe."""
+
+    def test_writes_playable_video(self, tmp_path):
+        """Test that the output can be read back with the right length."""
+        path = str(tmp_path / "out.mp4")
+        clip = ColorClip(size=(32, 24), color=(200, 0, 0), duration=1.0)
+
+        stats = write_video_pipe(clip, path, fps=10, preset="ultrafast", logger=None)
+
+        assert stats.frames == 10
+        with VideoFileClip(path) as result:
+            assert tuple(result.size) == (32, 24)
+            assert result.duration == pytest.approx(1.0, abs=0.15)
+            assert result.get_frame(0.5)[12, 16, 0] > 150
+
+    def test_muxes_audio_and_removes_temp_file(self, tmp_path):
+        """Test that audio is muxed and the temporary file is removed."""
+        path = str(tmp_path / "out.mp4")
+        temp_audio = str(tmp_path / "temp_audio.mp4")
+        audio = AudioClip(
+            lambda t: np.sin(440 * 2 * np.pi * t), duration=1.0, fps=44100
+        )
+        clip = ColorClip(size=(32, 24), color=(0, 0, 0), duration=1.0)
+        clip = clip.with_audio(audio)
+
+        write_video_pipe(
+            clip,
+            path,
+            fps=10,
+            preset="ultrafast",
+            temp_audiofile=temp_audio,
+            logger=None,
+        )
+
+        with VideoFileClip(path) as result:
+            assert result.audio is not None
+        assert not (tmp_path / "temp_audio.mp4").exists()
+
+    def test_encoder_failure_raises(self, tmp_path):
+        """Test that an ffmpeg failure is reported as OSError."""
+        path = str(tmp_path / "out.mp4")
+        clip = ColorClip(size=(32, 24), color=(0, 0, 0), duration=0.5)
+
+        with pytest.raises(OSError):
+            write_video_pipe(clip, path, fps=10, codec="no-such-codec", logger=None)
+
+    def test_writes_frame_range_without_audio(self, tmp_path):
+        """Test that a frame range can be written as a silent segment."""
+        path = str(tmp_path / "chunk.mp4")
+        audio = AudioClip(
+            lambda t: np.sin(440 * 2 * np.pi * t), duration=2.0, fps=44100
+        )
+        clip = ColorClip(size=(32, 24), color=(0, 0, 0), duration=2.0)
+        clip = clip.with_audio(audio)
+
+        stats = write_video_pipe(
+            clip,
+            path,
+            fps=10,
+            preset="ultrafast",
+            logger=None,
+            start_frame=5,
+            end_frame=12,
+            audio=False,
+        )
+
+        assert stats.frames == 7
+        with VideoFileClip(path) as result:
+            assert result.audio is None
+            assert len(list(result.iter_frames())) == 7
+
+    def test_muxes_encoded_audio_file(self, tmp_path):
+        """Test that a pre-encoded audio file is muxed and kept."""
+        audio_path = tmp_path / "shared.mp4"
+        AudioClip(
+            lambda t: np.sin(440 * 2 * np.pi * t), duration=1.0, fps=44100
+        ).write_audiofile(str(audio_path), fps=44100, codec="aac", logger=None)
+        clip = ColorClip(size=(32, 24), color=(0, 0, 0), duration=1.0)
+
+        write_video_pipe(
+            clip,
+            str(tmp_path / "out.mp4"),
+            fps=10,
+            preset="ultrafast",
+            logger=None,
+            audio_file=str(audio_path),
+        )
+
+        with VideoFileClip(str(tmp_path / "out.mp4")) as result:
+            assert result.audio is not None
+        assert audio_path.exists()
@@ -0,0 +1,165 @@
+"""Tests for the clip interval index and indexed composite clips."""
+
+import numpy as np
+import pytest
+from moviepy import (
+    AudioClip,
+    ColorClip,
+    CompositeAudioClip,
+    CompositeVideoClip,
+    concatenate_videoclips,
+)
+
+from teto_core.render import (
+    IntervalIndex,
+    IndexedCompositeAudioClip,
+    IndexedCompositeVideoClip,
+    concatenate_videoclips_indexed,
+)
+
+
+def _span(item):
+    """Return (start, end) from a tuple item."""
+    return item[1], item[2]
+
+
+@pytest.mark.unit
+class TestIntervalIndex:
+    """Test suite for IntervalIndex."""
+
+    def test_empty_index(self):
+        """Test that an empty index returns no items."""
+        index = IntervalIndex([], _span)
+
+        assert len(index) == 0
+        assert index.at(0.0) == []
+        assert index.overlapping(0.0, 10.0) == []
+
+    def test_half_open_intervals(self):
+        """Test that intervals are active on [start, end)."""
+        item = ("a", 1.0, 2.0)
+        index = IntervalIndex([item], _span)
+
+        assert index.at(0.99) == []
+        assert index.at(1.0) == [item]
+        assert index.at(1.99) == [item]
+        assert index.at(2.0) == []
+
+    def test_open_ended_interval(self):
+        """Test that an end of None never expires."""
+        item = ("a", 1.0, None)
+        index = IntervalIndex([item], _span)
+
+        assert index.at(0.5) == []
+        assert index.at(1e9) == [item]
+
+    def test_zero_length_interval_is_never_active(self):
+        """Test that zero-length intervals are ignored."""
+        index = IntervalIndex([("a", 1.0, 1.0)], _span)
+
+        assert index.at(1.0) == []
+
+    def test_preserves_input_order(self):
+        """Test that results keep the input (z) order."""
+        items = [("late", 2.0, 5.0), ("early", 0.0, 4.0), ("mid", 1.0, 3.0)]
+        index = IntervalIndex(items, _span)
+
+        assert index.at(2.5) == items
+
+    def test_matches_linear_scan(self):
+        """Test that lookups match a brute-force scan."""
+        rng = np.random.default_rng(0)
+        items = []
+        for i in range(200):
+            start = float(rng.uniform(0, 100))
+            items.append((i, start, start + float(rng.uniform(0, 5))))
+        index = IntervalIndex(items, _span)
+
+        for t in rng.uniform(-1, 106, size=500):
+            expected = [item for item in items if item[1] <= t < item[2]]
+            assert index.at(float(t)) == expected
+
+    def test_overlapping_range(self):
+        """Test that range queries return every interval touching the range."""
+        items = [("a", 0.0, 1.0), ("b", 1.5, 2.0), ("c", 3.0, 4.0)]
+        index = IntervalIndex(items, _span)
+
+        assert index.overlapping(0.5, 1.6) == [items[0], items[1]]
+        assert index.overlapping(2.1, 2.9) == []
+        # 範囲の開始と同時に終了する区間も候補に含める
+        assert items[0] in index.overlapping(1.0, 1.2)
+
+
+@pytest.mark.unit
+class TestIndexedCompositeVideoClip:
+    """Test suite for IndexedCompositeVideoClip."""
+
+    def test_playing_clips_uses_index(self):
+        """Test that playing_clips matches CompositeVideoClip."""
+        clips = [
+            ColorClip((8, 8), color=(i * 10, 0, 0), duration=1.0).with_start(i * 0.5)
+            for i in range(10)
+        ]
+        indexed = IndexedCompositeVideoClip(clips, size=(8, 8))
+        plain = CompositeVideoClip(clips, size=(8, 8))
+
+        for t in np.linspace(0, 5.5, 23):
+            assert indexed.playing_clips(t) == plain.playing_clips(t)
+
+    def test_mask_is_indexed(self):
+        """Test that the generated mask composite is also indexed."""
+        clip = ColorClip((8, 8), color=(255, 0, 0), duration=1.0)
+
+        indexed = IndexedCompositeVideoClip([clip], size=(8, 8))
+
+        assert isinstance(indexed.mask, IndexedCompositeVideoClip)
+
+    def test_concatenate_matches_moviepy(self):
+        """Test that concatenation matches concatenate_videoclips(compose)."""
+        clips = [
+            ColorClip((8, 6), color=(255, 0, 0), duration=1.0),
+            ColorClip((4, 4), color=(0, 255, 0), duration=0.5),
+            ColorClip((8, 6), color=(0, 0, 255), duration=1.5),
+        ]
+
+        indexed = concatenate_videoclips_indexed(clips)
+        plain = concatenate_videoclips(clips, method="compose")
+
+        assert indexed.size == plain.size
+        assert indexed.duration == plain.duration
+        for t in (0.0, 0.99, 1.0, 1.25, 1.5, 2.9):
+            assert np.array_equal(indexed.get_frame(t), plain.get_frame(t))
+
+
+@pytest.mark.unit
+class TestIndexedCompositeAudioClip:
+    """Test suite for IndexedCompositeAudioClip."""
+
+    @staticmethod
+    def _tone(value, duration, start):
+        """Create a constant stereo audio clip."""
+
+        def frame_function(t):
+            if isinstance(t, np.ndarray):
+                return np.full((len(t), 2), value)
+            return np.full(2, value)
+
+        return AudioClip(frame_function, duration=duration, fps=44100).with_start(start)
+
+    def test_matches_composite_audio(self):
+        """Test that mixed chunks match CompositeAudioClip."""
+        clips = [self._tone(0.1 * (i + 1), 1.0, i * 0.75) for i in range(8)]
+        indexed = IndexedCompositeAudioClip(clips)
+        plain = CompositeAudioClip(clips)
+
+        for start in np.arange(0, 7, 0.3):
+            t = np.linspace(start, start + 0.2, 50)
+            assert np.allclose(indexed.get_frame(t), plain.get_frame(t))
+
+    def test_scalar_time(self):
+        """Test that scalar lookups are supported."""
+        clips = [self._tone(0.5, 1.0, 0.0), self._tone(0.25, 1.0, 0.5)]
+        indexed = IndexedCompositeAudioClip(clips)
+
+        assert np.allclose(indexed.get_frame(0.75), [0.75, 0.75])
+        assert np.allclose(indexed.get_frame(3.0), [0.0, 0.0])
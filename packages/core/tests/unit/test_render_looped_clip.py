@@ -0,0 +1,104 @@
+"""Tests for the modular-time looped clip."""
+
+import numpy as np
+import pytest
+from moviepy import AudioClip, VideoClip
+
+from teto_core.layer.models import VideoLayer
+from teto_core.layer.processors import VideoLayerProcessor
+from teto_core.render import LoopedClip
+from teto_core.render.decoder_pool import DecoderPool
+from teto_core.render.ffmpeg_pipe import write_video_pipe
+
+
+def _counting_source(duration=1.0, fps=10):
+    """Create a source clip that records how many frames it produced."""
+    calls = []
+
+    def frame(t):
+        calls.append(t)
+        return np.full((4, 6, 3), round(t * fps), dtype=np.uint8)
+
+    clip = VideoClip(frame, duration=duration)
+    clip.fps = fps
+    calls.clear()
+    return clip, calls
+
+
+@pytest.mark.unit
+class TestLoopedClip:
+    """Test suite for LoopedClip."""
+
+    def test_wraps_time_modulo_source_duration(self):
+        """Test that frames repeat with the source period."""
+        source, _ = _counting_source()
+        clip = LoopedClip(source, duration=3.5)
+
+        assert clip.duration == 3.5
+        np.testing.assert_array_equal(clip.get_frame(2.3), source.get_frame(0.3))
+        np.testing.assert_array_equal(clip.get_frame(1.0), source.get_frame(0.0))
+
+    def test_caches_short_sources(self):
+        """Test that later loops reuse frames decoded in the first pass."""
+        source, calls = _counting_source()
+        clip = LoopedClip(source, duration=5.0)
+
+        for i in range(50):
+            clip.get_frame(i / 10)
+
+        assert len(calls) == 10
+        assert clip.cached_frames == 10
+
+    def test_skips_cache_over_limit(self):
+        """Test that sources larger than the limit are decoded every time."""
+        source, calls = _counting_source()
+        clip = LoopedClip(source, duration=5.0, max_cache_bytes=100)
+
+        for i in range(50):
+            clip.get_frame(i / 10)
+
+        assert len(calls) == 50
+        assert clip.cached_frames == 0
+
+    def test_loops_audio(self):
+        """Test that the soundtrack is looped with the same period."""
+        source, _ = _counting_source()
+        source.audio = AudioClip(
+            lambda t: np.column_stack([t, t]), duration=1.0, fps=100
+        )
+        clip = LoopedClip(source, duration=3.0)
+
+        assert clip.audio.duration == 3.0
+        np.testing.assert_allclose(
+            clip.audio.get_frame(np.array([2.25])), [[0.25, 0.25]]
+        )
+
+
+@pytest.mark.unit
+class TestVideoLayerLoop:
+    """Test suite for looping video layers."""
+
+    def test_loop_matches_source_frames(self, temp_dir):
+        """Test that a looped pooled video repeats the decoded source."""
+
+        def frame(t):
+            return np.full((24, 32, 3), min(int(t * 200), 255), dtype=np.uint8)
+
+        path = str(temp_dir / "loop.mp4")
+        write_video_pipe(
+            VideoClip(frame, duration=1.0),
+            path,
+            fps=10,
+            preset="ultrafast",
+            logger=None,
+        )
+        pool = DecoderPool()
+        layer = VideoLayer(path=path, duration=4.0)
+
+        clip = VideoLayerProcessor().execute(layer, decoder_pool=pool)
+        source = pool.open_clip(path)
+
+        assert isinstance(clip, LoopedClip)
+        assert clip.duration == 4.0
+        np.testing.assert_array_equal(clip.get_frame(3.45), source.get_frame(0.45))
+        pool.close()
@@ -0,0 +1,151 @@
+"""Tests for the render profiler."""
+
+import json
+import threading
+import time
+import tracemalloc
+
+import numpy as np
+import pytest
+from moviepy import VideoClip
+
+from teto_core import VideoGenerator
+from teto_core.effect.models import AnimationEffect
+from teto_core.generator.context import ProcessingContext
+from teto_core.generator.pipeline import ProcessingStep
+from teto_core.layer.models import ImageLayer
+from teto_core.output_config.models import OutputConfig
+from teto_core.project.models import Project, Timeline
+from teto_core.render import (
+    FrameScheduler,
+    RenderProfiler,
+    current_profiler,
+    profile_clip,
+)
+
+
+def _sleeping_clip(seconds):
+    """Create a clip whose frames take a fixed time to render."""
+
+    def frame_function(t):
+        time.sleep(seconds)
+        return np.zeros((4, 4, 3), dtype=np.uint8)
+
+    return VideoClip(frame_function, duration=1.0)
+
+
+class _NoopStep(ProcessingStep):
+    """A step that does nothing."""
+
+    def process(self, context):
+        return context
+
+
+@pytest.mark.unit
+class TestRenderProfiler:
+    """Test suite for RenderProfiler."""
+
+    def test_profile_clip_is_noop_when_inactive(self):
+        """Test that clips are left untouched outside a profile."""
+        clip = _sleeping_clip(0)
+        frame_function = clip.frame_function
+
+        assert current_profiler() is None
+        assert profile_clip(clip, "layer", "image").frame_function is frame_function
+
+    def test_self_time_excludes_nested_clips(self):
+        """Test that nested clip time is attributed to the inner clip."""
+        profiler = RenderProfiler(trace_memory=False)
+        with profiler.activate():
+            inner = profile_clip(_sleeping_clip(0.02), "layer", "image")
+            outer = profile_clip(
+                inner.transform(lambda gf, t: (time.sleep(0.01), gf(t))[1]),
+                "effect",
+                "zoom",
+            )
+            # transform がサイズ取得のために呼んだ分は数えない
+            profiler.frames.clear()
+            outer.get_frame(0)
+
+        image = profiler.frames["layer"]["image"]
+        zoom = profiler.frames["effect"]["zoom"]
+        assert image.calls == 1 and zoom.calls == 1
+        assert image.self_seconds >= 0.02
+        assert zoom.total_seconds >= 0.03
+        assert 0.01 <= zoom.self_seconds < 0.02
+
+    def test_threads_are_tracked_separately(self):
+        """Test that concurrent frames do not mix up nesting."""
+        profiler = RenderProfiler(trace_memory=False)
+        with profiler.activate():
+            inner = profile_clip(_sleeping_clip(0.01), "layer", "image")
+            outer = profile_clip(inner.transform(lambda gf, t: gf(t)), "effect", "fx")
+            profiler.frames.clear()
+            list(FrameScheduler(outer, fps=10, workers=4))
+
+        assert profiler.frames["layer"]["image"].calls == 10
+        assert profiler.frames["effect"]["fx"].calls == 10
+        assert profiler.frames["effect"]["fx"].self_seconds < 0.01 * 10
+
+    def test_step_records_time_and_memory(self):
+        """Test that pipeline steps are timed when a profiler is set."""
+        profiler = RenderProfiler()
+        step = _NoopStep()
+        step.then(_NoopStep())
+        context = ProcessingContext(project=None, profiler=profiler)
+
+        with profiler.activate():
+            step.execute(context)
+
+        assert [s.name for s in profiler.steps] == ["_NoopStep", "_NoopStep"]
+        assert all(s.peak_memory_bytes is not None for s in profiler.steps)
+        assert not tracemalloc.is_tracing()
+
+    def test_activate_is_thread_local_to_context(self):
+        """Test that other threads do not see the active profiler."""
+        seen = []
+        with RenderProfiler(trace_memory=False).activate():
+            thread = threading.Thread(target=lambda: seen.append(current_profiler()))
+            thread.start()
+            thread.join()
+
+        assert seen == [None]
+
+
+@pytest.mark.unit
+class TestGenerateWithProfiler:
+    """Test suite for profiling a full render."""
+
+    def test_report_covers_steps_layers_and_effects(self, sample_image_path, temp_dir):
+        """Test that a profiled render produces a complete report."""
+        project = Project(
+            output=OutputConfig(
+                path=str(temp_dir / "profiled.mp4"),
+                width=32,
+                height=24,
+                fps=10,
+                preset="ultrafast",
+            ),
+            timeline=Timeline(
+                video_layers=[
+                    ImageLayer(
+                        path=str(sample_image_path),
+                        duration=1.0,
+                        effects=[AnimationEffect(type="zoom")],
+                    )
+                ]
+            ),
+        )
+        profiler = RenderProfiler()
+
+        VideoGenerator(project).generate(verbose=False, profiler=profiler)
+        report_path = profiler.write_report(temp_dir / "profile.json")
+
+        report = json.loads(report_path.read_text(encoding="utf-8"))
+        step_names = [step["name"] for step in report["steps"]]
+        assert "VideoLayerProcessingStep" in step_names
+        assert "VideoOutputStep" in step_names
+        assert report["frames"]["layer"]["image"]["calls"] >= 10
+        assert report["frames"]["effect"]["zoom"]["calls"] >= 10
+        assert report["peak_memory_bytes"] > 0
+        assert "effect:zoom" in profiler.summary()
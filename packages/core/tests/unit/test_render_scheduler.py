@@ -0,0 +1,162 @@
+"""Tests for the ordered multi-threaded frame scheduler."""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+from moviepy import ColorClip, VideoClip, VideoFileClip
+
+from teto_core.render import (
+    FrameScheduler,
+    SerializedFrameReader,
+    serialize_reader,
+    write_video_pipe,
+)
+
+
+@pytest.mark.unit
+class TestFrameScheduler:
+    """Test suite for FrameScheduler."""
+
+    def test_frames_are_in_order(self, counter_clip):
+        """Test that frames come out in timeline order despite uneven work."""
+        # 前半のフレームほど遅くして、完了順を入れ替える
+        clip = counter_clip(delay=lambda t: (1.0 - t) * 0.01)
+        scheduler = FrameScheduler(clip, fps=10, workers=4)
+
+        values = [int(frame[0, 0, 0]) for frame in scheduler]
+
+        assert len(scheduler) == 10
+        assert values == [i * 10 for i in range(10)]
+
+    def test_frame_range(self, counter_clip):
+        """Test that only the requested frame range is produced."""
+        scheduler = FrameScheduler(
+            counter_clip(), fps=10, workers=2, start_frame=3, end_frame=6
+        )
+
+        assert [int(frame[0, 0, 0]) for frame in scheduler] == [30, 40, 50]
+
+    def test_window_limits_frames_in_flight(self):
+        """Test that no more than the window of frames is scheduled ahead."""
+        lock = threading.Lock()
+        in_flight = []
+        peak = []
+
+        def frame_function(t):
+            with lock:
+                in_flight.append(t)
+                peak.append(len(in_flight))
+            time.sleep(0.005)
+            with lock:
+                in_flight.remove(t)
+            return np.zeros((4, 4, 3), dtype=np.uint8)
+
+        clip = VideoClip(frame_function, duration=2.0)
+        scheduler = FrameScheduler(clip, fps=10, workers=8, window=3)
+
+        assert len(list(scheduler)) == 20
+        assert max(peak) <= 3
+
+    def test_default_window_is_twice_the_workers(self, counter_clip):
+        """Test the default look-ahead window."""
+        assert FrameScheduler(counter_clip(), fps=10, workers=3).window == 6
+
+    def test_worker_error_is_raised(self):
+        """Test that errors in worker threads reach the consumer."""
+
+        def frame_function(t):
+            if t > 0.25:
+                raise ValueError("broken frame")
+            return np.zeros((4, 4, 3), dtype=np.uint8)
+
+        scheduler = FrameScheduler(VideoClip(frame_function, duration=1.0), fps=10)
+
+        with pytest.raises(ValueError, match="broken frame"):
+            list(scheduler)
+
+    def test_early_exit_shuts_down_pool(self, counter_clip):
+        """Test that abandoning iteration shuts the thread pool down."""
+        scheduler = FrameScheduler(counter_clip(duration=10.0), fps=10, workers=2)
+
+        for _ in scheduler:
+            break
+
+        assert scheduler._executor is None
+        assert not scheduler._pending
+
+
+@pytest.mark.unit
+class TestSerializedFrameReader:
+    """Test suite for SerializedFrameReader."""
+
+    @pytest.fixture
+    def video_path(self, tmp_path):
+        """Write a short video whose red channel increases per frame."""
+        path = str(tmp_path / "counter.mp4")
+        clip = VideoClip(
+            lambda t: np.full((16, 16, 3), int(round(t * 10)) * 20, dtype=np.uint8),
+            duration=1.0,
+        )
+        write_video_pipe(clip, path, fps=10, preset="ultrafast", logger=None)
+        return path
+
+    def test_out_of_order_reads_match_sequential(self, video_path):
+        """Test that slightly out-of-order reads do not re-seek."""
+        with VideoFileClip(video_path) as sequential:
+            expected = [sequential.get_frame(i / 10).copy() for i in range(10)]
+
+        with VideoFileClip(video_path) as clip:
+            serialize_reader(clip)
+            order = [0, 2, 1, 3, 5, 4, 6, 7, 9, 8]
+            frames = {i: clip.get_frame(i / 10) for i in order}
+
+        for i in range(10):
+            np.testing.assert_array_equal(frames[i], expected[i])
+
+    def test_concurrent_reads(self, video_path):
+        """Test that concurrent reads through the scheduler stay correct."""
+        with VideoFileClip(video_path) as sequential:
+            expected = [sequential.get_frame(i / 10).copy() for i in range(10)]
+
+        with VideoFileClip(video_path) as clip:
+            serialize_reader(clip)
+            frames = list(FrameScheduler(clip, fps=10, workers=4))
+
+        for frame, reference in zip(frames, expected):
+            np.testing.assert_array_equal(frame, reference)
+
+    def test_serialize_reader_is_idempotent(self, video_path):
+        """Test that the reader is wrapped only once."""
+        with VideoFileClip(video_path) as clip:
+            serialize_reader(clip)
+            reader = clip.reader
+            serialize_reader(clip)
+
+            assert clip.reader is reader
+            assert isinstance(reader, SerializedFrameReader)
+
+
+@pytest.mark.unit
+class TestWriteVideoPipeWithScheduler:
+    """Test suite for write_video_pipe with multiple frame workers."""
+
+    def test_writes_all_frames(self, tmp_path):
+        """Test that a multi-threaded render writes every frame."""
+        path = str(tmp_path / "out.mp4")
+        clip = ColorClip(size=(32, 24), color=(0, 0, 200), duration=1.0)
+
+        stats = write_video_pipe(
+            clip,
+            path,
+            fps=10,
+            preset="ultrafast",
+            logger=None,
+            frame_workers=3,
+            frame_window=4,
+        )
+
+        assert stats.frames == 10
+        with VideoFileClip(path) as result:
+            assert len(list(result.iter_frames())) == 10
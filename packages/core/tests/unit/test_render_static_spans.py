@@ -0,0 +1,186 @@
+"""Tests for static span detection and duplicate-frame elision."""
+
+import numpy as np
+import pytest
+from moviepy import ColorClip, VideoClip
+
+from teto_core.layer.models import ImageLayer, VideoLayer
+from teto_core.layer.processors import VideoProcessor
+from teto_core.render import (
+    FlattenedCompositeClip,
+    TransitionSequenceClip,
+    concatenate_videoclips_indexed,
+    find_static_spans,
+    mark_static_overlay,
+    repeated_frames,
+)
+from teto_core.render.ffmpeg_pipe import FrameProducer, write_video_pipe
+from teto_core.render.scheduler import FrameScheduler
+
+
+def _static(color, duration=2.0, size=(16, 12)):
+    """Create a color clip marked as static."""
+    return mark_static_overlay(ColorClip(size=size, color=color, duration=duration))
+
+
+def _moving(duration=2.0, size=(16, 12)):
+    """Create a clip whose brightness changes every frame."""
+
+    def frame(t):
+        return np.full((size[1], size[0], 3), int(t * 50) % 256, dtype=np.uint8)
+
+    return VideoClip(frame, duration=duration)
+
+
+def _counting(clip):
+    """Wrap a clip so that get_frame calls are counted."""
+    calls = []
+    frame_function = clip.frame_function
+
+    def counted(t):
+        calls.append(t)
+        return frame_function(t)
+
+    clip.frame_function = counted
+    return clip, calls
+
+
+@pytest.mark.unit
+class TestFindStaticSpans:
+    """Test suite for find_static_spans."""
+
+    def test_unmarked_clip_has_no_spans(self):
+        """Test that an unmarked clip is never static."""
+        assert find_static_spans(_moving()) == []
+
+    def test_marked_clip_is_one_span(self):
+        """Test that a marked clip is static over its whole duration."""
+        assert find_static_spans(_static((1, 2, 3))) == [(0.0, 2.0)]
+
+    def test_concatenation_splits_at_clip_boundaries(self):
+        """Test that consecutive static clips produce separate spans."""
+        clip = concatenate_videoclips_indexed(
+            [_static((255, 0, 0)), _moving(), _static((0, 0, 255))]
+        )
+
+        assert find_static_spans(clip) == [(0.0, 2.0), (4.0, 6.0)]
+
+    def test_animated_overlay_breaks_span(self):
+        """Test that an unmarked overlay makes its display span non-static."""
+        base = concatenate_videoclips_indexed([_static((10, 10, 10), duration=4.0)])
+        overlay = _moving(duration=1.0, size=(4, 4)).with_start(1.0)
+        subtitle = _static((255, 255, 255), duration=1.0, size=(4, 4)).with_start(3.0)
+
+        clip = FlattenedCompositeClip(base, [overlay, subtitle])
+
+        assert find_static_spans(clip) == [(0.0, 1.0), (2.0, 3.0), (3.0, 4.0)]
+
+    def test_transition_windows_are_not_static(self):
+        """Test that cross fades are excluded from static spans."""
+        clip = TransitionSequenceClip(
+            [_static((255, 0, 0)), _static((0, 255, 0))], [0.5], size=(16, 12)
+        )
+
+        assert find_static_spans(clip) == [(0.0, 1.5), (2.0, 3.5)]
+
+
+@pytest.mark.unit
+class TestRepeatedFrames:
+    """Test suite for repeated_frames."""
+
+    def test_first_frame_of_each_span_is_rendered(self):
+        """Test that only frames after the first in a span are repeats."""
+        clip = concatenate_videoclips_indexed(
+            [_static((255, 0, 0), duration=0.3), _static((0, 0, 255), duration=0.3)]
+        )
+
+        repeats = repeated_frames(clip, fps=10, start_frame=0, end_frame=6)
+
+        assert repeats.tolist() == [False, True, True, False, True, True]
+
+    def test_chunk_start_is_always_rendered(self):
+        """Test that the first frame of a chunk is never a repeat."""
+        repeats = repeated_frames(
+            _static((1, 1, 1)), fps=10, start_frame=5, end_frame=8
+        )
+
+        assert repeats.tolist() == [False, True, True]
+
+
+@pytest.mark.unit
+class TestStaticFrameElision:
+    """Test suite for duplicate-frame elision in the frame producers."""
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_static_frames_are_rendered_once(self, workers):
+        """Test that a static span is rendered once and repeated."""
+        clip, calls = _counting(
+            concatenate_videoclips_indexed([_static((255, 0, 0)), _moving()])
+        )
+        if workers > 1:
+            producer = FrameScheduler(clip, fps=10, workers=workers)
+        else:
+            producer = FrameProducer(clip, fps=10)
+
+        frames = list(producer)
+
+        assert len(frames) == 40
+        assert producer.n_repeated == 19
+        assert len(calls) == 21
+        assert all(np.array_equal(frame, frames[0]) for frame in frames[:20])
+
+    def test_output_matches_without_elision(self):
+        """Test that elision does not change the produced frames."""
+        clip = FlattenedCompositeClip(
+            concatenate_videoclips_indexed([_static((200, 100, 0)), _moving()]),
+            [_static((255, 255, 255), duration=1.0, size=(4, 4)).with_start(0.5)],
+        )
+
+        elided = list(FrameProducer(clip, fps=10))
+        full = list(FrameProducer(clip, fps=10, elide_static=False))
+
+        assert len(elided) == len(full)
+        for a, b in zip(elided, full):
+            np.testing.assert_array_equal(a, b)
+
+
+@pytest.mark.unit
+class TestLoopedVideoLayer:
+    """Test suite for static spans around a looped video layer."""
+
+    @pytest.fixture
+    def timeline(self, temp_dir, sample_image_path, counter_clip):
+        """Build an image layer followed by a 0.5 s video looped to 1.5 s."""
+        path = str(temp_dir / "loop.mp4")
+        write_video_pipe(
+            counter_clip(duration=0.5, size=(32, 24)), path, fps=10, logger=None
+        )
+        layers = [
+            ImageLayer(path=str(sample_image_path), duration=1.0),
+            VideoLayer(path=path, duration=1.5),
+        ]
+        clip = VideoProcessor().execute(layers, output_size=(32, 24))
+        yield clip
+        clip.close()
+
+    def test_looped_video_is_not_static(self, timeline):
+        """Test that only the image layer forms a static span."""
+        assert find_static_spans(timeline) == [(0.0, 1.0)]
+
+    def test_elision_matches_full_render(self, timeline):
+        """Test that elided frames equal a full render across the loop seam."""
+        clip = FlattenedCompositeClip(
+            timeline,
+            [_static((255, 255, 255), duration=2.5, size=(8, 4)).with_start(0.0)],
+        )
+
+        producer = FrameProducer(clip, fps=10)
+        elided = list(producer)
+        full = list(FrameProducer(clip, fps=10, elide_static=False))
+
+        assert producer.n_repeated == 9
+        assert len(elided) == len(full) == 25
+        for a, b in zip(elided, full):
+            np.testing.assert_array_equal(a, b)
+        # ループの継ぎ目（0.5 秒ごと）でも素材の先頭に戻る
+        np.testing.assert_array_equal(elided[10], elided[15])
@@ -0,0 +1,87 @@
+"""Tests for the sequential transition compositor."""
+
+import numpy as np
+import pytest
+from unittest.mock import MagicMock
+from moviepy import ColorClip, CompositeVideoClip
+from moviepy.video.fx import CrossFadeIn, CrossFadeOut
+
+from teto_core.render import TransitionSequenceClip
+
+
+def _clips():
+    """Create three opaque clips with distinct colors."""
+    return [
+        ColorClip(size=(16, 12), color=(200, 0, 0), duration=2.0),
+        ColorClip(size=(16, 12), color=(0, 200, 0), duration=2.0),
+        ColorClip(size=(16, 12), color=(0, 0, 200), duration=2.0),
+    ]
+
+
+def _reference(clips, transitions):
+    """Build the equivalent CompositeVideoClip with cross fades."""
+    composite_clips = []
+    current_time = 0.0
+    for i, clip in enumerate(clips):
+        if i > 0 and transitions[i - 1]:
+            clip = clip.with_effects([CrossFadeIn(transitions[i - 1])])
+        if i < len(transitions) and transitions[i]:
+            clip = clip.with_effects([CrossFadeOut(transitions[i])])
+        composite_clips.append(clip.with_start(current_time))
+        overlap = transitions[i] if i < len(transitions) else 0.0
+        current_time += clip.duration - overlap
+    return CompositeVideoClip(composite_clips, size=(16, 12))
+
+
+@pytest.mark.unit
+class TestTransitionSequenceClip:
+    """Test suite for TransitionSequenceClip."""
+
+    def test_timing_overlaps_by_transition(self):
+        """Test that clips overlap by their transition duration."""
+        clip = TransitionSequenceClip(_clips(), [0.5, 0.0], size=(16, 12))
+
+        assert clip.starts == [0.0, 1.5, 3.5]
+        assert clip.duration == 5.5
+
+    def test_transition_count_must_match(self):
+        """Test that a mismatched transition list is rejected."""
+        with pytest.raises(ValueError):
+            TransitionSequenceClip(_clips(), [0.5], size=(16, 12))
+
+    def test_passes_single_frame_through(self):
+        """Test that frames outside a transition are not re-blended."""
+        frame = np.full((12, 16, 3), 77, dtype=np.uint8)
+        source = ColorClip(size=(16, 12), color=(0, 0, 0), duration=2.0)
+        source.frame_function = MagicMock(return_value=frame)
+        clip = TransitionSequenceClip(
+            [source, ColorClip(size=(16, 12), color=(1, 1, 1), duration=2.0)],
+            [0.5],
+            size=(16, 12),
+        )
+
+        assert clip.get_frame(0.5) is frame
+
+    def test_blends_only_inside_window(self):
+        """Test that the transition window mixes the two adjacent clips."""
+        clip = TransitionSequenceClip(_clips(), [1.0, 0.0], size=(16, 12))
+
+        mid = clip.get_frame(1.5)
+        assert 0 < mid[0, 0, 0] < 200
+        assert 0 < mid[0, 0, 1] < 200
+        assert mid[0, 0, 2] == 0
+        assert np.all(clip.get_frame(2.5) == (0, 200, 0))
+        assert np.all(clip.get_frame(3.5) == (0, 0, 200))
+
+    @pytest.mark.parametrize("t", [0.2, 1.1, 1.5, 1.9, 2.2, 3.0, 3.7, 4.5])
+    def test_matches_crossfade_composite(self, t):
+        """Test that output matches the CrossFadeIn/CrossFadeOut composite."""
+        transitions = [1.0, 0.5]
+        clip = TransitionSequenceClip(_clips(), transitions, size=(16, 12))
+        reference = _reference(_clips(), transitions)
+
+        np.testing.assert_allclose(
+            clip.get_frame(t).astype(int),
+            reference.get_frame(t).astype(int),
+            atol=1,
+        )
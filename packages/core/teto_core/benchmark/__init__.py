@@ -0,0 +1,29 @@
+"""Benchmark domain - Synthetic render benchmarks"""
+
+from .models import (
+    BenchmarkCase,
+    BenchmarkResult,
+    BenchmarkReport,
+    BenchmarkComparison,
+)
+from .synthetic import SyntheticAssets, prepare_assets, build_project
+from .runner import (
+    DEFAULT_CASES,
+    run_case,
+    run_benchmark,
+    compare_reports,
+)
+
+__all__ = [
+    "BenchmarkCase",
+    "BenchmarkResult",
+    "BenchmarkReport",
+    "BenchmarkComparison",
+    "SyntheticAssets",
+    "prepare_assets",
+    "build_project",
+    "DEFAULT_CASES",
+    "run_case",
+    "run_benchmark",
+    "compare_reports",
+]
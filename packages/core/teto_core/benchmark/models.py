@@ -0,0 +1,148 @@
+"""ベンチマークのデータモデル"""
+
+import json
+from pathlib import Path
+from typing import Literal, get_args
+
+from pydantic import BaseModel, Field, field_validator
+
+from ..effect.models import AnimationEffect
+
+# 出力バックエンド（null はフレームを生成して捨て、エンコードしない）
+BenchmarkEncoder = Literal["null", "ffmpeg_pipe", "moviepy"]
+
+# レポート形式のバージョン（互換性のない変更を入れたら上げる）
+BENCHMARK_REPORT_VERSION = 1
+
+
+class BenchmarkCase(BaseModel):
+    """合成プロジェクトの構成
+
+    シーン数・レイヤーの種類・エフェクト・字幕の密度・キャラクター数を
+    指定して、同じ構成のプロジェクトを何度でも再現できるようにする。
+    """
+
+    name: str = Field(..., description="ケース名")
+    scenes: int = Field(5, description="シーン数", ge=1)
+    scene_duration: float = Field(2.0, description="1シーンの長さ（秒）", gt=0)
+    layer_type: Literal["image", "video", "mixed"] = Field(
+        "image", description="背景レイヤーの種類（mixed は画像と動画を交互に使う）"
+    )
+    effects: list[str] = Field(
+        default_factory=list, description="各シーンに適用するエフェクトの種類"
+    )
+    subtitles_per_scene: int = Field(1, description="1シーンあたりの字幕数", ge=0)
+    characters: int = Field(0, description="キャラクターレイヤー数", ge=0)
+    width: int = Field(1280, description="幅（ピクセル）", ge=2)
+    height: int = Field(720, description="高さ（ピクセル）", ge=2)
+    fps: int = Field(30, description="フレームレート", ge=1)
+    frame_workers: int = Field(1, description="フレーム生成の並列スレッド数", ge=1)
+
+    @field_validator("effects")
+    @classmethod
+    def validate_effects(cls, v: list[str]) -> list[str]:
+        """エフェクトの種類が AnimationEffect で使えるものであることを確認"""
+        valid_types = get_args(AnimationEffect.model_fields["type"].annotation)
+        for effect_type in v:
+            if effect_type not in valid_types:
+                raise ValueError(
+                    f"unknown effect type '{effect_type}' "
+                    f"(available: {', '.join(valid_types)})"
+                )
+        return v
+
+    @property
+    def duration(self) -> float:
+        """出力の長さ（秒）"""
+        return self.scenes * self.scene_duration
+
+
+class BenchmarkResult(BaseModel):
+    """1ケース分の計測結果"""
+
+    case: BenchmarkCase
+    encoder: BenchmarkEncoder
+    frames: int = Field(..., description="生成したフレーム数")
+    seconds: float = Field(..., description="生成にかかった時間（秒）")
+    peak_rss_bytes: int | None = Field(
+        None, description="ピーク RSS（計測できない環境では None）"
+    )
+
+    @property
+    def fps(self) -> float:
+        """1秒あたりの生成フレーム数"""
+        return self.frames / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def seconds_per_output_minute(self) -> float:
+        """出力1分あたりの生成時間（秒）"""
+        return self.seconds / (self.case.duration / 60)
+
+
+class BenchmarkReport(BaseModel):
+    """ベンチマークのレポート（ベースラインとして保存・比較する）"""
+
+    version: int = BENCHMARK_REPORT_VERSION
+    environment: dict[str, str | int | None] = Field(default_factory=dict)
+    results: list[BenchmarkResult] = Field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        """計算済みの指標を含めて辞書に変換
+
+        Returns:
+            JSON に変換できる辞書
+        """
+        data = self.model_dump(mode="json")
+        for result, entry in zip(self.results, data["results"]):
+            entry["fps"] = round(result.fps, 3)
+            entry["seconds_per_output_minute"] = round(
+                result.seconds_per_output_minute, 3
+            )
+        return data
+
+    def write_json(self, path: str | Path) -> Path:
+        """レポートを JSON ファイルに書き出す
+
+        Args:
+            path: 出力ファイルパス
+
+        Returns:
+            出力ファイルパス
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps(self.to_dict(), ensure_ascii=False, indent=2),
+            encoding="utf-8",
+        )
+        return path
+
+    @classmethod
+    def from_json_file(cls, path: str | Path) -> "BenchmarkReport":
+        """JSON ファイルからレポートを読み込む
+
+        Args:
+            path: JSON ファイルパス
+
+        Returns:
+            レポート
+        """
+        # fps などの計算済みの指標は読み込み時に無視する
+        return cls.model_validate_json(Path(path).read_text(encoding="utf-8"))
+
+
+class BenchmarkComparison(BaseModel):
+    """ベースラインとの比較結果"""
+
+    name: str
+    baseline_fps: float
+    current_fps: float
+    baseline_peak_rss_bytes: int | None = None
+    current_peak_rss_bytes: int | None = None
+
+    @property
+    def fps_change(self) -> float:
+        """fps の変化率（0.1 なら 10% 速くなった）"""
+        if self.baseline_fps <= 0:
+            return 0.0
+        return self.current_fps / self.baseline_fps - 1
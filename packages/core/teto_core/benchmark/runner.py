@@ -0,0 +1,205 @@
+"""合成プロジェクトのレンダリングベンチマーク"""
+
+import os
+import platform
+import sys
+import time
+from importlib import metadata
+from pathlib import Path
+from typing import Callable
+
+from .models import (
+    BenchmarkCase,
+    BenchmarkComparison,
+    BenchmarkEncoder,
+    BenchmarkReport,
+    BenchmarkResult,
+)
+from .synthetic import build_project, prepare_assets
+from ..generator.steps import NullOutputStep
+from ..render.ffmpeg_pipe import frame_count
+from ..video_generator import VideoGenerator
+
+# 標準のベンチマークケース（シーン数やサイズは CLI から上書きできる）
+DEFAULT_CASES: list[BenchmarkCase] = [
+    BenchmarkCase(name="image_plain"),
+    BenchmarkCase(name="image_effects", effects=["kenBurns", "colorGrade", "vignette"]),
+    BenchmarkCase(name="image_blur", effects=["zoom", "blur"]),
+    BenchmarkCase(name="video_plain", layer_type="video"),
+    BenchmarkCase(name="mixed_zoom", layer_type="mixed", effects=["zoom"]),
+    BenchmarkCase(name="dense_subtitles", subtitles_per_scene=4),
+    BenchmarkCase(name="characters", characters=3),
+]
+
+
+def run_case(
+    case: BenchmarkCase,
+    work_dir: str | Path,
+    encoder: BenchmarkEncoder = "null",
+) -> BenchmarkResult:
+    """1ケースをレンダリングして計測する
+
+    計測するのは VideoGenerator.generate の実行時間で、レイヤーの
+    読み込みからフレームの生成（と encoder が null 以外ならエンコード）までを含む。
+    アセットの作成は計測に含めない。
+
+    Args:
+        case: ベンチマークケース
+        work_dir: アセットと出力を置く作業ディレクトリ
+        encoder: 出力バックエンド。null はフレームを生成して捨てる
+
+    Returns:
+        計測結果
+    """
+    work_dir = Path(work_dir)
+    assets = prepare_assets(case, work_dir)
+    output_path = work_dir / "output" / f"{case.name}.mp4"
+    project = build_project(case, assets, str(output_path))
+
+    generator = VideoGenerator(project)
+    output_step = None
+    if encoder == "null":
+        output_step = NullOutputStep()
+    else:
+        project.output.encoder = encoder
+
+    start = time.perf_counter()
+    generator.generate(verbose=False, output_step=output_step)
+    seconds = time.perf_counter() - start
+
+    return BenchmarkResult(
+        case=case,
+        encoder=encoder,
+        frames=frame_count(case.duration, case.fps),
+        seconds=seconds,
+        peak_rss_bytes=peak_rss_bytes(),
+    )
+
+
+def run_benchmark(
+    cases: list[BenchmarkCase],
+    work_dir: str | Path,
+    encoder: BenchmarkEncoder = "null",
+    isolate: bool = True,
+    progress_callback: Callable[[BenchmarkResult], None] | None = None,
+) -> BenchmarkReport:
+    """複数のケースを順に計測する
+
+    isolate=True の場合は各ケースを新しいプロセスで実行する。ピーク RSS は
+    プロセス単位でしか取れないため、ケースごとに正しく比較するにはプロセスを
+    分ける必要がある。ケースは並列に実行せず、互いの計測に干渉しないようにする。
+
+    Args:
+        cases: ベンチマークケースのリスト
+        work_dir: アセットと出力を置く作業ディレクトリ
+        encoder: 出力バックエンド
+        isolate: ケースごとに別プロセスで実行するか
+        progress_callback: ケースが終わるたびに結果を受け取るコールバック
+
+    Returns:
+        レポート
+    """
+    results = []
+    for case in cases:
+        # アセットの作成は親プロセスで済ませ、計測対象のプロセスに含めない
+        prepare_assets(case, work_dir)
+        if isolate:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                result_dict = executor.submit(
+                    run_case_worker, case.model_dump(), str(work_dir), encoder
+                ).result()
+            result = BenchmarkResult.model_validate(result_dict)
+        else:
+            result = run_case(case, work_dir, encoder)
+
+        results.append(result)
+        if progress_callback:
+            progress_callback(result)
+
+    return BenchmarkReport(environment=environment_info(), results=results)
+
+
+def run_case_worker(case_dict: dict, work_dir: str, encoder: str) -> dict:
+    """1ケースを計測するワーカー関数
+
+    ProcessPoolExecutor で使用するため、シリアライズ可能な dict を引数に取ります。
+
+    Args:
+        case_dict: ベンチマークケースの dict
+        work_dir: 作業ディレクトリ
+        encoder: 出力バックエンド
+
+    Returns:
+        計測結果の dict
+    """
+    case = BenchmarkCase.model_validate(case_dict)
+    return run_case(case, work_dir, encoder).model_dump()
+
+
+def compare_reports(
+    current: BenchmarkReport, baseline: BenchmarkReport
+) -> list[BenchmarkComparison]:
+    """ベースラインと同じケース・同じ出力バックエンドの結果を比較する
+
+    Args:
+        current: 今回のレポート
+        baseline: ベースラインのレポート
+
+    Returns:
+        両方に含まれるケースの比較結果
+    """
+    baseline_results = {
+        (result.case.name, result.encoder): result for result in baseline.results
+    }
+    comparisons = []
+    for result in current.results:
+        before = baseline_results.get((result.case.name, result.encoder))
+        if before is None:
+            continue
+        comparisons.append(
+            BenchmarkComparison(
+                name=result.case.name,
+                baseline_fps=before.fps,
+                current_fps=result.fps,
+                baseline_peak_rss_bytes=before.peak_rss_bytes,
+                current_peak_rss_bytes=result.peak_rss_bytes,
+            )
+        )
+    return comparisons
+
+
+def peak_rss_bytes() -> int | None:
+    """現在のプロセスのピーク RSS を取得
+
+    Returns:
+        ピーク RSS（バイト）。resource モジュールがない環境では None
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS はバイト、Linux は KB 単位
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def environment_info() -> dict[str, str | int | None]:
+    """計測環境の情報を取得
+
+    Returns:
+        Python・主要ライブラリのバージョンと CPU 数
+    """
+    info: dict[str, str | int | None] = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+    for package in ("teto-core", "moviepy", "numpy", "scipy", "pillow"):
+        try:
+            info[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            info[package] = None
+    return info
@@ -0,0 +1,224 @@
+"""ベンチマーク用の合成プロジェクト生成"""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from moviepy import VideoClip
+from PIL import Image, ImageDraw
+
+from .models import BenchmarkCase
+from ..effect.models import AnimationEffect
+from ..layer.models import (
+    CharacterAnimationConfig,
+    CharacterAnimationType,
+    CharacterLayer,
+    CharacterPositionPreset,
+    ImageLayer,
+    SubtitleItem,
+    SubtitleLayer,
+    VideoLayer,
+)
+from ..output_config.models import OutputConfig
+from ..project.models import Project, Timeline
+from ..render.ffmpeg_pipe import write_video_pipe
+
+# 合成アセットの乱数シード（実行ごとに同じ画像を作る）
+_ASSET_SEED = 1234
+
+
+@dataclass
+class SyntheticAssets:
+    """合成プロジェクトで使うアセットのパス"""
+
+    image_path: str
+    video_path: str | None
+    character_path: str | None
+
+
+def prepare_assets(case: BenchmarkCase, work_dir: str | Path) -> SyntheticAssets:
+    """ケースに必要なアセットを作成する
+
+    画像はノイズ入りのグラデーションにして、エンコーダーやスケーラーが
+    単色画像のように極端に速く処理できないようにする。作成済みの
+    アセットは再利用する。
+
+    Args:
+        case: ベンチマークケース
+        work_dir: アセットを置く作業ディレクトリ
+
+    Returns:
+        アセットのパス
+    """
+    asset_dir = Path(work_dir) / "assets"
+    asset_dir.mkdir(parents=True, exist_ok=True)
+    size = (case.width, case.height)
+
+    image_path = asset_dir / f"background_{case.width}x{case.height}.png"
+    if not image_path.exists():
+        Image.fromarray(_background_frame(size, 0.0)).save(image_path)
+
+    video_path = None
+    if case.layer_type in ("video", "mixed"):
+        video_path = (
+            asset_dir / f"background_{case.width}x{case.height}_{case.fps}fps_"
+            f"{case.scene_duration:g}s.mp4"
+        )
+        if not video_path.exists():
+            clip = VideoClip(
+                lambda t: _background_frame(size, t), duration=case.scene_duration
+            )
+            write_video_pipe(
+                clip, str(video_path), fps=case.fps, preset="ultrafast", logger=None
+            )
+
+    character_path = None
+    if case.characters:
+        character_path = asset_dir / "character.png"
+        if not character_path.exists():
+            _character_image(512).save(character_path)
+
+    return SyntheticAssets(
+        image_path=str(image_path),
+        video_path=str(video_path) if video_path else None,
+        character_path=str(character_path) if character_path else None,
+    )
+
+
+def build_project(
+    case: BenchmarkCase, assets: SyntheticAssets, output_path: str
+) -> Project:
+    """ケースの構成どおりのプロジェクトを組み立てる
+
+    Args:
+        case: ベンチマークケース
+        assets: prepare_assets で作成したアセット
+        output_path: 出力ファイルパス
+
+    Returns:
+        プロジェクト
+    """
+    video_layers = []
+    for i in range(case.scenes):
+        effects = [AnimationEffect(type=effect_type) for effect_type in case.effects]
+        use_video = case.layer_type == "video" or (
+            case.layer_type == "mixed" and i % 2 == 1
+        )
+        if use_video:
+            video_layers.append(
+                VideoLayer(
+                    path=assets.video_path,
+                    duration=case.scene_duration,
+                    effects=effects,
+                )
+            )
+        else:
+            video_layers.append(
+                ImageLayer(
+                    path=assets.image_path,
+                    duration=case.scene_duration,
+                    effects=effects,
+                )
+            )
+
+    subtitle_layers = []
+    if case.subtitles_per_scene:
+        items = []
+        item_duration = case.scene_duration / case.subtitles_per_scene
+        for i in range(case.scenes):
+            for j in range(case.subtitles_per_scene):
+                start = i * case.scene_duration + j * item_duration
+                items.append(
+                    SubtitleItem(
+                        text=f"シーン{i + 1}の字幕 {j + 1}: ベンチマーク用のテキスト",
+                        start_time=start,
+                        end_time=start + item_duration,
+                    )
+                )
+        subtitle_layers.append(SubtitleLayer(items=items))
+
+    # キャラクターは配置を変え、半数には動きをつける
+    positions = list(CharacterPositionPreset)
+    character_layers = [
+        CharacterLayer(
+            character_id=f"character_{k}",
+            character_name=f"キャラクター{k + 1}",
+            expression="normal",
+            path=assets.character_path,
+            start_time=0.0,
+            end_time=case.duration,
+            position=positions[k % len(positions)],
+            scale=0.5,
+            animation=CharacterAnimationConfig(
+                type=(
+                    CharacterAnimationType.BREATHE
+                    if k % 2 == 1
+                    else CharacterAnimationType.NONE
+                )
+            ),
+        )
+        for k in range(case.characters)
+    ]
+
+    return Project(
+        output=OutputConfig(
+            path=output_path,
+            width=case.width,
+            height=case.height,
+            fps=case.fps,
+            preset="ultrafast",
+            frame_workers=case.frame_workers,
+        ),
+        timeline=Timeline(
+            video_layers=video_layers,
+            subtitle_layers=subtitle_layers,
+            character_layers=character_layers,
+        ),
+    )
+
+
+def _background_frame(size: tuple[int, int], t: float) -> np.ndarray:
+    """ノイズ入りのグラデーション画像を作成
+
+    Args:
+        size: (幅, 高さ)
+        t: 時刻（秒）。グラデーションを横に流す
+
+    Returns:
+        RGB 画像
+    """
+    width, height = size
+    x = np.linspace(0, 1, width, dtype=np.float32)[None, :]
+    y = np.linspace(0, 1, height, dtype=np.float32)[:, None]
+    phase = (x + t * 0.25) % 1.0
+    frame = np.empty((height, width, 3), dtype=np.float32)
+    frame[:, :, 0] = phase * 255
+    frame[:, :, 1] = y * 255
+    frame[:, :, 2] = (1 - phase) * y * 255
+    rng = np.random.default_rng(_ASSET_SEED)
+    frame += rng.normal(0, 12, size=frame.shape).astype(np.float32)
+    return np.clip(frame, 0, 255).astype(np.uint8)
+
+
+def _character_image(size: int) -> Image.Image:
+    """透過付きのキャラクター風の画像を作成
+
+    Args:
+        size: 一辺のピクセル数
+
+    Returns:
+        RGBA 画像
+    """
+    image = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    margin = size // 8
+    draw.ellipse(
+        (margin, margin, size - margin, size - margin), fill=(250, 210, 180, 255)
+    )
+    eye = size // 12
+    for cx in (size * 3 // 8, size * 5 // 8):
+        draw.ellipse(
+            (cx - eye, size * 3 // 8, cx + eye, size * 3 // 8 + 2 * eye),
+            fill=(40, 40, 40, 255),
+        )
+    return image
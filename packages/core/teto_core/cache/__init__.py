@@ -9,6 +9,8 @@ from .tts import (
 )
 from .image import ImageCacheManager, get_image_cache_manager
 from .video import VideoCacheManager, get_video_cache_manager
+from .segment import SegmentCacheManager, get_segment_cache_manager
+from .audio_track import AudioTrackCacheManager, get_audio_track_cache_manager
 from .manager import (
     CacheManager,
     get_cache_manager,
@@ -31,6 +33,12 @@ __all__ = [
     # Video
     "VideoCacheManager",
     "get_video_cache_manager",
+    # Segment
+    "SegmentCacheManager",
+    "get_segment_cache_manager",
+    # Audio track
+    "AudioTrackCacheManager",
+    "get_audio_track_cache_manager",
     # Unified manager
     "CacheManager",
     "get_cache_manager",
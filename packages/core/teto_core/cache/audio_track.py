@@ -0,0 +1,158 @@
+"""Audio Track Cache Manager - Mixed audio track caching"""
+
+import os
+import shutil
+from pathlib import Path
+
+from .base import AssetCacheManager, CacheInfo
+from .segment import file_fingerprint, video_layer_spans
+from ..project.models import Project
+from ..layer.models import VideoLayer
+from ..render.audio_mixer import DEFAULT_AUDIO_FPS
+
+# キャッシュ形式のバージョン（音声の合成結果が変わる変更を入れたら上げる）
+AUDIO_TRACK_CACHE_VERSION = 1
+
+# 動画レイヤーのうち、埋め込み音声に影響するフィールド
+_VIDEO_AUDIO_FIELDS = {"volume", "loop", "duration"}
+
+
+class AudioTrackCacheManager(AssetCacheManager):
+    """合成済み音声トラックのキャッシュマネージャー
+
+    ナレーション・効果音・BGM と動画素材の埋め込み音声を合成して
+    エンコードした音声トラックを、音声に影響するレイヤーとソースファイルの
+    内容のハッシュをキーにして保存します。音声はアスペクト比や
+    映像だけの編集（エフェクト・字幕・スタンプなど）に依存しないため、
+    それらを変えた再レンダリングではエンコード済みの音声をそのまま
+    多重化（ストリームコピー）できます。
+    """
+
+    ASSET_TYPE = "audio_track"
+    DEFAULT_CACHE_SUBDIR = "audio_tracks"
+
+    def _compute_cache_key(self, project: Project) -> str:
+        """キャッシュキーを計算
+
+        Args:
+            project: プロジェクト
+
+        Returns:
+            キャッシュキー（ハッシュ値）
+        """
+        return self.compute_hash(audio_track_material(project))
+
+    def compute_key(self, project: Project) -> str:
+        """音声トラックのキャッシュキーを計算
+
+        Args:
+            project: プロジェクト
+
+        Returns:
+            キャッシュキー（ハッシュ値）
+        """
+        return self._compute_cache_key(project)
+
+    def get_path(self, cache_key: str, ext: str) -> Path | None:
+        """キャッシュ済み音声トラックのパスを取得
+
+        Args:
+            cache_key: キャッシュキー
+            ext: 拡張子（音声コーデックに対応するもの）
+
+        Returns:
+            キャッシュファイルのパス、なければ None
+        """
+        cache_path = self._get_cache_path(cache_key, ext)
+        if cache_path.exists():
+            return cache_path
+        return None
+
+    def put_file(self, cache_key: str, source: Path | str, ext: str) -> Path:
+        """エンコード済み音声トラックをキャッシュに保存
+
+        書き込み途中のファイルが参照されないよう、一時ファイルに
+        コピーしてから置き換えます。
+
+        Args:
+            cache_key: キャッシュキー
+            source: 音声ファイルのパス
+            ext: 拡張子
+
+        Returns:
+            キャッシュファイルのパス
+        """
+        cache_path = self._get_cache_path(cache_key, ext)
+        temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        shutil.copyfile(source, temp_path)
+        os.replace(temp_path, cache_path)
+        return cache_path
+
+
+def audio_track_material(project: Project) -> dict:
+    """合成済み音声トラックの内容を決める要素を列挙する
+
+    音声レイヤーと、動画レイヤーの埋め込み音声に関わる設定・配置を集める。
+    画像レイヤーは動画レイヤーの配置と全体の長さにだけ影響するため、
+    区間として含める。アセットはパスではなくファイル内容のハッシュで表す。
+
+    Args:
+        project: プロジェクト
+
+    Returns:
+        ハッシュ計算用の辞書
+    """
+    timeline = project.timeline
+    spans = video_layer_spans(timeline.video_layers)
+
+    video_layers = []
+    for layer, (start, end) in zip(timeline.video_layers, spans):
+        if not isinstance(layer, VideoLayer):
+            continue
+        video_layers.append(
+            {
+                "span": [round(start, 6), round(end, 6)],
+                "source": file_fingerprint(layer.path),
+                **layer.model_dump(mode="json", include=_VIDEO_AUDIO_FIELDS),
+            }
+        )
+
+    audio_layers = [
+        {
+            **layer.model_dump(mode="json", exclude={"path"}),
+            "source": file_fingerprint(layer.path),
+        }
+        for layer in timeline.audio_layers
+    ]
+
+    return {
+        "version": AUDIO_TRACK_CACHE_VERSION,
+        "audio_codec": project.output.audio_codec,
+        "sample_rate": DEFAULT_AUDIO_FPS,
+        # 音声トラックは映像全体の長さに合わせて出力する
+        "duration": round(spans[-1][1], 6) if spans else 0.0,
+        "video_layers": video_layers,
+        "audio_layers": audio_layers,
+    }
+
+
+# グローバルキャッシュマネージャー（シングルトン）
+_default_audio_track_cache_manager: AudioTrackCacheManager | None = None
+
+
+def get_audio_track_cache_manager() -> AudioTrackCacheManager:
+    """デフォルトの音声トラックキャッシュマネージャーを取得"""
+    global _default_audio_track_cache_manager
+    if _default_audio_track_cache_manager is None:
+        _default_audio_track_cache_manager = AudioTrackCacheManager()
+    return _default_audio_track_cache_manager
+
+
+def clear_audio_track_cache() -> int:
+    """音声トラックキャッシュをクリア"""
+    return get_audio_track_cache_manager().clear()
+
+
+def get_audio_track_cache_info() -> CacheInfo:
+    """音声トラックキャッシュの情報を取得"""
+    return get_audio_track_cache_manager().get_info()
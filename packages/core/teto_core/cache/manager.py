@@ -6,6 +6,8 @@ from .base import CacheInfo
 from .tts import TTSCacheManager, get_tts_cache_manager
 from .image import ImageCacheManager, get_image_cache_manager
 from .video import VideoCacheManager, get_video_cache_manager
+from .segment import SegmentCacheManager, get_segment_cache_manager
+from .audio_track import AudioTrackCacheManager, get_audio_track_cache_manager
 
 
 @dataclass
@@ -15,11 +17,19 @@ class AllCacheInfo:
     tts: CacheInfo
     image: CacheInfo
     video: CacheInfo
+    segment: CacheInfo
+    audio_track: CacheInfo
 
     @property
     def total_files(self) -> int:
         """総ファイル数"""
-        return self.tts.total_files + self.image.total_files + self.video.total_files
+        return (
+            self.tts.total_files
+            + self.image.total_files
+            + self.video.total_files
+            + self.segment.total_files
+            + self.audio_track.total_files
+        )
 
     @property
     def total_size_bytes(self) -> int:
@@ -28,6 +38,8 @@ class AllCacheInfo:
             self.tts.total_size_bytes
             + self.image.total_size_bytes
             + self.video.total_size_bytes
+            + self.segment.total_size_bytes
+            + self.audio_track.total_size_bytes
         )
 
     @property
@@ -39,7 +51,8 @@ class AllCacheInfo:
 class CacheManager:
     """統合キャッシュマネージャー
 
-    TTS、画像、動画のキャッシュを一括管理します。
+    TTS、画像、動画、レンダリング済みセグメント、合成済み音声トラックの
+    キャッシュを一括管理します。
     """
 
     def __init__(
@@ -47,16 +60,22 @@ class CacheManager:
         tts_cache: TTSCacheManager | None = None,
         image_cache: ImageCacheManager | None = None,
         video_cache: VideoCacheManager | None = None,
+        segment_cache: SegmentCacheManager | None = None,
+        audio_track_cache: AudioTrackCacheManager | None = None,
     ):
         """
         Args:
             tts_cache: TTSキャッシュマネージャー
             image_cache: 画像キャッシュマネージャー
             video_cache: 動画キャッシュマネージャー
+            segment_cache: セグメントキャッシュマネージャー
+            audio_track_cache: 音声トラックキャッシュマネージャー
         """
         self._tts = tts_cache or get_tts_cache_manager()
         self._image = image_cache or get_image_cache_manager()
         self._video = video_cache or get_video_cache_manager()
+        self._segment = segment_cache or get_segment_cache_manager()
+        self._audio_track = audio_track_cache or get_audio_track_cache_manager()
 
     @property
     def tts(self) -> TTSCacheManager:
@@ -73,6 +92,16 @@ class CacheManager:
         """動画キャッシュマネージャー"""
         return self._video
 
+    @property
+    def segment(self) -> SegmentCacheManager:
+        """セグメントキャッシュマネージャー"""
+        return self._segment
+
+    @property
+    def audio_track(self) -> AudioTrackCacheManager:
+        """音声トラックキャッシュマネージャー"""
+        return self._audio_track
+
     def clear_all(self) -> dict[str, int]:
         """全キャッシュをクリア
 
@@ -83,6 +112,8 @@ class CacheManager:
             "tts": self._tts.clear(),
             "image": self._image.clear(),
             "video": self._video.clear(),
+            "segment": self._segment.clear(),
+            "audio_track": self._audio_track.clear(),
         }
 
     def clear_tts(self) -> int:
@@ -97,12 +128,22 @@ class CacheManager:
         """動画キャッシュをクリア"""
         return self._video.clear()
 
+    def clear_segment(self) -> int:
+        """セグメントキャッシュをクリア"""
+        return self._segment.clear()
+
+    def clear_audio_track(self) -> int:
+        """音声トラックキャッシュをクリア"""
+        return self._audio_track.clear()
+
     def get_info(self) -> AllCacheInfo:
         """全キャッシュの情報を取得"""
         return AllCacheInfo(
             tts=self._tts.get_info(),
             image=self._image.get_info(),
             video=self._video.get_info(),
+            segment=self._segment.get_info(),
+            audio_track=self._audio_track.get_info(),
         )
 
 
@@ -0,0 +1,330 @@
+"""Segment Cache Manager - Rendered scene segment caching"""
+
+import hashlib
+import os
+import shutil
+from pathlib import Path
+from typing import Any
+
+from .base import AssetCacheManager, CacheInfo
+from ..project.models import Project
+from ..layer.models import VideoLayer, ImageLayer
+
+# キャッシュ形式のバージョン（レンダリング結果が変わる変更を入れたら上げる）
+SEGMENT_CACHE_VERSION = 1
+
+# タイムライン上の時刻を表すフィールド名
+_TIME_FIELDS = ("start_time", "end_time", "time")
+
+# ファイル内容のハッシュのメモ（パス, サイズ, 更新時刻）→ ハッシュ
+_fingerprint_memo: dict[tuple[str, int, int], str] = {}
+
+
+class SegmentCacheManager(AssetCacheManager):
+    """レンダリング済みセグメントのキャッシュマネージャー
+
+    シーン単位でエンコードした音声なしの動画セグメントを、その区間に
+    映るレイヤー・アセットの内容・出力設定のハッシュをキーにして保存します。
+    変更のないシーンはキャッシュから取り出して再利用します。
+    """
+
+    ASSET_TYPE = "segment"
+    DEFAULT_CACHE_SUBDIR = "segments"
+
+    def _compute_cache_key(
+        self, project: Project, start_frame: int, end_frame: int
+    ) -> str:
+        """キャッシュキーを計算
+
+        Args:
+            project: プロジェクト
+            start_frame: セグメントの最初のフレーム番号
+            end_frame: セグメントの終了フレーム番号（含まない）
+
+        Returns:
+            キャッシュキー（ハッシュ値）
+        """
+        return self.compute_hash(segment_material(project, start_frame, end_frame))
+
+    def compute_key(self, project: Project, start_frame: int, end_frame: int) -> str:
+        """セグメントのキャッシュキーを計算
+
+        Args:
+            project: プロジェクト
+            start_frame: セグメントの最初のフレーム番号
+            end_frame: セグメントの終了フレーム番号（含まない）
+
+        Returns:
+            キャッシュキー（ハッシュ値）
+        """
+        return self._compute_cache_key(project, start_frame, end_frame)
+
+    def get_path(self, cache_key: str, ext: str = ".mp4") -> Path | None:
+        """キャッシュ済みセグメントのパスを取得
+
+        Args:
+            cache_key: キャッシュキー
+            ext: 拡張子
+
+        Returns:
+            キャッシュファイルのパス、なければ None
+        """
+        cache_path = self._get_cache_path(cache_key, ext)
+        if cache_path.exists():
+            return cache_path
+        return None
+
+    def put_file(self, cache_key: str, source: Path | str, ext: str = ".mp4") -> Path:
+        """エンコード済みセグメントをキャッシュに保存
+
+        書き込み途中のファイルが参照されないよう、一時ファイルに
+        コピーしてから置き換えます。
+
+        Args:
+            cache_key: キャッシュキー
+            source: セグメントファイルのパス
+            ext: 拡張子
+
+        Returns:
+            キャッシュファイルのパス
+        """
+        cache_path = self._get_cache_path(cache_key, ext)
+        temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        shutil.copyfile(source, temp_path)
+        os.replace(temp_path, cache_path)
+        return cache_path
+
+
+def segment_material(project: Project, start_frame: int, end_frame: int) -> dict:
+    """セグメントの見た目を決める要素を列挙する
+
+    区間と重なる映像系レイヤーを、区間の先頭を 0 秒とした相対時刻に
+    直して集める。アセットはパスではなくファイル内容のハッシュで表すため、
+    前のシーンの長さが変わって区間がずれても、内容が同じなら同じ結果になる。
+    音声はセグメントに含めないため対象外。
+
+    Args:
+        project: プロジェクト
+        start_frame: セグメントの最初のフレーム番号
+        end_frame: セグメントの終了フレーム番号（含まない）
+
+    Returns:
+        ハッシュ計算用の辞書
+    """
+    output = project.output
+    timeline = project.timeline
+    t0 = start_frame / output.fps
+    t1 = end_frame / output.fps
+
+    def overlaps(start: float, end: float) -> bool:
+        return start < t1 and end > t0
+
+    layers: list[dict[str, Any]] = []
+
+    spans = video_layer_spans(timeline.video_layers)
+    for i, (layer, (start, end)) in enumerate(zip(timeline.video_layers, spans)):
+        if not overlaps(start, end):
+            continue
+        prev_layer = timeline.video_layers[i - 1] if i > 0 else None
+        layers.append(
+            {
+                "kind": "video",
+                "offset": round(start - t0, 6),
+                "layer": _normalize(layer.model_dump(mode="json"), t0),
+                # 前のレイヤーのトランジションはこのレイヤーのフェードインになる
+                "prev_transition": (
+                    prev_layer.model_dump(mode="json")["transition"]
+                    if prev_layer
+                    else None
+                ),
+                "is_last": i == len(timeline.video_layers) - 1,
+            }
+        )
+
+    for layer in timeline.stamp_layers:
+        if overlaps(layer.start_time, layer.start_time + layer.duration):
+            layers.append(
+                {
+                    "kind": "stamp",
+                    "layer": _normalize(layer.model_dump(mode="json"), t0),
+                }
+            )
+
+    for kind, character_layers in (
+        ("character", timeline.character_layers),
+        ("layered_character", timeline.layered_character_layers),
+    ):
+        for layer in character_layers:
+            if overlaps(layer.start_time, layer.end_time):
+                layers.append(
+                    {
+                        "kind": kind,
+                        "layer": _normalize(layer.model_dump(mode="json"), t0),
+                    }
+                )
+
+    if output.subtitle_mode == "burn":
+        for layer in timeline.subtitle_layers:
+            items = [
+                item.model_dump(mode="json")
+                for item in layer.items
+                if overlaps(item.start_time, item.end_time)
+            ]
+            if not items:
+                continue
+            style = layer.model_dump(mode="json", exclude={"items"})
+            layers.append(
+                {
+                    "kind": "subtitle",
+                    "style": _normalize(style, t0),
+                    "items": _normalize(items, t0),
+                }
+            )
+
+    return {
+        "version": SEGMENT_CACHE_VERSION,
+        # 音声・出力先のほか、フレーム生成の並列度・エンコードのスレッド数・
+        # デコーダー数・ループのキャッシュ量はセグメントの映像に影響しない
+        "output": output.model_dump(
+            mode="json",
+            exclude={
+                "path",
+                "encoder",
+                "audio_codec",
+                "threads",
+                "frame_workers",
+                "frame_window",
+                "max_decoders",
+                "loop_cache_mb",
+            },
+        ),
+        "frames": end_frame - start_frame,
+        "layers": layers,
+    }
+
+
+def video_layer_spans(
+    layers: list[VideoLayer | ImageLayer],
+) -> list[tuple[float, float]]:
+    """動画・画像レイヤーのタイムライン上の区間を計算
+
+    VideoProcessor と同じ規則で、レイヤーを順に並べ、トランジションの
+    長さだけ次のレイヤーと重ねる。
+
+    Args:
+        layers: 動画・画像レイヤーのリスト（タイムライン順）
+
+    Returns:
+        各レイヤーの (開始時刻, 終了時刻) のリスト
+    """
+    has_transition = any(layer.transition for layer in layers[:-1])
+
+    spans = []
+    current_time = 0.0
+    for i, layer in enumerate(layers):
+        duration = _layer_duration(layer)
+        spans.append((current_time, current_time + duration))
+
+        is_last = i == len(layers) - 1
+        overlap = 0.0
+        if has_transition and not is_last and layer.transition:
+            overlap = layer.transition.duration
+        current_time += duration - overlap
+
+    return spans
+
+
+def file_fingerprint(path: str) -> str:
+    """ファイル内容のハッシュを計算
+
+    同じプロセス内ではサイズと更新時刻が変わらない限り結果を再利用する。
+
+    Args:
+        path: ファイルパス
+
+    Returns:
+        16文字のハッシュ値。ファイルがない場合は "missing:<path>"
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return f"missing:{path}"
+
+    memo_key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    if memo_key not in _fingerprint_memo:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        _fingerprint_memo[memo_key] = digest.hexdigest()[:16]
+    return _fingerprint_memo[memo_key]
+
+
+def _layer_duration(layer: VideoLayer | ImageLayer) -> float:
+    """動画・画像レイヤーの実際の表示時間を取得
+
+    Args:
+        layer: 動画・画像レイヤー
+
+    Returns:
+        表示時間（秒）
+    """
+    if isinstance(layer, ImageLayer):
+        return layer.duration
+    # loop が None または True の場合は指定時間までループする
+    if layer.duration is not None and layer.loop is not False:
+        return layer.duration
+
+    from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
+
+    file_duration = ffmpeg_parse_infos(layer.path)["duration"]
+    if layer.duration is None:
+        return file_duration
+    return min(layer.duration, file_duration)
+
+
+def _normalize(data: Any, t0: float) -> Any:
+    """時刻を区間先頭からの相対時刻に、パスをファイル内容のハッシュに置き換える
+
+    Args:
+        data: レイヤーをダンプした値
+        t0: 区間の先頭時刻（秒）
+
+    Returns:
+        正規化した値
+    """
+    if isinstance(data, dict):
+        normalized = {}
+        for key, value in data.items():
+            if key in _TIME_FIELDS and isinstance(value, (int, float)):
+                normalized[key] = round(value - t0, 6)
+            elif key == "path" and isinstance(value, str):
+                normalized[key] = file_fingerprint(value)
+            else:
+                normalized[key] = _normalize(value, t0)
+        return normalized
+    if isinstance(data, list):
+        return [_normalize(value, t0) for value in data]
+    return data
+
+
+# グローバルキャッシュマネージャー（シングルトン）
+_default_segment_cache_manager: SegmentCacheManager | None = None
+
+
+def get_segment_cache_manager() -> SegmentCacheManager:
+    """デフォルトのセグメントキャッシュマネージャーを取得"""
+    global _default_segment_cache_manager
+    if _default_segment_cache_manager is None:
+        _default_segment_cache_manager = SegmentCacheManager()
+    return _default_segment_cache_manager
+
+
+def clear_segment_cache() -> int:
+    """セグメントキャッシュをクリア"""
+    return get_segment_cache_manager().clear()
+
+
+def get_segment_cache_info() -> CacheInfo:
+    """セグメントキャッシュの情報を取得"""
+    return get_segment_cache_manager().get_info()
@@ -0,0 +1,102 @@
+"""連続するエフェクトを1パスの処理に融合する"""
+
+from typing import Callable
+
+import numpy as np
+from moviepy import VideoClip, ImageClip
+
+from .resample import ResampleQuality, affine_resample
+
+# 画素ごとの処理: float32 の作業バッファ（0〜255）と時刻を受け取り、
+# 処理したバッファを返す（その場で書き換えてよい）
+PixelStage = Callable[[np.ndarray, float], np.ndarray]
+
+# 拡大・パン: 時刻と入力サイズ (width, height) から
+# affine_resample の (scale_x, scale_y, offset_x, offset_y) を返す
+AffineStage = Callable[[float, int, int], tuple[float, float, float, float]]
+
+
+def fuse_pixel_stages(
+    clip: VideoClip | ImageClip, stages: list[PixelStage]
+) -> VideoClip | ImageClip:
+    """画素ごとのエフェクトを1回の変換にまとめる
+
+    エフェクトごとに clip.transform を重ねると、毎フレーム
+    エフェクトの数だけ float への変換と uint8 への書き戻しが走る。
+    融合した変換では1つの float32 バッファに全エフェクトを順に適用し、
+    uint8 への変換は最後の1回だけ行う。
+
+    Args:
+        clip: 元のクリップ
+        stages: 適用順の画素ごとの処理
+
+    Returns:
+        エフェクトを適用したクリップ
+    """
+
+    def fused_frame(get_frame, t):
+        frame = get_frame(t)
+        buffer = frame.astype(np.float32)
+        for stage in stages:
+            buffer = stage(buffer, t)
+        np.clip(buffer, 0, 255, out=buffer)
+        return buffer.astype(frame.dtype)
+
+    return clip.transform(fused_frame)
+
+
+def compose_affine(
+    stages: list[AffineStage], t: float, width: int, height: int
+) -> tuple[float, float, float, float]:
+    """連続する拡大・パンを1つのアフィン写像に合成する
+
+    affine_resample の写像は軸ごとに
+    元の座標 = (出力の座標 + 0.5 + offset) / scale - 0.5 の形なので、
+    続けて適用した2つの写像は拡大率の積と
+    offset = 後段の offset + 前段の offset × 後段の拡大率 の1つの写像になる。
+
+    Args:
+        stages: 適用順の拡大・パン
+        t: 時刻（秒）
+        width: 入力の幅
+        height: 入力の高さ
+
+    Returns:
+        (scale_x, scale_y, offset_x, offset_y)
+    """
+    scale_x, scale_y, offset_x, offset_y = 1.0, 1.0, 0.0, 0.0
+    for stage in stages:
+        stage_sx, stage_sy, stage_x, stage_y = stage(t, width, height)
+        offset_x = stage_x + offset_x * stage_sx
+        offset_y = stage_y + offset_y * stage_sy
+        scale_x *= stage_sx
+        scale_y *= stage_sy
+    return scale_x, scale_y, offset_x, offset_y
+
+
+def fuse_affine_stages(
+    clip: VideoClip | ImageClip,
+    stages: list[AffineStage],
+    quality: ResampleQuality = "bilinear",
+) -> VideoClip | ImageClip:
+    """拡大・パンのエフェクトを1回のリサンプリングにまとめる
+
+    Args:
+        clip: 元のクリップ
+        stages: 適用順の拡大・パン（いずれも出力サイズは入力と同じ）
+        quality: 補間方法
+
+    Returns:
+        エフェクトを適用したクリップ
+    """
+
+    def fused_frame(get_frame, t):
+        frame = get_frame(t)
+        h, w = frame.shape[:2]
+        scale_x, scale_y, offset_x, offset_y = compose_affine(stages, t, w, h)
+        result, _ = affine_resample(
+            frame, (scale_x, scale_y), (offset_x, offset_y), quality=quality
+        )
+        return result
+
+    return clip.transform(fused_frame)
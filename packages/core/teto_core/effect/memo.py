@@ -0,0 +1,34 @@
+"""時間変化しないエフェクト結果の再利用"""
+
+import threading
+
+from moviepy import VideoClip, ImageClip
+
+
+def freeze_clip(clip: VideoClip | ImageClip) -> VideoClip | ImageClip:
+    """最初に生成したフレームをすべての時刻で返すクリップを作る
+
+    静止画の素材に時間変化しないエフェクト（一定半径のブラーや色調整など）
+    だけを重ねた結果は、どの時刻でも同じフレームになる。最初の1回だけ
+    エフェクトを計算し、以降はそのフレームを使い回す。返すフレームは
+    ImageClip と同様に共有されるため、後段で書き換えてはならない。
+
+    Args:
+        clip: 全時刻で同じフレームを返すクリップ
+
+    Returns:
+        フレームを記憶するクリップ
+    """
+    cache: dict[str, object] = {}
+    lock = threading.Lock()
+
+    def frozen_frame(get_frame, t):
+        frame = cache.get("frame")
+        if frame is None:
+            with lock:
+                frame = cache.get("frame")
+                if frame is None:
+                    frame = cache["frame"] = get_frame(t)
+        return frame
+
+    return clip.transform(frozen_frame)
@@ -41,9 +41,22 @@ class AnimationEffect(BaseModel):
     pan_end: tuple[float, float] | None = Field(
         None, description="終了位置（kenBurns用）"
     )
+    resample: Literal["bilinear", "nearest"] | None = Field(
+        None,
+        description="拡大縮小の補間方法（zoom/kenBurns用、未指定時は bilinear）",
+    )
 
     # ブラー用
     blur_amount: float | None = Field(None, description="ブラー量（blur用）", ge=0)
+    blur_quality: Literal["auto", "exact", "box", "pyramid"] | None = Field(
+        None,
+        description="ブラーの計算方式（blur用、未指定時は auto）",
+    )
+    blur_tolerance: float | None = Field(
+        None,
+        description="auto で許容する厳密なブラーとの平均誤差（blur用、8bit の階調、未指定時は 1.5）",
+        ge=0,
+    )
 
     # カラーグレーディング用
     color_temp: float | None = Field(
@@ -1,7 +1,11 @@
 """エフェクト処理プロセッサー（Strategy パターン実装）"""
 
 from moviepy import VideoClip, ImageClip
+from .fusion import fuse_affine_stages, fuse_pixel_stages
+from .memo import freeze_clip
 from .models import AnimationEffect
+from ..render.profiler import profile_clip
+from ..render.static_spans import is_static_overlay, mark_static_overlay
 from .strategies import (
     EffectStrategy,
     FadeInEffect,
@@ -90,22 +94,110 @@ class EffectProcessor:
         clip: VideoClip | ImageClip,
         effects: list[AnimationEffect],
         video_size: tuple[int, int],
+        static_source: bool = False,
     ) -> VideoClip | ImageClip:
         """クリップにエフェクトを適用
 
+        連続する画素ごとのエフェクト（色調整・フェードなど）は1回の変換に、
+        連続する拡大・パン（ズーム・Ken Burns）は1回のリサンプリングに
+        まとめて適用する。それ以外のエフェクトは1つずつ適用する。
+
+        元のクリップが時間変化しない場合（静止画など）、先頭から続く
+        時間変化しないエフェクトは最初のフレームで一度だけ計算し、
+        後続のエフェクトはその結果を元に適用する。すべてのエフェクトが
+        時間変化しない場合、結果は静的オーバーレイとしてマークする。
+
         Args:
             clip: 元のクリップ
             effects: 適用する効果のリスト
             video_size: 動画サイズ（スライド計算用）
+            static_source: 元のクリップが全時刻で同じフレームを返すか。
+                静的オーバーレイとしてマーク済みのクリップは指定しなくてもよい
 
         Returns:
             効果を適用したクリップ
         """
+        known = []
         for effect in effects:
-            strategy = EffectProcessor._effect_strategies.get(effect.type)
-            if strategy:
-                clip = strategy.apply(clip, effect, video_size)
+            if effect.type in EffectProcessor._effect_strategies:
+                known.append(effect)
             else:
                 print(f"Warning: Unknown effect type '{effect.type}'. Skipping.")
 
+        if static_source or is_static_overlay(clip):
+            invariant = 0
+            for effect in known:
+                strategy = EffectProcessor._effect_strategies[effect.type]
+                if not strategy.is_time_invariant(effect):
+                    break
+                invariant += 1
+
+            if invariant:
+                clip = freeze_clip(
+                    EffectProcessor._apply_chain(clip, known[:invariant], video_size)
+                )
+                if invariant == len(known):
+                    return mark_static_overlay(clip)
+                known = known[invariant:]
+
+        return EffectProcessor._apply_chain(clip, known, video_size)
+
+    @staticmethod
+    def _apply_chain(
+        clip: VideoClip | ImageClip,
+        effects: list[AnimationEffect],
+        video_size: tuple[int, int],
+    ) -> VideoClip | ImageClip:
+        """登録済みのエフェクトを順に適用（融合できる並びはまとめる）"""
+        # 同じ種類で融合できるエフェクトの並び: (種類, [(エフェクト, 処理)])
+        runs: list[tuple[str | None, list]] = []
+        for effect in effects:
+            strategy = EffectProcessor._effect_strategies[effect.type]
+            stage = strategy.pixel_stage(clip, effect)
+            kind = "pixel" if stage else None
+            if stage is None:
+                stage = strategy.affine_stage(clip, effect)
+                kind = "affine" if stage else None
+
+            if kind is not None and runs and runs[-1][0] == kind:
+                runs[-1][1].append((effect, stage))
+            else:
+                runs.append((kind, [(effect, stage)]))
+
+        for kind, items in runs:
+            types = [effect.type for effect, _ in items]
+            if len(items) < 2:
+                effect = items[0][0]
+                strategy = EffectProcessor._effect_strategies[effect.type]
+                clip = strategy.apply(clip, effect, video_size)
+            elif kind == "pixel":
+                clip = fuse_pixel_stages(clip, [stage for _, stage in items])
+            else:
+                nearest = all(effect.resample == "nearest" for effect, _ in items)
+                clip = fuse_affine_stages(
+                    clip,
+                    [stage for _, stage in items],
+                    quality="nearest" if nearest else "bilinear",
+                )
+            clip = profile_clip(clip, "effect", "+".join(types))
+
         return clip
+
+    @staticmethod
+    def scale_effects(
+        effects: list[AnimationEffect], scale: float
+    ) -> list[AnimationEffect]:
+        """エフェクトのピクセル単位のパラメータを描画解像度の縮尺に合わせる
+
+        Args:
+            effects: エフェクトのリスト
+            scale: 描画解像度の縮尺
+
+        Returns:
+            調整したエフェクトのリスト
+        """
+        scaled = []
+        for effect in effects:
+            strategy = EffectProcessor._effect_strategies.get(effect.type)
+            scaled.append(strategy.scale_params(effect, scale) if strategy else effect)
+        return scaled
@@ -0,0 +1,137 @@
+"""出力サイズで直接サンプリングする拡大縮小・平行移動"""
+
+from typing import Literal
+
+import numpy as np
+
+ResampleQuality = Literal["bilinear", "nearest"]
+
+
+def corner_aligned_axis(n_src: int, scale: float) -> tuple[float, int]:
+    """scipy.ndimage.zoom(order=1) と同じ1軸分の実際の拡大率と拡大後の画素数
+
+    scipy の zoom は拡大後の画素数を round(n_src * scale) に丸め、
+    両端の画素の中心を揃えて拡大する。そのため実際の拡大率は
+    (拡大後の画素数 - 1) / (n_src - 1) になり、縦横で少し異なりうる。
+
+    Args:
+        n_src: 元画像の画素数
+        scale: 指定の拡大率
+
+    Returns:
+        (実際の拡大率, 拡大後の画素数)
+    """
+    n_zoomed = max(round(n_src * scale), 1)
+    if n_src <= 1 or n_zoomed <= 1:
+        return scale, n_zoomed
+    return (n_zoomed - 1) / (n_src - 1), n_zoomed
+
+
+def corner_aligned_offset(start: float, scale: float) -> float:
+    """端を揃えて拡大した画像の start 画素目から切り出す場合の offset
+
+    端を揃えた拡大では出力ピクセル o が元画像の座標 (o + start) / scale に
+    写る。affine_resample の画素中心の写像で同じ座標を得るための offset を返す。
+
+    Args:
+        start: 拡大後の画像上での切り出し開始位置（画素、小数可）
+        scale: corner_aligned_axis で求めた実際の拡大率
+
+    Returns:
+        affine_resample に渡す offset
+    """
+    return start - 0.5 + 0.5 * scale
+
+
+def _axis_samples(
+    n_out: int, n_src: int, scale: float, offset: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """1軸分の出力ピクセルに対応する元画像の座標を求める
+
+    出力ピクセル o の中心は、元画像の座標 (o + 0.5 + offset) / scale - 0.5 に写る。
+
+    Args:
+        n_out: 出力の画素数
+        n_src: 元画像の画素数
+        scale: 拡大率
+        offset: 拡大後の画像上での切り出し開始位置（画素、小数可）
+
+    Returns:
+        (下側の画素, 上側の画素, 上側の重み, 元画像の範囲内か) の配列
+    """
+    coords = (np.arange(n_out, dtype=np.float64) + 0.5 + offset) / scale - 0.5
+    inside = (coords >= -0.5) & (coords <= n_src - 0.5)
+    coords = np.clip(coords, 0.0, n_src - 1)
+    lower = np.floor(coords).astype(np.intp)
+    upper = np.minimum(lower + 1, n_src - 1)
+    weight = (coords - lower).astype(np.float32)
+    return lower, upper, weight, inside
+
+
+def affine_resample(
+    frame: np.ndarray,
+    scale: float | tuple[float, float],
+    offset: tuple[float, float] = (0.0, 0.0),
+    out_size: tuple[int, int] | None = None,
+    quality: ResampleQuality = "bilinear",
+) -> tuple[np.ndarray, np.ndarray | None]:
+    """拡大縮小と平行移動を1回のサンプリングで行う
+
+    元画像を scale 倍して (offset_x, offset_y) から out_size を切り出した
+    結果を、拡大後の画像を作らずに出力ピクセルだけ計算する。
+    拡大・縮小・サブピクセルのパンが1つのアフィン写像にまとまるため、
+    フレーム全体の拡大と切り出し・シフトを別々に行うより高速。
+
+    双線形補間は軸ごとに分けて、先に出力の行に必要な範囲だけを補間する。
+
+    Args:
+        frame: 元画像 (h, w) または (h, w, c)
+        scale: 拡大率。(scale_x, scale_y) で縦横別に指定できる
+        offset: 拡大後の画像上での切り出し開始位置 (x, y)（画素、小数可）
+        out_size: 出力サイズ (width, height)。省略時は元画像と同じ
+        quality: "bilinear"（双線形補間）または "nearest"（最近傍、高速）
+
+    Returns:
+        (出力画像, 元画像の範囲内かを表す (height, width) の bool 配列)。
+        すべての出力ピクセルが範囲内の場合、2つ目は None
+    """
+    src_h, src_w = frame.shape[:2]
+    out_w, out_h = out_size or (src_w, src_h)
+    offset_x, offset_y = offset
+    scale_x, scale_y = scale if isinstance(scale, tuple) else (scale, scale)
+
+    y0, y1, wy, inside_y = _axis_samples(out_h, src_h, scale_y, offset_y)
+    x0, x1, wx, inside_x = _axis_samples(out_w, src_w, scale_x, offset_x)
+
+    if quality == "nearest":
+        rows = np.where(wy >= 0.5, y1, y0)
+        cols = np.where(wx >= 0.5, x1, x0)
+        result = frame.take(rows, axis=0).take(cols, axis=1)
+    else:
+        # 出力に必要な行・列の範囲だけを切り出してから補間する
+        top, bottom = y0[0], y1[-1] + 1
+        left, right = x0[0], x1[-1] + 1
+        source = frame[top:bottom, left:right]
+        y0, y1, x0, x1 = y0 - top, y1 - top, x0 - left, x1 - left
+
+        if frame.ndim == 3:
+            wy = wy[:, np.newaxis, np.newaxis]
+            wx = wx[np.newaxis, :, np.newaxis]
+        else:
+            wy = wy[:, np.newaxis]
+            wx = wx[np.newaxis, :]
+
+        upper_rows = source.take(y0, axis=0).astype(np.float32)
+        lower_rows = source.take(y1, axis=0).astype(np.float32)
+        rows = upper_rows + (lower_rows - upper_rows) * wy
+        left_cols = rows.take(x0, axis=1)
+        right_cols = rows.take(x1, axis=1)
+        result = left_cols + (right_cols - left_cols) * wx
+
+        if np.issubdtype(frame.dtype, np.integer):
+            np.rint(result, out=result)
+        result = result.astype(frame.dtype)
+
+    if inside_y.all() and inside_x.all():
+        return result, None
+    return result, inside_y[:, np.newaxis] & inside_x[np.newaxis, :]
@@ -2,6 +2,7 @@
 
 from abc import ABC, abstractmethod
 from moviepy import VideoClip, ImageClip
+from ..fusion import AffineStage, PixelStage
 from ..models import AnimationEffect
 
 
@@ -26,3 +27,71 @@ class EffectStrategy(ABC):
             エフェクトを適用したクリップ
         """
         pass
+
+    def scale_params(self, effect: AnimationEffect, scale: float) -> AnimationEffect:
+        """ピクセル単位のパラメータを描画解像度の縮尺に合わせる
+
+        ドラフト出力のように縮小した解像度で描画する場合に、見た目が
+        本番出力と同じ比率になるよう呼び出される。
+        比率で指定するパラメータしか持たないエフェクトはそのまま返す。
+
+        Args:
+            effect: エフェクト設定
+            scale: 描画解像度の縮尺
+
+        Returns:
+            調整したエフェクト設定
+        """
+        return effect
+
+    def is_time_invariant(self, effect: AnimationEffect) -> bool:
+        """出力フレームが時刻によらず入力フレームだけで決まるか
+
+        True を返すエフェクトは、静止画の素材に対して最初のフレームで
+        一度だけ計算され、結果が以降のフレームで再利用される
+        （EffectProcessor.apply_effects を参照）。
+
+        Args:
+            effect: エフェクト設定
+
+        Returns:
+            時間変化しない場合 True
+        """
+        return False
+
+    def pixel_stage(
+        self, clip: VideoClip | ImageClip, effect: AnimationEffect
+    ) -> PixelStage | None:
+        """画素ごとの処理として融合できる場合、その処理を返す
+
+        色調整やフェードのように各画素を独立に変換するエフェクトは、
+        これを実装すると前後の同種のエフェクトと1パスにまとめられる
+        （fuse_pixel_stages を参照）。処理は apply と同じ結果になるよう、
+        float32 の作業バッファ（0〜255）に対して行う。
+
+        Args:
+            clip: エフェクトを適用するクリップ
+            effect: エフェクト設定
+
+        Returns:
+            画素ごとの処理。融合できない場合は None（apply で個別に適用する）
+        """
+        return None
+
+    def affine_stage(
+        self, clip: VideoClip | ImageClip, effect: AnimationEffect
+    ) -> AffineStage | None:
+        """拡大・パンとして融合できる場合、その写像を返す
+
+        出力サイズを変えない拡大・パンのエフェクトは、これを実装すると
+        前後の同種のエフェクトと1回のリサンプリングにまとめられる
+        （fuse_affine_stages を参照）。
+
+        Args:
+            clip: エフェクトを適用するクリップ
+            effect: エフェクト設定
+
+        Returns:
+            時刻と入力サイズから写像を返す関数。融合できない場合は None
+        """
+        return None
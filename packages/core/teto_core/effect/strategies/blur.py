@@ -1,14 +1,19 @@
 """ブラーエフェクト"""
 
-import numpy as np
-from scipy.ndimage import gaussian_filter
 from moviepy import VideoClip, ImageClip
 from .base import EffectStrategy
+from ..gaussian import DEFAULT_BLUR_TOLERANCE, gaussian_blur
 from ..models import AnimationEffect
 
 
 class BlurEffect(EffectStrategy):
-    """ブラー効果（被写界深度風）"""
+    """ブラー効果（被写界深度風）
+
+    半径とフレームサイズに応じて、厳密なガウスぼかし・箱型フィルタの近似・
+    縮小してぼかす方式を使い分ける（gaussian_blur を参照）。
+    """
+
+    DEFAULT_BLUR_AMOUNT = 3.0
 
     def apply(
         self,
@@ -17,18 +22,24 @@ class BlurEffect(EffectStrategy):
         video_size: tuple[int, int],
     ) -> VideoClip | ImageClip:
         """ブラーを適用"""
-        blur_amount = effect.blur_amount or 3.0
+        blur_amount = effect.blur_amount or self.DEFAULT_BLUR_AMOUNT
+        quality = effect.blur_quality or "auto"
+        tolerance = (
+            effect.blur_tolerance
+            if effect.blur_tolerance is not None
+            else DEFAULT_BLUR_TOLERANCE
+        )
 
         def blur_frame(get_frame, t):
-            frame = get_frame(t)
-            if len(frame.shape) == 3:
-                blurred = np.zeros_like(frame)
-                for i in range(frame.shape[2]):
-                    blurred[:, :, i] = gaussian_filter(
-                        frame[:, :, i], sigma=blur_amount
-                    )
-                return blurred
-            else:
-                return gaussian_filter(frame, sigma=blur_amount)
+            return gaussian_blur(get_frame(t), blur_amount, quality, tolerance)
 
         return clip.transform(blur_frame)
+
+    def is_time_invariant(self, effect: AnimationEffect) -> bool:
+        """ブラー半径は一定のため時間変化しない"""
+        return True
+
+    def scale_params(self, effect: AnimationEffect, scale: float) -> AnimationEffect:
+        """ブラー半径（ピクセル）を縮尺に合わせる"""
+        blur_amount = effect.blur_amount or self.DEFAULT_BLUR_AMOUNT
+        return effect.model_copy(update={"blur_amount": blur_amount * scale})
@@ -1,13 +1,108 @@
 """カラーエフェクト"""
 
+from functools import lru_cache
+
 import numpy as np
 from moviepy import VideoClip, ImageClip
 from .base import EffectStrategy
+from ..fusion import PixelStage
 from ..models import AnimationEffect
 
+# 輝度の重み (R, G, B)
+LUMA_WEIGHTS = (0.299, 0.587, 0.114)
+
+
+@lru_cache(maxsize=32)
+def _grade_matrix(
+    contrast: float,
+    brightness: float,
+    color_temp: float,
+    saturation: float,
+    channels: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """カラーグレーディングを 0〜255 の画素値に対する1つのアフィン変換にまとめる
+
+    コントラスト・明度・色温度はチャンネルごとの一次式、彩度は RGB と
+    輝度の線形結合なので、全体は 出力 = 行列 @ 入力 + バイアス
+    （最後に 0〜255 にクリップ）で表せる。
+
+    Args:
+        contrast: コントラスト
+        brightness: 明度
+        color_temp: 色温度
+        saturation: 彩度
+        channels: チャンネル数
+
+    Returns:
+        (channels x channels の行列, channels 個のバイアス)
+    """
+    # ((x / 255 - 0.5) * contrast + 0.5) * brightness * 色温度の係数
+    temp = np.ones(channels)
+    temp[0] = 1 + color_temp * 0.3
+    temp[2] = 1 - color_temp * 0.3
+    matrix = np.diag(contrast * brightness * temp)
+    bias = 127.5 * (1 - contrast) * brightness * temp
+
+    if saturation != 1.0:
+        mix = np.eye(channels)
+        mix[:3, :3] = saturation * np.eye(3) + (1 - saturation) * np.outer(
+            np.ones(3), LUMA_WEIGHTS
+        )
+        matrix = mix @ matrix
+        bias = mix @ bias
+
+    return matrix, bias
+
+
+@lru_cache(maxsize=32)
+def _grade_lut(
+    contrast: float, brightness: float, color_temp: float, channels: int
+) -> np.ndarray:
+    """彩度を変えないカラーグレーディングのチャンネルごとのルックアップテーブル
+
+    Returns:
+        (channels, 256) の uint8 テーブル
+    """
+    # 変換前のフレームと同じ計算を 0〜255 の各値に対して行う
+    values = (np.arange(256, dtype=np.float64) / 255.0 - 0.5) * contrast + 0.5
+    table = np.tile(values * brightness, (channels, 1))
+    table[0] *= 1 + color_temp * 0.3
+    table[2] *= 1 - color_temp * 0.3
+    return np.clip(table * 255, 0, 255).astype(np.uint8)
+
+
+@lru_cache(maxsize=8)
+def _vignette_mask(height: int, width: int, amount: float) -> np.ndarray:
+    """フレームサイズごとの周辺減光マスク（計算済みのものを再利用する）
+
+    Returns:
+        (height, width) の float32 マスク
+    """
+    y, x = np.ogrid[:height, :width]
+    cx, cy = width / 2, height / 2
+    distance = np.sqrt((x - cx) ** 2 + (y - cy) ** 2)
+    max_distance = np.sqrt(cx**2 + cy**2)
+    mask = (1 - (distance / max_distance) * amount).astype(np.float32)
+    mask.setflags(write=False)
+    return mask
+
 
 class ColorGradeEffect(EffectStrategy):
-    """シネマティックなカラーグレーディング"""
+    """シネマティックなカラーグレーディング
+
+    パラメータから変換を一度だけ求めておき、フレームごとには
+    彩度を変えない場合はチャンネルごとのテーブル参照1回、
+    彩度を変える場合は 3x3 の色行列の適用1回で処理する。
+    """
+
+    def _params(self, effect: AnimationEffect) -> tuple[float, float, float, float]:
+        """(contrast, brightness, color_temp, saturation) を取得"""
+        return (
+            effect.contrast or 1.0,
+            effect.brightness or 1.0,
+            effect.color_temp or 0.0,
+            effect.saturation or 1.0,
+        )
 
     def apply(
         self,
@@ -16,39 +111,57 @@ class ColorGradeEffect(EffectStrategy):
         video_size: tuple[int, int],
     ) -> VideoClip | ImageClip:
         """カラーグレーディングを適用"""
-        color_temp = effect.color_temp or 0.0
-        saturation = effect.saturation or 1.0
-        contrast = effect.contrast or 1.0
-        brightness = effect.brightness or 1.0
+        contrast, brightness, color_temp, saturation = self._params(effect)
 
         def color_grade_frame(get_frame, t):
-            frame = get_frame(t).astype(float) / 255.0
+            frame = get_frame(t)
+            channels = frame.shape[2]
+
+            if saturation == 1.0 and frame.dtype == np.uint8:
+                lut = _grade_lut(contrast, brightness, color_temp, channels)
+                graded = np.empty_like(frame)
+                for channel in range(channels):
+                    np.take(lut[channel], frame[..., channel], out=graded[..., channel])
+                return graded
+
+            matrix, bias = _grade_matrix(
+                contrast, brightness, color_temp, saturation, channels
+            )
+            graded = frame.astype(np.float32) @ matrix.T.astype(np.float32)
+            graded += bias.astype(np.float32)
+            return np.clip(graded, 0, 255, out=graded).astype(np.uint8)
 
-            frame = (frame - 0.5) * contrast + 0.5
-            frame = frame * brightness
+        return clip.transform(color_grade_frame)
 
-            if color_temp != 0:
-                if color_temp > 0:
-                    frame[:, :, 0] *= 1 + color_temp * 0.3
-                    frame[:, :, 2] *= 1 - color_temp * 0.3
-                else:
-                    frame[:, :, 0] *= 1 + color_temp * 0.3
-                    frame[:, :, 2] *= 1 - color_temp * 0.3
+    def is_time_invariant(self, effect: AnimationEffect) -> bool:
+        """グレーディングは時刻によらない"""
+        return True
 
-            if saturation != 1.0:
-                gray = np.dot(frame[..., :3], [0.299, 0.587, 0.114])
-                frame[:, :, :3] = (
-                    gray[..., np.newaxis] * (1 - saturation)
-                    + frame[:, :, :3] * saturation
-                )
+    def pixel_stage(
+        self, clip: VideoClip | ImageClip, effect: AnimationEffect
+    ) -> PixelStage:
+        """グレーディングのアフィン変換を作業バッファに適用する処理"""
+        contrast, brightness, color_temp, saturation = self._params(effect)
 
-            return np.clip(frame * 255, 0, 255).astype(np.uint8)
+        def stage(buffer, t):
+            matrix, bias = _grade_matrix(
+                contrast, brightness, color_temp, saturation, buffer.shape[2]
+            )
+            if saturation == 1.0:
+                buffer *= np.diag(matrix).astype(np.float32)
+            else:
+                buffer = buffer @ matrix.T.astype(np.float32)
+            buffer += bias.astype(np.float32)
+            return np.clip(buffer, 0, 255, out=buffer)
 
-        return clip.transform(color_grade_frame)
+        return stage
 
 
 class VignetteEffect(EffectStrategy):
-    """ビネット効果（周辺減光）"""
+    """ビネット効果（周辺減光）
+
+    マスクはフレームサイズごとに一度だけ計算して使い回す。
+    """
 
     def apply(
         self,
@@ -63,15 +176,31 @@ class VignetteEffect(EffectStrategy):
             frame = get_frame(t)
             h, w = frame.shape[:2]
 
-            y, x = np.ogrid[:h, :w]
-            cx, cy = w / 2, h / 2
-            distance = np.sqrt((x - cx) ** 2 + (y - cy) ** 2)
-            max_distance = np.sqrt(cx**2 + cy**2)
-            vignette_mask = 1 - (distance / max_distance) * vignette_amount
-
+            vignette_mask = _vignette_mask(h, w, vignette_amount)
             if len(frame.shape) == 3:
                 vignette_mask = vignette_mask[:, :, np.newaxis]
 
-            return np.clip(frame * vignette_mask, 0, 255).astype(np.uint8)
+            result = frame * vignette_mask
+            return np.clip(result, 0, 255, out=result).astype(np.uint8)
 
         return clip.transform(vignette_frame)
+
+    def is_time_invariant(self, effect: AnimationEffect) -> bool:
+        """マスクは時刻によらない"""
+        return True
+
+    def pixel_stage(
+        self, clip: VideoClip | ImageClip, effect: AnimationEffect
+    ) -> PixelStage:
+        """周辺減光のマスクを掛ける処理"""
+        vignette_amount = effect.vignette_amount or 0.5
+
+        def stage(buffer, t):
+            h, w = buffer.shape[:2]
+            mask = _vignette_mask(h, w, vignette_amount)
+            if buffer.ndim == 3:
+                mask = mask[:, :, np.newaxis]
+            buffer *= mask
+            return buffer
+
+        return stage
@@ -1,15 +1,41 @@
 """フェードエフェクト"""
 
+from typing import Callable
+
 import numpy as np
 from moviepy import VideoClip, ImageClip
 from .base import EffectStrategy
+from ..fusion import PixelStage
 from ..utils import get_easing_function
 from ..models import AnimationEffect
 
 
+def _scale_stage(opacity_at: Callable[[float], float | None]) -> PixelStage:
+    """時刻ごとの不透明度を作業バッファに掛ける処理を作る"""
+
+    def stage(buffer, t):
+        opacity = opacity_at(t)
+        if opacity is not None:
+            buffer *= opacity
+        return buffer
+
+    return stage
+
+
 class FadeInEffect(EffectStrategy):
     """フェードインエフェクト（透明度ベース）"""
 
+    def _opacity(self, effect: AnimationEffect) -> Callable[[float], float | None]:
+        """時刻から不透明度を求める関数（フェード区間外は None）"""
+        easing_fn = get_easing_function(effect.easing)
+
+        def opacity_at(t):
+            if t > effect.duration:
+                return None
+            return easing_fn(min(t / effect.duration, 1.0))
+
+        return opacity_at
+
     def apply(
         self,
         clip: VideoClip | ImageClip,
@@ -17,16 +43,14 @@ class FadeInEffect(EffectStrategy):
         video_size: tuple[int, int],
     ) -> VideoClip | ImageClip:
         """フェードインを適用"""
-        easing_fn = get_easing_function(effect.easing)
+        opacity_at = self._opacity(effect)
 
         def fadein_transform(get_frame, t):
             frame = get_frame(t)
-            if t > effect.duration:
+            eased_progress = opacity_at(t)
+            if eased_progress is None:
                 return frame
 
-            progress = min(t / effect.duration, 1.0)
-            eased_progress = easing_fn(progress)
-
             # フレームのコピーを作成して乗算
             frame = frame.copy().astype(np.float32)
             frame = (frame * eased_progress).astype(np.uint8)
@@ -35,10 +59,31 @@ class FadeInEffect(EffectStrategy):
 
         return clip.transform(fadein_transform)
 
+    def pixel_stage(
+        self, clip: VideoClip | ImageClip, effect: AnimationEffect
+    ) -> PixelStage:
+        """不透明度を掛ける処理"""
+        return _scale_stage(self._opacity(effect))
+
 
 class FadeOutEffect(EffectStrategy):
     """フェードアウトエフェクト（透明度ベース）"""
 
+    def _opacity(
+        self, clip: VideoClip | ImageClip, effect: AnimationEffect
+    ) -> Callable[[float], float | None]:
+        """時刻から不透明度を求める関数（フェード区間外は None）"""
+        easing_fn = get_easing_function(effect.easing)
+
+        def opacity_at(t):
+            time_from_end = clip.duration - t
+            if time_from_end > effect.duration:
+                return None
+            progress = 1 - min(time_from_end / effect.duration, 1.0)
+            return 1.0 - easing_fn(progress)
+
+        return opacity_at
+
     def apply(
         self,
         clip: VideoClip | ImageClip,
@@ -46,18 +91,14 @@ class FadeOutEffect(EffectStrategy):
         video_size: tuple[int, int],
     ) -> VideoClip | ImageClip:
         """フェードアウトを適用"""
-        easing_fn = get_easing_function(effect.easing)
+        opacity_at = self._opacity(clip, effect)
 
         def fadeout_transform(get_frame, t):
             frame = get_frame(t)
-            time_from_end = clip.duration - t
-            if time_from_end > effect.duration:
+            opacity = opacity_at(t)
+            if opacity is None:
                 return frame
 
-            progress = 1 - min(time_from_end / effect.duration, 1.0)
-            eased_progress = easing_fn(progress)
-            opacity = 1.0 - eased_progress
-
             # フレームのコピーを作成して乗算
             frame = frame.copy().astype(np.float32)
             frame = (frame * opacity).astype(np.uint8)
@@ -65,3 +106,9 @@ class FadeOutEffect(EffectStrategy):
             return frame
 
         return clip.transform(fadeout_transform)
+
+    def pixel_stage(
+        self, clip: VideoClip | ImageClip, effect: AnimationEffect
+    ) -> PixelStage:
+        """不透明度を掛ける処理"""
+        return _scale_stage(self._opacity(clip, effect))
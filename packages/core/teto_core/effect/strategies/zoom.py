@@ -1,15 +1,57 @@
 """ズームエフェクト"""
 
 import numpy as np
-from scipy.ndimage import zoom as scipy_zoom, shift as scipy_shift
 from moviepy import VideoClip, ImageClip
 from .base import EffectStrategy
+from ..fusion import AffineStage
+from ..resample import affine_resample, corner_aligned_axis, corner_aligned_offset
 from ..utils import get_easing_function
 from ..models import AnimationEffect
 
 
+def _center_start(n_zoomed: int, n: int) -> int:
+    """拡大後の画像から中央の n 画素を切り出す開始位置
+
+    縮小して小さくなった場合は、中央に配置したときの位置を負の値で返す。
+    """
+    if n_zoomed >= n:
+        return (n_zoomed - n) // 2
+    return -((n - n_zoomed) // 2)
+
+
 class ZoomEffect(EffectStrategy):
-    """スムーズズーム効果（イージング付き、透明背景対応）"""
+    """スムーズズーム効果（イージング付き、透明背景対応）
+
+    フレームごとに拡大率から出力ピクセルを直接サンプリングする
+    （affine_resample）。拡大した画像全体は作らない。サンプリング位置は
+    scipy.ndimage.zoom(order=1) で拡大して中央を切り出す場合と同じ。
+    """
+
+    def _mapping(
+        self, clip: VideoClip | ImageClip, effect: AnimationEffect
+    ) -> AffineStage:
+        """時刻と入力サイズから (scale_x, scale_y, offset_x, offset_y) を求める関数"""
+        start_scale = effect.start_scale or 1.0
+        end_scale = effect.end_scale or 1.2
+        easing_fn = get_easing_function(effect.easing)
+
+        def mapping(t, w, h):
+            progress = min(t / clip.duration, 1.0) if clip.duration > 0 else 0
+            eased_progress = easing_fn(progress)
+
+            current_scale = start_scale + (end_scale - start_scale) * eased_progress
+            scale_x, zoomed_w = corner_aligned_axis(w, current_scale)
+            scale_y, zoomed_h = corner_aligned_axis(h, current_scale)
+
+            # 拡大後の画像の中央を切り出す（縮小時は中央に配置する）
+            return (
+                scale_x,
+                scale_y,
+                corner_aligned_offset(_center_start(zoomed_w, w), scale_x),
+                corner_aligned_offset(_center_start(zoomed_h, h), scale_y),
+            )
+
+        return mapping
 
     def apply(
         self,
@@ -18,73 +60,61 @@ class ZoomEffect(EffectStrategy):
         video_size: tuple[int, int],
     ) -> VideoClip | ImageClip:
         """ズームを適用"""
-        start_scale = effect.start_scale or 1.0
-        end_scale = effect.end_scale or 1.2
-        easing_fn = get_easing_function(effect.easing)
+        quality = effect.resample or "bilinear"
+        mapping = self._mapping(clip, effect)
 
         def zoom_frame(get_frame, t):
             frame = get_frame(t)
-            progress = min(t / clip.duration, 1.0) if clip.duration > 0 else 0
-            eased_progress = easing_fn(progress)
+            h, w = frame.shape[:2]
 
-            current_scale = start_scale + (end_scale - start_scale) * eased_progress
+            scale_x, scale_y, offset_x, offset_y = mapping(t, w, h)
+            zoomed, inside = affine_resample(
+                frame, (scale_x, scale_y), (offset_x, offset_y), quality=quality
+            )
 
-            h, w = frame.shape[:2]
+            if min(scale_x, scale_y) >= 1.0 or inside is None:
+                return zoomed
 
-            if len(frame.shape) == 3:
-                zoomed = scipy_zoom(frame, (current_scale, current_scale, 1), order=1)
-            else:
-                zoomed = scipy_zoom(frame, (current_scale, current_scale), order=1)
-
-            zh, zw = zoomed.shape[:2]
-            y_start = (zh - h) // 2
-            x_start = (zw - w) // 2
-
-            if current_scale >= 1.0:
-                return zoomed[y_start : y_start + h, x_start : x_start + w]
-            else:
-                # 透明背景を使用（RGBAの場合）
-                if len(frame.shape) == 3:
-                    if frame.shape[2] == 4:
-                        # RGBA - アルファチャンネル付き透明背景
-                        result = np.zeros((h, w, 4), dtype=frame.dtype)
-                    elif frame.shape[2] == 3:
-                        # RGB - アルファチャンネルを追加
-                        result = np.zeros((h, w, 4), dtype=frame.dtype)
-                        # ズーム後の画像にアルファチャンネルを追加
-                        alpha = np.full((zh, zw, 1), 255, dtype=frame.dtype)
-                        zoomed = np.concatenate([zoomed, alpha], axis=2)
-                    else:
-                        result = np.zeros_like(frame)
-                else:
-                    result = np.zeros_like(frame)
-
-                y_offset = (h - zh) // 2
-                x_offset = (w - zw) // 2
-                result[y_offset : y_offset + zh, x_offset : x_offset + zw] = zoomed
-                return result
+            # 縮小時は元画像の外側を透明背景にする
+            if zoomed.ndim == 3 and zoomed.shape[2] == 3:
+                # RGB - アルファチャンネルを追加
+                alpha = np.full((h, w, 1), 255, dtype=zoomed.dtype)
+                zoomed = np.concatenate([zoomed, alpha], axis=2)
+            zoomed[~inside] = 0
+            return zoomed
 
         return clip.transform(zoom_frame)
 
+    def affine_stage(
+        self, clip: VideoClip | ImageClip, effect: AnimationEffect
+    ) -> AffineStage | None:
+        """拡大のみの場合の写像（縮小は透明背景を足すため融合しない）"""
+        start_scale = effect.start_scale or 1.0
+        end_scale = effect.end_scale or 1.2
+        if min(start_scale, end_scale) < 1.0:
+            return None
+        return self._mapping(clip, effect)
+
 
 class KenBurnsEffect(EffectStrategy):
-    """Ken Burns効果（パン＋ズーム）"""
+    """Ken Burns効果（パン＋ズーム）
 
-    def apply(
-        self,
-        clip: VideoClip | ImageClip,
-        effect: AnimationEffect,
-        video_size: tuple[int, int],
-    ) -> VideoClip | ImageClip:
-        """Ken Burns効果を適用"""
+    拡大・パン・サブピクセルのずれを1つのアフィン写像にまとめ、
+    出力ピクセルだけを元画像から1回でサンプリングする。サンプリング位置は
+    scipy.ndimage.zoom(order=1) で拡大してから小数の位置で切り出す場合と同じ。
+    """
+
+    def _mapping(
+        self, clip: VideoClip | ImageClip, effect: AnimationEffect
+    ) -> AffineStage:
+        """時刻と入力サイズから (scale_x, scale_y, offset_x, offset_y) を求める関数"""
         start_scale = effect.start_scale or 1.0
         end_scale = effect.end_scale or 1.3
         pan_start = effect.pan_start or (0.0, 0.0)
         pan_end = effect.pan_end or (0.1, 0.1)
         easing_fn = get_easing_function(effect.easing)
 
-        def ken_burns_frame(get_frame, t):
-            frame = get_frame(t)
+        def mapping(t, w, h):
             progress = min(t / clip.duration, 1.0) if clip.duration > 0 else 0
             eased_progress = easing_fn(progress)
 
@@ -92,50 +122,47 @@ class KenBurnsEffect(EffectStrategy):
             pan_x = pan_start[0] + (pan_end[0] - pan_start[0]) * eased_progress
             pan_y = pan_start[1] + (pan_end[1] - pan_start[1]) * eased_progress
 
+            scale_x, zoomed_w = corner_aligned_axis(w, current_scale)
+            scale_y, zoomed_h = corner_aligned_axis(h, current_scale)
+
+            # 拡大後の画像上での切り出し位置（小数のままサブピクセルで扱う）
+            margin_x = max(zoomed_w - w, 0)
+            margin_y = max(zoomed_h - h, 0)
+            start_x = min(max(margin_x * (0.5 + pan_x), 0.0), margin_x)
+            start_y = min(max(margin_y * (0.5 + pan_y), 0.0), margin_y)
+            return (
+                scale_x,
+                scale_y,
+                corner_aligned_offset(start_x, scale_x),
+                corner_aligned_offset(start_y, scale_y),
+            )
+
+        return mapping
+
+    def apply(
+        self,
+        clip: VideoClip | ImageClip,
+        effect: AnimationEffect,
+        video_size: tuple[int, int],
+    ) -> VideoClip | ImageClip:
+        """Ken Burns効果を適用"""
+        quality = effect.resample or "bilinear"
+        mapping = self._mapping(clip, effect)
+
+        def ken_burns_frame(get_frame, t):
+            frame = get_frame(t)
             h, w = frame.shape[:2]
+            scale_x, scale_y, offset_x, offset_y = mapping(t, w, h)
 
-            if len(frame.shape) == 3:
-                zoomed = scipy_zoom(frame, (current_scale, current_scale, 1), order=1)
-            else:
-                zoomed = scipy_zoom(frame, (current_scale, current_scale), order=1)
-
-            zh, zw = zoomed.shape[:2]
-
-            # サブピクセル補間を使用してスムーズなパンを実現
-            x_offset_float = (zw - w) * (0.5 + pan_x)
-            y_offset_float = (zh - h) * (0.5 + pan_y)
-
-            # 整数部分で切り出し範囲を決定
-            x_offset_int = int(x_offset_float)
-            y_offset_int = int(y_offset_float)
-
-            # 小数部分（サブピクセルシフト量）
-            x_subpixel = x_offset_float - x_offset_int
-            y_subpixel = y_offset_float - y_offset_int
-
-            # 境界チェック（サブピクセルシフト用に1ピクセル余裕を持たせる）
-            x_offset_int = max(0, min(x_offset_int, zw - w - 1))
-            y_offset_int = max(0, min(y_offset_int, zh - h - 1))
-
-            # 少し大きめに切り出し（サブピクセルシフト用）
-            crop_h = min(h + 1, zh - y_offset_int)
-            crop_w = min(w + 1, zw - x_offset_int)
-            cropped = zoomed[
-                y_offset_int : y_offset_int + crop_h,
-                x_offset_int : x_offset_int + crop_w,
-            ]
-
-            # サブピクセルシフトを適用
-            if len(frame.shape) == 3:
-                shifted = scipy_shift(
-                    cropped, (-y_subpixel, -x_subpixel, 0), order=1, mode="nearest"
-                )
-            else:
-                shifted = scipy_shift(
-                    cropped, (-y_subpixel, -x_subpixel), order=1, mode="nearest"
-                )
-
-            # 最終サイズに切り出し
-            return shifted[:h, :w]
+            result, _ = affine_resample(
+                frame, (scale_x, scale_y), (offset_x, offset_y), quality=quality
+            )
+            return result
 
         return clip.transform(ken_burns_frame)
+
+    def affine_stage(
+        self, clip: VideoClip | ImageClip, effect: AnimationEffect
+    ) -> AffineStage:
+        """拡大・パンの写像"""
+        return self._mapping(clip, effect)
@@ -10,7 +10,10 @@ from .steps import (
     CharacterLayerProcessingStep,
     LayeredCharacterLayerProcessingStep,
     SubtitleProcessingStep,
+    OverlayCompositingStep,
     VideoOutputStep,
+    ChunkOutputStep,
+    AudioTrackOutputStep,
     CleanupStep,
 )
 
@@ -24,6 +27,9 @@ __all__ = [
     "CharacterLayerProcessingStep",
     "LayeredCharacterLayerProcessingStep",
     "SubtitleProcessingStep",
+    "OverlayCompositingStep",
     "VideoOutputStep",
+    "ChunkOutputStep",
+    "AudioTrackOutputStep",
     "CleanupStep",
 ]
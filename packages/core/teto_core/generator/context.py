@@ -1,11 +1,16 @@
 """処理パイプラインのコンテキスト"""
 
-from dataclasses import dataclass
-from typing import Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable
 from moviepy import VideoClip, AudioClip
 
 from ..project import Project
 
+if TYPE_CHECKING:
+    import proglog
+    from ..render.decoder_pool import DecoderPool
+    from ..render.profiler import RenderProfiler
+
 
 @dataclass
 class ProcessingContext:
@@ -15,8 +20,28 @@ class ProcessingContext:
     video_clip: VideoClip | None = None
     audio_clip: AudioClip | None = None
     output_size: tuple[int, int] | None = None
+    # video_clip の上に合成するオーバーレイ（リスト順が z 順）
+    overlay_clips: list[VideoClip] = field(default_factory=list)
     progress_callback: Callable[[str], None] | None = None
     verbose: bool = True  # False にすると MoviePy のログを抑制
+    # 設定するとステップごとの実行時間とピークメモリを記録する
+    profiler: "RenderProfiler | None" = None
+    # 設定すると出力ステップの進捗バーの代わりにこのロガーへ進捗を通知する
+    progress_logger: "proglog.ProgressBarLogger | None" = None
+    # 動画レイヤーのデコーダープール（クリーンアップで閉じる）
+    decoder_pool: "DecoderPool | None" = None
+
+    @property
+    def logger(self) -> "proglog.ProgressBarLogger | str | None":
+        """出力ステップで MoviePy / ffmpeg に渡す logger 引数
+
+        Returns:
+            progress_logger が設定されていればそれ、なければ verbose に応じて
+            "bar"（進捗バーを表示）または None（抑制）
+        """
+        if self.progress_logger is not None:
+            return self.progress_logger
+        return "bar" if self.verbose else None
 
     def report_progress(self, message: str) -> None:
         """進捗を報告
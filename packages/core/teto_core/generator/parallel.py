@@ -56,3 +56,71 @@ def generate_single_output(
     except Exception as e:
         output_path = output_config_dict.get("path", "unknown")
         raise RuntimeError(f"Failed to generate {output_path}: {e}") from e
+
+
+def render_chunk(
+    project_dict: dict,
+    start_frame: int,
+    end_frame: int,
+    chunk_path: str,
+    verbose: bool = False,
+) -> str:
+    """時間分割レンダリングの1チャンクを出力するワーカー関数
+
+    ProcessPoolExecutor で使用するため、シリアライズ可能な dict を引数に取ります。
+    各プロセスでタイムライン全体を再構築し、指定範囲のフレームだけを出力します。
+
+    Args:
+        project_dict: Project をシリアライズした dict
+        start_frame: 書き出す最初のフレーム番号
+        end_frame: 書き出しを終えるフレーム番号（含まない）
+        chunk_path: チャンクの出力ファイルパス
+        verbose: MoviePy のログを出力するかどうか
+
+    Returns:
+        チャンクの出力ファイルパス
+    """
+    from ..project import Project
+    from ..video_generator import VideoGenerator
+
+    generator = VideoGenerator(Project(**project_dict))
+    return generator.render_chunk(start_frame, end_frame, chunk_path, verbose)
+
+
+def generate_output_with_audio(
+    project_dict: dict,
+    output_config_dict: dict,
+    audio_path: str | None,
+    verbose: bool = False,
+) -> str:
+    """共有の音声トラックを多重化して単一出力を生成するワーカー関数
+
+    音声レイヤーの処理と音声のエンコードは親プロセスで一度だけ行われるため、
+    各プロセスでは映像のレンダリングとエンコードだけを行います。
+
+    Args:
+        project_dict: Project をシリアライズした dict
+        output_config_dict: OutputConfig をシリアライズした dict
+        audio_path: エンコード済みの音声ファイルのパス。None の場合は無音
+        verbose: MoviePy のログを出力するかどうか
+
+    Returns:
+        生成された出力ファイルのパス
+
+    Raises:
+        RuntimeError: 動画生成に失敗した場合
+    """
+    from ..project import Project
+    from ..output_config.models import OutputConfig
+    from ..video_generator import VideoGenerator
+
+    output_path = output_config_dict.get("path", "unknown")
+    try:
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+
+        project = Project(**project_dict)
+        project.output = OutputConfig(**output_config_dict)
+        return VideoGenerator(project).render_with_audio_track(audio_path, verbose)
+
+    except Exception as e:
+        raise RuntimeError(f"Failed to generate {output_path}: {e}") from e
@@ -40,7 +40,11 @@ class ProcessingStep(ABC):
         Returns:
             最終的なコンテキスト
         """
-        context = self.process(context)
+        if context.profiler is not None:
+            with context.profiler.step(type(self).__name__):
+                context = self.process(context)
+        else:
+            context = self.process(context)
 
         if self._next:
             return self._next.execute(context)
@@ -7,7 +7,14 @@ from .stamp_layer import StampLayerProcessingStep
 from .character_layer import CharacterLayerProcessingStep
 from .layered_character_layer import LayeredCharacterLayerProcessingStep
 from .subtitle import SubtitleProcessingStep
-from .output import VideoOutputStep
+from .compositing import OverlayCompositingStep
+from .output import (
+    VideoOutputStep,
+    ChunkOutputStep,
+    CheckpointOutputStep,
+    AudioTrackOutputStep,
+    NullOutputStep,
+)
 from .cleanup import CleanupStep
 
 __all__ = [
@@ -18,6 +25,11 @@ __all__ = [
     "CharacterLayerProcessingStep",
     "LayeredCharacterLayerProcessingStep",
     "SubtitleProcessingStep",
+    "OverlayCompositingStep",
     "VideoOutputStep",
+    "ChunkOutputStep",
+    "CheckpointOutputStep",
+    "AudioTrackOutputStep",
+    "NullOutputStep",
     "CleanupStep",
 ]
@@ -2,6 +2,7 @@
 
 from ..pipeline import ProcessingStep
 from ..context import ProcessingContext
+from ...render.audio_mixer import AudioMixer, MixedAudioClip
 
 
 class AudioMergingStep(ProcessingStep):
@@ -24,14 +25,22 @@ class AudioMergingStep(ProcessingStep):
 
         from moviepy import CompositeAudioClip
 
-        if context.video_clip.audio is not None:
-            # 動画の音声と追加音声を合成
-            final_audio = CompositeAudioClip(
-                [context.video_clip.audio, context.audio_clip]
-            )
-            context.video_clip = context.video_clip.with_audio(final_audio)
-        else:
+        video_audio = context.video_clip.audio
+        if video_audio is None:
             # 追加音声のみ
             context.video_clip = context.video_clip.with_audio(context.audio_clip)
+        elif (
+            isinstance(context.audio_clip, MixedAudioClip)
+            and video_audio.duration is not None
+        ):
+            # 動画の音声を一度だけ PCM に書き出し、追加音声のバッファに合成する
+            mixer = AudioMixer(fps=context.audio_clip.fps)
+            mixer.add(video_audio.to_soundarray(fps=mixer.fps))
+            mixer.add(context.audio_clip.samples)
+            context.video_clip = context.video_clip.with_audio(mixer.to_clip())
+        else:
+            # 動画の音声と追加音声を合成
+            final_audio = CompositeAudioClip([video_audio, context.audio_clip])
+            context.video_clip = context.video_clip.with_audio(final_audio)
 
         return context
@@ -3,12 +3,14 @@
 from ..pipeline import ProcessingStep
 from ..context import ProcessingContext
 from ...layer.processors.character import CharacterLayerProcessor
+from ...layer.models import CharacterAnimationType
+from ...render import mark_static_overlay, profile_clip
 
 
 class CharacterLayerProcessingStep(ProcessingStep):
     """キャラクターレイヤー処理ステップ
 
-    キャラクターレイヤーを処理し、ベース動画に合成する。
+    キャラクターレイヤーを処理し、オーバーレイとして登録する。
     キャラクターは字幕より下、スタンプより上のレイヤーに配置される。
     """
 
@@ -42,9 +44,7 @@ class CharacterLayerProcessingStep(ProcessingStep):
 
         context.report_progress("キャラクターを処理中...")
 
-        from moviepy import CompositeVideoClip
-
-        character_clips = []
+        # キャラクターをオーバーレイとして登録（合成は OverlayCompositingStep で行う）
         for character_layer in timeline.character_layers:
             if self.character_processor.validate(
                 character_layer, output_size=context.output_size
@@ -52,12 +52,11 @@ class CharacterLayerProcessingStep(ProcessingStep):
                 character_clip = self.character_processor.process(
                     character_layer, output_size=context.output_size
                 )
-                character_clips.append(character_clip)
-
-        if character_clips:
-            # ベース動画とキャラクターを合成
-            context.video_clip = CompositeVideoClip(
-                [context.video_clip] + character_clips, size=context.output_size
-            )
+                # アニメーションのないキャラクターは事前合成の対象
+                if character_layer.animation.type == CharacterAnimationType.NONE:
+                    mark_static_overlay(character_clip)
+                context.overlay_clips.append(
+                    profile_clip(character_clip, "layer", "character")
+                )
 
         return context
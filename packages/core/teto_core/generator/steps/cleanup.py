@@ -21,6 +21,8 @@ class CleanupStep(ProcessingStep):
             context.video_clip.close()
         if context.audio_clip:
             context.audio_clip.close()
+        if context.decoder_pool is not None:
+            context.decoder_pool.close()
 
         context.report_progress("完了！")
 
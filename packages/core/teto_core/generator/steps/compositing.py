@@ -0,0 +1,46 @@
+"""オーバーレイ合成ステップ"""
+
+from ..pipeline import ProcessingStep
+from ..context import ProcessingContext
+from ...render import FlattenedCompositeClip, profile_clip, scale_overlay
+
+
+class OverlayCompositingStep(ProcessingStep):
+    """オーバーレイ合成ステップ
+
+    スタンプ・キャラクター・字幕などの各ステップが context.overlay_clips に
+    積んだオーバーレイを、ベース動画へ1パスでまとめて合成する。
+    縮小描画（render_scale < 1）の場合、レイアウト解像度で作られた
+    オーバーレイをここで描画解像度に縮める。
+    """
+
+    def process(self, context: ProcessingContext) -> ProcessingContext:
+        """オーバーレイを合成
+
+        Args:
+            context: 処理コンテキスト
+
+        Returns:
+            更新されたコンテキスト
+        """
+        if not context.overlay_clips:
+            return context
+
+        context.report_progress("オーバーレイを合成中...")
+
+        output_config = context.project.output
+        overlays = [
+            scale_overlay(clip, output_config.render_scale)
+            for clip in context.overlay_clips
+        ]
+
+        context.video_clip = profile_clip(
+            FlattenedCompositeClip(
+                context.video_clip, overlays, size=output_config.render_size
+            ),
+            "composite",
+            "overlays",
+        )
+        context.overlay_clips = []
+
+        return context
@@ -3,12 +3,13 @@
 from ..pipeline import ProcessingStep
 from ..context import ProcessingContext
 from ...layer.processors.layered_character import LayeredCharacterProcessor
+from ...render import profile_clip
 
 
 class LayeredCharacterLayerProcessingStep(ProcessingStep):
     """レイヤードキャラクターレイヤー処理ステップ
 
-    レイヤードキャラクターレイヤーを処理し、ベース動画に合成する。
+    レイヤードキャラクターレイヤーを処理し、オーバーレイとして登録する。
     """
 
     def __init__(
@@ -48,18 +49,9 @@ class LayeredCharacterLayerProcessingStep(ProcessingStep):
         if not self.processor:
             self.processor = LayeredCharacterProcessor(video_size=video_size)
 
-        from moviepy import CompositeVideoClip
-
-        # 各レイヤーを処理
-        layered_character_clips = []
+        # 各レイヤーをオーバーレイとして登録（合成は OverlayCompositingStep で行う）
         for layer in timeline.layered_character_layers:
             clip = self.processor.process_layer(layer)
-            layered_character_clips.append(clip)
-
-        if layered_character_clips:
-            # ベース動画とレイヤードキャラクターを合成
-            context.video_clip = CompositeVideoClip(
-                [context.video_clip] + layered_character_clips, size=video_size
-            )
+            context.overlay_clips.append(profile_clip(clip, "layer", layer.type))
 
         return context
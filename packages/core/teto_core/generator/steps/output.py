@@ -1,14 +1,38 @@
 """動画出力ステップ"""
 
+import math
+import os
+import shutil
 from pathlib import Path
 
+from moviepy.tools import find_extension
+
 from ..pipeline import ProcessingStep
 from ..context import ProcessingContext
+from ...cache.base import AssetCacheManager
+from ...cache.segment import segment_material
+from ...render.audio_mixer import write_audio_track
+from ...render.checkpoint import RenderCheckpoint
+from ...render.chunked import plan_chunks, concat_segments
+from ...render.ffmpeg_pipe import FrameProducer, write_video_pipe
+from ...render.scheduler import FrameScheduler
 
 
 class VideoOutputStep(ProcessingStep):
     """動画出力ステップ"""
 
+    def __init__(self, audio_path: str | None = None, next_step: ProcessingStep = None):
+        """初期化
+
+        Args:
+            audio_path: エンコード済みの音声ファイルのパス。指定した場合は
+                クリップの音声を書き出さず、このファイルを再エンコードなしで
+                多重化する（複数フォーマット出力での音声の共有に使う）
+            next_step: 次の処理ステップ（オプション）
+        """
+        super().__init__(next_step)
+        self.audio_path = audio_path
+
     def process(self, context: ProcessingContext) -> ProcessingContext:
         """動画を出力
 
@@ -30,17 +54,308 @@ class VideoOutputStep(ProcessingStep):
         temp_audio_file = str(output_dir / f"temp_audio_{Path(output_path).stem}.mp4")
 
         # verbose=False の場合は MoviePy のログを抑制
-        logger = "bar" if context.verbose else None
+        logger = context.logger
+
+        if output_config.encoder == "ffmpeg_pipe":
+            stats = write_video_pipe(
+                context.video_clip,
+                output_path,
+                fps=output_config.fps,
+                codec=output_config.codec,
+                audio_codec=output_config.audio_codec,
+                bitrate=output_config.bitrate,
+                preset=output_config.preset,
+                threads=output_config.threads,
+                temp_audiofile=temp_audio_file,
+                logger=logger,
+                audio_file=self.audio_path,
+                frame_workers=output_config.frame_workers,
+                frame_window=output_config.frame_window,
+            )
+            context.report_progress(
+                f"エンコード完了: {stats.frames}フレーム / "
+                f"{stats.elapsed:.1f}秒 ({stats.fps:.1f} fps, "
+                f"静止フレーム {stats.repeated_frames}枚を再利用)"
+            )
+            return context
 
         context.video_clip.write_videofile(
             output_path,
             fps=output_config.fps,
             codec=output_config.codec,
-            audio_codec=output_config.audio_codec,
+            audio=self.audio_path or True,
+            audio_codec="copy" if self.audio_path else output_config.audio_codec,
             bitrate=output_config.bitrate,
             preset=output_config.preset,
+            threads=output_config.threads,
             temp_audiofile=temp_audio_file,
             logger=logger,
         )
 
         return context
+
+
+class ChunkOutputStep(ProcessingStep):
+    """チャンク出力ステップ
+
+    時間分割レンダリングで、タイムラインの一部のフレーム範囲だけを
+    音声なしでエンコードする。フレームの時刻はタイムライン全体の時刻を
+    使うため、チャンクを順に結合すると通常の出力と同じフレーム列になる。
+    """
+
+    def __init__(self, start_frame: int, end_frame: int, path: str):
+        """初期化
+
+        Args:
+            start_frame: 書き出す最初のフレーム番号
+            end_frame: 書き出しを終えるフレーム番号（含まない）
+            path: チャンクの出力ファイルパス
+        """
+        super().__init__()
+        self.start_frame = start_frame
+        self.end_frame = end_frame
+        self.path = path
+
+    def process(self, context: ProcessingContext) -> ProcessingContext:
+        """チャンクを出力
+
+        Args:
+            context: 処理コンテキスト
+
+        Returns:
+            更新されたコンテキスト
+        """
+        context.report_progress(
+            f"チャンクを出力中 (フレーム {self.start_frame}-{self.end_frame})..."
+        )
+
+        output_config = context.project.output
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        write_video_pipe(
+            context.video_clip,
+            self.path,
+            fps=output_config.fps,
+            codec=output_config.codec,
+            bitrate=output_config.bitrate,
+            preset=output_config.preset,
+            threads=output_config.threads,
+            logger=context.logger,
+            start_frame=self.start_frame,
+            end_frame=self.end_frame,
+            audio=False,
+            frame_workers=output_config.frame_workers,
+            frame_window=output_config.frame_window,
+        )
+
+        return context
+
+
+class CheckpointOutputStep(ProcessingStep):
+    """チェックポイント付きの動画出力ステップ
+
+    タイムラインを segment_seconds 秒ごとのセグメントに分けて音声なしで
+    順にエンコードし、書き終えるたびに作業ディレクトリのマニフェストへ
+    記録する。最後に音声トラックを書き出し、セグメントと合わせて
+    再エンコードなしで結合する。resume を有効にすると、プロジェクトの
+    内容が変わっていない限り、前回書き終えたセグメントを再利用して
+    続きから出力する。
+    """
+
+    def __init__(
+        self,
+        work_dir: str,
+        segment_seconds: float = 60.0,
+        resume: bool = False,
+        audio_path: str | None = None,
+        next_step: ProcessingStep = None,
+    ):
+        """初期化
+
+        Args:
+            work_dir: セグメントとマニフェストを置く作業ディレクトリ。
+                結合に成功したら削除する
+            segment_seconds: 1セグメントの目安の長さ（秒）
+            resume: 前回のマニフェストから書き終えたセグメントを再利用するか
+            audio_path: エンコード済みの音声ファイルのパス。指定した場合は
+                クリップの音声を書き出さず、このファイルをセグメントと結合する
+                （音声トラックキャッシュの利用に使う）
+            next_step: 次の処理ステップ（オプション）
+        """
+        super().__init__(next_step)
+        self.work_dir = work_dir
+        self.segment_seconds = segment_seconds
+        self.resume = resume
+        self.audio_path = audio_path
+
+    def process(self, context: ProcessingContext) -> ProcessingContext:
+        """セグメントごとに動画を出力して結合
+
+        Args:
+            context: 処理コンテキスト
+
+        Returns:
+            更新されたコンテキスト
+        """
+        project = context.project
+        output_config = project.output
+        output_path = output_config.path
+        clip = context.video_clip
+        logger = context.logger
+
+        duration = clip.duration
+        num_segments = max(1, math.ceil(duration / self.segment_seconds))
+        segments = plan_chunks(duration, output_config.fps, num_segments)
+        total_frames = segments[-1][1] if segments else 0
+        project_hash = AssetCacheManager.compute_hash(
+            segment_material(project, 0, total_frames)
+        )
+
+        checkpoint = RenderCheckpoint(
+            self.work_dir,
+            project_hash,
+            segments,
+            suffix=Path(output_path).suffix or ".mp4",
+        )
+        if self.resume and checkpoint.resume():
+            context.report_progress(
+                f"チェックポイントから再開: {len(checkpoint.completed)}/"
+                f"{len(segments)}セグメントを再利用"
+            )
+        else:
+            shutil.rmtree(self.work_dir, ignore_errors=True)
+        checkpoint.save()
+
+        paths = checkpoint.segment_paths
+        for index in checkpoint.pending:
+            start_frame, end_frame = segments[index]
+            context.report_progress(
+                f"セグメントを出力中 ({index + 1}/{len(segments)}, "
+                f"フレーム {start_frame}-{end_frame})..."
+            )
+            # 書き込み途中のファイルを完了済みと取り違えないよう別名で書く
+            partial = Path(paths[index]).with_suffix(f".part{checkpoint.suffix}")
+            write_video_pipe(
+                clip,
+                str(partial),
+                fps=output_config.fps,
+                codec=output_config.codec,
+                bitrate=output_config.bitrate,
+                preset=output_config.preset,
+                threads=output_config.threads,
+                logger=logger,
+                start_frame=start_frame,
+                end_frame=end_frame,
+                audio=False,
+                frame_workers=output_config.frame_workers,
+                frame_window=output_config.frame_window,
+            )
+            os.replace(partial, paths[index])
+            checkpoint.mark_done(index)
+
+        audio_path = self.audio_path
+        if audio_path is None and clip.audio is not None:
+            context.report_progress("音声トラックを出力中...")
+            audio_path = str(
+                Path(self.work_dir)
+                / f"audio.{find_extension(output_config.audio_codec)}"
+            )
+            write_audio_track(
+                clip.audio.with_duration(duration),
+                audio_path,
+                codec=output_config.audio_codec,
+                logger=logger,
+            )
+
+        context.report_progress("セグメントを結合中...")
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        concat_segments(paths, output_path, audio_path=audio_path)
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+        return context
+
+
+class AudioTrackOutputStep(ProcessingStep):
+    """音声トラック出力ステップ
+
+    合成済みの音声トラックだけをエンコードして書き出す。
+    時間分割レンダリングで、チャンクの結合時に一度だけ多重化するために使う。
+    """
+
+    def __init__(self, path: str):
+        """初期化
+
+        Args:
+            path: 音声の出力ファイルパス
+        """
+        super().__init__()
+        self.path = path
+
+    def process(self, context: ProcessingContext) -> ProcessingContext:
+        """音声トラックを出力
+
+        Args:
+            context: 処理コンテキスト
+
+        Returns:
+            更新されたコンテキスト
+        """
+        audio = context.video_clip.audio
+        if audio is None:
+            return context
+
+        context.report_progress("音声トラックを出力中...")
+
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        write_audio_track(
+            audio.with_duration(context.video_clip.duration),
+            self.path,
+            codec=context.project.output.audio_codec,
+            logger=context.logger,
+        )
+
+        return context
+
+
+class NullOutputStep(ProcessingStep):
+    """フレームを生成して捨てる出力ステップ
+
+    エンコードを行わず、合成までのフレーム生成のコストだけを計測する
+    ベンチマークで使う。フレームの生成方法（frame_workers）は
+    動画出力と同じ設定に従う。
+    """
+
+    def __init__(self, next_step: ProcessingStep = None):
+        """初期化
+
+        Args:
+            next_step: 次の処理ステップ（オプション）
+        """
+        super().__init__(next_step)
+        self.frames = 0
+
+    def process(self, context: ProcessingContext) -> ProcessingContext:
+        """全フレームを生成
+
+        Args:
+            context: 処理コンテキスト
+
+        Returns:
+            更新されたコンテキスト
+        """
+        context.report_progress("フレームを生成中（出力なし）...")
+
+        output_config = context.project.output
+        if output_config.frame_workers > 1:
+            frames = FrameScheduler(
+                context.video_clip,
+                output_config.fps,
+                workers=output_config.frame_workers,
+                window=output_config.frame_window,
+            )
+        else:
+            frames = FrameProducer(context.video_clip, output_config.fps)
+
+        self.frames = sum(1 for _ in frames)
+
+        return context
@@ -3,6 +3,7 @@
 from ..pipeline import ProcessingStep
 from ..context import ProcessingContext
 from ...layer.processors.video import StampLayerProcessor
+from ...render import mark_static_overlay, profile_clip
 
 
 class StampLayerProcessingStep(ProcessingStep):
@@ -38,18 +39,14 @@ class StampLayerProcessingStep(ProcessingStep):
 
         context.report_progress("スタンプを処理中...")
 
-        from moviepy import CompositeVideoClip
-
-        stamp_clips = []
+        # スタンプをオーバーレイとして登録（合成は OverlayCompositingStep で行う）
         for stamp_layer in timeline.stamp_layers:
             stamp_clip = self.stamp_processor.execute(
                 stamp_layer, output_size=context.output_size
             )
-            stamp_clips.append(stamp_clip)
-
-        # ベース動画とスタンプを合成
-        context.video_clip = CompositeVideoClip(
-            [context.video_clip] + stamp_clips, size=context.output_size
-        )
+            # エフェクトのないスタンプは表示中に変化しないため事前合成の対象
+            if not stamp_layer.effects:
+                mark_static_overlay(stamp_clip)
+            context.overlay_clips.append(profile_clip(stamp_clip, "layer", "stamp"))
 
         return context
@@ -5,6 +5,7 @@ from pathlib import Path
 from ..pipeline import ProcessingStep
 from ..context import ProcessingContext
 from ...layer.processors.subtitle import SubtitleBurnProcessor, SubtitleExportProcessor
+from ...render import mark_static_overlay, profile_clip
 
 
 class SubtitleProcessingStep(ProcessingStep):
@@ -45,9 +46,15 @@ class SubtitleProcessingStep(ProcessingStep):
         subtitle_mode = output_config.subtitle_mode
 
         if subtitle_mode == "burn":
-            # 字幕を動画に焼き込む
-            context.video_clip = self.subtitle_burn_processor.execute(
-                (context.video_clip, timeline.subtitle_layers)
+            # 字幕をオーバーレイとして登録（合成は OverlayCompositingStep で行う）
+            # 字幕アイテムは表示中に変化しないため事前合成の対象
+            video_size = context.output_size or tuple(context.video_clip.size)
+            subtitle_clips = self.subtitle_burn_processor.create_clips(
+                timeline.subtitle_layers, video_size
+            )
+            context.overlay_clips.extend(
+                profile_clip(mark_static_overlay(clip), "layer", "subtitle")
+                for clip in subtitle_clips
             )
         elif subtitle_mode in ["srt", "vtt"]:
             # 字幕ファイルを別途出力
@@ -3,6 +3,8 @@
 from ..pipeline import ProcessingStep
 from ..context import ProcessingContext
 from ...layer.processors import VideoProcessor
+from ...effect.processors import EffectProcessor
+from ...render.decoder_pool import DecoderPool
 
 
 class VideoLayerProcessingStep(ProcessingStep):
@@ -38,10 +40,30 @@ class VideoLayerProcessingStep(ProcessingStep):
             output_config.height,
         )
 
+        layers = timeline.video_layers
+        if output_config.render_scale != 1.0:
+            # 縮小描画ではピクセル単位のエフェクトパラメータも縮める
+            layers = [
+                layer.model_copy(
+                    update={
+                        "effects": EffectProcessor.scale_effects(
+                            layer.effects, output_config.render_scale
+                        )
+                    }
+                )
+                for layer in layers
+            ]
+
+        # 動画素材のデコーダーはレンダリングの終了時に CleanupStep で閉じる
+        context.decoder_pool = DecoderPool(max_open=output_config.max_decoders)
+
+        # レイアウトは output_size、背景の動画・画像は描画解像度で処理する
         context.video_clip = self.video_processor.execute(
-            timeline.video_layers,
-            output_size=context.output_size,
+            layers,
+            output_size=output_config.render_size,
             object_fit=output_config.object_fit,
+            decoder_pool=context.decoder_pool,
+            loop_cache_mb=output_config.loop_cache_mb,
         )
 
         return context
@@ -1,9 +1,10 @@
 """音声処理プロセッサー"""
 
 from pathlib import Path
-from moviepy import AudioFileClip, CompositeAudioClip
+from moviepy import AudioFileClip
 from ..models import AudioLayer
 from ...core import ProcessorBase
+from ...render.audio_mixer import AudioMixer, MixedAudioClip
 
 
 class AudioLayerProcessor(ProcessorBase[AudioLayer, AudioFileClip]):
@@ -33,9 +34,34 @@ class AudioLayerProcessor(ProcessorBase[AudioLayer, AudioFileClip]):
 
         return clip
 
+    def add_to_mixer(self, layer: AudioLayer, mixer: AudioMixer) -> None:
+        """音声レイヤーをミキサーに配置する
 
-class AudioProcessor(ProcessorBase[list[AudioLayer], CompositeAudioClip | None]):
-    """音声タイムライン処理プロセッサー"""
+        process と同じ音量・継続時間・開始時間で配置する。
+
+        Args:
+            layer: 音声レイヤー
+            mixer: 配置先のミキサー
+
+        Raises:
+            ValueError: バリデーションに失敗した場合
+        """
+        if not self.validate(layer):
+            raise ValueError(f"Validation failed for {type(layer).__name__}")
+
+        mixer.add_file(
+            layer.path,
+            start=layer.start_time,
+            gain=layer.volume,
+            duration=layer.duration,
+        )
+
+
+class AudioProcessor(ProcessorBase[list[AudioLayer], MixedAudioClip | None]):
+    """音声タイムライン処理プロセッサー
+
+    すべての音声レイヤーを AudioMixer で1本の PCM バッファに合成する。
+    """
 
     def __init__(self, audio_processor: AudioLayerProcessor = None):
         self.audio_processor = audio_processor or AudioLayerProcessor()
@@ -45,15 +71,13 @@ class AudioProcessor(ProcessorBase[list[AudioLayer], CompositeAudioClip | None])
         # 空の場合も許可（Noneを返すため）
         return True
 
-    def process(self, layers: list[AudioLayer], **kwargs) -> CompositeAudioClip | None:
+    def process(self, layers: list[AudioLayer], **kwargs) -> MixedAudioClip | None:
         """音声レイヤーを処理して合成"""
         if not layers:
             return None
 
-        audio_clips = [self.audio_processor.execute(layer) for layer in layers]
+        mixer = AudioMixer()
+        for layer in layers:
+            self.audio_processor.add_to_mixer(layer, mixer)
 
-        # 複数の音声を合成
-        if len(audio_clips) == 1:
-            return audio_clips[0]
-        else:
-            return CompositeAudioClip(audio_clips)
+        return mixer.to_clip()
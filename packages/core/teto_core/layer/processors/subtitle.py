@@ -69,23 +69,41 @@ class SubtitleBurnProcessor(
         # 字幕配置の基準サイズ（指定がない場合は動画サイズ）
         subtitle_base_size = output_size if output_size else (video.w, video.h)
 
+        subtitle_clips = self.create_clips(subtitle_layers, subtitle_base_size)
+
+        if subtitle_clips:
+            # 合成サイズも output_size を使用
+            composite_size = output_size if output_size else (video.w, video.h)
+            return CompositeVideoClip([video] + subtitle_clips, size=composite_size)
+        else:
+            return video
+
+    def create_clips(
+        self, subtitle_layers: list[SubtitleLayer], video_size: tuple[int, int]
+    ) -> list[VideoClip]:
+        """字幕レイヤーから配置済みの字幕クリップを作成
+
+        動画への合成は行わないため、他のオーバーレイとまとめて合成できる。
+
+        Args:
+            subtitle_layers: 字幕レイヤーのリスト
+            video_size: 字幕配置の基準サイズ (width, height)
+
+        Returns:
+            開始時間・位置を設定した字幕クリップのリスト
+        """
         subtitle_clips = []
 
         for layer in subtitle_layers:
             for item in layer.items:
                 try:
-                    clip = self._create_subtitle_clip(item, layer, subtitle_base_size)
+                    clip = self._create_subtitle_clip(item, layer, video_size)
                     subtitle_clips.append(clip)
                 except Exception as e:
                     print(f"Warning: Failed to create subtitle clip: {e}")
                     continue
 
-        if subtitle_clips:
-            # 合成サイズも output_size を使用
-            composite_size = output_size if output_size else (video.w, video.h)
-            return CompositeVideoClip([video] + subtitle_clips, size=composite_size)
-        else:
-            return video
+        return subtitle_clips
 
     def _calculate_position(
         self, layer: SubtitleLayer, clip_height: int, video_size: tuple[int, int]
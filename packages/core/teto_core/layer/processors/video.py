@@ -5,13 +5,18 @@ from moviepy import (
     VideoFileClip,
     ImageClip,
     CompositeVideoClip,
-    concatenate_videoclips,
     ColorClip,
 )
-from moviepy.video.fx import CrossFadeIn, CrossFadeOut
 from ..models import VideoLayer, ImageLayer, StampLayer, PositionPreset
 from ...effect.processors import EffectProcessor
 from ...core import ProcessorBase
+from ...render.scheduler import serialize_reader
+from ...render.decoder_pool import DecoderPool, DEFAULT_MAX_DECODERS
+from ...render.profiler import profile_clip
+from ...render.looped_clip import LoopedClip, DEFAULT_LOOP_CACHE_MB
+from ...render.static_spans import mark_static_overlay
+from ...render.indexed_clips import concatenate_videoclips_indexed
+from ...render.transitions import TransitionSequenceClip
 from typing import Union
 
 
@@ -171,22 +176,25 @@ class VideoLayerProcessor(ProcessorBase[VideoLayer, VideoFileClip]):
     def __init__(self, effect_processor: EffectProcessor = None):
         self.effect_processor = effect_processor or EffectProcessor()
 
-    def _loop_clip(self, clip: VideoFileClip, target_duration: float) -> VideoFileClip:
-        """動画をループして指定時間まで延長する"""
-        clips = []
-        total_duration = 0.0
-
-        while total_duration < target_duration:
-            remaining = target_duration - total_duration
-            if remaining >= clip.duration:
-                clips.append(clip)
-                total_duration += clip.duration
-            else:
-                # 最後の部分は必要な長さだけカット
-                clips.append(clip.subclipped(0, remaining))
-                total_duration += remaining
-
-        return concatenate_videoclips(clips, method="compose")
+    def _loop_clip(
+        self,
+        clip: VideoFileClip,
+        target_duration: float,
+        loop_cache_mb: int = DEFAULT_LOOP_CACHE_MB,
+    ) -> LoopedClip:
+        """動画をループして指定時間まで延長する
+
+        Args:
+            clip: ループする動画
+            target_duration: ループ後の長さ（秒）
+            loop_cache_mb: 素材のフレームをメモリに保持する上限（MB）
+
+        Returns:
+            時刻を素材の長さで折り返すクリップ
+        """
+        return LoopedClip(
+            clip, target_duration, max_cache_bytes=loop_cache_mb * 1024 * 1024
+        )
 
     def validate(self, layer: VideoLayer, **kwargs) -> bool:
         """動画ファイルの存在チェック"""
@@ -200,8 +208,12 @@ class VideoLayerProcessor(ProcessorBase[VideoLayer, VideoFileClip]):
         output_size = kwargs.get("output_size")
         object_fit = kwargs.get("object_fit", "cover")
 
-        # 動画を読み込む
-        clip = VideoFileClip(layer.path)
+        # 動画を読み込む（フレームの並行生成に備えてリーダーを直列化）
+        decoder_pool: DecoderPool | None = kwargs.get("decoder_pool")
+        if decoder_pool is not None:
+            clip = decoder_pool.open_clip(layer.path)
+        else:
+            clip = serialize_reader(VideoFileClip(layer.path))
 
         # 音量調整
         if clip.audio and layer.volume != 1.0:
@@ -213,7 +225,11 @@ class VideoLayerProcessor(ProcessorBase[VideoLayer, VideoFileClip]):
             should_loop = layer.loop is not False
             if should_loop and layer.duration > clip.duration:
                 # ループ再生: 動画が短い場合は繰り返す
-                clip = self._loop_clip(clip, layer.duration)
+                clip = self._loop_clip(
+                    clip,
+                    layer.duration,
+                    kwargs.get("loop_cache_mb", DEFAULT_LOOP_CACHE_MB),
+                )
             else:
                 clip = clip.subclipped(0, min(layer.duration, clip.duration))
 
@@ -285,7 +301,7 @@ class ImageLayerProcessor(ProcessorBase[ImageLayer, ImageClip]):
                 # 2. エフェクトを適用（リサイズ後のサイズで）
                 effect_size = resized_clip.size
                 effect_clip = self.effect_processor.apply_effects(
-                    resized_clip, layer.effects, effect_size
+                    resized_clip, layer.effects, effect_size, static_source=True
                 )
                 # 3. 背景を追加して中央配置（黒背景は静止したまま）
                 clip = add_background_padding(effect_clip, target_size)
@@ -293,13 +309,13 @@ class ImageLayerProcessor(ProcessorBase[ImageLayer, ImageClip]):
                 # fill モード: 引き伸ばしてからエフェクト適用
                 resized_clip = resize_with_fill(clip, target_size)
                 clip = self.effect_processor.apply_effects(
-                    resized_clip, layer.effects, target_size
+                    resized_clip, layer.effects, target_size, static_source=True
                 )
             else:  # cover (default)
                 # cover モード: トリミングしてからエフェクト適用
                 resized_clip = resize_with_cover(clip, target_size)
                 clip = self.effect_processor.apply_effects(
-                    resized_clip, layer.effects, target_size
+                    resized_clip, layer.effects, target_size, static_source=True
                 )
         else:
             # エフェクトがない場合は通常のリサイズ
@@ -390,7 +406,9 @@ class StampLayerProcessor(ProcessorBase[StampLayer, ImageClip]):
         if layer.effects:
             # スタンプのサイズを取得（スケール適用後）
             stamp_size = (int(clip.w), int(clip.h))
-            clip = self.effect_processor.apply_effects(clip, layer.effects, stamp_size)
+            clip = self.effect_processor.apply_effects(
+                clip, layer.effects, stamp_size, static_source=True
+            )
 
         # 開始時間の設定
         clip = clip.with_start(layer.start_time)
@@ -429,22 +447,38 @@ class VideoProcessor(ProcessorBase[list[Union[VideoLayer, ImageLayer]], VideoFil
         output_size = kwargs["output_size"]
         object_fit = kwargs.get("object_fit", "cover")
 
+        # 動画素材のデコーダーは表示区間に合わせて開閉する
+        # （閉じるのはプールを渡した呼び出し側の責任）
+        decoder_pool: DecoderPool | None = kwargs.get("decoder_pool")
+        if decoder_pool is None:
+            decoder_pool = DecoderPool(
+                max_open=kwargs.get("max_decoders", DEFAULT_MAX_DECODERS)
+            )
+
         # レイヤーとクリップのペアを作成
         layer_clips: list[tuple[Union[VideoLayer, ImageLayer], any]] = []
 
         for layer in layers:
             if isinstance(layer, VideoLayer):
                 clip = self.video_processor.execute(
-                    layer, output_size=output_size, object_fit=object_fit
+                    layer,
+                    output_size=output_size,
+                    object_fit=object_fit,
+                    decoder_pool=decoder_pool,
+                    loop_cache_mb=kwargs.get("loop_cache_mb", DEFAULT_LOOP_CACHE_MB),
                 )
             elif isinstance(layer, ImageLayer):
                 clip = self.image_processor.execute(
                     layer, target_size=output_size, object_fit=object_fit
                 )
+                # エフェクトのない画像は表示中に変化しないため静止区間の対象
+                # （時間変化しないエフェクトだけの画像は apply_effects でマーク済み）
+                if not layer.effects:
+                    mark_static_overlay(clip)
             else:
                 continue
 
-            layer_clips.append((layer, clip))
+            layer_clips.append((layer, profile_clip(clip, "layer", layer.type)))
 
         if not layer_clips:
             raise ValueError("No valid layers to process")
@@ -452,36 +486,26 @@ class VideoProcessor(ProcessorBase[list[Union[VideoLayer, ImageLayer]], VideoFil
         # トランジションがない場合は単純に連結
         if not any(layer.transition for layer, _ in layer_clips[:-1]):
             clips = [clip for _, clip in layer_clips]
-            final_clip = concatenate_videoclips(clips, method="compose")
-            return final_clip
-
-        # トランジションがある場合は CompositeVideoClip で合成
-        composite_clips = []
-        current_time = 0.0
-
-        for i, (layer, clip) in enumerate(layer_clips):
-            is_last = i == len(layer_clips) - 1
-            prev_layer = layer_clips[i - 1][0] if i > 0 else None
-
-            # 前のレイヤーからのトランジションがある場合、フェードインを適用
-            if prev_layer and prev_layer.transition:
-                clip = clip.with_effects([CrossFadeIn(prev_layer.transition.duration)])
-
-            # 次のレイヤーへのトランジションがある場合、フェードアウトを適用
-            if not is_last and layer.transition:
-                clip = clip.with_effects([CrossFadeOut(layer.transition.duration)])
-
-            # 開始時間を設定
-            clip = clip.with_start(current_time)
-            composite_clips.append(clip)
-
-            # 次のクリップの開始時間を計算（トランジション分オーバーラップ）
-            overlap = (
-                layer.transition.duration if (not is_last and layer.transition) else 0
-            )
-            current_time += clip.duration - overlap
-
-        # CompositeVideoClip で合成
-        final_clip = CompositeVideoClip(composite_clips, size=output_size)
+            current_time = 0.0
+            for layer, clip in layer_clips:
+                if isinstance(layer, VideoLayer):
+                    decoder_pool.add_window(
+                        layer.path, current_time, current_time + clip.duration
+                    )
+                current_time += clip.duration
+            final_clip = concatenate_videoclips_indexed(clips)
+            return decoder_pool.attach(final_clip)
+
+        # トランジションがある場合は隣接する2クリップだけをブレンドして合成
+        transitions = [
+            layer.transition.duration if layer.transition else 0.0
+            for layer, _ in layer_clips[:-1]
+        ]
+        final_clip = TransitionSequenceClip(
+            [clip for _, clip in layer_clips], transitions, size=output_size
+        )
+        for (layer, _), clip in zip(layer_clips, final_clip.clips):
+            if isinstance(layer, VideoLayer):
+                decoder_pool.add_window(layer.path, clip.start, clip.end)
 
-        return final_clip
+        return decoder_pool.attach(final_clip)
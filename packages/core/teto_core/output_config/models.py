@@ -24,6 +24,10 @@ ASPECT_RATIO_RESOLUTIONS: dict[VideoAspectRatio, tuple[int, int]] = {
     VideoAspectRatio.WIDE_21_9: (2560, 1080),
 }
 
+# ドラフト出力の既定値（画素数 1/4・フレームレート 12fps で約 1/10 の処理量）
+DRAFT_RENDER_SCALE = 0.5
+DRAFT_MAX_FPS = 12
+
 
 class OutputSettings(BaseModel):
     """出力設定（パスなし、Script用）"""
@@ -53,6 +57,33 @@ class OutputSettings(BaseModel):
         "cover",
         description="リサイズモード（contain: 余白あり, cover: トリミング, fill: 引き伸ばし）",
     )
+    encoder: Literal["moviepy", "ffmpeg_pipe"] = Field(
+        "moviepy",
+        description="出力バックエンド（moviepy: write_videofile, ffmpeg_pipe: ffmpeg への直接パイプ）",
+    )
+    threads: int | None = Field(
+        None, description="ffmpeg のエンコードスレッド数（未指定時は自動）", gt=0
+    )
+    frame_workers: int = Field(
+        1,
+        description="フレーム生成の並列スレッド数（ffmpeg_pipe 出力時のみ有効）",
+        ge=1,
+    )
+    frame_window: int | None = Field(
+        None,
+        description="並列生成で先行生成するフレーム数（未指定時はスレッド数の2倍）",
+        ge=1,
+    )
+    max_decoders: int = Field(
+        4,
+        description="同時に開く動画デコーダー（ffmpeg プロセス）の最大数",
+        ge=1,
+    )
+    loop_cache_mb: int = Field(
+        512,
+        description="ループ再生する動画のフレームをメモリに保持する上限（MB、素材ごと）",
+        ge=0,
+    )
 
     @model_validator(mode="after")
     def apply_aspect_ratio(self) -> "OutputSettings":
@@ -89,6 +120,39 @@ class OutputConfig(BaseModel):
         "cover",
         description="リサイズモード（contain: 余白あり, cover: トリミング, fill: 引き伸ばし）",
     )
+    encoder: Literal["moviepy", "ffmpeg_pipe"] = Field(
+        "moviepy",
+        description="出力バックエンド（moviepy: write_videofile, ffmpeg_pipe: ffmpeg への直接パイプ）",
+    )
+    threads: int | None = Field(
+        None, description="ffmpeg のエンコードスレッド数（未指定時は自動）", gt=0
+    )
+    frame_workers: int = Field(
+        1,
+        description="フレーム生成の並列スレッド数（ffmpeg_pipe 出力時のみ有効）",
+        ge=1,
+    )
+    frame_window: int | None = Field(
+        None,
+        description="並列生成で先行生成するフレーム数（未指定時はスレッド数の2倍）",
+        ge=1,
+    )
+    max_decoders: int = Field(
+        4,
+        description="同時に開く動画デコーダー（ffmpeg プロセス）の最大数",
+        ge=1,
+    )
+    loop_cache_mb: int = Field(
+        512,
+        description="ループ再生する動画のフレームをメモリに保持する上限（MB、素材ごと）",
+        ge=0,
+    )
+    render_scale: float = Field(
+        1.0,
+        description="描画解像度の縮尺（ドラフト用。レイアウトは width/height を基準に計算）",
+        gt=0,
+        le=1.0,
+    )
 
     @model_validator(mode="after")
     def apply_aspect_ratio(self) -> "OutputConfig":
@@ -114,4 +178,49 @@ class OutputConfig(BaseModel):
             preset=settings.preset,
             subtitle_mode=settings.subtitle_mode,
             object_fit=settings.object_fit,
+            encoder=settings.encoder,
+            threads=settings.threads,
+            frame_workers=settings.frame_workers,
+            frame_window=settings.frame_window,
+            max_decoders=settings.max_decoders,
+            loop_cache_mb=settings.loop_cache_mb,
+        )
+
+    @property
+    def render_size(self) -> tuple[int, int]:
+        """実際に描画する解像度 (width, height)
+
+        render_scale を掛けた解像度。yuv420p でエンコードできるよう偶数に丸める。
+        """
+        if self.render_scale == 1.0:
+            return (self.width, self.height)
+        return (
+            max(2, round(self.width * self.render_scale / 2) * 2),
+            max(2, round(self.height * self.render_scale / 2) * 2),
+        )
+
+    def draft(
+        self, scale: float = DRAFT_RENDER_SCALE, max_fps: int = DRAFT_MAX_FPS
+    ) -> "OutputConfig":
+        """プレビュー用のドラフト出力設定を作成
+
+        解像度とフレームレートを下げ、最速のプリセットでエンコードする。
+        レイアウトや字幕サイズは元の width/height を基準に計算されたうえで
+        縮小されるため、本番出力と同じ比率で確認できる。
+
+        Args:
+            scale: 描画解像度の縮尺
+            max_fps: フレームレートの上限
+
+        Returns:
+            ドラフト用の出力設定
+        """
+        return self.model_copy(
+            update={
+                "render_scale": self.render_scale * scale,
+                "fps": min(self.fps, max_fps),
+                "preset": "ultrafast",
+                "bitrate": None,
+                "encoder": "ffmpeg_pipe",
+            }
         )
@@ -0,0 +1,79 @@
+"""Render domain - Frame compositing for the generator pipeline"""
+
+from .compositor import (
+    FlattenedCompositeClip,
+    mark_static_overlay,
+    is_static_overlay,
+    scale_overlay,
+)
+from .interval_index import IntervalIndex
+from .static_spans import find_static_spans, repeated_frames
+from .indexed_clips import (
+    IndexedCompositeVideoClip,
+    IndexedCompositeAudioClip,
+    concatenate_videoclips_indexed,
+)
+from .transitions import TransitionSequenceClip
+from .audio_mixer import (
+    AudioMixer,
+    DecodedAudioFileClip,
+    MixedAudioClip,
+    decode_audio,
+    write_audio_track,
+)
+from .ffmpeg_pipe import (
+    EncodeStats,
+    FFmpegPipeWriter,
+    FrameProducer,
+    write_video_pipe,
+)
+from .scheduler import FrameScheduler, SerializedFrameReader, serialize_reader
+from .decoder_pool import DecoderPool, PooledFrameReader
+from .looped_clip import LoopedClip
+from .chunked import plan_chunks, scene_chunks, concat_segments
+from .checkpoint import RenderCheckpoint
+from .profiler import (
+    FrameCost,
+    RenderProfiler,
+    StepProfile,
+    current_profiler,
+    profile_clip,
+)
+
+__all__ = [
+    "FlattenedCompositeClip",
+    "mark_static_overlay",
+    "is_static_overlay",
+    "scale_overlay",
+    "IntervalIndex",
+    "find_static_spans",
+    "repeated_frames",
+    "IndexedCompositeVideoClip",
+    "IndexedCompositeAudioClip",
+    "concatenate_videoclips_indexed",
+    "TransitionSequenceClip",
+    "AudioMixer",
+    "DecodedAudioFileClip",
+    "MixedAudioClip",
+    "decode_audio",
+    "write_audio_track",
+    "EncodeStats",
+    "FFmpegPipeWriter",
+    "FrameProducer",
+    "write_video_pipe",
+    "FrameScheduler",
+    "SerializedFrameReader",
+    "serialize_reader",
+    "DecoderPool",
+    "PooledFrameReader",
+    "LoopedClip",
+    "plan_chunks",
+    "scene_chunks",
+    "concat_segments",
+    "RenderCheckpoint",
+    "FrameCost",
+    "RenderProfiler",
+    "StepProfile",
+    "current_profiler",
+    "profile_clip",
+]
@@ -0,0 +1,372 @@
+"""PCM バッファ上で音声を合成するオフラインミキサー"""
+
+import subprocess
+import threading
+from dataclasses import dataclass
+
+import numpy as np
+from moviepy import AudioClip
+from moviepy.config import FFMPEG_BINARY
+
+# 合成・出力のサンプルレート（MoviePy の音声出力と同じ）
+DEFAULT_AUDIO_FPS = 44100
+
+
+def decode_audio(
+    path: str,
+    fps: int = DEFAULT_AUDIO_FPS,
+    nchannels: int = 2,
+    ffmpeg_binary: str = FFMPEG_BINARY,
+) -> np.ndarray:
+    """音声ファイルを float32 の PCM にデコードする
+
+    ffmpeg を1回だけ起動してファイル全体を指定のサンプルレート・
+    チャンネル数に変換する。
+
+    Args:
+        path: 音声（または音声付き動画）ファイルのパス
+        fps: サンプルレート
+        nchannels: チャンネル数
+        ffmpeg_binary: ffmpeg 実行ファイルのパス
+
+    Returns:
+        (サンプル数, チャンネル数) の float32 配列
+
+    Raises:
+        OSError: デコードに失敗した場合
+    """
+    cmd = [
+        ffmpeg_binary,
+        "-loglevel",
+        "error",
+        "-i",
+        path,
+        "-vn",
+        "-f",
+        "f32le",
+        "-acodec",
+        "pcm_f32le",
+        "-ar",
+        str(fps),
+        "-ac",
+        str(nchannels),
+        "-",
+    ]
+    result = subprocess.run(cmd, capture_output=True)
+    if result.returncode != 0:
+        raise OSError(
+            f"音声のデコードに失敗しました ({path}): "
+            f"{result.stderr.decode(errors='replace').strip()}"
+        )
+    return np.frombuffer(result.stdout, dtype=np.float32).reshape(-1, nchannels)
+
+
+@dataclass
+class _Track:
+    """タイムラインに配置した音声"""
+
+    samples: np.ndarray
+    start: int  # 開始位置（サンプル）
+    gain: float
+
+
+class AudioMixer:
+    """複数の音声を1本の float32 バッファに合成するミキサー
+
+    CompositeAudioClip はチャンクごとに全クリップの再生判定と読み出しを
+    行い、ソースごとに ffmpeg のリーダーを開いたままにする。このミキサーは
+    各ソースを一度だけ PCM にデコードし、配置位置へのゲイン付き加算を
+    NumPy のスライス演算で行う。同じファイルを複数回配置した場合も
+    デコードは1回で済む。
+    """
+
+    def __init__(self, fps: int = DEFAULT_AUDIO_FPS, nchannels: int = 2):
+        """初期化
+
+        Args:
+            fps: サンプルレート
+            nchannels: チャンネル数
+        """
+        self.fps = fps
+        self.nchannels = nchannels
+        self._tracks: list[_Track] = []
+        self._decoded: dict[str, np.ndarray] = {}
+
+    def decode(self, path: str) -> np.ndarray:
+        """音声ファイルをデコードする（同じパスは再利用）
+
+        Args:
+            path: 音声ファイルのパス
+
+        Returns:
+            (サンプル数, チャンネル数) の float32 配列
+        """
+        if path not in self._decoded:
+            self._decoded[path] = decode_audio(path, self.fps, self.nchannels)
+        return self._decoded[path]
+
+    def add(
+        self,
+        samples: np.ndarray,
+        start: float = 0.0,
+        gain: float = 1.0,
+        duration: float | None = None,
+    ) -> None:
+        """PCM をタイムラインに配置する
+
+        Args:
+            samples: (サンプル数, チャンネル数) の配列（モノラルは複製して使う）
+            start: 開始時刻（秒）
+            gain: 音量の倍率
+            duration: 使用する長さ（秒）。省略時は全体
+        """
+        samples = np.asarray(samples, dtype=np.float32)
+        if samples.ndim == 1:
+            samples = samples[:, np.newaxis]
+        if samples.shape[1] != self.nchannels:
+            # チャンネル数が異なる場合は平均してから複製する
+            samples = np.repeat(
+                samples.mean(axis=1, keepdims=True), self.nchannels, axis=1
+            )
+        if duration is not None:
+            samples = samples[: max(round(duration * self.fps), 0)]
+        self._tracks.append(_Track(samples, round(start * self.fps), gain))
+
+    def add_file(
+        self,
+        path: str,
+        start: float = 0.0,
+        gain: float = 1.0,
+        duration: float | None = None,
+    ) -> None:
+        """音声ファイルをタイムラインに配置する
+
+        Args:
+            path: 音声ファイルのパス
+            start: 開始時刻（秒）
+            gain: 音量の倍率
+            duration: 使用する長さ（秒）。省略時はファイル全体
+        """
+        self.add(self.decode(path), start=start, gain=gain, duration=duration)
+
+    @property
+    def duration(self) -> float:
+        """配置した音声の終了時刻（秒）"""
+        end = max((t.start + len(t.samples) for t in self._tracks), default=0)
+        return end / self.fps
+
+    def mix(self, duration: float | None = None) -> np.ndarray:
+        """配置した音声を合成する
+
+        Args:
+            duration: 出力の長さ（秒）。省略時は最後の音声の終了まで
+
+        Returns:
+            (サンプル数, チャンネル数) の float32 配列
+        """
+        if duration is None:
+            duration = self.duration
+        total = round(duration * self.fps)
+        buffer = np.zeros((total, self.nchannels), dtype=np.float32)
+
+        for track in self._tracks:
+            start = max(track.start, 0)
+            end = min(track.start + len(track.samples), total)
+            if end <= start:
+                continue
+            segment = track.samples[start - track.start : end - track.start]
+            if track.gain == 1.0:
+                buffer[start:end] += segment
+            else:
+                buffer[start:end] += segment * np.float32(track.gain)
+
+        return buffer
+
+    def to_clip(self, duration: float | None = None) -> "MixedAudioClip":
+        """合成結果を音声クリップとして取得
+
+        Args:
+            duration: 出力の長さ（秒）。省略時は最後の音声の終了まで
+
+        Returns:
+            合成済みの音声クリップ
+        """
+        return MixedAudioClip(self.mix(duration), self.fps)
+
+
+class MixedAudioClip(AudioClip):
+    """合成済みの PCM バッファを再生する音声クリップ
+
+    フレームの要求はバッファのインデックス参照だけで返す。
+    write_audio_track ではバッファをそのままエンコーダーに渡す。
+    """
+
+    def __init__(self, samples: np.ndarray, fps: int = DEFAULT_AUDIO_FPS):
+        """初期化
+
+        Args:
+            samples: (サンプル数, チャンネル数) の float32 配列
+            fps: サンプルレート
+        """
+        self.samples = samples
+        super().__init__(
+            frame_function=self._sample_at,
+            duration=len(samples) / fps,
+            fps=fps,
+        )
+        self.nchannels = samples.shape[1]
+        # transform などで frame_function が差し替えられたかを判定するため保持
+        self._buffer_frame_function = self.frame_function
+
+    @property
+    def is_unmodified(self) -> bool:
+        """フレームがバッファそのままか（音量変更などの加工がないか）"""
+        return self.frame_function is self._buffer_frame_function
+
+    def _sample_at(self, t):
+        """時刻 t（スカラーまたは配列）のサンプルを取得"""
+        return _index_samples(self.samples, t, self.fps)
+
+
+class DecodedAudioFileClip(AudioClip):
+    """最初に使われた時点でファイル全体をデコードする音声クリップ
+
+    AudioFileClip は作成時に ffmpeg のリーダーを開き、クリップを閉じるまで
+    プロセスを保持する。動画素材の埋め込み音声は合成時に一度読むだけなので、
+    プロセスを開いたままにせず、必要になった時点で PCM に一括デコードする。
+    """
+
+    def __init__(
+        self,
+        path: str,
+        duration: float,
+        fps: int = DEFAULT_AUDIO_FPS,
+        nchannels: int = 2,
+    ):
+        """初期化
+
+        Args:
+            path: 音声（または音声付き動画）ファイルのパス
+            duration: 長さ（秒）
+            fps: サンプルレート
+            nchannels: チャンネル数
+        """
+        self.filename = path
+        self._samples: np.ndarray | None = None
+        self._decode_lock = threading.Lock()
+        # frame_function を渡すと AudioClip が先頭フレームを読むため後から設定する
+        super().__init__(duration=duration, fps=fps)
+        self.frame_function = self._sample_at
+        self.nchannels = nchannels
+
+    @property
+    def samples(self) -> np.ndarray:
+        """デコード済みの PCM（初回アクセス時にデコード）"""
+        with self._decode_lock:
+            if self._samples is None:
+                self._samples = decode_audio(self.filename, self.fps, self.nchannels)
+            return self._samples
+
+    def _sample_at(self, t):
+        """時刻 t（スカラーまたは配列）のサンプルを取得"""
+        return _index_samples(self.samples, t, self.fps)
+
+
+def _index_samples(samples: np.ndarray, t, fps: int) -> np.ndarray:
+    """PCM バッファから時刻 t（スカラーまたは配列）のサンプルを取り出す
+
+    範囲外の時刻は無音にする。
+
+    Args:
+        samples: (サンプル数, チャンネル数) の配列
+        t: 時刻（秒）
+        fps: サンプルレート
+
+    Returns:
+        サンプル
+    """
+    nchannels = samples.shape[1]
+    index = np.round(np.asarray(t) * fps).astype(np.int64)
+    in_range = (index >= 0) & (index < len(samples))
+    if index.ndim == 0:
+        if not in_range:
+            return np.zeros(nchannels, dtype=np.float32)
+        return samples[index]
+    frames = np.zeros((len(index), nchannels), dtype=np.float32)
+    frames[in_range] = samples[index[in_range]]
+    return frames
+
+
+def write_audio_track(
+    audio: AudioClip,
+    path: str,
+    codec: str,
+    fps: int = DEFAULT_AUDIO_FPS,
+    bitrate: str | None = None,
+    logger: str | None = "bar",
+    ffmpeg_binary: str = FFMPEG_BINARY,
+) -> None:
+    """音声クリップをエンコードしてファイルに書き出す
+
+    加工されていない MixedAudioClip の場合は合成済みのバッファを1本の
+    ストリームとして ffmpeg に渡す。それ以外のクリップは MoviePy の
+    write_audiofile で書き出す。
+
+    Args:
+        audio: 音声クリップ
+        path: 出力ファイルパス
+        codec: 音声コーデック
+        fps: サンプルレート
+        bitrate: 音声ビットレート
+        logger: MoviePy のロガー（MoviePy で書き出す場合のみ使用）
+        ffmpeg_binary: ffmpeg 実行ファイルのパス
+
+    Raises:
+        OSError: ffmpeg が異常終了した場合
+    """
+    if (
+        not isinstance(audio, MixedAudioClip)
+        or not audio.is_unmodified
+        or audio.fps != fps
+    ):
+        audio.write_audiofile(
+            path, fps=fps, codec=codec, bitrate=bitrate, logger=logger
+        )
+        return
+
+    # with_duration などでクリップの長さが変わっている場合に合わせる
+    samples = audio.samples
+    total = round(audio.duration * fps)
+    if len(samples) < total:
+        padding = np.zeros((total - len(samples), audio.nchannels), np.float32)
+        samples = np.concatenate([samples, padding])
+    samples = np.clip(samples[:total], -1.0, 1.0)
+
+    cmd = [
+        ffmpeg_binary,
+        "-y",
+        "-loglevel",
+        "error",
+        "-f",
+        "f32le",
+        "-ar",
+        str(fps),
+        "-ac",
+        str(audio.nchannels),
+        "-i",
+        "-",
+        "-acodec",
+        codec,
+    ]
+    if bitrate is not None:
+        cmd.extend(["-ab", bitrate])
+    cmd.append(path)
+
+    result = subprocess.run(
+        cmd, input=np.ascontiguousarray(samples).tobytes(), capture_output=True
+    )
+    if result.returncode != 0:
+        raise OSError(
+            f"音声の書き出しに失敗しました ({path}): "
+            f"{result.stderr.decode(errors='replace').strip()}"
+        )
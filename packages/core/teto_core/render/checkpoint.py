@@ -0,0 +1,122 @@
+"""中断したレンダリングを再開するためのチェックポイント"""
+
+import json
+import os
+from pathlib import Path
+
+# マニフェストの形式のバージョン
+CHECKPOINT_VERSION = 1
+
+# 作業ディレクトリ内のマニフェストのファイル名
+MANIFEST_NAME = "manifest.json"
+
+
+class RenderCheckpoint:
+    """セグメント単位で確定したレンダリングの進捗
+
+    長いタイムラインをフレーム範囲のセグメントに分けて順に書き出し、
+    書き終えたセグメントを作業ディレクトリのマニフェストに記録する。
+    マニフェストにはプロジェクトのハッシュとセグメントの分割を保存し、
+    どちらかが変わっていれば以前のセグメントは使わずに最初からやり直す。
+
+    マニフェストは一時ファイルに書いてから置き換えるため、書き込み中に
+    プロセスが落ちても壊れたマニフェストは残らない。
+    """
+
+    def __init__(
+        self,
+        work_dir: Path | str,
+        project_hash: str,
+        segments: list[tuple[int, int]],
+        suffix: str = ".mp4",
+    ):
+        """初期化
+
+        Args:
+            work_dir: セグメントとマニフェストを置く作業ディレクトリ
+            project_hash: プロジェクトの内容のハッシュ
+            segments: (開始フレーム, 終了フレーム) のリスト。終了フレームは含まない
+            suffix: セグメントファイルの拡張子
+        """
+        self.work_dir = Path(work_dir)
+        self.project_hash = project_hash
+        self.segments = [tuple(segment) for segment in segments]
+        self.suffix = suffix
+        self.completed: set[int] = set()
+
+    @property
+    def manifest_path(self) -> Path:
+        """マニフェストのパス"""
+        return self.work_dir / MANIFEST_NAME
+
+    @property
+    def segment_paths(self) -> list[str]:
+        """各セグメントの出力ファイルパス"""
+        return [
+            str(self.work_dir / f"segment_{i:04d}{self.suffix}")
+            for i in range(len(self.segments))
+        ]
+
+    @property
+    def pending(self) -> list[int]:
+        """まだ書き終えていないセグメントのインデックス"""
+        return [i for i in range(len(self.segments)) if i not in self.completed]
+
+    @property
+    def is_complete(self) -> bool:
+        """すべてのセグメントを書き終えたか"""
+        return not self.pending
+
+    def resume(self) -> int:
+        """マニフェストから書き終えたセグメントを読み込む
+
+        プロジェクトのハッシュ・セグメントの分割・拡張子が一致し、
+        ファイルが残っているセグメントだけを完了扱いにする。
+
+        Returns:
+            再利用できるセグメントの数
+        """
+        self.completed = set()
+        try:
+            manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return 0
+
+        if (
+            manifest.get("version") != CHECKPOINT_VERSION
+            or manifest.get("project_hash") != self.project_hash
+            or manifest.get("suffix") != self.suffix
+            or [tuple(s) for s in manifest.get("segments", [])] != self.segments
+        ):
+            return 0
+
+        paths = self.segment_paths
+        self.completed = {
+            i
+            for i in manifest.get("completed", [])
+            if 0 <= i < len(paths) and Path(paths[i]).exists()
+        }
+        return len(self.completed)
+
+    def mark_done(self, index: int) -> None:
+        """セグメントを書き終えたことを記録し、マニフェストを保存する
+
+        Args:
+            index: セグメントのインデックス
+        """
+        self.completed.add(index)
+        self.save()
+
+    def save(self) -> None:
+        """マニフェストを保存する"""
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+        manifest = {
+            "version": CHECKPOINT_VERSION,
+            "project_hash": self.project_hash,
+            "suffix": self.suffix,
+            "segments": [list(segment) for segment in self.segments],
+            "completed": sorted(self.completed),
+        }
+        temp_path = self.manifest_path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        os.replace(temp_path, self.manifest_path)
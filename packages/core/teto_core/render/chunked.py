@@ -0,0 +1,141 @@
+"""時間分割レンダリングのチャンク計画と結合"""
+
+import subprocess
+from pathlib import Path
+
+from moviepy.config import FFMPEG_BINARY
+
+# エラーメッセージに含める ffmpeg のログの最大バイト数
+_STDERR_TAIL_BYTES = 4096
+
+
+def plan_chunks(
+    duration: float,
+    fps: float,
+    num_chunks: int,
+    scene_boundaries: list[float] | None = None,
+) -> list[tuple[int, int]]:
+    """タイムラインをフレーム範囲のチャンクに分割する
+
+    均等分割した理想的な分割点を求め、シーン境界が与えられている場合は
+    各分割点を最も近いシーン境界に寄せる。シーン境界で切ると、チャンクの
+    継ぎ目がシーンの切り替わりと重なり、画質の差が目立たない。
+    分割点はフレーム単位に丸めるため、全チャンクを結合すると
+    元のフレーム列と過不足なく一致する。
+
+    Args:
+        duration: タイムラインの長さ（秒）
+        fps: フレームレート
+        num_chunks: 目標とするチャンク数
+        scene_boundaries: シーンの切り替わり時刻のリスト（秒）
+
+    Returns:
+        (開始フレーム, 終了フレーム) のリスト。終了フレームは含まない
+    """
+    total_frames = int(duration * fps)
+    if total_frames <= 0:
+        return []
+    num_chunks = max(1, min(num_chunks, total_frames))
+
+    candidates = sorted({round(t * fps) for t in scene_boundaries or []})
+    candidates = [f for f in candidates if 0 < f < total_frames]
+    # 理想の分割点からこの距離以内のシーン境界にだけ寄せる
+    tolerance = total_frames / num_chunks / 2
+
+    cuts: set[int] = set()
+    for k in range(1, num_chunks):
+        ideal = round(total_frames * k / num_chunks)
+        nearby = [
+            f for f in candidates if f not in cuts and abs(f - ideal) <= tolerance
+        ]
+        cuts.add(min(nearby, key=lambda f: abs(f - ideal)) if nearby else ideal)
+
+    points = [0] + sorted(cuts) + [total_frames]
+    return [(start, end) for start, end in zip(points[:-1], points[1:]) if end > start]
+
+
+def scene_chunks(
+    duration: float,
+    fps: float,
+    scene_boundaries: list[float] | None = None,
+) -> list[tuple[int, int]]:
+    """タイムラインをシーン境界ちょうどでチャンクに分割する
+
+    セグメントキャッシュ用。分割点がシーンの長さだけで決まるため、
+    他のシーンが変更されても、変更のないシーンは同じ範囲の
+    チャンクとして切り出される。
+
+    Args:
+        duration: タイムラインの長さ（秒）
+        fps: フレームレート
+        scene_boundaries: シーンの切り替わり時刻のリスト（秒）
+
+    Returns:
+        (開始フレーム, 終了フレーム) のリスト。終了フレームは含まない
+    """
+    total_frames = int(duration * fps)
+    if total_frames <= 0:
+        return []
+
+    cuts = {round(t * fps) for t in scene_boundaries or []}
+    points = [0] + sorted(f for f in cuts if 0 < f < total_frames) + [total_frames]
+    return list(zip(points[:-1], points[1:]))
+
+
+def concat_segments(
+    segment_paths: list[str],
+    output_path: str,
+    audio_path: str | None = None,
+    ffmpeg_binary: str = FFMPEG_BINARY,
+) -> None:
+    """エンコード済みのセグメントを再エンコードなしで結合する
+
+    ffmpeg の concat demuxer でストリームコピーするため、各セグメントは
+    同じコーデック・解像度・フレームレートでエンコードされている必要がある。
+    音声トラックが指定された場合は結合と同時に多重化する。
+
+    Args:
+        segment_paths: 結合順に並べたセグメントのパス
+        output_path: 出力ファイルパス
+        audio_path: 多重化するエンコード済み音声ファイルのパス
+        ffmpeg_binary: ffmpeg 実行ファイルのパス
+
+    Raises:
+        OSError: ffmpeg が異常終了した場合
+    """
+    list_path = Path(output_path).with_name(f"{Path(output_path).stem}_concat.txt")
+    lines = []
+    for path in segment_paths:
+        # concat リストではシングルクォートをエスケープする
+        escaped = str(Path(path).resolve()).replace("'", "'\\''")
+        lines.append(f"file '{escaped}'\n")
+    list_path.write_text("".join(lines), encoding="utf-8")
+
+    cmd = [
+        ffmpeg_binary,
+        "-y",
+        "-loglevel",
+        "error",
+        "-f",
+        "concat",
+        "-safe",
+        "0",
+        "-i",
+        str(list_path),
+    ]
+    if audio_path is not None:
+        cmd.extend(["-i", audio_path, "-map", "0:v", "-map", "1:a"])
+    cmd.extend(["-c", "copy", output_path])
+
+    try:
+        # run() はプロセスの終了まで stderr を読み続けるため詰まらない
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    finally:
+        list_path.unlink(missing_ok=True)
+
+    if result.returncode != 0:
+        stderr = result.stderr[-_STDERR_TAIL_BYTES:]
+        raise OSError(
+            f"セグメントの結合に失敗しました ({output_path}): "
+            f"{stderr.decode(errors='replace').strip()}"
+        )
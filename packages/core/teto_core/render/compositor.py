@@ -0,0 +1,515 @@
+"""オーバーレイの単一パス合成"""
+
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import numpy as np
+from moviepy import VideoClip, CompositeVideoClip
+from moviepy.tools import compute_position
+
+from .interval_index import IntervalIndex, clip_span
+from .indexed_clips import IndexedCompositeAudioClip
+from .static_spans import (
+    composite_static_spans,
+    find_static_spans,
+    is_static_overlay,
+    mark_static_overlay,
+)
+
+# 再ブレンドする領域がフレームのこの割合を超える場合は全体を描き直す
+DIRTY_AREA_LIMIT = 0.5
+
+# 出力フレーム上の矩形 (x0, y0, x1, y1)
+Box = tuple[int, int, int, int]
+
+
+def scale_overlay(clip: VideoClip, scale: float) -> VideoClip:
+    """レイアウト解像度で作ったオーバーレイを描画解像度に縮小する
+
+    ドラフト出力では、字幕・スタンプ・キャラクターをレイアウト解像度
+    （本番の width/height）で作成してから、画像と位置を同じ縮尺で縮める。
+    これにより、レスポンシブサイズの計算結果も含めて本番出力と同じ比率になる。
+
+    Args:
+        clip: オーバーレイクリップ
+        scale: 描画解像度の縮尺
+
+    Returns:
+        縮小したクリップ
+    """
+    if scale == 1.0:
+        return clip
+
+    width, height = clip.size
+    scaled = clip.resized((max(1, round(width * scale)), max(1, round(height * scale))))
+
+    # 割合指定（relative_pos）と "center" などの文字列指定はそのまま使える
+    if not clip.relative_pos:
+        pos = clip.pos
+
+        def scaled_pos(t):
+            return tuple(
+                v * scale if isinstance(v, (int, float)) else v for v in pos(t)
+            )
+
+        scaled = scaled.with_position(scaled_pos)
+
+    if is_static_overlay(clip):
+        mark_static_overlay(scaled)
+    return scaled
+
+
+@dataclass
+class _Raster:
+    """出力フレーム上に配置済みのクリップ画像"""
+
+    x0: int
+    y0: int
+    x1: int
+    y1: int
+    image: np.ndarray  # (h, w, 3) uint8
+    alpha: np.ndarray | None  # (h, w) 0.0〜1.0、None は不透明
+
+
+@dataclass
+class _Plate:
+    """静的オーバーレイを事前合成したプレート（乗算済みアルファ）"""
+
+    x0: int
+    y0: int
+    x1: int
+    y1: int
+    color: np.ndarray  # (h, w, 3) float32、アルファ乗算済みの色
+    transmittance: np.ndarray  # (h, w, 1) float32、背景が透ける割合
+
+
+@dataclass
+class _PreviousFrame:
+    """直前に生成したフレームと、その時点の合成の状態"""
+
+    key: tuple
+    frame: np.ndarray
+    boxes: list[Box]  # 動的オーバーレイが描かれた領域
+
+
+class FlattenedCompositeClip(VideoClip):
+    """ベース映像に全オーバーレイを1パスで合成するクリップ
+
+    CompositeVideoClip を入れ子にすると、階層ごとにフルフレームの
+    バッファ確保・PIL 変換・マスク合成が発生する。このクリップは
+    ベースフレームを1枚の出力バッファにコピーし、z順に並べた
+    オーバーレイをそれぞれの表示領域だけブレンドする。
+
+    静的オーバーレイ（mark_static_overlay でマークしたもの）は、z順で
+    連続する組ごとに1枚のプレートへ事前合成してキャッシュする。
+    有効な静的オーバーレイの組が変わらない区間では、フレームごとの
+    処理はプレート1枚のブレンドだけになる。
+
+    ベースが静止していて有効な静的オーバーレイの組も変わらない間は、
+    直前のフレームをコピーし、動的オーバーレイが直前と今回に描かれる
+    矩形（ダーティ矩形）だけを描き直す。口パクするキャラクターや
+    跳ねるスタンプのように小さな領域だけが変化する場合、フレームごとの
+    ブレンドはその領域に限られる。直前のフレームはスレッドごとに保持する。
+
+    最終出力用のため、結果はマスクを持たない RGB フレームとなる。
+    """
+
+    def __init__(
+        self,
+        base: VideoClip,
+        overlays: list[VideoClip],
+        size: tuple[int, int] | None = None,
+        max_cached_plates: int = 8,
+    ):
+        """初期化
+
+        Args:
+            base: ベース映像クリップ（背景）
+            overlays: オーバーレイクリップのリスト（リスト順が z 順）
+            size: 出力サイズ (width, height)。省略時はベースのサイズ
+            max_cached_plates: 保持する事前合成プレートの最大数
+        """
+        super().__init__()
+        self.size = tuple(size) if size else tuple(base.size)
+        self.base = base
+        # CompositeVideoClip と同様に layer_index で安定ソート
+        self.overlays = sorted(overlays, key=lambda clip: clip.layer_index)
+        self._overlay_index = IntervalIndex(self.overlays, clip_span)
+        self._max_cached_plates = max_cached_plates
+        self._plates: OrderedDict[tuple[int, ...], _Plate | None] = OrderedDict()
+        # FrameScheduler で複数スレッドからフレームを生成する場合に備える
+        self._plates_lock = threading.Lock()
+
+        clips = [base] + self.overlays
+        fpss = [clip.fps for clip in clips if getattr(clip, "fps", None)]
+        self.fps = max(fpss) if fpss else None
+
+        ends = [clip.end for clip in clips]
+        if None not in ends:
+            self.duration = max(ends)
+            self.end = self.duration
+
+        audioclips = [clip.audio for clip in clips if clip.audio is not None]
+        if len(audioclips) == 1:
+            self.audio = audioclips[0]
+        elif audioclips:
+            self.audio = IndexedCompositeAudioClip(audioclips)
+
+        # CompositeVideoClip のフレームは既に黒背景へ合成済みのためマスク不要
+        self._apply_base_mask = base.mask is not None and not isinstance(
+            base, CompositeVideoClip
+        )
+
+        # ベースの静止区間（ダーティ矩形での描き直しとベース画像の再利用に使う）
+        self._base_spans = find_static_spans(base)
+        self._base_span_starts = [start for start, _ in self._base_spans]
+        self._base_raster: tuple[int, _Raster | None] | None = None
+        self._previous = threading.local()
+
+    def frame_function(self, t: float) -> np.ndarray:
+        """時刻 t のフレームを生成
+
+        Args:
+            t: 時刻（秒）
+
+        Returns:
+            RGB フレーム (height, width, 3) の uint8 配列
+        """
+        width, height = self.size
+        active = self._overlay_index.at(t)
+        rasters = {
+            id(clip): self._rasterize(clip, t)
+            for clip in active
+            if not is_static_overlay(clip)
+        }
+        boxes = [_box(raster) for raster in rasters.values() if raster is not None]
+
+        key = self._static_key(t, active)
+        previous: _PreviousFrame | None = getattr(self._previous, "frame", None)
+        dirty = None
+        if key is not None and previous is not None and previous.key == key:
+            dirty = previous.boxes + boxes
+            area = sum((x1 - x0) * (y1 - y0) for x0, y0, x1, y1 in dirty)
+            if area > width * height * DIRTY_AREA_LIMIT:
+                dirty = None
+
+        if dirty is None:
+            frame = np.empty((height, width, 3), dtype=np.uint8)
+            self._draw(frame, t, active, rasters, (0, 0, width, height))
+        else:
+            # 静止した部分は直前のフレームのまま、変化した矩形だけ描き直す
+            frame = previous.frame.copy()
+            for region in dirty:
+                self._draw(frame, t, active, rasters, region)
+
+        if key is not None:
+            self._previous.frame = _PreviousFrame(key, frame, boxes)
+        return frame
+
+    def _draw(
+        self,
+        frame: np.ndarray,
+        t: float,
+        active: list[VideoClip],
+        rasters: dict[int, _Raster | None],
+        region: Box,
+    ) -> None:
+        """出力フレームの矩形領域をベースから合成し直す
+
+        Args:
+            frame: 出力バッファ（インプレースで更新）
+            t: 時刻（秒）
+            active: 時刻 t に有効なオーバーレイ（z順）
+            rasters: 動的オーバーレイの配置済みの画像（id(clip) がキー）
+            region: 描き直す矩形
+        """
+        x0, y0, x1, y1 = region
+        frame[y0:y1, x0:x1] = 0
+
+        if self.base.is_playing(t):
+            _blend_raster(frame, _crop_raster(self._rasterize_base(t), region))
+
+        # z順で連続する静的オーバーレイはまとめてプレートとして描画
+        static_run: list[VideoClip] = []
+        for clip in active:
+            if is_static_overlay(clip):
+                static_run.append(clip)
+                continue
+            self._draw_static_run(frame, static_run, region)
+            static_run = []
+            _blend_raster(frame, _crop_raster(rasters[id(clip)], region))
+        self._draw_static_run(frame, static_run, region)
+
+    def _static_key(self, t: float, active: list[VideoClip]) -> tuple | None:
+        """動的オーバーレイの外側の画像を決める状態を取得
+
+        Args:
+            t: 時刻（秒）
+            active: 時刻 t に有効なオーバーレイ
+
+        Returns:
+            (ベースの静止区間の番号, 有効なオーバーレイの並び)。
+            ベースが静止していない場合は None
+        """
+        span = self._base_span_at(t)
+        if span is None:
+            return None
+        # 動的オーバーレイの位置も含めるのは、プレートの組み分けを揃えるため
+        return (span,) + tuple(
+            id(clip) if is_static_overlay(clip) else None for clip in active
+        )
+
+    def _base_span_at(self, t: float) -> int | None:
+        """時刻 t を含むベースの静止区間の番号を取得"""
+        i = bisect_right(self._base_span_starts, t) - 1
+        if i < 0 or t >= self._base_spans[i][1]:
+            return None
+        return i
+
+    def _rasterize_base(self, t: float) -> _Raster | None:
+        """ベースの時刻 t の画像を取得（静止区間では区間ごとに1回だけ生成）"""
+        span = self._base_span_at(t)
+        if span is None:
+            return self._rasterize(self.base, t, apply_mask=self._apply_base_mask)
+
+        with self._plates_lock:
+            cached = self._base_raster
+        if cached is not None and cached[0] == span:
+            return cached[1]
+        raster = self._rasterize(self.base, t, apply_mask=self._apply_base_mask)
+        with self._plates_lock:
+            self._base_raster = (span, raster)
+        return raster
+
+    def static_spans(self) -> list[tuple[float, float]]:
+        """ベースと全オーバーレイが静止している区間を取得
+
+        Returns:
+            静止区間のリスト
+        """
+        return composite_static_spans([self.base] + self.overlays, self.duration)
+
+    def _rasterize(
+        self, clip: VideoClip, t: float, apply_mask: bool = True
+    ) -> _Raster | None:
+        """クリップの時刻 t の画像を出力フレーム上の領域に切り出す
+
+        Args:
+            clip: 対象クリップ
+            t: 合成全体での時刻（秒）
+            apply_mask: マスク（アルファ）を適用するかどうか
+
+        Returns:
+            配置済みの画像。出力フレーム外の場合は None
+        """
+        ct = t - clip.start
+        image = clip.get_frame(ct)
+        if image.ndim == 2:
+            image = np.repeat(image[:, :, np.newaxis], 3, axis=2)
+
+        alpha = None
+        if apply_mask:
+            if image.shape[2] == 4:
+                alpha = image[:, :, 3].astype(np.float32) / 255.0
+            if clip.mask is not None:
+                mask = _fit_mask(clip.mask.get_frame(ct), image.shape[:2])
+                alpha = mask if alpha is None else alpha * mask
+        image = image[:, :, :3]
+
+        clip_h, clip_w = image.shape[:2]
+        pos = compute_position(
+            (clip_w, clip_h), self.size, clip.pos(ct), clip.relative_pos
+        )
+        x, y = int(pos[0]), int(pos[1])
+
+        # 出力フレームとクリップの重なり領域を計算
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + clip_w, self.size[0]), min(y + clip_h, self.size[1])
+        if x0 >= x1 or y0 >= y1:
+            return None
+
+        crop = (slice(y0 - y, y1 - y), slice(x0 - x, x1 - x))
+        return _Raster(
+            x0=x0,
+            y0=y0,
+            x1=x1,
+            y1=y1,
+            image=image[crop],
+            alpha=None if alpha is None else alpha[crop],
+        )
+
+    def _draw_static_run(
+        self, frame: np.ndarray, run: list[VideoClip], region: Box
+    ) -> None:
+        """連続する静的オーバーレイをキャッシュ済みプレートで描画
+
+        Args:
+            frame: 出力バッファ（インプレースで更新）
+            run: z順で連続する静的オーバーレイ
+            region: 描画する矩形（この外側は変更しない）
+        """
+        if not run:
+            return
+
+        key = tuple(id(clip) for clip in run)
+        with self._plates_lock:
+            if key in self._plates:
+                self._plates.move_to_end(key)
+                plate = self._plates[key]
+            else:
+                plate = self._build_plate(run)
+                self._plates[key] = plate
+                while len(self._plates) > self._max_cached_plates:
+                    self._plates.popitem(last=False)
+
+        if plate is None:
+            return
+
+        area = _intersect(_box(plate), region)
+        if area is None:
+            return
+        x0, y0, x1, y1 = area
+        crop = (
+            slice(y0 - plate.y0, y1 - plate.y0),
+            slice(x0 - plate.x0, x1 - plate.x0),
+        )
+        dst = frame[y0:y1, x0:x1]
+        blended = dst.astype(np.float32)
+        blended *= plate.transmittance[crop]
+        blended += plate.color[crop]
+        np.rint(blended, out=blended)
+        dst[...] = blended.astype(np.uint8)
+
+    def _build_plate(self, run: list[VideoClip]) -> _Plate | None:
+        """静的オーバーレイの組を1枚のプレートに事前合成
+
+        Args:
+            run: z順で連続する静的オーバーレイ
+
+        Returns:
+            事前合成したプレート。すべて出力フレーム外の場合は None
+        """
+        rasters = [self._rasterize(clip, clip.start) for clip in run]
+        rasters = [raster for raster in rasters if raster is not None]
+        if not rasters:
+            return None
+
+        x0 = min(raster.x0 for raster in rasters)
+        y0 = min(raster.y0 for raster in rasters)
+        x1 = max(raster.x1 for raster in rasters)
+        y1 = max(raster.y1 for raster in rasters)
+
+        color = np.zeros((y1 - y0, x1 - x0, 3), dtype=np.float32)
+        transmittance = np.ones((y1 - y0, x1 - x0, 1), dtype=np.float32)
+
+        for raster in rasters:
+            area = (
+                slice(raster.y0 - y0, raster.y1 - y0),
+                slice(raster.x0 - x0, raster.x1 - x0),
+            )
+            if raster.alpha is None:
+                a = np.ones(raster.image.shape[:2] + (1,), dtype=np.float32)
+            else:
+                a = raster.alpha.astype(np.float32)[:, :, np.newaxis]
+            color[area] = raster.image.astype(np.float32) * a + color[area] * (1 - a)
+            transmittance[area] *= 1 - a
+
+        return _Plate(
+            x0=x0, y0=y0, x1=x1, y1=y1, color=color, transmittance=transmittance
+        )
+
+
+def _box(item: _Raster | _Plate) -> Box:
+    """配置済みの画像・プレートの矩形を取得"""
+    return item.x0, item.y0, item.x1, item.y1
+
+
+def _intersect(a: Box, b: Box) -> Box | None:
+    """2つの矩形の共通部分を取得（重ならない場合は None）"""
+    x0, y0 = max(a[0], b[0]), max(a[1], b[1])
+    x1, y1 = min(a[2], b[2]), min(a[3], b[3])
+    if x0 >= x1 or y0 >= y1:
+        return None
+    return x0, y0, x1, y1
+
+
+def _crop_raster(raster: _Raster | None, region: Box) -> _Raster | None:
+    """配置済みの画像を矩形の内側に切り詰める
+
+    Args:
+        raster: 配置済みの画像
+        region: 切り詰める矩形
+
+    Returns:
+        切り詰めた画像。矩形と重ならない場合は None
+    """
+    if raster is None:
+        return None
+    area = _intersect(_box(raster), region)
+    if area is None:
+        return None
+    if area == _box(raster):
+        return raster
+    x0, y0, x1, y1 = area
+    crop = (
+        slice(y0 - raster.y0, y1 - raster.y0),
+        slice(x0 - raster.x0, x1 - raster.x0),
+    )
+    return _Raster(
+        x0=x0,
+        y0=y0,
+        x1=x1,
+        y1=y1,
+        image=raster.image[crop],
+        alpha=None if raster.alpha is None else raster.alpha[crop],
+    )
+
+
+def _blend_raster(frame: np.ndarray, raster: _Raster | None) -> None:
+    """配置済みの画像を出力バッファにブレンド
+
+    Args:
+        frame: 出力バッファ（インプレースで更新）
+        raster: 配置済みの画像（None の場合は何もしない）
+    """
+    if raster is None:
+        return
+
+    dst = frame[raster.y0 : raster.y1, raster.x0 : raster.x1]
+    if raster.alpha is None:
+        dst[...] = raster.image
+        return
+
+    a = raster.alpha
+    if not a.any():
+        return
+    if a.min() >= 1.0:
+        dst[...] = raster.image
+        return
+
+    a = a.astype(np.float32)[:, :, np.newaxis]
+    blended = dst.astype(np.float32)
+    blended += (raster.image.astype(np.float32) - blended) * a
+    np.rint(blended, out=blended)
+    dst[...] = blended.astype(np.uint8)
+
+
+def _fit_mask(mask: np.ndarray, shape: tuple[int, int]) -> np.ndarray:
+    """マスクを画像サイズに合わせる（左上基準で切り取り・ゼロ埋め）
+
+    Args:
+        mask: マスク配列 (0.0〜1.0)
+        shape: 画像の (height, width)
+
+    Returns:
+        画像サイズに揃えたマスク
+    """
+    if mask.shape[:2] == shape:
+        return mask
+    fitted = np.zeros(shape, dtype=np.float32)
+    h = min(shape[0], mask.shape[0])
+    w = min(shape[1], mask.shape[1])
+    fitted[:h, :w] = mask[:h, :w]
+    return fitted
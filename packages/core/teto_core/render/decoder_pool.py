@@ -0,0 +1,273 @@
+"""動画デコーダー（ffmpeg プロセス）の共有プール"""
+
+import logging
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from moviepy import VideoClip, VideoFileClip
+
+from .audio_mixer import DecodedAudioFileClip
+from .scheduler import SerializedFrameReader
+
+logger = logging.getLogger(__name__)
+
+# 同時に開くデコーダーの既定の上限
+DEFAULT_MAX_DECODERS = 4
+
+# レイヤーの表示区間の何秒前からデコーダーを開いておくか
+DEFAULT_LOOKAHEAD = 1.0
+
+
+class PooledFrameReader(SerializedFrameReader):
+    """DecoderPool が開閉を管理する動画リーダー
+
+    ffmpeg のプロセスは閉じていてもメタデータ（サイズ・fps・長さ）は保持し、
+    フレームを要求された時点で必要なら開き直す。
+    """
+
+    def __init__(self, pool: "DecoderPool", reader, max_cached_frames: int = 16):
+        """初期化
+
+        Args:
+            pool: このリーダーを管理するプール
+            reader: FFMPEG_VideoReader
+            max_cached_frames: 保持する直近のフレーム数
+        """
+        super().__init__(reader, max_cached_frames)
+        self._pool = pool
+
+    @property
+    def is_open(self) -> bool:
+        """ffmpeg のプロセスが開いているか"""
+        return self._reader.proc is not None
+
+    def get_frame(self, t: float) -> np.ndarray:
+        """時刻 t のフレームを読み出す（閉じていれば開き直す）
+
+        Args:
+            t: 時刻（秒）
+
+        Returns:
+            フレーム
+        """
+        while True:
+            self._pool._acquire(self)
+            with self._lock:
+                if self._reader.proc is None:
+                    if not self._pool._is_registered(self):
+                        # _acquire の後にロックを取るまでの間に他のスレッドに
+                        # 閉じられた。登録し直さずに開くと max_open を超えるため
+                        # もう一度 _acquire からやり直す
+                        continue
+                    self._reader.initialize(t)
+                return self._read(t)
+
+    def open(self, t: float = 0.0) -> None:
+        """デコーダーを時刻 t の位置で開く
+
+        開いている場合と、プールに使用中として登録されていない
+        （開く前に閉じる対象になった）場合は何もしない。
+
+        Args:
+            t: 時刻（秒）
+        """
+        with self._lock:
+            if self._reader.proc is None and self._pool._is_registered(self):
+                self._reader.initialize(t)
+
+    def release(self) -> None:
+        """デコーダーを閉じる（次のフレーム要求で開き直す）"""
+        with self._lock:
+            self._reader.close(delete_lastread=False)
+            self._recent.clear()
+
+
+class DecoderPool:
+    """動画デコーダーを共有・遅延オープンするプール
+
+    VideoFileClip はレイヤーごとに ffmpeg のプロセスを開き、レンダリングが
+    終わるまで保持する。B ロールの多いタイムラインではプロセス数・
+    ファイルディスクリプタ・メモリを使い切ってしまうため、このプールでは
+
+    - 同じファイルを参照するレイヤーで1つのリーダーを共有する
+    - リーダーはフレームを要求された時点（またはレイヤーの表示区間が
+      lookahead 秒以内に迫った時点）で開き、表示区間を過ぎたら閉じる
+    - 同時に開くリーダーの数を max_open に制限し、超えた場合は
+      最も長く使われていないものから閉じる
+
+    ことで、同時に存在する ffmpeg プロセスを抑える。埋め込み音声は
+    プロセスを開いたままにせず、使われた時点で一括デコードする
+    （DecodedAudioFileClip）。
+    """
+
+    def __init__(
+        self,
+        max_open: int = DEFAULT_MAX_DECODERS,
+        lookahead: float = DEFAULT_LOOKAHEAD,
+    ):
+        """初期化
+
+        Args:
+            max_open: 同時に開くデコーダーの最大数
+            lookahead: 表示区間の何秒前からデコーダーを開いておくか
+        """
+        self.max_open = max(max_open, 1)
+        self.lookahead = lookahead
+        self._lock = threading.Lock()
+        self._clips: dict[str, VideoFileClip] = {}
+        self._readers: dict[str, PooledFrameReader] = {}
+        self._open: OrderedDict[PooledFrameReader, None] = OrderedDict()
+        self._windows: dict[str, list[tuple[float, float]]] = {}
+        self._prefetching: set[str] = set()
+
+    @property
+    def open_count(self) -> int:
+        """開いているデコーダーの数"""
+        return sum(reader.is_open for reader in self._readers.values())
+
+    def open_clip(self, path: str) -> VideoFileClip:
+        """動画ファイルのクリップを取得
+
+        同じパスのクリップはリーダーを共有する。
+
+        Args:
+            path: 動画ファイルのパス
+
+        Returns:
+            VideoFileClip（リーダーはプールが管理）
+        """
+        template = self._clips.get(path)
+        if template is None:
+            template = VideoFileClip(path, audio=False)
+            reader = template.reader
+            # メタデータだけ残し、必要になるまで ffmpeg は開かない
+            reader.close()
+            pooled = PooledFrameReader(self, reader)
+            template.reader = pooled
+            if reader.infos.get("audio_found"):
+                template.audio = DecodedAudioFileClip(
+                    path, duration=reader.ffmpeg_duration
+                )
+            self._clips[path] = template
+            self._readers[path] = pooled
+        return template.copy()
+
+    def add_window(self, path: str, start: float, end: float) -> None:
+        """ファイルが表示されるタイムライン上の区間を登録
+
+        Args:
+            path: 動画ファイルのパス
+            start: 表示開始時刻（秒）。この時刻にクリップの先頭が表示される
+            end: 表示終了時刻（秒）
+        """
+        self._windows.setdefault(path, []).append((start, end))
+
+    def attach(self, clip: VideoClip) -> VideoClip:
+        """タイムラインのクリップにデコーダーの開閉を連動させる
+
+        フレームを要求されるたびに advance を呼ぶよう、frame_function を
+        その場で差し替える。
+
+        Args:
+            clip: タイムライン全体のクリップ
+
+        Returns:
+            同じクリップ
+        """
+        frame_function = clip.frame_function
+
+        def advance_and_get(t):
+            self.advance(t)
+            return frame_function(t)
+
+        clip.frame_function = advance_and_get
+        return clip
+
+    def advance(self, t: float) -> None:
+        """タイムラインの時刻 t に合わせてデコーダーを開閉する
+
+        表示区間が lookahead 秒以内に迫ったファイルは別スレッドで先に開き、
+        表示区間（前後 lookahead 秒を含む）を外れたファイルは閉じる。
+
+        Args:
+            t: タイムライン上の時刻（秒）
+        """
+        to_open: list[tuple[str, PooledFrameReader]] = []
+        to_close: list[PooledFrameReader] = []
+        with self._lock:
+            for path, windows in self._windows.items():
+                reader = self._readers[path]
+                in_window = any(
+                    start - self.lookahead <= t <= end + self.lookahead
+                    for start, end in windows
+                )
+                upcoming = any(
+                    start - self.lookahead <= t < start for start, _ in windows
+                )
+                if not in_window:
+                    if reader.is_open:
+                        self._open.pop(reader, None)
+                        to_close.append(reader)
+                elif (
+                    upcoming
+                    and not reader.is_open
+                    and path not in self._prefetching
+                    and len(self._open) < self.max_open
+                ):
+                    self._prefetching.add(path)
+                    self._open[reader] = None
+                    to_open.append((path, reader))
+
+        for reader in to_close:
+            reader.release()
+        for path, reader in to_open:
+            threading.Thread(
+                target=self._prefetch,
+                args=(path, reader),
+                name="teto-decoder-prefetch",
+                daemon=True,
+            ).start()
+
+    def close(self) -> None:
+        """すべてのデコーダーを閉じる
+
+        レンダリングの終了時に呼ぶ。閉じた後にフレームを要求された場合は
+        開き直す。
+        """
+        with self._lock:
+            self._open.clear()
+            readers = list(self._readers.values())
+        for reader in readers:
+            reader.release()
+
+    def _acquire(self, reader: PooledFrameReader) -> None:
+        """リーダーを使用中にし、上限を超えた分を古い順に閉じる"""
+        with self._lock:
+            self._open[reader] = None
+            self._open.move_to_end(reader)
+            evicted = []
+            while len(self._open) > self.max_open:
+                victim, _ = self._open.popitem(last=False)
+                evicted.append(victim)
+        # リーダーのロックを持ったままプールのロックを取ることがあるため、
+        # プールのロックを放してから閉じる（ロックの順序を一方向に保つ）
+        for victim in evicted:
+            victim.release()
+
+    def _is_registered(self, reader: PooledFrameReader) -> bool:
+        """リーダーが使用中として登録されているか"""
+        with self._lock:
+            return reader in self._open
+
+    def _prefetch(self, path: str, reader: PooledFrameReader) -> None:
+        """クリップの先頭の位置でデコーダーを開く"""
+        try:
+            reader.open(0.0)
+        except OSError:
+            # ffmpeg を起動できなかった場合はフレーム要求時に開き直し、
+            # そこで例外を送出する
+            logger.debug("Failed to prefetch decoder for %s", path, exc_info=True)
+        finally:
+            with self._lock:
+                self._prefetching.discard(path)
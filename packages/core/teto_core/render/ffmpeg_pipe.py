@@ -0,0 +1,471 @@
+"""ffmpeg への直接パイプ出力"""
+
+import os
+import queue
+import subprocess
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import proglog
+from moviepy import VideoClip
+from moviepy.config import FFMPEG_BINARY
+from moviepy.tools import find_extension
+
+from .audio_mixer import write_audio_track
+from .static_spans import repeated_frames
+
+# キューの終端を示す番兵
+_END = object()
+
+# エラーメッセージに含める ffmpeg のログの最大バイト数
+_STDERR_TAIL_BYTES = 4096
+
+
+@dataclass
+class EncodeStats:
+    """エンコード結果の統計"""
+
+    frames: int
+    elapsed: float  # 秒
+    repeated_frames: int = 0  # 静止区間で直前のフレームを再利用した数
+
+    @property
+    def fps(self) -> float:
+        """1秒あたりの処理フレーム数"""
+        if self.elapsed <= 0:
+            return 0.0
+        return self.frames / self.elapsed
+
+
+class FFmpegPipeWriter:
+    """生の RGB フレームを標準入力経由で ffmpeg に渡すライター"""
+
+    def __init__(
+        self,
+        path: str,
+        size: tuple[int, int],
+        fps: float,
+        codec: str = "libx264",
+        preset: str = "fast",
+        bitrate: str | None = None,
+        threads: int | None = None,
+        audio_path: str | None = None,
+        audio_codec: str = "copy",
+        ffmpeg_binary: str = FFMPEG_BINARY,
+    ):
+        """初期化
+
+        Args:
+            path: 出力ファイルパス
+            size: フレームサイズ (width, height)
+            fps: フレームレート
+            codec: ビデオコーデック
+            preset: エンコード速度プリセット
+            bitrate: ビットレート（None の場合はコーデックの既定値）
+            threads: ffmpeg のエンコードスレッド数（None の場合は自動）
+            audio_path: 多重化する音声ファイルのパス（None の場合は無音）
+            audio_codec: 音声コーデック（エンコード済み音声は "copy"）
+            ffmpeg_binary: ffmpeg 実行ファイルのパス
+        """
+        self.path = path
+        self.size = size
+        self.fps = fps
+        self.codec = codec
+        self.preset = preset
+        self.bitrate = bitrate
+        self.threads = threads
+        self.audio_path = audio_path
+        self.audio_codec = audio_codec
+        self.ffmpeg_binary = ffmpeg_binary
+        self._proc: subprocess.Popen | None = None
+        self._stderr = None
+
+    def build_command(self) -> list[str]:
+        """ffmpeg のコマンドラインを組み立てる
+
+        Returns:
+            コマンドライン引数のリスト
+        """
+        width, height = self.size
+        cmd = [
+            self.ffmpeg_binary,
+            "-y",
+            "-loglevel",
+            "error",
+            "-f",
+            "rawvideo",
+            "-vcodec",
+            "rawvideo",
+            "-s",
+            f"{width}x{height}",
+            "-pix_fmt",
+            "rgb24",
+            "-r",
+            f"{self.fps:.02f}",
+            "-i",
+            "-",
+        ]
+        if self.audio_path is not None:
+            cmd.extend(["-i", self.audio_path, "-acodec", self.audio_codec])
+        else:
+            cmd.append("-an")
+
+        cmd.extend(["-vcodec", self.codec, "-preset", self.preset])
+        if self.bitrate is not None:
+            cmd.extend(["-b:v", self.bitrate])
+        if self.threads is not None:
+            cmd.extend(["-threads", str(self.threads)])
+        # 一般的なプレイヤーで再生できるよう 4:2:0 に変換（奇数サイズは不可）
+        even = width % 2 == 0 and height % 2 == 0
+        if self.codec in ("libx264", "h264_nvenc") and even:
+            cmd.extend(["-pix_fmt", "yuv420p"])
+
+        cmd.append(self.path)
+        return cmd
+
+    def open(self) -> None:
+        """ffmpeg プロセスを起動
+
+        ffmpeg のログは一時ファイルに書き出す。パイプにすると、書き込み中に
+        誰も読まないためバッファが埋まった時点で ffmpeg と互いに待ち合う。
+        """
+        self._stderr = tempfile.TemporaryFile()
+        try:
+            self._proc = subprocess.Popen(
+                self.build_command(),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=self._stderr,
+            )
+        except BaseException:
+            self._close_stderr()
+            raise
+
+    def write_frame(self, frame: np.ndarray) -> None:
+        """フレームを1枚書き込む
+
+        Args:
+            frame: RGB フレーム (height, width, 3) の uint8 配列
+
+        Raises:
+            OSError: ffmpeg がフレームを受け付けなかった場合
+        """
+        try:
+            self._proc.stdin.write(frame.tobytes())
+        except OSError as e:
+            raise OSError(
+                f"ffmpeg への書き込みに失敗しました ({self.path}): {self._error()}"
+            ) from e
+
+    def close(self) -> None:
+        """入力を閉じてエンコード完了を待つ
+
+        Raises:
+            OSError: ffmpeg が異常終了した場合
+        """
+        if self._proc is None:
+            return
+        proc, self._proc = self._proc, None
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            if proc.wait() != 0:
+                raise OSError(
+                    f"ffmpeg のエンコードに失敗しました ({self.path}): "
+                    f"{self._stderr_tail()}"
+                )
+        finally:
+            self._close_stderr()
+
+    def abort(self) -> None:
+        """エンコードを中断してプロセスを終了"""
+        if self._proc is None:
+            return
+        proc, self._proc = self._proc, None
+        proc.kill()
+        proc.wait()
+        self._close_stderr()
+
+    def _error(self) -> str:
+        """ffmpeg を終了させてエラー出力の末尾を取得"""
+        if self._proc is None:
+            return ""
+        self._proc.kill()
+        self._proc.wait()
+        return self._stderr_tail()
+
+    def _stderr_tail(self) -> str:
+        """ffmpeg のログの末尾を取得"""
+        if self._stderr is None:
+            return ""
+        self._stderr.seek(0, os.SEEK_END)
+        self._stderr.seek(max(self._stderr.tell() - _STDERR_TAIL_BYTES, 0))
+        return self._stderr.read().decode(errors="replace").strip()
+
+    def _close_stderr(self) -> None:
+        """ログの一時ファイルを閉じる（閉じると削除される）"""
+        if self._stderr is not None:
+            self._stderr.close()
+            self._stderr = None
+
+    def __enter__(self) -> "FFmpegPipeWriter":
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class FrameProducer:
+    """フレーム生成をワーカースレッドで行い、有界キューに積むプロデューサー
+
+    エンコーダーがフレームを書き込んでいる間に次のフレームを生成する。
+    キューが満杯の間は生成を待つため、メモリ使用量は queue_size 枚分に収まる。
+    静止区間（static_spans を参照）では最初のフレームだけを生成し、
+    以降は同じフレームを繰り返し渡す。
+    """
+
+    def __init__(
+        self,
+        clip: VideoClip,
+        fps: float,
+        queue_size: int = 8,
+        start_frame: int = 0,
+        end_frame: int | None = None,
+        elide_static: bool = True,
+    ):
+        """初期化
+
+        Args:
+            clip: フレームを生成するクリップ
+            fps: フレームレート
+            queue_size: 先行生成するフレームの最大数
+            start_frame: 生成する最初のフレーム番号
+            end_frame: 生成を終えるフレーム番号（このフレームは含まない）。
+                省略時はクリップの最後まで
+            elide_static: 静止区間で直前のフレームを再利用するかどうか
+        """
+        self.clip = clip
+        self.fps = fps
+        if end_frame is None:
+            end_frame = frame_count(clip.duration, fps)
+        self.start_frame = start_frame
+        self.end_frame = end_frame
+        self.n_frames = max(end_frame - start_frame, 0)
+        self.repeats = (
+            repeated_frames(clip, fps, start_frame, end_frame)
+            if elide_static
+            else np.zeros(self.n_frames, dtype=bool)
+        )
+        self._queue: queue.Queue = queue.Queue(maxsize=max(queue_size, 1))
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __len__(self) -> int:
+        return self.n_frames
+
+    @property
+    def n_repeated(self) -> int:
+        """直前のフレームを再利用するフレームの数"""
+        return int(self.repeats.sum())
+
+    def __iter__(self):
+        """生成順にフレームを返す
+
+        Raises:
+            Exception: ワーカースレッドでのフレーム生成中に発生した例外
+        """
+        self._thread.start()
+        try:
+            while True:
+                item = self._queue.get()
+                if item is _END:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        """生成を停止してワーカースレッドの終了を待つ"""
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def _run(self) -> None:
+        """ワーカースレッド本体"""
+        try:
+            frame = None
+            for i in range(self.start_frame, self.end_frame):
+                if self._stop.is_set():
+                    return
+                if frame is None or not self.repeats[i - self.start_frame]:
+                    frame = to_rgb24(self.clip.get_frame(i / self.fps))
+                self._put(frame)
+            self._put(_END)
+        except BaseException as e:  # noqa: BLE001 - 呼び出し側で再送出する
+            self._put(e)
+
+    def _put(self, item) -> None:
+        """停止要求を確認しながらキューに積む"""
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+
+def frame_count(duration: float, fps: float) -> int:
+    """出力するフレーム数を計算（MoviePy の iter_frames と同じ規則）
+
+    Args:
+        duration: 長さ（秒）
+        fps: フレームレート
+
+    Returns:
+        フレーム数
+    """
+    return int(duration * fps)
+
+
+def to_rgb24(frame: np.ndarray) -> np.ndarray:
+    """フレームを ffmpeg に渡せる連続した RGB uint8 配列に変換
+
+    Args:
+        frame: 任意形式のフレーム（グレースケール・RGBA・浮動小数点を含む）
+
+    Returns:
+        (height, width, 3) の uint8 配列
+    """
+    if frame.ndim == 2:
+        frame = np.repeat(frame[:, :, np.newaxis], 3, axis=2)
+    elif frame.shape[2] == 4:
+        frame = frame[:, :, :3]
+    if frame.dtype != np.uint8:
+        frame = frame.astype(np.uint8)
+    return np.ascontiguousarray(frame)
+
+
+def write_video_pipe(
+    clip: VideoClip,
+    path: str,
+    fps: float,
+    codec: str = "libx264",
+    audio_codec: str = "aac",
+    preset: str = "fast",
+    bitrate: str | None = None,
+    threads: int | None = None,
+    temp_audiofile: str | None = None,
+    queue_size: int = 8,
+    logger: str | None = "bar",
+    start_frame: int = 0,
+    end_frame: int | None = None,
+    audio: bool = True,
+    audio_file: str | None = None,
+    frame_workers: int = 1,
+    frame_window: int | None = None,
+    elide_static: bool = True,
+) -> EncodeStats:
+    """クリップを ffmpeg への直接パイプで書き出す
+
+    フレーム生成はワーカースレッドで行い、メインスレッドは ffmpeg への
+    書き込みのみを担当する。frame_workers が2以上の場合は FrameScheduler で
+    複数のフレームを並行に生成する。音声は一時ファイルに書き出してから
+    同じ ffmpeg プロセスで多重化する。
+
+    Args:
+        clip: 出力するクリップ
+        path: 出力ファイルパス
+        fps: フレームレート
+        codec: ビデオコーデック
+        audio_codec: 音声コーデック
+        preset: エンコード速度プリセット
+        bitrate: ビットレート
+        threads: ffmpeg のエンコードスレッド数
+        temp_audiofile: 一時音声ファイルのパス（省略時は出力の隣に作成）
+        queue_size: 先行生成するフレームの最大数
+        logger: "bar" で進捗バーを表示、None で抑制
+        start_frame: 書き出す最初のフレーム番号
+        end_frame: 書き出しを終えるフレーム番号（含まない）。省略時は最後まで
+        audio: False の場合は音声を多重化しない
+        audio_file: エンコード済みの音声ファイル。指定した場合は clip の音声を
+            書き出さず、このファイルを再エンコードなしで多重化する（削除しない）
+        frame_workers: フレーム生成のスレッド数
+        frame_window: 並行生成時に先行生成するフレームの最大数
+            （省略時はスレッド数の2倍）
+        elide_static: 静止区間では最初のフレームだけを生成し、同じフレームを
+            繰り返しエンコーダーに渡すかどうか
+
+    Returns:
+        エンコード結果の統計
+    """
+    logger = proglog.default_bar_logger(logger)
+    start_time = time.perf_counter()
+
+    audio_path = None
+    temp_audio_path = None
+    if audio_file is not None:
+        audio_path = audio_file
+    elif audio and clip.audio is not None:
+        audio_ext = find_extension(audio_codec)
+        audio_path = temp_audiofile or str(
+            Path(path).with_name(f"{Path(path).stem}_temp_audio.{audio_ext}")
+        )
+        write_audio_track(clip.audio, audio_path, codec=audio_codec, logger=logger)
+        temp_audio_path = audio_path
+
+    try:
+        writer = FFmpegPipeWriter(
+            path,
+            size=clip.size,
+            fps=fps,
+            codec=codec,
+            preset=preset,
+            bitrate=bitrate,
+            threads=threads,
+            audio_path=audio_path,
+        )
+        if frame_workers > 1:
+            from .scheduler import FrameScheduler
+
+            producer = FrameScheduler(
+                clip,
+                fps,
+                workers=frame_workers,
+                window=frame_window,
+                start_frame=start_frame,
+                end_frame=end_frame,
+                elide_static=elide_static,
+            )
+        else:
+            producer = FrameProducer(
+                clip,
+                fps,
+                queue_size=queue_size,
+                start_frame=start_frame,
+                end_frame=end_frame,
+                elide_static=elide_static,
+            )
+        with writer:
+            for frame in logger.iter_bar(frame_index=producer):
+                writer.write_frame(frame)
+    finally:
+        if temp_audio_path is not None:
+            Path(temp_audio_path).unlink(missing_ok=True)
+
+    return EncodeStats(
+        frames=producer.n_frames,
+        elapsed=time.perf_counter() - start_time,
+        repeated_frames=producer.n_repeated,
+    )
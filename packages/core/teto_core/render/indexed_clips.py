@@ -0,0 +1,110 @@
+"""区間インデックスで再生中クリップを引く合成クリップ"""
+
+import numpy as np
+from moviepy import CompositeVideoClip, CompositeAudioClip
+
+from .interval_index import IntervalIndex, clip_span
+from .static_spans import composite_static_spans
+
+
+class IndexedCompositeVideoClip(CompositeVideoClip):
+    """再生中クリップの判定に区間インデックスを使う CompositeVideoClip
+
+    CompositeVideoClip は毎フレーム全クリップの is_playing を確認するため、
+    長いタイムラインではクリップ数に比例してコストが増える。
+    このクラスは構築時に区間インデックスを作り、フレームごとの処理を
+    その時刻に再生中のクリップだけに限定する。
+    """
+
+    def __init__(
+        self, clips, size=None, bg_color=None, use_bgclip=False, is_mask=False
+    ):
+        super().__init__(
+            clips,
+            size=size,
+            bg_color=bg_color,
+            use_bgclip=use_bgclip,
+            is_mask=is_mask,
+        )
+        self._index = IntervalIndex(self.clips, clip_span)
+
+        # 親クラスが生成したマスク・音声の合成もインデックス版に差し替える
+        if type(self.mask) is CompositeVideoClip:
+            self.mask = IndexedCompositeVideoClip(
+                self.mask.clips, self.size, is_mask=True, bg_color=0.0
+            )
+        if type(self.audio) is CompositeAudioClip:
+            self.audio = IndexedCompositeAudioClip(self.audio.clips)
+
+    def playing_clips(self, t=0):
+        """時刻 t に再生中のクリップを取得（layer_index 順）"""
+        return self._index.at(t)
+
+    def static_spans(self) -> list[tuple[float, float]]:
+        """再生中の全クリップが静止している区間を取得
+
+        Returns:
+            静止区間のリスト
+        """
+        clips = list(self.clips)
+        if not self.created_bg:
+            clips.append(self.bg)
+        return composite_static_spans(clips, self.duration)
+
+
+class IndexedCompositeAudioClip(CompositeAudioClip):
+    """再生中クリップの判定に区間インデックスを使う CompositeAudioClip
+
+    音声はチャンク（時刻の配列）単位で要求されるため、チャンクの
+    時間範囲と重なるクリップだけを合成する。
+    """
+
+    def __init__(self, clips):
+        super().__init__(clips)
+        self._index = IntervalIndex(self.clips, clip_span)
+
+    def frame_function(self, t):
+        """時刻 t（スカラーまたは配列）の音声フレームを合成"""
+        if isinstance(t, np.ndarray):
+            candidates = self._index.overlapping(float(t.min()), float(t.max()))
+            zero = np.zeros((len(t), self.nchannels))
+        else:
+            candidates = self._index.at(t)
+            zero = np.zeros(self.nchannels)
+
+        sounds = []
+        for clip in candidates:
+            part = clip.is_playing(t)
+            if part is not False:
+                sounds.append(clip.get_frame(t - clip.start) * np.array([part]).T)
+
+        return zero + sum(sounds)
+
+
+def concatenate_videoclips_indexed(clips: list) -> IndexedCompositeVideoClip:
+    """クリップを順に連結（concatenate_videoclips の method="compose" 相当）
+
+    各クリップを中央配置で直列に並べ、区間インデックス付きの
+    合成クリップとして返す。
+
+    Args:
+        clips: 連結するクリップのリスト
+
+    Returns:
+        連結されたクリップ
+    """
+    timings = np.cumsum([0] + [clip.duration for clip in clips])
+    width = max(clip.size[0] for clip in clips)
+    height = max(clip.size[1] for clip in clips)
+
+    result = IndexedCompositeVideoClip(
+        [clip.with_start(t).with_position("center") for clip, t in zip(clips, timings)],
+        size=(width, height),
+    )
+    result.timings = timings
+    result.start_times = timings[:-1]
+    result.start, result.duration, result.end = 0, timings[-1], timings[-1]
+    if result.audio is not None:
+        result.audio = result.audio.with_duration(result.duration)
+
+    return result
@@ -0,0 +1,114 @@
+"""クリップの再生区間インデックス"""
+
+from bisect import bisect_left, bisect_right
+from typing import Callable, Generic, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+class IntervalIndex(Generic[T]):
+    """再生区間 [start, end) から、時刻 t に有効な要素を引くインデックス
+
+    全区間の境界で時間軸を分割し、各区間で有効な要素をあらかじめ
+    列挙しておく。レンダリング開始時に一度だけ構築すれば、
+    各フレームの検索は二分探索のみとなり、コストはタイムライン全体の
+    クリップ数ではなく画面上のクリップ数に比例する。
+
+    検索結果は常に元のリストの順序（z 順）を保つ。
+    """
+
+    def __init__(
+        self,
+        items: Sequence[T],
+        span: Callable[[T], tuple[float, float | None]],
+    ):
+        """初期化
+
+        Args:
+            items: インデックス対象の要素リスト
+            span: 要素から (開始時刻, 終了時刻) を返す関数。
+                終了時刻が None の場合は無期限とみなす
+        """
+        self._items = list(items)
+
+        intervals = []
+        for i, item in enumerate(self._items):
+            start, end = span(item)
+            end = float("inf") if end is None else end
+            # 長さ 0 の区間は有効になることがないため除外
+            if end > start:
+                intervals.append((start, end, i))
+
+        boundaries = sorted(
+            {start for start, _, _ in intervals}
+            | {end for _, end, _ in intervals if end != float("inf")}
+        )
+
+        # 境界ごとに有効な要素を走査で求める
+        by_start = sorted(intervals)
+        active: dict[int, float] = {}
+        segments: list[tuple[int, ...]] = []
+        cursor = 0
+        for boundary in boundaries:
+            active = {i: end for i, end in active.items() if end > boundary}
+            while cursor < len(by_start) and by_start[cursor][0] <= boundary:
+                start, end, i = by_start[cursor]
+                if end > boundary:
+                    active[i] = end
+                cursor += 1
+            segments.append(tuple(sorted(active)))
+
+        self._boundaries = boundaries
+        self._segments = segments
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def at(self, t: float) -> list[T]:
+        """時刻 t に有効な要素を取得
+
+        Args:
+            t: 時刻（秒）
+
+        Returns:
+            start <= t < end を満たす要素のリスト（元の順序）
+        """
+        i = bisect_right(self._boundaries, t) - 1
+        if i < 0:
+            return []
+        return [self._items[j] for j in self._segments[i]]
+
+    def overlapping(self, t_start: float, t_end: float) -> list[T]:
+        """時間範囲と重なる可能性のある要素を取得
+
+        音声チャンクのように時刻の配列で問い合わせる場合に使う。
+        範囲の端ちょうどで終了する要素も含めるため、結果は
+        実際に再生される要素の上位集合となる。
+
+        Args:
+            t_start: 範囲の開始時刻（秒）
+            t_end: 範囲の終了時刻（秒）
+
+        Returns:
+            範囲と重なる要素のリスト（元の順序）
+        """
+        first = max(bisect_left(self._boundaries, t_start) - 1, 0)
+        last = bisect_right(self._boundaries, t_end) - 1
+        if last < 0:
+            return []
+        indices = set()
+        for segment in self._segments[first : last + 1]:
+            indices.update(segment)
+        return [self._items[j] for j in sorted(indices)]
+
+
+def clip_span(clip) -> tuple[float, float | None]:
+    """MoviePy クリップの再生区間を返す
+
+    Args:
+        clip: start / end 属性を持つクリップ
+
+    Returns:
+        (開始時刻, 終了時刻)
+    """
+    return clip.start, clip.end
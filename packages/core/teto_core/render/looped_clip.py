@@ -0,0 +1,116 @@
+"""時刻の剰余で素材を繰り返すループクリップ"""
+
+import threading
+
+import numpy as np
+from moviepy import AudioClip, VideoClip
+
+# ループ素材のフレームをメモリに保持する既定の上限（MB）
+DEFAULT_LOOP_CACHE_MB = 512
+
+
+class LoopedClip(VideoClip):
+    """素材クリップを t mod 素材の長さ で繰り返すクリップ
+
+    素材のコピーを concatenate_videoclips(method="compose") で並べると、
+    ループ回数に比例した合成クリップの木ができ、境界ごとにデコーダーが
+    先頭へシークし直す。このクリップは時刻を素材の長さで割った余りに
+    写して素材のフレームを返すため、ループ回数によらず1段で済む。
+
+    デコード済みのフレームが max_cache_bytes に収まる短い素材は、
+    最初の1周で読んだフレームをメモリに保持し、2周目以降はデコーダーを
+    使わずに返す。
+    """
+
+    def __init__(
+        self,
+        source: VideoClip,
+        duration: float,
+        max_cache_bytes: int = DEFAULT_LOOP_CACHE_MB * 1024 * 1024,
+    ):
+        """初期化
+
+        Args:
+            source: ループする素材クリップ（fps と duration が必要）
+            duration: ループ後の長さ（秒）
+            max_cache_bytes: 素材のフレームをメモリに保持する上限（バイト）。
+                素材全体のフレームがこれを超える場合は保持しない
+        """
+        super().__init__(duration=duration, is_mask=source.is_mask)
+        self.source = source
+        self.size = source.size
+        self.fps = source.fps
+        self.period = source.duration
+
+        self._lock = threading.Lock()
+        self._frames: dict[int, np.ndarray] | None = (
+            {} if self.cache_bytes(source) <= max_cache_bytes else None
+        )
+
+        if source.mask is not None:
+            self.mask = LoopedClip(source.mask, duration, max_cache_bytes)
+        if source.audio is not None:
+            self.audio = loop_audio(source.audio, duration)
+
+    @staticmethod
+    def cache_bytes(source: VideoClip) -> int:
+        """素材全体のフレームを保持するのに必要なバイト数を見積もる
+
+        Args:
+            source: 素材クリップ
+
+        Returns:
+            見積もりのバイト数
+        """
+        width, height = source.size
+        channels = 1 if source.is_mask else 3
+        itemsize = 8 if source.is_mask else 1
+        n_frames = int(np.ceil(source.duration * source.fps))
+        return n_frames * width * height * channels * itemsize
+
+    @property
+    def cached_frames(self) -> int:
+        """メモリに保持しているフレーム数"""
+        return len(self._frames) if self._frames is not None else 0
+
+    def frame_function(self, t: float) -> np.ndarray:
+        """時刻 t のフレームを素材から取得
+
+        Args:
+            t: 時刻（秒）
+
+        Returns:
+            フレーム
+        """
+        local_t = t % self.period
+        if self._frames is None:
+            return self.source.get_frame(local_t)
+
+        # 動画リーダーと同じ丸めでフレーム番号に写す
+        index = int(self.fps * local_t + 0.00001)
+        frame = self._frames.get(index)
+        if frame is None:
+            frame = self.source.get_frame(local_t)
+            with self._lock:
+                frame = self._frames.setdefault(index, frame)
+        return frame
+
+
+def loop_audio(source: AudioClip, duration: float) -> AudioClip:
+    """音声クリップを t mod 素材の長さ で繰り返す
+
+    Args:
+        source: ループする音声クリップ
+        duration: ループ後の長さ（秒）
+
+    Returns:
+        ループした音声クリップ
+    """
+    period = source.duration
+
+    def frame_function(t):
+        return source.get_frame(np.mod(t, period))
+
+    looped = AudioClip(frame_function, duration=duration, fps=source.fps)
+    looped.nchannels = source.nchannels
+    return looped
@@ -0,0 +1,301 @@
+"""レンダリングのプロファイラー"""
+
+import contextvars
+import json
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from moviepy import VideoClip
+
+# 実行中のプロファイラー（profile_clip から参照する）
+_active_profiler: contextvars.ContextVar["RenderProfiler | None"] = (
+    contextvars.ContextVar("teto_render_profiler", default=None)
+)
+
+
+@dataclass
+class StepProfile:
+    """処理ステップ1回分の計測結果"""
+
+    name: str
+    seconds: float
+    peak_memory_bytes: int | None = None
+
+
+@dataclass
+class FrameCost:
+    """フレーム生成コストの集計
+
+    self_seconds は入れ子のクリップ（エフェクトの元クリップなど）の
+    時間を除いた、そのクリップ自身の処理時間。
+    """
+
+    calls: int = 0
+    total_seconds: float = 0.0
+    self_seconds: float = 0.0
+
+    @property
+    def mean_ms(self) -> float:
+        """1回あたりの自身の処理時間（ミリ秒）"""
+        return self.self_seconds / self.calls * 1000 if self.calls else 0.0
+
+
+@dataclass
+class _Timer:
+    """get_frame 呼び出し1回分の計測中の状態"""
+
+    start: float
+    child_seconds: float = 0.0
+
+
+class RenderProfiler:
+    """生成パイプラインのプロファイラー
+
+    処理ステップごとの実行時間とピークメモリ、フレーム生成時の get_frame の
+    コストをレイヤー種別・エフェクト種別ごとに記録する。get_frame は
+    入れ子になるため、各クリップの時間から内側のクリップの時間を差し引いた
+    自身の処理時間も集計する。フレーム生成を並行に行う場合も、スレッドごとに
+    入れ子を追跡するため正しく集計できる。
+
+    Example:
+        >>> profiler = RenderProfiler()
+        >>> generator.generate(profiler=profiler)
+        >>> profiler.write_report("profile.json")
+        >>> print(profiler.summary())
+    """
+
+    def __init__(self, trace_memory: bool = True):
+        """初期化
+
+        Args:
+            trace_memory: tracemalloc でステップごとのピークメモリを計測するか
+                （計測中は Python のメモリ確保が遅くなる）
+        """
+        self.trace_memory = trace_memory
+        self.steps: list[StepProfile] = []
+        self.frames: dict[str, dict[str, FrameCost]] = {}
+        self.total_seconds = 0.0
+        self.peak_memory_bytes: int | None = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._started_tracing = False
+
+    @contextmanager
+    def activate(self):
+        """プロファイルを開始する
+
+        この中で作られたクリップは profile_clip によって計測対象になる。
+        """
+        token = _active_profiler.set(self)
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.total_seconds += time.perf_counter() - start
+            if self.trace_memory and tracemalloc.is_tracing():
+                peak = tracemalloc.get_traced_memory()[1]
+                self.peak_memory_bytes = max(self.peak_memory_bytes or 0, peak)
+            if self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+            _active_profiler.reset(token)
+
+    @contextmanager
+    def step(self, name: str):
+        """処理ステップの実行時間とピークメモリを計測する
+
+        Args:
+            name: ステップ名
+        """
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1] if tracing else None
+            if peak is not None:
+                self.peak_memory_bytes = max(self.peak_memory_bytes or 0, peak)
+            self.steps.append(StepProfile(name, seconds, peak))
+
+    def wrap_clip(self, clip: VideoClip, category: str, name: str) -> VideoClip:
+        """クリップの get_frame を計測対象にする
+
+        クリップの frame_function をその場で置き換えるため、
+        mark_static_overlay などの属性はそのまま残る。
+
+        Args:
+            clip: 計測するクリップ
+            category: 集計の分類（"layer", "effect" など）
+            name: 分類内の名前（レイヤー種別・エフェクト種別など）
+
+        Returns:
+            同じクリップ
+        """
+        frame_function = clip.frame_function
+
+        def timed_frame_function(t):
+            stack = self._timer_stack()
+            timer = _Timer(time.perf_counter())
+            stack.append(timer)
+            try:
+                return frame_function(t)
+            finally:
+                stack.pop()
+                elapsed = time.perf_counter() - timer.start
+                if stack:
+                    stack[-1].child_seconds += elapsed
+                self._record(category, name, elapsed, elapsed - timer.child_seconds)
+
+        clip.frame_function = timed_frame_function
+        return clip
+
+    def _timer_stack(self) -> list[_Timer]:
+        """現在のスレッドの計測中の get_frame のスタックを取得"""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _record(
+        self, category: str, name: str, total_seconds: float, self_seconds: float
+    ) -> None:
+        """get_frame 1回分のコストを集計"""
+        with self._lock:
+            cost = self.frames.setdefault(category, {}).setdefault(name, FrameCost())
+            cost.calls += 1
+            cost.total_seconds += total_seconds
+            cost.self_seconds += self_seconds
+
+    def to_dict(self) -> dict:
+        """計測結果を辞書に変換
+
+        Returns:
+            JSON に変換できる辞書
+        """
+        return {
+            "total_seconds": round(self.total_seconds, 6),
+            "peak_memory_bytes": self.peak_memory_bytes,
+            "steps": [
+                {
+                    "name": step.name,
+                    "seconds": round(step.seconds, 6),
+                    "peak_memory_bytes": step.peak_memory_bytes,
+                }
+                for step in self.steps
+            ],
+            "frames": {
+                category: {
+                    name: {
+                        "calls": cost.calls,
+                        "total_seconds": round(cost.total_seconds, 6),
+                        "self_seconds": round(cost.self_seconds, 6),
+                        "mean_ms": round(cost.mean_ms, 3),
+                    }
+                    for name, cost in sorted(
+                        costs.items(), key=lambda item: -item[1].self_seconds
+                    )
+                }
+                for category, costs in self.frames.items()
+            },
+        }
+
+    def write_report(self, path: str | Path) -> Path:
+        """計測結果を JSON ファイルに書き出す
+
+        Args:
+            path: 出力ファイルパス
+
+        Returns:
+            出力ファイルパス
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps(self.to_dict(), ensure_ascii=False, indent=2),
+            encoding="utf-8",
+        )
+        return path
+
+    def summary(self, top: int = 10) -> str:
+        """計測結果の要約を作成
+
+        Args:
+            top: フレーム生成コストを表示する上位の件数
+
+        Returns:
+            要約テキスト
+        """
+        lines = [f"合計: {self.total_seconds:.2f}s"]
+        if self.peak_memory_bytes is not None:
+            lines[0] += f" / ピークメモリ: {_format_bytes(self.peak_memory_bytes)}"
+
+        lines.append("ステップ:")
+        for step in self.steps:
+            line = f"  {step.name:<36} {step.seconds:8.2f}s"
+            if step.peak_memory_bytes is not None:
+                line += f"  {_format_bytes(step.peak_memory_bytes):>10}"
+            lines.append(line)
+
+        costs = [
+            (f"{category}:{name}", cost)
+            for category, items in self.frames.items()
+            for name, cost in items.items()
+        ]
+        if costs:
+            lines.append("フレーム生成（自身の処理時間）:")
+            for label, cost in sorted(costs, key=lambda c: -c[1].self_seconds)[:top]:
+                lines.append(
+                    f"  {label:<36} {cost.self_seconds:8.2f}s"
+                    f"  {cost.mean_ms:8.2f}ms x {cost.calls}"
+                )
+
+        return "\n".join(lines)
+
+
+def current_profiler() -> RenderProfiler | None:
+    """実行中のプロファイラーを取得
+
+    Returns:
+        プロファイラー。プロファイル中でなければ None
+    """
+    return _active_profiler.get()
+
+
+def profile_clip(clip: VideoClip, category: str, name: str) -> VideoClip:
+    """プロファイル中であればクリップの get_frame を計測対象にする
+
+    プロファイル中でなければ何もしないため、レイヤーやエフェクトの
+    処理から常に呼び出してよい。
+
+    Args:
+        clip: 計測するクリップ
+        category: 集計の分類（"layer", "effect" など）
+        name: 分類内の名前
+
+    Returns:
+        同じクリップ
+    """
+    profiler = _active_profiler.get()
+    if profiler is None:
+        return clip
+    return profiler.wrap_clip(clip, category, name)
+
+
+def _format_bytes(size: int) -> str:
+    """バイト数を読みやすい単位に変換"""
+    value = float(size)
+    for unit in ("B", "KB", "MB"):
+        if value < 1024:
+            return f"{value:.1f}{unit}"
+        value /= 1024
+    return f"{value:.1f}GB"
@@ -0,0 +1,196 @@
+"""スレッドプールによる順序付きフレーム生成"""
+
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import numpy as np
+from moviepy import VideoClip
+
+from .ffmpeg_pipe import frame_count, to_rgb24
+from .static_spans import repeated_frames
+
+
+class FrameScheduler:
+    """複数のフレームをスレッドプールで並行に生成し、時刻順に返すスケジューラー
+
+    NumPy のブレンドや scipy のフィルタ、PIL の合成は GIL を解放するため、
+    プロセスプールのようなピクル化やメモリの複製なしにマルチコアを活用できる。
+    先行して生成するフレームは window 枚までに制限し、メモリ使用量を抑える。
+
+    静止区間のフレームは生成せず、区間の最初のフレームを繰り返し返す。
+    FrameProducer と同じインターフェースを持ち、write_video_pipe から
+    差し替えて使う。
+    """
+
+    def __init__(
+        self,
+        clip: VideoClip,
+        fps: float,
+        workers: int = 2,
+        window: int | None = None,
+        start_frame: int = 0,
+        end_frame: int | None = None,
+        elide_static: bool = True,
+    ):
+        """初期化
+
+        Args:
+            clip: フレームを生成するクリップ
+            fps: フレームレート
+            workers: フレーム生成のスレッド数
+            window: 先行生成するフレームの最大数（省略時はスレッド数の2倍）
+            start_frame: 生成する最初のフレーム番号
+            end_frame: 生成を終えるフレーム番号（このフレームは含まない）。
+                省略時はクリップの最後まで
+            elide_static: 静止区間で直前のフレームを再利用するかどうか
+        """
+        self.clip = clip
+        self.fps = fps
+        self.workers = max(workers, 1)
+        self.window = max(window or self.workers * 2, 1)
+        if end_frame is None:
+            end_frame = frame_count(clip.duration, fps)
+        self.start_frame = start_frame
+        self.end_frame = end_frame
+        self.n_frames = max(end_frame - start_frame, 0)
+        self.repeats = (
+            repeated_frames(clip, fps, start_frame, end_frame)
+            if elide_static
+            else np.zeros(self.n_frames, dtype=bool)
+        )
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending: deque[Future] = deque()
+
+    def __len__(self) -> int:
+        return self.n_frames
+
+    @property
+    def n_repeated(self) -> int:
+        """直前のフレームを再利用するフレームの数"""
+        return int(self.repeats.sum())
+
+    def __iter__(self):
+        """時刻順にフレームを返す
+
+        Raises:
+            Exception: フレーム生成中に発生した例外
+        """
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="teto-frame"
+        )
+        next_frame = self.start_frame
+        previous: Future | None = None
+        try:
+            while next_frame < self.end_frame or self._pending:
+                # ウィンドウが埋まるまで先のフレームを投入
+                while next_frame < self.end_frame and len(self._pending) < self.window:
+                    # 静止区間では直前のフレームの結果を使い回す
+                    if (
+                        previous is None
+                        or not self.repeats[next_frame - self.start_frame]
+                    ):
+                        previous = self._executor.submit(self._render, next_frame)
+                    self._pending.append(previous)
+                    next_frame += 1
+                yield self._pending.popleft().result()
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        """未着手のフレームを取り消してスレッドプールを終了"""
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _render(self, index: int) -> np.ndarray:
+        """フレームを1枚生成"""
+        return to_rgb24(self.clip.get_frame(index / self.fps))
+
+
+class SerializedFrameReader:
+    """動画ファイルリーダーへのアクセスを直列化するラッパー
+
+    MoviePy の ffmpeg リーダーは順次読み出しの状態を持つため、複数スレッドから
+    同時に呼び出せない。ロックで直列化したうえで、直近のフレームを保持し、
+    少し先のフレームを要求された場合は途中のフレームも読んで保持しておく。
+    これにより、スレッドの実行順が前後しても巻き戻しによる再シークが起きない。
+    """
+
+    def __init__(self, reader, max_cached_frames: int = 16):
+        """初期化
+
+        Args:
+            reader: FFMPEG_VideoReader
+            max_cached_frames: 保持する直近のフレーム数
+        """
+        self._reader = reader
+        self._lock = threading.Lock()
+        self._max_cached_frames = max_cached_frames
+        self._recent: OrderedDict[int, np.ndarray] = OrderedDict()
+
+    def get_frame(self, t: float) -> np.ndarray:
+        """時刻 t のフレームを読み出す
+
+        Args:
+            t: 時刻（秒）
+
+        Returns:
+            フレーム
+        """
+        with self._lock:
+            return self._read(t)
+
+    def _read(self, t: float) -> np.ndarray:
+        """時刻 t のフレームを読み出す（ロックを取得した状態で呼ぶ）"""
+        index = self._reader.get_frame_number(t)
+        if index in self._recent:
+            self._recent.move_to_end(index)
+            return self._recent[index]
+
+        # reader.pos は次に読み出すフレーム番号
+        next_index = self._reader.pos
+        if self._reader.proc and next_index <= index < (
+            next_index + self._max_cached_frames
+        ):
+            for i in range(next_index, index + 1):
+                frame = self._reader.read_frame()
+                self._remember(i, frame)
+            return frame
+
+        frame = self._reader.get_frame(t)
+        self._remember(index, frame)
+        return frame
+
+    def _remember(self, index: int, frame: np.ndarray) -> None:
+        """読み出したフレームを保持"""
+        self._recent[index] = frame
+        while len(self._recent) > self._max_cached_frames:
+            self._recent.popitem(last=False)
+
+    def __getattr__(self, name: str):
+        # コピーや復元の途中で _reader が未設定の場合に再帰しないようにする
+        if name == "_reader":
+            raise AttributeError(name)
+        return getattr(self._reader, name)
+
+
+def serialize_reader(clip: VideoClip) -> VideoClip:
+    """動画ファイルクリップのリーダーを複数スレッドから使えるようにする
+
+    FrameScheduler で並行にフレームを生成する場合に備え、VideoFileClip を
+    読み込んだ直後（subclipped などでコピーする前）に呼び出す。
+
+    Args:
+        clip: VideoFileClip
+
+    Returns:
+        同じクリップ（リーダーを差し替え済み）
+    """
+    reader = getattr(clip, "reader", None)
+    if reader is not None and not isinstance(reader, SerializedFrameReader):
+        clip.reader = SerializedFrameReader(reader)
+    return clip
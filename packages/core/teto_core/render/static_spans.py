@@ -0,0 +1,142 @@
+"""時間変化しない区間（静止区間）の検出"""
+
+import numpy as np
+from moviepy import VideoClip
+
+from .interval_index import IntervalIndex, clip_span
+
+# 静的オーバーレイであることを示すクリップ属性名
+STATIC_OVERLAY_ATTR = "is_static_overlay"
+
+# 静止区間（開始時刻, 終了時刻）。区間内ではフレームが変化しない
+Span = tuple[float, float]
+
+
+def mark_static_overlay(clip: VideoClip) -> VideoClip:
+    """クリップを静的オーバーレイとしてマークする
+
+    表示区間中に画像・マスク・位置が変化しないクリップに付ける。
+    FlattenedCompositeClip はマークされたクリップを一度だけラスタライズし、
+    以降のフレームではキャッシュを再利用する。エフェクトのない画像レイヤー
+    のようなベース映像のクリップにも付けられ、静止区間の検出に使われる。
+
+    Args:
+        clip: 対象クリップ
+
+    Returns:
+        マークしたクリップ（同一インスタンス）
+    """
+    setattr(clip, STATIC_OVERLAY_ATTR, True)
+    return clip
+
+
+def is_static_overlay(clip: VideoClip) -> bool:
+    """クリップが静的オーバーレイとしてマークされているか
+
+    Args:
+        clip: 対象クリップ
+
+    Returns:
+        マークされていれば True
+    """
+    return getattr(clip, STATIC_OVERLAY_ATTR, False)
+
+
+def find_static_spans(clip: VideoClip) -> list[Span]:
+    """クリップのフレームが変化しない区間を取得
+
+    静的としてマークされたクリップは全体が1つの区間となる。それ以外で
+    static_spans メソッドを持つ合成クリップは、子クリップから区間を求める。
+
+    Args:
+        clip: 対象クリップ
+
+    Returns:
+        クリップ内の時刻での静止区間のリスト（時刻順・重なりなし）。
+        区間ごとにフレームは一定だが、隣り合う区間のフレームは異なりうる
+    """
+    if is_static_overlay(clip) and clip.duration is not None:
+        return [(0.0, clip.duration)]
+    static_spans = getattr(clip, "static_spans", None)
+    if callable(static_spans):
+        return static_spans()
+    return []
+
+
+def composite_static_spans(
+    clips: list[VideoClip], duration: float | None
+) -> list[Span]:
+    """重ねたクリップのうち、再生中の全クリップが静止している区間を取得
+
+    全クリップの再生区間と静止区間の境界で時間軸を分割し、各区間で
+    再生中のクリップがすべて静止していれば、その区間を静止区間とする。
+    境界では再生中のクリップの組か、いずれかのクリップの画像が変わるため、
+    隣り合う区間は結合しない。
+
+    Args:
+        clips: 開始時刻を設定済みのクリップのリスト
+        duration: 合成全体の長さ（秒）。None の場合は静止区間なし
+
+    Returns:
+        合成全体の時刻での静止区間のリスト
+    """
+    if duration is None:
+        return []
+
+    boundaries = {0.0, float(duration)}
+    child_spans: dict[int, list[Span]] = {}
+    for clip in clips:
+        spans = [(clip.start + a, clip.start + b) for a, b in find_static_spans(clip)]
+        child_spans[id(clip)] = spans
+        boundaries.add(clip.start)
+        if clip.end is not None:
+            boundaries.add(clip.end)
+        for a, b in spans:
+            boundaries.update((a, b))
+
+    index = IntervalIndex(clips, clip_span)
+    points = sorted(b for b in boundaries if 0.0 <= b <= duration)
+    result: list[Span] = []
+    for a, b in zip(points, points[1:]):
+        mid = (a + b) / 2
+        if all(
+            any(start <= mid < end for start, end in child_spans[id(clip)])
+            for clip in index.at(mid)
+        ):
+            result.append((a, b))
+    return result
+
+
+def repeated_frames(
+    clip: VideoClip, fps: float, start_frame: int, end_frame: int
+) -> np.ndarray:
+    """直前のフレームと同じ画像になるフレームを判定
+
+    Args:
+        clip: 対象クリップ
+        fps: フレームレート
+        start_frame: 最初のフレーム番号
+        end_frame: 終わりのフレーム番号（含まない）
+
+    Returns:
+        start_frame からの各フレームについて、直前のフレームを再利用できれば
+        True となる bool 配列。最初のフレームは常に False
+    """
+    n_frames = max(end_frame - start_frame, 0)
+    spans = find_static_spans(clip)
+    if not spans or n_frames == 0:
+        return np.zeros(n_frames, dtype=bool)
+
+    starts = np.array([a for a, _ in spans])
+    ends = np.array([b for _, b in spans])
+    times = np.arange(start_frame, end_frame) / fps
+
+    # 各フレームが属する静止区間（属さない場合は -1）
+    span_ids = np.searchsorted(starts, times, side="right") - 1
+    inside = span_ids >= 0
+    inside[inside] = times[inside] < ends[span_ids[inside]]
+    span_ids[~inside] = -1
+
+    repeats = np.zeros(n_frames, dtype=bool)
+    repeats[1:] = (span_ids[1:] >= 0) & (span_ids[1:] == span_ids[:-1])
+    return repeats
@@ -0,0 +1,221 @@
+"""トランジション付きで直列に並べたクリップの合成"""
+
+from bisect import bisect_right
+
+import numpy as np
+from moviepy import VideoClip, CompositeVideoClip
+
+from .indexed_clips import IndexedCompositeAudioClip
+from .static_spans import find_static_spans
+
+
+class TransitionSequenceClip(VideoClip):
+    """クロスフェードで繋いだベースクリップの列
+
+    CrossFadeIn / CrossFadeOut を付けたクリップを CompositeVideoClip で
+    重ねると、毎フレーム全クリップの再生判定とマスク合成が走る。
+    ベース映像の列では同時に再生されるクリップは高々2つなので、
+    このクリップは開始時刻の二分探索で再生中のクリップを引き、
+
+    - トランジション区間の外では、そのクリップのフレームをそのまま返す
+    - トランジション区間の中では、前後2つのフレームを1回だけブレンドする
+
+    合成結果は CrossFadeIn / CrossFadeOut を付けたクリップを
+    CompositeVideoClip で重ねた場合のフレームと同じになる。トランジションの長さは前後のクリップの
+    長さ以下であることを前提とする（3つ以上のクリップは重ならない）。
+    """
+
+    def __init__(
+        self,
+        clips: list[VideoClip],
+        transitions: list[float],
+        size: tuple[int, int],
+    ):
+        """初期化
+
+        Args:
+            clips: 再生順のクリップのリスト
+            transitions: clips[i] から clips[i + 1] へのトランジションの長さ（秒）。
+                長さは len(clips) - 1 で、0 はトランジションなしを表す
+            size: 出力サイズ (width, height)
+        """
+        if len(transitions) != len(clips) - 1:
+            raise ValueError("transitions must have one entry per clip boundary")
+
+        super().__init__()
+        self.size = tuple(size)
+        self.transitions = list(transitions)
+
+        # 各クリップの開始時刻（トランジション分オーバーラップさせる）
+        starts = []
+        current_time = 0.0
+        for i, clip in enumerate(clips):
+            starts.append(current_time)
+            overlap = self.transitions[i] if i < len(self.transitions) else 0.0
+            current_time += clip.duration - overlap
+        self.clips = [clip.with_start(start) for clip, start in zip(clips, starts)]
+        self.starts = starts
+
+        self.duration = max(clip.end for clip in self.clips)
+        self.end = self.duration
+
+        fpss = [clip.fps for clip in self.clips if getattr(clip, "fps", None)]
+        self.fps = max(fpss) if fpss else None
+
+        audioclips = [
+            clip.audio.with_start(clip.start)
+            for clip in self.clips
+            if clip.audio is not None
+        ]
+        if audioclips:
+            self.audio = IndexedCompositeAudioClip(audioclips)
+
+    def active_index(self, t: float) -> int:
+        """時刻 t に再生中のクリップのうち、後ろ側のインデックスを取得
+
+        Args:
+            t: 時刻（秒）
+
+        Returns:
+            クリップのインデックス
+        """
+        return max(bisect_right(self.starts, t) - 1, 0)
+
+    def static_spans(self) -> list[tuple[float, float]]:
+        """トランジション区間を除き、クリップが静止している区間を取得
+
+        Returns:
+            静止区間のリスト
+        """
+        spans = []
+        for i, clip in enumerate(self.clips):
+            fade_in = self.transitions[i - 1] if i > 0 else 0.0
+            fade_out = self.transitions[i] if i < len(self.transitions) else 0.0
+            lo, hi = clip.start + fade_in, clip.end - fade_out
+            for a, b in find_static_spans(clip):
+                a, b = max(clip.start + a, lo), min(clip.start + b, hi)
+                if a < b:
+                    spans.append((a, b))
+        return spans
+
+    def frame_function(self, t: float) -> np.ndarray:
+        """時刻 t のフレームを生成
+
+        Args:
+            t: 時刻（秒）
+
+        Returns:
+            RGB フレーム (height, width, 3) の uint8 配列
+        """
+        index = self.active_index(t)
+        clip = self.clips[index]
+        if not clip.is_playing(t):
+            width, height = self.size
+            return np.zeros((height, width, 3), dtype=np.uint8)
+
+        fade = self.transitions[index - 1] if index > 0 else 0.0
+        prev = self.clips[index - 1] if fade > 0 else None
+        if prev is None or t >= prev.end:
+            # トランジション区間外: 1クリップのフレームをそのまま返す
+            image, alpha = self._layer(clip, t)
+            if alpha is None:
+                return image
+            return np.where(alpha[:, :, np.newaxis] > 0, image, 0).astype(np.uint8)
+
+        # トランジション区間内: CrossFadeOut した前のクリップに
+        # CrossFadeIn したクリップを重ねる
+        in_factor = min((t - clip.start) / fade, 1.0)
+        out_factor = min((prev.end - t) / fade, 1.0)
+
+        prev_image, prev_alpha = self._layer(prev, t)
+        image, alpha = self._layer(clip, t)
+        prev_alpha = out_factor if prev_alpha is None else prev_alpha * out_factor
+        alpha = in_factor if alpha is None else alpha * in_factor
+        return _cross_blend(prev_image, prev_alpha, image, alpha)
+
+    def _layer(self, clip: VideoClip, t: float) -> tuple[np.ndarray, np.ndarray | None]:
+        """クリップの時刻 t の画像とアルファを出力サイズで取得
+
+        Args:
+            clip: 対象クリップ
+            t: 合成全体での時刻（秒）
+
+        Returns:
+            (RGB 画像, アルファ)。アルファが None の場合は不透明
+        """
+        ct = t - clip.start
+        image = clip.get_frame(ct)
+        if image.shape[2] == 4:
+            image = image[:, :, :3]
+        image = _fit(image, self.size)
+
+        # CompositeVideoClip のフレームは既に黒背景へ合成済みのためマスク不要
+        if clip.mask is None or isinstance(clip, CompositeVideoClip):
+            return image, None
+        mask = _fit(clip.mask.get_frame(ct), self.size).astype(np.float32)
+        return image, mask
+
+
+def _cross_blend(
+    below: np.ndarray,
+    below_alpha: np.ndarray | float,
+    above: np.ndarray,
+    above_alpha: np.ndarray | float,
+) -> np.ndarray:
+    """フェード中の2つの画像を1回のブレンドで合成
+
+    CompositeVideoClip は透明な背景の上にクリップを重ね、結果の色を
+    アルファで割り戻した（非乗算の）値をフレームとして返す。同じ結果を、
+    上側の画像の重み above_alpha / (合成後のアルファ) による1回の
+    線形補間で求める。
+
+    Args:
+        below: 下側（フェードアウト側）の画像
+        below_alpha: 下側のアルファ（スカラーまたは (h, w) の配列）
+        above: 上側（フェードイン側）の画像
+        above_alpha: 上側のアルファ（スカラーまたは (h, w) の配列）
+
+    Returns:
+        合成した uint8 画像
+    """
+    coverage = above_alpha + below_alpha * (1.0 - above_alpha)
+    if np.isscalar(coverage):
+        if coverage <= 0.0:
+            return np.zeros_like(above)
+        weight = above_alpha / coverage
+        if weight >= 1.0:
+            return above
+        if weight <= 0.0:
+            return below
+        transparent = None
+    else:
+        transparent = coverage <= 0.0
+        weight = np.where(transparent, 0.0, above_alpha / np.maximum(coverage, 1e-6))
+        weight = weight[:, :, np.newaxis].astype(np.float32)
+
+    blended = below.astype(np.float32)
+    blended += (above.astype(np.float32) - blended) * weight
+    np.rint(blended, out=blended)
+    if transparent is not None:
+        blended[transparent] = 0
+    return blended.astype(np.uint8)
+
+
+def _fit(image: np.ndarray, size: tuple[int, int]) -> np.ndarray:
+    """画像を出力サイズに合わせる（左上基準で切り取り・ゼロ埋め）
+
+    Args:
+        image: 画像（2次元または3次元）
+        size: 出力サイズ (width, height)
+
+    Returns:
+        出力サイズに揃えた画像
+    """
+    width, height = size
+    if image.shape[:2] == (height, width):
+        return image
+    fitted = np.zeros((height, width) + image.shape[2:], dtype=image.dtype)
+    h = min(height, image.shape[0])
+    w = min(width, image.shape[1])
+    fitted[:h, :w] = image[:h, :w]
+    return fitted
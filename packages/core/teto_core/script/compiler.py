@@ -61,6 +61,14 @@ class CompileMetadata:
     scene_timings: list[SceneTiming]
     generated_assets: list[str]
 
+    def scene_boundaries(self) -> list[float]:
+        """シーンの切り替わり時刻を取得
+
+        Returns:
+            2番目以降の各シーンの開始時刻（秒）
+        """
+        return [timing.start_time for timing in self.scene_timings[1:]]
+
 
 @dataclass
 class CompileResult:
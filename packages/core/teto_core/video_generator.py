@@ -1,6 +1,6 @@
 """動画生成エンジン"""
 
-from typing import Callable, Any
+from typing import Callable, Any, TYPE_CHECKING
 from .project import Project
 from .layer.processors import VideoProcessor, AudioProcessor
 from .layer.processors.video import StampLayerProcessor
@@ -16,10 +16,20 @@ from .generator.steps import (
     CharacterLayerProcessingStep,
     LayeredCharacterLayerProcessingStep,
     SubtitleProcessingStep,
+    OverlayCompositingStep,
     VideoOutputStep,
+    ChunkOutputStep,
+    CheckpointOutputStep,
+    AudioTrackOutputStep,
     CleanupStep,
 )
 
+if TYPE_CHECKING:
+    import proglog
+    from .cache.audio_track import AudioTrackCacheManager
+    from .cache.segment import SegmentCacheManager
+    from .render.profiler import RenderProfiler
+
 
 class VideoGenerator:
     """動画生成のメインエンジン
@@ -56,6 +66,7 @@ class VideoGenerator:
 
         # パイプラインを構築
         self._pipeline = self._build_default_pipeline()
+        self._has_custom_pipeline = False
 
     def register_pre_hook(self, hook: Callable[[Project], Any]) -> None:
         """生成前に実行されるフックを登録
@@ -93,7 +104,11 @@ class VideoGenerator:
         """
         return self._custom_processors.get(name)
 
-    def _build_default_pipeline(self) -> ProcessingStep:
+    def _build_default_pipeline(
+        self,
+        output_step: ProcessingStep | None = None,
+        include_audio: bool = True,
+    ) -> ProcessingStep:
         """デフォルトの処理パイプラインを構築
 
         処理順序:
@@ -103,29 +118,57 @@ class VideoGenerator:
         4. スタンプレイヤー処理
         5. キャラクターレイヤー処理
         6. 字幕処理
-        7. 動画出力
-        8. クリーンアップ
+        7. オーバーレイ合成（スタンプ・キャラクター・字幕を1パスで合成）
+        8. 動画出力
+        9. クリーンアップ
+
+        Args:
+            output_step: 動画出力ステップの差し替え（省略時は VideoOutputStep）
+            include_audio: False の場合は音声レイヤー処理と音声合成を省く。
+                合成済みの音声トラックを多重化する場合に使う
 
         Returns:
             処理パイプラインの先頭ステップ
         """
         video_step = VideoLayerProcessingStep(video_processor=self.video_processor)
-        video_step.then(
-            AudioLayerProcessingStep(audio_processor=self.audio_processor)
-        ).then(AudioMergingStep()).then(
-            StampLayerProcessingStep(stamp_processor=self.stamp_processor)
-        ).then(
+        step: ProcessingStep = video_step
+        if include_audio:
+            step = step.then(
+                AudioLayerProcessingStep(audio_processor=self.audio_processor)
+            ).then(AudioMergingStep())
+        step.then(StampLayerProcessingStep(stamp_processor=self.stamp_processor)).then(
             CharacterLayerProcessingStep(character_processor=self.character_processor)
-        ).then(
-            LayeredCharacterLayerProcessingStep()
-        ).then(
+        ).then(LayeredCharacterLayerProcessingStep()).then(
             SubtitleProcessingStep(
                 subtitle_burn_processor=self.subtitle_burn_processor,
                 subtitle_export_processor=self.subtitle_export_processor,
             )
         ).then(
-            VideoOutputStep()
+            OverlayCompositingStep()
         ).then(
+            output_step or VideoOutputStep()
+        ).then(
+            CleanupStep()
+        )
+
+        return video_step
+
+    def _build_audio_track_pipeline(self, audio_path: str) -> ProcessingStep:
+        """音声トラックだけを出力するパイプラインを構築
+
+        音声は出力サイズや字幕・オーバーレイに依存しないため、
+        動画/画像レイヤー（埋め込み音声を含む）と音声レイヤーだけを処理する。
+
+        Args:
+            audio_path: 音声の出力ファイルパス
+
+        Returns:
+            処理パイプラインの先頭ステップ
+        """
+        video_step = VideoLayerProcessingStep(video_processor=self.video_processor)
+        video_step.then(
+            AudioLayerProcessingStep(audio_processor=self.audio_processor)
+        ).then(AudioMergingStep()).then(AudioTrackOutputStep(audio_path)).then(
             CleanupStep()
         )
 
@@ -138,13 +181,40 @@ class VideoGenerator:
             pipeline: カスタム処理パイプライン
         """
         self._pipeline = pipeline
+        self._has_custom_pipeline = True
 
-    def generate(self, progress_callback=None, verbose: bool = True) -> str:
+    def generate(
+        self,
+        progress_callback=None,
+        verbose: bool = True,
+        draft: bool = False,
+        profiler: "RenderProfiler | None" = None,
+        use_audio_cache: bool = False,
+        audio_cache: "AudioTrackCacheManager | None" = None,
+        progress_logger: "proglog.ProgressBarLogger | None" = None,
+        output_step: ProcessingStep | None = None,
+    ) -> str:
         """プロジェクトから動画を生成
 
+        use_audio_cache を有効にすると、合成・エンコード済みの音声トラックを
+        音声トラックキャッシュから取り出して再エンコードなしで多重化する
+        （cached_audio_track を参照）。set_pipeline でパイプラインを
+        差し替えている場合は use_audio_cache と output_step は使わない。
+
         Args:
             progress_callback: 進捗コールバック関数（オプション）
             verbose: MoviePy のログを出力するかどうか（デフォルト: True）
+            draft: プレビュー用に縮小解像度・低フレームレートで出力するか
+                （OutputConfig.draft() を参照）
+            profiler: ステップごとの実行時間・ピークメモリと、レイヤー・
+                エフェクトごとのフレーム生成コストを記録するプロファイラー
+            use_audio_cache: 音声トラックキャッシュを使うか
+            audio_cache: 音声トラックキャッシュマネージャー（Noneの場合はデフォルト）
+            progress_logger: エンコードの進捗（フレーム番号など）を受け取る
+                proglog のロガー。指定時は verbose の進捗バーの代わりに使う
+            output_step: デフォルトパイプラインの動画出力ステップの差し替え
+                （例: フレームを生成して捨てる NullOutputStep）。指定時は
+                use_audio_cache より優先する
 
         Returns:
             出力ファイルパス
@@ -153,15 +223,42 @@ class VideoGenerator:
         for hook in self._pre_hooks:
             hook(self.project)
 
+        # ドラフト出力では output 設定を一時的に差し替える
+        original_output = self.project.output
+        if draft:
+            self.project.output = original_output.draft()
+
         # 処理コンテキストを作成
         context = ProcessingContext(
             project=self.project,
             progress_callback=progress_callback,
             verbose=verbose,
+            profiler=profiler,
+            progress_logger=progress_logger,
         )
 
+        pipeline = self._pipeline
         # パイプラインを実行
-        context = self._pipeline.execute(context)
+        try:
+            if output_step is not None and not self._has_custom_pipeline:
+                pipeline = self._build_default_pipeline(output_step=output_step)
+            elif use_audio_cache and not self._has_custom_pipeline:
+                pipeline = self._build_default_pipeline(
+                    output_step=VideoOutputStep(
+                        audio_path=self.cached_audio_track(audio_cache, verbose)
+                    ),
+                    include_audio=False,
+                )
+            if profiler is not None:
+                with profiler.activate():
+                    context = pipeline.execute(context)
+            else:
+                context = pipeline.execute(context)
+        finally:
+            self.project.output = original_output
+            # 途中で失敗した場合も ffmpeg のプロセスを残さない
+            if context.decoder_pool is not None:
+                context.decoder_pool.close()
 
         # 後処理フックを実行
         output_path = self.project.output.path
@@ -252,6 +349,9 @@ class VideoGenerator:
         max_workers: int | None = None,
         progress_callback: Callable[[str], None] | None = None,
         verbose: bool = False,
+        share_audio: bool = False,
+        use_audio_cache: bool = False,
+        audio_cache: "AudioTrackCacheManager | None" = None,
         _executor_class=None,
     ) -> list[str]:
         """複数のアスペクト比で動画を並列生成
@@ -259,11 +359,22 @@ class VideoGenerator:
         ProcessPoolExecutor を使用して各フォーマットを別プロセスで並列実行します。
         CPUコアを活用して処理時間を短縮できます。
 
+        share_audio を有効にすると、フォーマットに依存しない音声の合成と
+        エンコードを最初に一度だけ行い、各ワーカーはその音声ファイルを
+        再エンコードなしで多重化します。音声コーデックが異なる出力が
+        ある場合は、コーデックごとに一度ずつエンコードします。
+        use_audio_cache も有効にすると、共有する音声トラックを
+        音声トラックキャッシュから取り出します。
+
         Args:
             output_configs: 出力設定のリスト（OutputConfigまたはdict）
             max_workers: 最大並列数（デフォルト: CPUコア数）
             progress_callback: 進捗コールバック関数（オプション）
             verbose: MoviePy のログを出力するかどうか（デフォルト: False）
+            share_audio: 音声トラックを全フォーマットで共有するか
+            use_audio_cache: 共有する音声トラックにキャッシュを使うか
+                （share_audio が有効な場合のみ）
+            audio_cache: 音声トラックキャッシュマネージャー（Noneの場合はデフォルト）
             _executor_class: 内部用。テスト時に executor を差し替え可能
 
         Returns:
@@ -280,9 +391,15 @@ class VideoGenerator:
             >>> generator.generate_multi_parallel(configs, max_workers=3)
             ['youtube.mp4', 'tiktok.mp4', 'instagram.mp4']
         """
+        import shutil
+        import tempfile
         from concurrent.futures import ProcessPoolExecutor, as_completed
+        from moviepy.tools import find_extension
         from .output_config.models import OutputConfig
-        from .generator.parallel import generate_single_output
+        from .generator.parallel import (
+            generate_single_output,
+            generate_output_with_audio,
+        )
         from pathlib import Path
 
         # デフォルトは ProcessPoolExecutor
@@ -301,52 +418,477 @@ class VideoGenerator:
             Path(config.path).parent.mkdir(parents=True, exist_ok=True)
             normalized_configs.append(config)
 
-        if progress_callback:
-            progress_callback(f"並列生成開始: {len(normalized_configs)}フォーマット")
-
-        # プロジェクトをシリアライズ
-        project_dict = self.project.model_dump()
-
-        # 結果を格納するリスト（順序を維持）
-        output_paths = [None] * len(normalized_configs)
-        completed_count = 0
-
-        with _executor_class(max_workers=max_workers) as executor:
-            # タスクを投入
-            future_to_index = {
-                executor.submit(
-                    generate_single_output,
-                    project_dict,
-                    config.model_dump(),
-                    verbose,
-                ): i
-                for i, config in enumerate(normalized_configs)
-            }
-
-            # 結果を収集
-            for future in as_completed(future_to_index):
-                index = future_to_index[future]
-                config = normalized_configs[index]
-
-                try:
-                    output_path = future.result()
-                    output_paths[index] = output_path
-                    completed_count += 1
+        work_dir = None
+        audio_paths: list[str | None] = [None] * len(normalized_configs)
+        share_audio = share_audio and bool(normalized_configs)
+        if share_audio:
+            work_dir = Path(
+                tempfile.mkdtemp(
+                    prefix=".teto_shared_", dir=Path(normalized_configs[0].path).parent
+                )
+            )
+
+        try:
+            if share_audio:
+                if progress_callback:
+                    progress_callback("共有音声トラックを出力中...")
+                # 音声は出力サイズに依存しないため、コーデックごとに一度だけ出力する
+                tracks: dict[str, str | None] = {}
+                for i, config in enumerate(normalized_configs):
+                    if config.audio_codec not in tracks:
+                        ext = find_extension(config.audio_codec)
+                        track_project = self.project.model_copy(
+                            update={"output": config}
+                        )
+                        track_generator = VideoGenerator(
+                            track_project,
+                            video_processor=self.video_processor,
+                            audio_processor=self.audio_processor,
+                        )
+                        if use_audio_cache:
+                            tracks[config.audio_codec] = (
+                                track_generator.cached_audio_track(audio_cache, verbose)
+                            )
+                        else:
+                            tracks[config.audio_codec] = (
+                                track_generator.render_audio_track(
+                                    str(work_dir / f"audio_{len(tracks)}.{ext}"),
+                                    verbose,
+                                )
+                            )
+                    audio_paths[i] = tracks[config.audio_codec]
+
+            if progress_callback:
+                progress_callback(
+                    f"並列生成開始: {len(normalized_configs)}フォーマット"
+                )
+
+            # プロジェクトをシリアライズ
+            project_dict = self.project.model_dump()
+
+            # 結果を格納するリスト（順序を維持）
+            output_paths = [None] * len(normalized_configs)
+            completed_count = 0
+
+            with _executor_class(max_workers=max_workers) as executor:
+                # タスクを投入
+                future_to_index = {}
+                for i, config in enumerate(normalized_configs):
+                    if share_audio:
+                        future = executor.submit(
+                            generate_output_with_audio,
+                            project_dict,
+                            config.model_dump(),
+                            audio_paths[i],
+                            verbose,
+                        )
+                    else:
+                        future = executor.submit(
+                            generate_single_output,
+                            project_dict,
+                            config.model_dump(),
+                            verbose,
+                        )
+                    future_to_index[future] = i
+
+                # 結果を収集
+                for future in as_completed(future_to_index):
+                    index = future_to_index[future]
+                    config = normalized_configs[index]
+
+                    try:
+                        output_path = future.result()
+                        output_paths[index] = output_path
+                        completed_count += 1
+
+                        if progress_callback:
+                            progress_callback(
+                                f"完了 ({completed_count}/{len(normalized_configs)}): "
+                                f"{config.path}"
+                            )
+
+                        # 後処理フックを実行
+                        for hook in self._post_hooks:
+                            hook(output_path, self.project)
+
+                    except Exception as e:
+                        raise RuntimeError(
+                            f"Failed to generate {config.path}: {e}"
+                        ) from e
+        finally:
+            if work_dir is not None:
+                shutil.rmtree(work_dir, ignore_errors=True)
+
+        return output_paths
+
+    def generate_chunked(
+        self,
+        num_chunks: int | None = None,
+        max_workers: int | None = None,
+        scene_boundaries: list[float] | None = None,
+        progress_callback: Callable[[str], None] | None = None,
+        verbose: bool = False,
+        use_segment_cache: bool = False,
+        segment_cache: "SegmentCacheManager | None" = None,
+        use_audio_cache: bool = False,
+        audio_cache: "AudioTrackCacheManager | None" = None,
+        _executor_class=None,
+    ) -> str:
+        """タイムラインを時間分割して並列にレンダリング
+
+        タイムラインを複数のチャンクに分け、ProcessPoolExecutor の各プロセスで
+        フレーム範囲ごとにエンコードする。チャンクは ffmpeg の concat demuxer で
+        再エンコードなしに結合し、音声トラックは結合時に一度だけ多重化する。
+        チャンクは ffmpeg への直接パイプで出力するため、output.encoder の
+        設定には依存しない。
+
+        use_segment_cache を有効にすると、シーンごとに1チャンクとして
+        レンダリングし、各セグメントをその内容のハッシュでキャッシュする。
+        再レンダリング時は内容が変わったシーンだけをエンコードする。
+        use_audio_cache を有効にすると、音声トラックも音声トラックキャッシュから
+        取り出し、音声に関わる変更がなければ音声の合成とエンコードを省く。
+
+        Args:
+            num_chunks: チャンク数（デフォルト: ワーカー数）
+            max_workers: 最大並列数（デフォルト: CPUコア数）
+            scene_boundaries: シーンの切り替わり時刻（秒）。指定時は
+                チャンクの分割点をシーン境界に寄せる
+                （CompileMetadata.scene_boundaries() を参照）
+            progress_callback: 進捗コールバック関数（オプション）
+            verbose: MoviePy のログを出力するかどうか（デフォルト: False）
+            use_segment_cache: シーン単位のセグメントキャッシュを使うか。
+                scene_boundaries が未指定の場合は動画・画像レイヤーの境界を使う
+            segment_cache: セグメントキャッシュマネージャー（Noneの場合はデフォルト）
+            use_audio_cache: 音声トラックキャッシュを使うか
+            audio_cache: 音声トラックキャッシュマネージャー（Noneの場合はデフォルト）
+            _executor_class: 内部用。テスト時に executor を差し替え可能
+
+        Returns:
+            出力ファイルパス
+
+        Example:
+            >>> result = compiler.compile(script)
+            >>> generator = VideoGenerator(result.project)
+            >>> generator.generate_chunked(
+            ...     num_chunks=16,
+            ...     scene_boundaries=result.metadata.scene_boundaries(),
+            ... )
+            'output.mp4'
+        """
+        import os
+        import shutil
+        import tempfile
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        from pathlib import Path
+        from moviepy.tools import find_extension
+        from .generator.parallel import render_chunk
+        from .render.chunked import plan_chunks, scene_chunks, concat_segments
+        from .cache.segment import get_segment_cache_manager, video_layer_spans
+
+        if _executor_class is None:
+            _executor_class = ProcessPoolExecutor
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if num_chunks is None:
+            num_chunks = max_workers
+
+        # 前処理フックを実行
+        for hook in self._pre_hooks:
+            hook(self.project)
+
+        output_config = self.project.output
+        output_path = output_config.path
+        output_dir = Path(output_path).parent
+        output_dir.mkdir(parents=True, exist_ok=True)
+        work_dir = Path(tempfile.mkdtemp(prefix=".teto_chunks_", dir=output_dir))
+
+        try:
+            # 音声トラックはタイムライン全体で一度だけエンコードする
+            if progress_callback:
+                progress_callback("音声トラックを出力中...")
+            if use_audio_cache:
+                audio_path = self.cached_audio_track(audio_cache, verbose)
+            else:
+                audio_ext = find_extension(output_config.audio_codec)
+                audio_path = self.render_audio_track(
+                    str(work_dir / f"audio.{audio_ext}"), verbose
+                )
+            duration = self._video_layers_duration(verbose)
+
+            suffix = Path(output_path).suffix or ".mp4"
+            if use_segment_cache:
+                segment_cache = segment_cache or get_segment_cache_manager()
+                if scene_boundaries is None:
+                    spans = video_layer_spans(self.project.timeline.video_layers)
+                    scene_boundaries = [start for start, _ in spans[1:]]
+                chunks = scene_chunks(duration, output_config.fps, scene_boundaries)
+                cache_keys = [
+                    segment_cache.compute_key(self.project, start, end)
+                    for start, end in chunks
+                ]
+                cached_paths = [
+                    segment_cache.get_path(key, suffix) for key in cache_keys
+                ]
+            else:
+                chunks = plan_chunks(
+                    duration,
+                    output_config.fps,
+                    num_chunks,
+                    scene_boundaries,
+                )
+                cached_paths = [None] * len(chunks)
+
+            chunk_paths = [
+                str(cached_path or work_dir / f"chunk_{i:04d}{suffix}")
+                for i, cached_path in enumerate(cached_paths)
+            ]
+            pending = [i for i, path in enumerate(cached_paths) if path is None]
+            if progress_callback:
+                if use_segment_cache:
+                    progress_callback(
+                        f"セグメントキャッシュ: {len(chunks) - len(pending)}/"
+                        f"{len(chunks)}シーンを再利用"
+                    )
+                progress_callback(f"並列レンダリング開始: {len(pending)}チャンク")
+
+            project_dict = self.project.model_dump()
+            completed_count = 0
+
+            with _executor_class(max_workers=max_workers) as executor:
+                future_to_index = {
+                    executor.submit(
+                        render_chunk,
+                        project_dict,
+                        chunks[i][0],
+                        chunks[i][1],
+                        chunk_paths[i],
+                        verbose,
+                    ): i
+                    for i in pending
+                }
+
+                for future in as_completed(future_to_index):
+                    index = future_to_index[future]
+                    try:
+                        future.result()
+                    except Exception as e:
+                        raise RuntimeError(
+                            f"Failed to render chunk {index} of {output_path}: {e}"
+                        ) from e
+
+                    if use_segment_cache:
+                        segment_cache.put_file(
+                            cache_keys[index], chunk_paths[index], suffix
+                        )
 
+                    completed_count += 1
                     if progress_callback:
                         progress_callback(
-                            f"完了 ({completed_count}/{len(normalized_configs)}): "
-                            f"{config.path}"
+                            f"チャンク完了 ({completed_count}/{len(pending)})"
                         )
 
-                    # 後処理フックを実行
-                    for hook in self._post_hooks:
-                        hook(output_path, self.project)
+            if progress_callback:
+                progress_callback("チャンクを結合中...")
+            concat_segments(chunk_paths, output_path, audio_path=audio_path)
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
 
-                except Exception as e:
-                    raise RuntimeError(f"Failed to generate {config.path}: {e}") from e
+        if progress_callback:
+            progress_callback("完了！")
 
-        return output_paths
+        # 後処理フックを実行
+        for hook in self._post_hooks:
+            hook(output_path, self.project)
+
+        return output_path
+
+    def generate_resumable(
+        self,
+        segment_seconds: float = 60.0,
+        resume: bool = False,
+        progress_callback: Callable[[str], None] | None = None,
+        verbose: bool = False,
+        use_audio_cache: bool = False,
+        audio_cache: "AudioTrackCacheManager | None" = None,
+    ) -> str:
+        """チェックポイントを残しながら動画を生成
+
+        タイムラインを segment_seconds 秒ごとのセグメントとして順に確定させ、
+        出力ファイルと同じディレクトリの作業ディレクトリ
+        （.teto_resume_<出力ファイル名>）にマニフェストを残す。
+        途中でプロセスが落ちても、resume=True で再実行すると書き終えた
+        セグメントを再利用し、残りだけをレンダリングして結合する。
+        プロジェクトの内容や出力設定が変わっている場合は最初からやり直す。
+
+        Args:
+            segment_seconds: 1セグメントの目安の長さ（秒）
+            resume: 前回の作業ディレクトリから再開するか
+            progress_callback: 進捗コールバック関数（オプション）
+            verbose: MoviePy のログを出力するかどうか（デフォルト: False）
+            use_audio_cache: 音声トラックキャッシュを使うか
+                （generate の同名の引数を参照）
+            audio_cache: 音声トラックキャッシュマネージャー（Noneの場合はデフォルト）
+
+        Returns:
+            出力ファイルパス
+        """
+        from pathlib import Path
+
+        # 前処理フックを実行
+        for hook in self._pre_hooks:
+            hook(self.project)
+
+        output_path = self.project.output.path
+        work_dir = Path(output_path).with_name(f".teto_resume_{Path(output_path).name}")
+
+        audio_path = None
+        if use_audio_cache:
+            audio_path = self.cached_audio_track(audio_cache, verbose)
+        pipeline = self._build_default_pipeline(
+            output_step=CheckpointOutputStep(
+                str(work_dir),
+                segment_seconds=segment_seconds,
+                resume=resume,
+                audio_path=audio_path,
+            ),
+            include_audio=not use_audio_cache,
+        )
+        pipeline.execute(
+            ProcessingContext(
+                project=self.project,
+                progress_callback=progress_callback,
+                verbose=verbose,
+            )
+        )
+
+        if progress_callback:
+            progress_callback("完了！")
+
+        # 後処理フックを実行
+        for hook in self._post_hooks:
+            hook(output_path, self.project)
+
+        return output_path
+
+    def render_chunk(
+        self, start_frame: int, end_frame: int, path: str, verbose: bool = False
+    ) -> str:
+        """タイムラインの一部のフレーム範囲を音声なしで出力
+
+        generate_chunked のワーカーから呼ばれる。
+
+        Args:
+            start_frame: 書き出す最初のフレーム番号
+            end_frame: 書き出しを終えるフレーム番号（含まない）
+            path: チャンクの出力ファイルパス
+            verbose: MoviePy のログを出力するかどうか
+
+        Returns:
+            チャンクの出力ファイルパス
+        """
+        pipeline = self._build_default_pipeline(
+            output_step=ChunkOutputStep(start_frame, end_frame, path)
+        )
+        pipeline.execute(ProcessingContext(project=self.project, verbose=verbose))
+        return path
+
+    def _video_layers_duration(self, verbose: bool = False) -> float:
+        """動画・画像レイヤーだけを処理してタイムラインの長さを求める
+
+        チャンクの分割に使う。字幕・スタンプ・キャラクターなどの
+        オーバーレイは処理しない。
+
+        Args:
+            verbose: MoviePy のログを出力するかどうか
+
+        Returns:
+            タイムラインの長さ（秒）
+        """
+        video_step = VideoLayerProcessingStep(video_processor=self.video_processor)
+        video_step.then(CleanupStep())
+        context = video_step.execute(
+            ProcessingContext(project=self.project, verbose=verbose)
+        )
+        return context.video_clip.duration
+
+    def render_audio_track(self, path: str, verbose: bool = False) -> str | None:
+        """合成済みの音声トラックだけを出力
+
+        Args:
+            path: 音声の出力ファイルパス
+            verbose: MoviePy のログを出力するかどうか
+
+        Returns:
+            音声の出力ファイルパス。タイムラインに音声がない場合は None
+        """
+        from pathlib import Path
+
+        Path(path).unlink(missing_ok=True)
+        pipeline = self._build_audio_track_pipeline(path)
+        pipeline.execute(ProcessingContext(project=self.project, verbose=verbose))
+        return path if Path(path).exists() else None
+
+    def cached_audio_track(
+        self,
+        audio_cache: "AudioTrackCacheManager | None" = None,
+        verbose: bool = False,
+    ) -> str | None:
+        """合成済みの音声トラックをキャッシュから取得
+
+        音声レイヤーと動画素材の埋め込み音声、ソースファイルの内容、
+        音声コーデックのハッシュが一致するエンコード済みの音声があれば
+        それを返す。なければ render_audio_track で出力してキャッシュに保存する。
+
+        Args:
+            audio_cache: 音声トラックキャッシュマネージャー（Noneの場合はデフォルト）
+            verbose: MoviePy のログを出力するかどうか
+
+        Returns:
+            キャッシュ内の音声ファイルのパス。タイムラインに音声がない場合は None
+        """
+        import os
+        from pathlib import Path
+        from moviepy.tools import find_extension
+        from .cache.audio_track import get_audio_track_cache_manager
+
+        audio_cache = audio_cache or get_audio_track_cache_manager()
+        cache_key = audio_cache.compute_key(self.project)
+        ext = f".{find_extension(self.project.output.audio_codec)}"
+
+        cached_path = audio_cache.get_path(cache_key, ext)
+        if cached_path is not None:
+            return str(cached_path)
+
+        temp_path = audio_cache.cache_dir / f"render_{cache_key}_{os.getpid()}{ext}"
+        try:
+            if self.render_audio_track(str(temp_path), verbose) is None:
+                return None
+            return str(audio_cache.put_file(cache_key, temp_path, ext))
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+
+    def render_with_audio_track(
+        self, audio_path: str | None, verbose: bool = False
+    ) -> str:
+        """合成済みの音声トラックを多重化して動画を出力
+
+        音声レイヤーの処理と音声のエンコードを省き、render_audio_track で
+        出力した音声ファイルをそのまま多重化する。
+        generate_multi_parallel のワーカーから呼ばれる。
+
+        Args:
+            audio_path: エンコード済みの音声ファイルのパス。None の場合は無音
+            verbose: MoviePy のログを出力するかどうか
+
+        Returns:
+            出力ファイルパス
+        """
+        pipeline = self._build_default_pipeline(
+            output_step=VideoOutputStep(audio_path=audio_path),
+            include_audio=False,
+        )
+        pipeline.execute(ProcessingContext(project=self.project, verbose=verbose))
+        return self.project.output.path
 
     @classmethod
     def from_json(cls, json_path: str) -> "VideoGenerator":